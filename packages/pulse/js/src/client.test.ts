@@ -126,6 +126,23 @@ describe("PulseSocketIOClient attach ack", () => {
 		});
 	});
 
+	it("handles batched server messages in order", async () => {
+		const client = await makeClient();
+		const connected = client.connect();
+		client.attach("/", view);
+		socket.trigger("connect");
+		await connected;
+
+		const attach = sentMessages()[0]!;
+		client.invokeCallback("/", "1.onClick", []);
+		socket.trigger("message_batch", [
+			serialize({ type: "attach_ack", path: "/", attachId: attach.attachId }),
+			serialize({ type: "attach_ack", path: "/", attachId: "stale" }),
+		]);
+
+		expect(sentMessages().map((message) => message.type)).toEqual(["attach", "callback"]);
+	});
+
 	it("drops queued callbacks when the path detaches before ack", async () => {
 		const client = await makeClient();
 		const connected = client.connect();
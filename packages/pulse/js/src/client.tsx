@@ -1,6 +1,12 @@
 import type { NavigateFunction } from "react-router";
 import { io, type Socket } from "socket.io-client";
 import { ChannelBridge, createRandomId, PulseChannelResetError } from "./channel";
+import {
+	decodeBinary,
+	decodeCompressed,
+	isCompressedPayload,
+	supportsCompression,
+} from "./compression";
 import type { RouteInfo } from "./helpers";
 import { pulseFetch } from "./http";
 import type {
@@ -16,7 +22,8 @@ import type {
 } from "./messages";
 import type { PulsePrerenderView } from "./pulse";
 import { extractEvent } from "./serialize/events";
-import { deserialize, serialize } from "./serialize/serializer";
+import { isBinaryPayload } from "./serialize/msgpack";
+import { deserialize, type Serialized, serialize } from "./serialize/serializer";
 import type { VDOMUpdate } from "./vdom";
 
 function documentIsHidden(): boolean {
@@ -27,7 +34,17 @@ function browserIsOnline(): boolean {
 	return typeof navigator === "undefined" || navigator.onLine !== false;
 }
 
+const decodeOptions = { coerceNullsToUndefined: true };
+
+function decodeServerMessage(data: unknown): ServerMessage {
+	return isBinaryPayload(data)
+		? decodeBinary(data, decodeOptions)
+		: deserialize(data as Serialized, decodeOptions);
+}
+
 const PAGE_INSTANCE_AUTH_KEY = "__pulse_page_instance_id";
+const WIRE_FORMATS_AUTH_KEY = "__pulse_wire_formats";
+const COMPRESSION_AUTH_KEY = "__pulse_compression";
 const RENDER_ID_COLLISION_CODE = "render_id_collision";
 const pageWindow =
 	typeof window === "undefined"
@@ -79,6 +96,8 @@ export class PulseSocketIOClient {
 	#ackedAttachIds: Map<string, string>;
 	#pendingCallbacks: Map<string, ClientCallbackMessage[]>;
 	#socket: Socket | null = null;
+	// Messages still waiting on an earlier compressed one, in arrival order
+	#decoding: Promise<void> | null = null;
 	#messageQueue: ClientMessage[];
 	#connectionListeners: Set<ConnectionStatusListener> = new Set();
 	#channels: Map<string, { bridge: ChannelBridge; refCount: number }> = new Map();
@@ -207,6 +226,8 @@ export class PulseSocketIOClient {
 				auth: {
 					...this.#directives.socketio?.auth,
 					[PAGE_INSTANCE_AUTH_KEY]: pageInstanceId,
+					[WIRE_FORMATS_AUTH_KEY]: "msgpack",
+					...(supportsCompression() ? { [COMPRESSION_AUTH_KEY]: "gzip" } : {}),
 				},
 				query: this.#directives.socketio?.query,
 			});
@@ -258,7 +279,15 @@ export class PulseSocketIOClient {
 			// Wrap in an arrow function to avoid losing the `this` reference
 			socket.on("message", (data) => {
 				if (this.#socket !== socket) return;
-				this.#handleServerMessage(deserialize(data, { coerceNullsToUndefined: true }));
+				this.#receive(socket, data);
+			});
+
+			// Messages the server sent within one event loop iteration, in order
+			socket.on("message_batch", (batch: unknown[]) => {
+				if (this.#socket !== socket) return;
+				for (const data of batch) {
+					this.#receive(socket, data);
+				}
 			});
 		});
 	}
@@ -362,6 +391,33 @@ export class PulseSocketIOClient {
 		socket.disconnect();
 	}
 
+	#receive(socket: Socket, data: unknown): void {
+		const compressed = isCompressedPayload(data);
+		if (!compressed && this.#decoding === null) {
+			this.#handleServerMessage(decodeServerMessage(data));
+			return;
+		}
+		// Compressed messages decode asynchronously. Start right away, but handle
+		// messages in the order they arrived.
+		const decoded = compressed
+			? decodeCompressed<ServerMessage>(data, decodeOptions)
+			: Promise.resolve().then(() => decodeServerMessage(data));
+		const previous = this.#decoding ?? Promise.resolve();
+		const decoding = previous
+			.then(() => decoded)
+			.then((message) => {
+				if (this.#socket !== socket) return;
+				this.#handleServerMessage(message);
+			})
+			.catch((err) => {
+				console.error("[PulseClient] Failed to handle server message:", err);
+			})
+			.finally(() => {
+				if (this.#decoding === decoding) this.#decoding = null;
+			});
+		this.#decoding = decoding;
+	}
+
 	#handleServerMessage(message: ServerMessage) {
 		// console.log("[PulseClient] Received message:", message);
 		switch (message.type) {
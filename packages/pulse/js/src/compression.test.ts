@@ -0,0 +1,44 @@
+import { describe, expect, it } from "bun:test";
+import { decodeBinary, decodeCompressed, isCompressedPayload } from "./compression";
+import { decodeMsgpack } from "./serialize/msgpack";
+import { serialize } from "./serialize/serializer";
+
+async function gzip(bytes: Uint8Array): Promise<Uint8Array> {
+	const stream = new Blob([bytes as BlobPart])
+		.stream()
+		.pipeThrough(new CompressionStream("gzip"));
+	return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+describe("compressed socket messages", () => {
+	it("are told apart from MessagePack and JSON payloads", async () => {
+		const compressed = await gzip(new TextEncoder().encode("[]"));
+		expect(isCompressedPayload(compressed)).toBe(true);
+		expect(isCompressedPayload(compressed.buffer)).toBe(true);
+		// fixmap with one entry
+		expect(isCompressedPayload(new Uint8Array([0x81, 0xa1, 0x61, 0x01]))).toBe(false);
+		expect(isCompressedPayload([[], { type: "vdom_init" }])).toBe(false);
+	});
+
+	it("decode the JSON form", async () => {
+		const message = { type: "vdom_init", path: "/", at: new Date(0), rows: [1, 2, 3] };
+		const json = JSON.stringify(serialize(message));
+		const decoded = await decodeCompressed(await gzip(new TextEncoder().encode(json)));
+		expect(decoded).toEqual(message);
+	});
+
+	it("decode the MessagePack form", async () => {
+		// {"a": [1, 2]}
+		const msgpack = new Uint8Array([0x81, 0xa1, 0x61, 0x92, 0x01, 0x02]);
+		const decoded = await decodeCompressed(await gzip(msgpack));
+		expect(decoded).toEqual(decodeMsgpack(msgpack));
+		expect(decoded).toEqual({ a: [1, 2] });
+	});
+
+	it("share their decoding with uncompressed binary messages", () => {
+		const message = { type: "vdom_update", path: "/", ops: [] };
+		const json = new TextEncoder().encode(JSON.stringify(serialize(message)));
+		expect(decodeBinary(json)).toEqual(message);
+		expect(decodeBinary(new Uint8Array([0x81, 0xa1, 0x61, 0x01]))).toEqual({ a: 1 });
+	});
+});
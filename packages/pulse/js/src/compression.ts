@@ -0,0 +1,56 @@
+import { decodeMsgpack, isBinaryPayload } from "./serialize/msgpack";
+import { type DeserializationOptions, deserialize } from "./serialize/serializer";
+
+// Large socket messages may arrive gzipped (`pulse/compression.py`). They are
+// binary payloads starting with the gzip magic bytes, which MessagePack
+// messages (always a map) never do. Clients that support compression also get
+// the smaller JSON messages as binary, encoded once by the server. Once
+// decompressed, a payload starting with `[` is the JSON form produced by
+// `serialize()`, anything else is MessagePack.
+
+const GZIP_MAGIC_0 = 0x1f;
+const GZIP_MAGIC_1 = 0x8b;
+const JSON_ARRAY_START = 0x5b;
+
+const textDecoder = new TextDecoder();
+
+export function supportsCompression(): boolean {
+	return typeof DecompressionStream !== "undefined";
+}
+
+function toBytes(data: ArrayBuffer | ArrayBufferView): Uint8Array {
+	return ArrayBuffer.isView(data)
+		? new Uint8Array(data.buffer, data.byteOffset, data.byteLength)
+		: new Uint8Array(data);
+}
+
+export function isCompressedPayload(data: unknown): data is ArrayBuffer | ArrayBufferView {
+	if (!isBinaryPayload(data)) return false;
+	const bytes = toBytes(data);
+	return bytes.length >= 2 && bytes[0] === GZIP_MAGIC_0 && bytes[1] === GZIP_MAGIC_1;
+}
+
+export async function gunzip(data: ArrayBuffer | ArrayBufferView): Promise<Uint8Array> {
+	const stream = new Blob([toBytes(data) as BlobPart])
+		.stream()
+		.pipeThrough(new DecompressionStream("gzip"));
+	return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+export function decodeBinary<Data = any>(
+	data: ArrayBuffer | ArrayBufferView,
+	options?: DeserializationOptions,
+): Data {
+	const bytes = toBytes(data);
+	if (bytes[0] === JSON_ARRAY_START) {
+		return deserialize(JSON.parse(textDecoder.decode(bytes)), options) as Data;
+	}
+	return decodeMsgpack(bytes, options);
+}
+
+export async function decodeCompressed<Data = any>(
+	data: ArrayBuffer | ArrayBufferView,
+	options?: DeserializationOptions,
+): Promise<Data> {
+	return decodeBinary(await gunzip(data), options);
+}
@@ -54,6 +54,7 @@ export { VDOMRenderer } from "./renderer";
 //   decodeFromWire,
 //   cleanForSerialization,
 // } from "./serialize/clean";
+export { decodeMsgpack } from "./serialize/msgpack";
 export { deserialize, serialize } from "./serialize/serializer";
 // Transports (types only - implementation is internal)
 export type { MessageListener, Transport } from "./transport";
@@ -3,13 +3,16 @@
 // =================================================================
 
 import type { RouteInfo } from "./helpers";
+import type { TemplateRef, VDOMTemplate } from "./templates";
 import type { VDOM, VDOMNode, VDOMUpdate } from "./vdom";
 
 // Based on pulse/messages.py
 export interface ServerInitMessage {
 	type: "vdom_init";
 	path: string;
-	vdom: VDOM;
+	vdom: VDOM | TemplateRef;
+	// Present when `vdom` refers to templates (`App(vdom_templates=True)`)
+	templates?: VDOMTemplate[];
 }
 
 export interface ServerUpdateMessage {
@@ -0,0 +1,43 @@
+import { describe, expect, it } from "bun:test";
+import { applyPatch, type PatchOp } from "./patch";
+
+describe("applyPatch", () => {
+	it("splices lists and sets or deletes keys in order", () => {
+		const value = { series: [[0, 1], [1, 2]], name: "a", legend: true };
+		const ops: PatchOp[] = [
+			{ t: "splice", path: ["series"], start: 0, delete: 1, items: [] },
+			{ t: "splice", path: ["series"], start: 1, delete: 0, items: [[2, 3]] },
+			{ t: "set", path: ["series", 0, 1], value: 9 },
+			{ t: "set", path: ["name"], value: "b" },
+			{ t: "del", path: ["legend"] },
+		];
+		expect(applyPatch(value, ops)).toEqual({
+			series: [
+				[1, 9],
+				[2, 3],
+			],
+			name: "b",
+		});
+	});
+
+	it("copies the containers it changes and shares the rest", () => {
+		const rows = [{ id: 1 }, { id: 2 }];
+		const value = { rows, other: { x: 1 } };
+		const result: any = applyPatch(value, [{ t: "set", path: ["rows", 0, "id"], value: 5 }]);
+		expect(value).toEqual({ rows: [{ id: 1 }, { id: 2 }], other: { x: 1 } });
+		expect(result.rows).not.toBe(rows);
+		expect(result.rows[1]).toBe(rows[1]);
+		expect(result.other).toBe(value.other);
+	});
+
+	it("patches a list at the root", () => {
+		const series = Array.from({ length: 5 }, (_, i) => i);
+		expect(
+			applyPatch(series, [{ t: "splice", path: [], start: 5, delete: 0, items: [5] }]),
+		).toEqual([0, 1, 2, 3, 4, 5]);
+	});
+
+	it("rejects patches of non-containers", () => {
+		expect(() => applyPatch(3, [{ t: "set", path: ["a"], value: 1 }])).toThrow("Cannot patch");
+	});
+});
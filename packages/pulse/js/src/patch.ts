@@ -0,0 +1,73 @@
+import type { JsonValue } from "./vdom";
+
+// Structural patches of list/dict prop values (`pulse/patches.py`). Operations
+// apply in order; containers along each path are copied once, so the previous
+// value (and anything memoized on it) is left untouched.
+
+export type PatchPath = (string | number)[];
+
+export interface PatchSplice {
+	t: "splice";
+	path: PatchPath;
+	start: number;
+	delete: number;
+	items: JsonValue[];
+}
+
+export interface PatchSet {
+	t: "set";
+	path: PatchPath;
+	value: JsonValue;
+}
+
+export interface PatchDelete {
+	t: "del";
+	path: PatchPath;
+}
+
+export type PatchOp = PatchSplice | PatchSet | PatchDelete;
+
+export function applyPatch(value: unknown, ops: PatchOp[]): unknown {
+	const root: any[] = [value];
+	const copies = new Set<unknown>();
+
+	function writable(parent: any, key: string | number): any {
+		const current = parent[key];
+		if (copies.has(current)) return current;
+		if (current === null || typeof current !== "object") {
+			throw new Error(`[Pulse] Cannot patch a ${current === null ? "null" : typeof current}`);
+		}
+		const copy = Array.isArray(current) ? current.slice() : { ...current };
+		parent[key] = copy;
+		copies.add(copy);
+		return copy;
+	}
+
+	for (const op of ops) {
+		const steps = op.t === "splice" ? op.path.length : op.path.length - 1;
+		let parent: any = root;
+		let key: string | number = 0;
+		for (let i = 0; i < steps; i++) {
+			parent = writable(parent, key);
+			key = op.path[i];
+		}
+		const target = writable(parent, key);
+		switch (op.t) {
+			case "splice": {
+				// Not `splice(start, delete, ...items)`: items may exceed the argument limit
+				const tail = target.slice(op.start + op.delete);
+				target.length = op.start;
+				for (const item of op.items) target.push(item);
+				for (const item of tail) target.push(item);
+				break;
+			}
+			case "set":
+				target[op.path[op.path.length - 1]] = op.value;
+				break;
+			case "del":
+				delete target[op.path[op.path.length - 1]];
+				break;
+		}
+	}
+	return root[0];
+}
@@ -14,6 +14,7 @@ import { type ConnectionStatus, type Directives, PulseSocketIOClient } from "./c
 import type { RouteInfo } from "./helpers";
 import type { ServerError } from "./messages";
 import { VDOMRenderer } from "./renderer";
+import type { TemplateRef, VDOMTemplate } from "./templates";
 import type { VDOM } from "./vdom";
 
 // =================================================================
@@ -33,7 +34,8 @@ export interface PulseConfig {
 }
 
 export type PulsePrerenderView = {
-	vdom: VDOM;
+	vdom: VDOM | TemplateRef;
+	templates?: VDOMTemplate[];
 };
 
 export type PulsePrerender = {
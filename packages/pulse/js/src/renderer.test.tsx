@@ -147,6 +147,34 @@ describe("VDOMRenderer", () => {
 		}
 	});
 
+	it("applies prop patches without mutating the previous value", () => {
+		const { renderer } = makeRenderer();
+		const data = [
+			[0, 1],
+			[1, 2],
+		];
+		let tree = renderer.renderNode({ tag: "div", props: { data, title: "chart" } });
+		tree = renderer.applyUpdates(tree, [
+			{
+				type: "update_props",
+				path: "",
+				data: {
+					set: { title: "live" },
+					patch: { data: [{ t: "splice", path: [], start: 2, delete: 0, items: [[2, 3]] }] },
+				},
+			},
+		]);
+		const props = (tree as React.ReactElement).props as any;
+		expect(props.title).toBe("live");
+		expect(props.data).toEqual([
+			[0, 1],
+			[1, 2],
+			[2, 3],
+		]);
+		expect(props.data[0]).toBe(data[0]);
+		expect(data).toHaveLength(2);
+	});
+
 	it("handles multiple ref channels across renderers", () => {
 		const shared = makeClient();
 		const rendererA = new VDOMRenderer(shared.client, "/a", {});
@@ -593,6 +621,42 @@ describe("VDOMRenderer", () => {
 		expect(invokeCallback).toHaveBeenCalledWith("/test", "1.onClick", ["from-A"]);
 	});
 
+	it("applies relative reconciliation with removals and minimal moves", () => {
+		const { renderer, invokeCallback } = makeRenderer();
+		const button = (label: string): VDOMNode => ({
+			tag: "button",
+			key: label,
+			props: { onClick: "$cb" },
+			eval: ["onClick"],
+			children: [label],
+		});
+		let tree = renderer.renderNode({
+			tag: "div",
+			children: ["A", "B", "C", "D", "E"].map(button),
+		});
+
+		// A B C D E -> E A B D X: C removed, E moved to the front, X inserted.
+		tree = renderer.applyUpdates(tree, [
+			{
+				type: "reconciliation",
+				path: "",
+				N: 5,
+				new: [[4], [button("X")]],
+				reuse: [[0], [4]],
+				removed: [2],
+			},
+		]);
+
+		const kids = childrenArray(tree as React.ReactElement) as React.ReactElement[];
+		expect(kids.map((k) => k.key)).toEqual(["E", "A", "B", "D", "X"]);
+
+		// Shifted stable children are rebound to their new paths.
+		(kids[3].props as any).onClick("from-D");
+		expect(invokeCallback).toHaveBeenCalledWith("/test", "3.onClick", ["from-D"]);
+		(kids[1].props as any).onClick("from-A");
+		expect(invokeCallback).toHaveBeenCalledWith("/test", "1.onClick", ["from-A"]);
+	});
+
 	it("clears children when reconciliation N=0", () => {
 		const { renderer } = makeRenderer();
 		const initialVDOM: VDOMNode = {
@@ -9,8 +9,10 @@ import {
 } from "react";
 import type { PulseSocketIOClient } from "./client";
 import type { PulsePrerenderView } from "./pulse";
+import { applyPatch } from "./patch";
 import { isPulseRefSpec, RefRegistry } from "./ref";
 import { extractEvent } from "./serialize/events";
+import { expandTemplates } from "./templates";
 import type {
 	ComponentRegistry,
 	JsonValue,
@@ -460,8 +462,9 @@ export class VDOMRenderer {
 		return null;
 	}
 
-	init(view: PulsePrerenderView & { vdom: VDOM }): ReactNode {
-		return this.renderNode(view.vdom);
+	init(view: PulsePrerenderView): ReactNode {
+		const vdom = view.templates ? expandTemplates(view.vdom, view.templates) : view.vdom;
+		return this.renderNode(vdom as VDOM);
 	}
 
 	dispose(): void {
@@ -618,6 +621,11 @@ export class VDOMRenderer {
 								}
 							}
 						}
+						if (update.data.patch) {
+							for (const [k, ops] of Object.entries(update.data.patch)) {
+								nextProps[k] = applyPatch(nextProps[k], ops);
+							}
+						}
 						meta.eval = nextEval;
 						meta.path = path;
 
@@ -653,15 +661,23 @@ export class VDOMRenderer {
 						const newIndexSet = new Set(newIndices);
 						const reuseIndexSet = new Set(reuseIndices);
 						const reuseSourceSet = new Set(reuseSources);
+						// Relative mode: children that were neither removed nor moved
+						// keep their order and fill the remaining slots.
+						const removedSet = update.removed ? new Set(update.removed) : undefined;
+						const stable: number[] = [];
 						for (let i = 0; i < prevChildren.length; i += 1) {
-							const reused =
-								reuseSourceSet.has(i) ||
-								(i < update.N && !newIndexSet.has(i) && !reuseIndexSet.has(i));
+							const reused = removedSet
+								? !removedSet.has(i)
+								: reuseSourceSet.has(i) ||
+									(i < update.N && !newIndexSet.has(i) && !reuseIndexSet.has(i));
 							if (!reused) {
 								const childPath = path ? `${path}.${i}` : String(i);
 								this.#dropCallbacksInSubtree(prevChildren[i], childPath);
+							} else if (removedSet && !reuseSourceSet.has(i)) {
+								stable.push(i);
 							}
 						}
+						let stableIdx = 0;
 
 						let nextNew = -1,
 							nextReuse = -1,
@@ -690,6 +706,14 @@ export class VDOMRenderer {
 								src = this.#rebindCallbacksInSubtree(src, childPath);
 								nextChildren.push(src);
 								nextReuse = reuseIdx < reuseIndices.length - 1 ? reuseIndices[++reuseIdx]! : -1;
+							} else if (removedSet) {
+								const srcIdx = stable[stableIdx++]!;
+								let src = prevChildren[srcIdx];
+								if (srcIdx !== i) {
+									const childPath = path ? `${path}.${i}` : String(i);
+									src = this.#rebindCallbacksInSubtree(src, childPath);
+								}
+								nextChildren.push(src);
 							} else {
 								nextChildren.push(prevChildren[i]);
 							}
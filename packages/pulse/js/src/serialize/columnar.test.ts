@@ -0,0 +1,66 @@
+import { describe, expect, it } from "bun:test";
+import { rowsFromColumns, typedArray } from "./columnar";
+import { decodeMsgpack } from "./msgpack";
+import { deserialize, type Serialized } from "./serializer";
+
+// Generated with pulse.serializer.serialize / pulse.wire.encode_msgpack:
+//   a = np.arange(6, dtype=np.int16).reshape(2, 3)
+//   df = pd.DataFrame({"x": np.array([0.5, 1.5], dtype=np.float32), "name": ["a", None]})
+//   data = {"a": a, "same": a, "df": df, "s": pd.Series([1, 2], dtype="uint8"),
+//           "z": np.array(7, dtype=np.int32)}
+const JSON_FIXTURE = [
+	[[2], [], [], [], [1, 3, 8, 12, 13]],
+	{
+		a: { dtype: "int16", shape: [2, 3], data: "AAABAAIAAwAEAAUA" },
+		same: 1,
+		df: {
+			columns: ["x", "name"],
+			data: [{ dtype: "float32", shape: [2], data: "AAAAPwAAwD8=" }, ["a", null]],
+		},
+		s: { dtype: "uint8", shape: [2], data: "AQI=" },
+		z: { dtype: "int32", shape: [], data: "BwAAAA==" },
+	},
+] as Serialized;
+
+const MSGPACK_FIXTURE = new Uint8Array([
+	133, 161, 97, 199, 22, 4, 2, 2, 0, 0, 0, 2, 0, 0, 0, 3, 0, 0, 1, 0, 2, 0, 3, 0, 4, 0, 5, 0, 164,
+	115, 97, 109, 101, 214, 3, 0, 0, 0, 1, 162, 100, 102, 199, 31, 5, 146, 146, 161, 120, 164, 110,
+	97, 109, 101, 146, 199, 14, 4, 6, 1, 0, 0, 0, 2, 0, 0, 0, 63, 0, 0, 192, 63, 146, 161, 97, 192,
+	161, 115, 215, 4, 1, 1, 0, 0, 0, 2, 1, 2, 161, 122, 199, 6, 4, 4, 0, 7, 0, 0, 0,
+]);
+
+function checkDecoded(data: any) {
+	expect(data.a).toEqual([new Int16Array([0, 1, 2]), new Int16Array([3, 4, 5])]);
+	expect(data.same).toBe(data.a);
+	expect(data.df).toEqual([
+		{ x: 0.5, name: "a" },
+		{ x: 1.5, name: undefined },
+	]);
+	expect(data.s).toEqual(new Uint8Array([1, 2]));
+	expect(data.z).toBe(7);
+}
+
+describe("columnar arrays", () => {
+	it("decodes arrays and DataFrames from the JSON form", () => {
+		checkDecoded(deserialize(JSON_FIXTURE, { coerceNullsToUndefined: true }));
+	});
+
+	it("decodes arrays and DataFrames from MessagePack", () => {
+		checkDecoded(decodeMsgpack(MSGPACK_FIXTURE, { coerceNullsToUndefined: true }));
+	});
+
+	it("views unaligned data as typed arrays", () => {
+		const bytes = new Uint8Array([0, 0, 0, 0, 0, 0, 0xf0, 0x3f, 0]);
+		expect(typedArray("float64", [1], bytes.subarray(0, 8))).toEqual(new Float64Array([1]));
+		expect(typedArray("float32", [0], new Uint8Array())).toEqual(new Float32Array());
+		expect(() => typedArray("complex128", [1], bytes)).toThrow("Unsupported array dtype");
+	});
+
+	it("builds rows from columns", () => {
+		expect(rowsFromColumns(["x", "y"], [new Float64Array([1, 2]), ["a", "b"]])).toEqual([
+			{ x: 1, y: "a" },
+			{ x: 2, y: "b" },
+		]);
+		expect(rowsFromColumns([], [])).toEqual([]);
+	});
+});
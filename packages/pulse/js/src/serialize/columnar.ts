@@ -0,0 +1,96 @@
+// Columnar payloads for NumPy arrays and pandas DataFrames/Series
+// (`pulse/columnar.py`). Buffers are little-endian, like every platform
+// browsers run on, so they're viewed as typed arrays directly.
+
+// Order matters: the MessagePack array extension refers to dtypes by index
+export const ARRAY_DTYPES = [
+	"int8",
+	"uint8",
+	"int16",
+	"uint16",
+	"int32",
+	"uint32",
+	"float32",
+	"float64",
+] as const;
+
+export type ArrayDtype = (typeof ARRAY_DTYPES)[number];
+
+export type NumericArray =
+	| Int8Array
+	| Uint8Array
+	| Int16Array
+	| Uint16Array
+	| Int32Array
+	| Uint32Array
+	| Float32Array
+	| Float64Array;
+
+const TYPED_ARRAYS: Record<ArrayDtype, new (buffer: ArrayBuffer) => NumericArray> = {
+	int8: Int8Array,
+	uint8: Uint8Array,
+	int16: Int16Array,
+	uint16: Uint16Array,
+	int32: Int32Array,
+	uint32: Uint32Array,
+	float32: Float32Array,
+	float64: Float64Array,
+};
+
+/**
+ * View array data as a typed array. More than one dimension gives nested
+ * arrays of typed rows sharing the same buffer; no dimension gives the value.
+ */
+export function typedArray(dtype: string, shape: number[], bytes: Uint8Array): any {
+	const TypedArray = TYPED_ARRAYS[dtype as ArrayDtype];
+	if (!TypedArray) {
+		throw new Error(`Unsupported array dtype: ${dtype}`);
+	}
+	// Copy so the data starts at an aligned offset of its own buffer
+	const flat = new TypedArray(bytes.slice().buffer);
+	if (shape.length === 0) {
+		return flat[0];
+	}
+	return reshape(flat, shape, 0);
+}
+
+function reshape(flat: NumericArray, shape: number[], dim: number): any {
+	if (dim === shape.length - 1) {
+		return flat;
+	}
+	let size = 1;
+	for (let i = dim + 1; i < shape.length; i++) {
+		size *= shape[i];
+	}
+	const rows = new Array(shape[dim]);
+	for (let i = 0; i < rows.length; i++) {
+		rows[i] = reshape(flat.subarray(i * size, (i + 1) * size), shape, dim + 1);
+	}
+	return rows;
+}
+
+/** Rebuild DataFrame rows from its columns. */
+export function rowsFromColumns(
+	columns: string[],
+	data: ArrayLike<unknown>[],
+): Record<string, unknown>[] {
+	const length = data.length > 0 ? data[0].length : 0;
+	const rows = new Array(length);
+	for (let i = 0; i < length; i++) {
+		const row: Record<string, unknown> = {};
+		for (let c = 0; c < columns.length; c++) {
+			row[columns[c]] = data[c][i];
+		}
+		rows[i] = row;
+	}
+	return rows;
+}
+
+export function base64ToBytes(value: string): Uint8Array {
+	const binary = atob(value);
+	const bytes = new Uint8Array(binary.length);
+	for (let i = 0; i < binary.length; i++) {
+		bytes[i] = binary.charCodeAt(i);
+	}
+	return bytes;
+}
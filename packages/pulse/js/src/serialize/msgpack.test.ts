@@ -0,0 +1,70 @@
+import { describe, expect, it } from "bun:test";
+import { decodeMsgpack, isBinaryPayload } from "./msgpack";
+
+// Generated with pulse.wire.encode_msgpack:
+//   s = {"k": 1}
+//   root = {"a": [1, -5, 300, -300, 70000, 2**40, -(2**40), 1.5, "hi", None, True, False],
+//           "day": date(2024, 3, 5), "when": datetime(2024, 3, 5, 10, 20, 30, 456000, UTC),
+//           "tags": {"x"}, "s1": s, "s2": s, "raw": b"\x01\x02",
+//           "old": datetime(1900, 1, 1, tzinfo=UTC)}
+//   root["self"] = root
+const FIXTURE = new Uint8Array([
+	137, 161, 97, 156, 1, 251, 205, 1, 44, 209, 254, 212, 206, 0, 1, 17, 112, 207, 0, 0, 1, 0, 0, 0,
+	0, 0, 211, 255, 255, 255, 0, 0, 0, 0, 0, 203, 63, 248, 0, 0, 0, 0, 0, 0, 162, 104, 105, 192, 195,
+	194, 163, 100, 97, 121, 214, 1, 0, 0, 77, 75, 164, 119, 104, 101, 110, 215, 255, 108, 184, 8, 0,
+	101, 230, 241, 238, 164, 116, 97, 103, 115, 199, 3, 2, 145, 161, 120, 162, 115, 49, 129, 161,
+	107, 1, 162, 115, 50, 214, 3, 0, 0, 0, 5, 163, 114, 97, 119, 196, 2, 1, 2, 163, 111, 108, 100,
+	199, 12, 255, 0, 0, 0, 0, 255, 255, 255, 255, 124, 85, 129, 128, 164, 115, 101, 108, 102, 214, 3,
+	0, 0, 0, 0,
+]);
+
+describe("msgpack wire format", () => {
+	it("decodes primitives, dates, sets, bytes and shared refs", () => {
+		const root = decodeMsgpack(FIXTURE);
+		expect(root.a).toEqual([
+			1,
+			-5,
+			300,
+			-300,
+			70000,
+			2 ** 40,
+			-(2 ** 40),
+			1.5,
+			"hi",
+			null,
+			true,
+			false,
+		]);
+		expect(root.day).toEqual(new Date(Date.UTC(2024, 2, 5)));
+		expect(root.when).toEqual(new Date("2024-03-05T10:20:30.456Z"));
+		expect(root.old).toEqual(new Date("1900-01-01T00:00:00.000Z"));
+		expect(root.tags).toEqual(new Set(["x"]));
+		expect(root.raw).toEqual(new Uint8Array([1, 2]));
+		expect(root.s1).toEqual({ k: 1 });
+		expect(root.s2).toBe(root.s1);
+		expect(root.self).toBe(root);
+	});
+
+	it("coerces nulls to undefined with the option", () => {
+		const root = decodeMsgpack(FIXTURE, { coerceNullsToUndefined: true });
+		expect(root.a[9]).toBeUndefined();
+	});
+
+	it("accepts an ArrayBuffer or a view into a larger buffer", () => {
+		const padded = new Uint8Array(FIXTURE.length + 4);
+		padded.set(FIXTURE, 2);
+		expect(decodeMsgpack(padded.subarray(2, 2 + FIXTURE.length)).s1).toEqual({ k: 1 });
+		expect(decodeMsgpack(new Uint8Array([0x91, 0x07]).buffer)).toEqual([7]);
+	});
+
+	it("rejects truncated and trailing bytes", () => {
+		expect(() => decodeMsgpack(FIXTURE.subarray(0, 20))).toThrow("Truncated");
+		expect(() => decodeMsgpack(new Uint8Array([0x01, 0x02]))).toThrow("Trailing");
+	});
+
+	it("detects binary payloads", () => {
+		expect(isBinaryPayload(FIXTURE)).toBe(true);
+		expect(isBinaryPayload(FIXTURE.buffer)).toBe(true);
+		expect(isBinaryPayload([[[], [], [], []], {}])).toBe(false);
+	});
+});
@@ -0,0 +1,266 @@
+import { ARRAY_DTYPES, rowsFromColumns, typedArray } from "./columnar";
+import type { DeserializationOptions } from "./serializer";
+
+// MessagePack decoder for the binary wire format (`pulse/wire.py`). Carries the
+// same values as `deserialize` with no metadata header; dates, sets and shared
+// references are extension types, as are NumPy arrays and DataFrames. Maps,
+// arrays, sets, dates, array buffers and DataFrames are numbered in the order
+// they start, which is what reference extensions point back to.
+
+const EXT_TIMESTAMP = -1;
+const EXT_DATE = 1;
+const EXT_SET = 2;
+const EXT_REF = 3;
+const EXT_ARRAY = 4;
+const EXT_FRAME = 5;
+
+const MS_PER_DAY = 86_400_000;
+
+const textDecoder = new TextDecoder();
+
+export function decodeMsgpack<Data = any>(
+	data: ArrayBuffer | ArrayBufferView,
+	options?: DeserializationOptions,
+): Data {
+	const bytes = ArrayBuffer.isView(data)
+		? new Uint8Array(data.buffer, data.byteOffset, data.byteLength)
+		: new Uint8Array(data);
+	const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+	const coerceNulls = options?.coerceNullsToUndefined ?? false;
+	const objects: any[] = [];
+	let pos = 0;
+
+	function need(n: number): number {
+		const start = pos;
+		if (start + n > bytes.length) {
+			throw new Error("Truncated MessagePack payload");
+		}
+		pos += n;
+		return start;
+	}
+
+	function str(n: number): string {
+		const start = need(n);
+		return textDecoder.decode(bytes.subarray(start, start + n));
+	}
+
+	function uint(n: 1 | 2 | 4 | 8): number {
+		const start = need(n);
+		switch (n) {
+			case 1:
+				return view.getUint8(start);
+			case 2:
+				return view.getUint16(start);
+			case 4:
+				return view.getUint32(start);
+			default:
+				return Number(view.getBigUint64(start));
+		}
+	}
+
+	function int(n: 1 | 2 | 4 | 8): number {
+		const start = need(n);
+		switch (n) {
+			case 1:
+				return view.getInt8(start);
+			case 2:
+				return view.getInt16(start);
+			case 4:
+				return view.getInt32(start);
+			default:
+				return Number(view.getBigInt64(start));
+		}
+	}
+
+	function array(n: number): any[] {
+		const result = new Array(n);
+		objects.push(result);
+		for (let i = 0; i < n; i++) {
+			result[i] = read();
+		}
+		return result;
+	}
+
+	function map(n: number): Record<string, any> {
+		const result: Record<string, any> = {};
+		objects.push(result);
+		for (let i = 0; i < n; i++) {
+			const key = read();
+			if (typeof key !== "string") {
+				throw new Error("Map keys must be strings");
+			}
+			result[key] = read();
+		}
+		return result;
+	}
+
+	function ext(size: number): any {
+		const code = int(1);
+		switch (code) {
+			case EXT_REF: {
+				const idx = uint(4);
+				if (idx >= objects.length) {
+					throw new Error(`Dangling reference to index ${idx}`);
+				}
+				return objects[idx];
+			}
+			case EXT_SET: {
+				const result = new Set();
+				objects.push(result);
+				const byte = uint(1);
+				const n =
+					byte >= 0x90 && byte <= 0x9f
+						? byte & 0x0f
+						: byte === 0xdc
+							? uint(2)
+							: byte === 0xdd
+								? uint(4)
+								: -1;
+				if (n < 0) {
+					throw new Error("Set payload must be an array");
+				}
+				for (let i = 0; i < n; i++) {
+					result.add(read());
+				}
+				return result;
+			}
+			case EXT_ARRAY: {
+				const dtype = ARRAY_DTYPES[uint(1)];
+				const shape = new Array<number>(uint(1));
+				for (let i = 0; i < shape.length; i++) {
+					shape[i] = uint(4);
+				}
+				const n = size - 2 - 4 * shape.length;
+				const start = need(n);
+				const result = typedArray(dtype, shape, bytes.subarray(start, start + n));
+				objects.push(result);
+				return result;
+			}
+			case EXT_FRAME: {
+				const slot = objects.length;
+				objects.push(undefined);
+				if (uint(1) !== 0x92) {
+					throw new Error("DataFrame payload must be a 2-item array");
+				}
+				const columns = read();
+				const rows = rowsFromColumns(columns, read());
+				objects[slot] = rows;
+				return rows;
+			}
+			case EXT_DATE: {
+				const date = new Date(int(4) * MS_PER_DAY);
+				objects.push(date);
+				return date;
+			}
+			case EXT_TIMESTAMP: {
+				let seconds: number;
+				let nanos: number;
+				if (size === 8) {
+					const hi = uint(4);
+					const lo = uint(4);
+					nanos = hi >>> 2;
+					seconds = (hi & 0x3) * 0x100000000 + lo;
+				} else if (size === 12) {
+					nanos = uint(4);
+					seconds = int(8);
+				} else {
+					throw new Error(`Unsupported timestamp size ${size}`);
+				}
+				const date = new Date(seconds * 1000 + Math.floor(nanos / 1_000_000));
+				objects.push(date);
+				return date;
+			}
+			default:
+				throw new Error(`Unsupported MessagePack extension type ${code}`);
+		}
+	}
+
+	function nil(): null | undefined {
+		return coerceNulls ? undefined : null;
+	}
+
+	function read(): any {
+		const byte = uint(1);
+		if (byte <= 0x7f) return byte;
+		if (byte >= 0xe0) return byte - 0x100;
+		if (byte >= 0xa0 && byte <= 0xbf) return str(byte & 0x1f);
+		if (byte >= 0x90 && byte <= 0x9f) return array(byte & 0x0f);
+		if (byte >= 0x80 && byte <= 0x8f) return map(byte & 0x0f);
+		switch (byte) {
+			case 0xc0:
+				return nil();
+			case 0xc2:
+				return false;
+			case 0xc3:
+				return true;
+			case 0xc4:
+			case 0xc5:
+			case 0xc6: {
+				const n = uint(byte === 0xc4 ? 1 : byte === 0xc5 ? 2 : 4);
+				const start = need(n);
+				return bytes.slice(start, start + n);
+			}
+			case 0xc7:
+				return ext(uint(1));
+			case 0xc8:
+				return ext(uint(2));
+			case 0xc9:
+				return ext(uint(4));
+			case 0xca:
+				return view.getFloat32(need(4));
+			case 0xcb:
+				return view.getFloat64(need(8));
+			case 0xcc:
+				return uint(1);
+			case 0xcd:
+				return uint(2);
+			case 0xce:
+				return uint(4);
+			case 0xcf:
+				return uint(8);
+			case 0xd0:
+				return int(1);
+			case 0xd1:
+				return int(2);
+			case 0xd2:
+				return int(4);
+			case 0xd3:
+				return int(8);
+			case 0xd4:
+				return ext(1);
+			case 0xd5:
+				return ext(2);
+			case 0xd6:
+				return ext(4);
+			case 0xd7:
+				return ext(8);
+			case 0xd8:
+				return ext(16);
+			case 0xd9:
+				return str(uint(1));
+			case 0xda:
+				return str(uint(2));
+			case 0xdb:
+				return str(uint(4));
+			case 0xdc:
+				return array(uint(2));
+			case 0xdd:
+				return array(uint(4));
+			case 0xde:
+				return map(uint(2));
+			case 0xdf:
+				return map(uint(4));
+		}
+		throw new Error(`Invalid MessagePack byte 0x${byte.toString(16)}`);
+	}
+
+	const result = read();
+	if (pos !== bytes.length) {
+		throw new Error("Trailing bytes after MessagePack payload");
+	}
+	return result;
+}
+
+export function isBinaryPayload(data: unknown): data is ArrayBuffer | ArrayBufferView {
+	return data instanceof ArrayBuffer || ArrayBuffer.isView(data);
+}
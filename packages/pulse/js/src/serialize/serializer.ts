@@ -1,9 +1,12 @@
+import { base64ToBytes, rowsFromColumns, typedArray } from "./columnar";
+
 export type Primitive = number | string | boolean | null | undefined;
 export type JSON<T> = T | Array<JSON<T>> | { [K: string]: JSON<T> };
 export type PlainJSON = JSON<Primitive>;
 export type Serializable = any;
 
-export type Serialized = [[number[], number[], number[], number[]], PlainJSON];
+// refs, dates, sets, maps and, only from the server, columnar arrays
+export type Serialized = [[number[], number[], number[], number[], number[]?], PlainJSON];
 
 function isDomNode(value: object): boolean {
 	if (typeof Node !== "undefined" && value instanceof Node) {
@@ -212,12 +215,13 @@ export function deserialize<Data extends Serializable = Serializable>(
 	payload: Serialized,
 	options?: DeserializationOptions,
 ): Data {
-	const [[refsA, datesA, setsA, mapsA], data] = payload;
+	const [[refsA, datesA, setsA, mapsA, arraysA], data] = payload;
 
 	const refs = new Set(refsA);
 	const dates = new Set(datesA);
 	const sets = new Set(setsA);
 	const maps = new Set(mapsA);
+	const arrays = new Set(arraysA);
 
 	const objects = new Map<number, any>();
 	let globalIndex = 0;
@@ -253,6 +257,19 @@ export function deserialize<Data extends Serializable = Serializable>(
 			return dt;
 		}
 
+		if (arrays.has(idx)) {
+			const columnar = value as Record<string, any>;
+			if ("columns" in columnar) {
+				const columns = reconstruct(columnar.columns);
+				const rows = rowsFromColumns(columns, reconstruct(columnar.data));
+				objects.set(idx, rows);
+				return rows;
+			}
+			const array = typedArray(columnar.dtype, columnar.shape, base64ToBytes(columnar.data));
+			objects.set(idx, array);
+			return array;
+		}
+
 		if (
 			value == null ||
 			typeof value === "number" ||
@@ -0,0 +1,74 @@
+import { describe, expect, it } from "bun:test";
+import { expandTemplates, type TemplateRef, type VDOMTemplate } from "./templates";
+import type { VDOM } from "./vdom";
+
+// Generated with pulse.templates.extract_templates from 3 rows of
+//   {"tag": "tr", "key": f"row-{i}", "props": {"className": "row", "data-index": i},
+//    "children": [{"tag": "td", "children": [f"n{i}"]},
+//                 {"tag": "td", "children": [{"tag": "button", "props": {"onClick": "$cb"},
+//                                             "eval": ["onClick"]}, "Edit"]}]}
+const TEMPLATES: VDOMTemplate[] = [
+	{
+		tag: "tr",
+		keyed: true,
+		props: { className: "row" },
+		children: [
+			{ tag: "td", children: [null], slots: [0] },
+			{
+				tag: "td",
+				children: [{ tag: "button", props: { onClick: "$cb" }, eval: ["onClick"] }, "Edit"],
+			},
+		],
+		slots: ["data-index"],
+	},
+];
+
+function row(i: number): VDOM {
+	return {
+		tag: "tr",
+		key: `row-${i}`,
+		props: { className: "row", "data-index": i },
+		children: [
+			{ tag: "td", children: [`n${i}`] },
+			{
+				tag: "td",
+				children: [{ tag: "button", props: { onClick: "$cb" }, eval: ["onClick"] }, "Edit"],
+			},
+		],
+	};
+}
+
+describe("expandTemplates", () => {
+	it("expands template references into elements", () => {
+		const refs: TemplateRef[] = [0, 1, 2].map((i) => ({
+			t: "tpl",
+			id: 0,
+			slots: [`row-${i}`, i, `n${i}`],
+		}));
+		const vdom = { tag: "table", children: refs } as unknown as VDOM;
+		expect(expandTemplates(vdom, TEMPLATES)).toEqual({
+			tag: "table",
+			children: [row(0), row(1), row(2)],
+		});
+	});
+
+	it("expands a template reference at the root", () => {
+		expect(expandTemplates({ t: "tpl", id: 0, slots: ["row-7", 7, "n7"] }, TEMPLATES)).toEqual(
+			row(7),
+		);
+	});
+
+	it("does not share mutable containers between occurrences", () => {
+		const a: any = expandTemplates({ t: "tpl", id: 0, slots: ["a", 1, "x"] }, TEMPLATES);
+		const b: any = expandTemplates({ t: "tpl", id: 0, slots: ["b", 2, "y"] }, TEMPLATES);
+		expect(a.props).not.toBe(b.props);
+		expect(a.children[0].children).not.toBe(b.children[0].children);
+		expect(TEMPLATES[0].props).toEqual({ className: "row" });
+	});
+
+	it("rejects unknown templates", () => {
+		expect(() => expandTemplates({ t: "tpl", id: 3, slots: [] }, TEMPLATES)).toThrow(
+			"Unknown template",
+		);
+	});
+});
@@ -0,0 +1,88 @@
+import type { VDOM, VDOMElement, VDOMNode, VDOMPropValue } from "./vdom";
+
+// Templates for repeated element shapes in `vdom_init` payloads
+// (`pulse/templates.py`). Each template reference is expanded back into the
+// element it stands for, taking its slot values in order: the key, then
+// props and children listed in `slots`, then the slots of each child element.
+
+export interface TemplateRef {
+	t: "tpl";
+	id: number;
+	slots: VDOMPropValue[];
+}
+
+export interface VDOMTemplate {
+	tag: string;
+	key?: string;
+	keyed?: boolean;
+	props?: Record<string, VDOMPropValue>;
+	children?: (VDOMTemplate | VDOMNode)[];
+	eval?: string[];
+	// Prop names and child indices filled in by each occurrence
+	slots?: (string | number)[];
+}
+
+function isTemplateRef(node: unknown): node is TemplateRef {
+	return typeof node === "object" && node !== null && (node as any).t === "tpl";
+}
+
+function isTemplateElement(node: unknown): node is VDOMTemplate {
+	return typeof node === "object" && node !== null && typeof (node as any).tag === "string";
+}
+
+export function expandTemplates(vdom: VDOM | TemplateRef, templates: VDOMTemplate[]): VDOM {
+	if (isTemplateRef(vdom)) {
+		const template = templates[vdom.id];
+		if (!template) {
+			throw new Error(`[Pulse] Unknown template: ${vdom.id}`);
+		}
+		const cursor = { values: vdom.slots, pos: 0 };
+		return expand(template, cursor);
+	}
+	if (!isTemplateElement(vdom) || !vdom.children) {
+		return vdom;
+	}
+	const children = vdom.children as (VDOMNode | TemplateRef)[];
+	const expanded = new Array<VDOMNode>(children.length);
+	for (let i = 0; i < children.length; i++) {
+		expanded[i] = expandTemplates(children[i], templates);
+	}
+	return { ...(vdom as VDOMElement), children: expanded };
+}
+
+function expand(
+	template: VDOMTemplate,
+	cursor: { values: VDOMPropValue[]; pos: number },
+): VDOMElement {
+	const element: VDOMElement = { tag: template.tag };
+	if (template.keyed) {
+		element.key = cursor.values[cursor.pos++] as string;
+	} else if (template.key !== undefined) {
+		element.key = template.key;
+	}
+	let props = template.props;
+	const children = template.children?.slice();
+	if (template.slots) {
+		for (const slot of template.slots) {
+			const value = cursor.values[cursor.pos++];
+			if (typeof slot === "string") {
+				if (props === template.props) props = { ...template.props };
+				props![slot] = value;
+			} else {
+				children![slot] = value as VDOMNode;
+			}
+		}
+	}
+	if (children) {
+		for (let i = 0; i < children.length; i++) {
+			const child = children[i];
+			if (isTemplateElement(child)) {
+				children[i] = expand(child, cursor);
+			}
+		}
+		element.children = children as VDOMNode[];
+	}
+	if (props) element.props = props;
+	if (template.eval) element.eval = template.eval;
+	return element;
+}
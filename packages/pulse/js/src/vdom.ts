@@ -1,3 +1,5 @@
+import type { PatchOp } from "./patch";
+
 // =============================================================================
 // VDOM (structural expressions + eval-keyed props)
 // =============================================================================
@@ -195,6 +197,8 @@ export interface UpdatePropsUpdate extends VDOMUpdateBase {
 		// - absent/undefined: keep previous
 		// - []: clear
 		eval?: string[];
+		// Structural patches of plain list/dict props, applied after `set`.
+		patch?: Record<string, PatchOp[]>;
 	};
 }
 
@@ -204,6 +208,11 @@ export interface ReconciliationUpdate {
 	N: number;
 	new: [number[], VDOM[]];
 	reuse: [number[], number[]];
+	// Relative mode: previous indices that were removed. `reuse` then only lists
+	// moved children, and every other previous child keeps its relative order,
+	// filling the slots not taken by `new` or `reuse`. Without it, indices not
+	// listed in `new`/`reuse` keep the previous child at the same index.
+	removed?: number[];
 }
 
 export type VDOMUpdate = ReplaceUpdate | UpdatePropsUpdate | ReconciliationUpdate;
@@ -47,6 +47,9 @@ from pulse.component import (
 from pulse.component import (
 	component as component,
 )
+from pulse.component import (
+	memo as memo,
+)
 
 # Built-in components
 from pulse.components.for_ import For as For
@@ -55,6 +58,10 @@ from pulse.components.if_ import If as If
 # Router components
 from pulse.components.react_router import Link as Link
 from pulse.components.react_router import Outlet as Outlet
+
+# Compression
+from pulse.compression import Compression as Compression
+from pulse.compression import CompressionStats as CompressionStats
 from pulse.context import PulseContext as PulseContext
 
 # Cookies
@@ -72,6 +79,7 @@ from pulse.debounce import (
 # Decorators
 from pulse.decorators import computed as computed
 from pulse.decorators import effect as effect
+from pulse.decorators import selector as selector
 from pulse.dom.elements import (
 	GenericHTMLElement as GenericHTMLElement,
 )
@@ -1338,6 +1346,11 @@ from pulse.middleware import (
 # Plugin
 from pulse.plugin import Plugin as Plugin
 
+# Profiling
+from pulse.profiler import ComponentProfile as ComponentProfile
+from pulse.profiler import RenderProfiler as RenderProfiler
+from pulse.profiler import RouteProfile as RouteProfile
+
 # Proxy
 from pulse.proxy import Proxy as Proxy
 from pulse.queries.client import QueryClient as QueryClient
@@ -1390,6 +1403,9 @@ from pulse.reactive import (
 from pulse.reactive import (
 	IgnoreBatch as IgnoreBatch,
 )
+from pulse.reactive import (
+	Selector as Selector,
+)
 from pulse.reactive import (
 	Signal as Signal,
 )
@@ -1410,6 +1426,9 @@ from pulse.reactive_extensions import (
 from pulse.reactive_extensions import (
 	reactive as reactive,
 )
+from pulse.reactive_extensions import (
+	shallow as shallow,
+)
 from pulse.reactive_extensions import (
 	unwrap as unwrap,
 )
@@ -1533,3 +1552,6 @@ from pulse.user_session import (
 	UserSession as UserSession,
 )
 from pulse.version import __version__ as __version__
+
+# Wire format
+from pulse.wire import WireFormat as WireFormat
@@ -26,6 +26,7 @@ from starlette.websockets import WebSocket
 
 from pulse.api_router import PulseFastAPI, PulseFrameworkAPIRoute
 from pulse.codegen.codegen import Codegen, CodegenConfig
+from pulse.compression import COMPRESSION_AUTH_KEY, Compression
 from pulse.context import PULSE_CONTEXT, PulseContext
 from pulse.cookies import (
 	Cookie,
@@ -71,6 +72,7 @@ from pulse.middleware import (
 	Redirect,
 )
 from pulse.plugin import Plugin
+from pulse.profiler import ProfileSort, RenderProfiler
 from pulse.proxy import Proxy, ReactProxy
 from pulse.render_session import RenderSession
 from pulse.request import PulseRequest
@@ -83,6 +85,12 @@ from pulse.user_session import (
 	UserSession,
 	new_sid,
 )
+from pulse.wire import (
+	WIRE_FORMATS_AUTH_KEY,
+	WireFormat,
+	encode_msgpack,
+	negotiate_wire_format,
+)
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
@@ -90,6 +98,12 @@ FRAMEWORK_API_PREFIX = "/_pulse"
 PAGE_INSTANCE_AUTH_KEY = "__pulse_page_instance_id"
 RENDER_ID_COLLISION_CODE = "render_id_collision"
 MAX_PENDING_SOCKET_MESSAGES = 100
+# Server messages carrying VDOM, serialized without tracking shared
+# references. Prop values shared between elements arrive on the client as
+# separate copies; cyclic values are detected and encoded with references.
+TREE_MESSAGES = frozenset({"vdom_init", "vdom_update"})
+# Socket event carrying every message sent to a socket in one loop iteration
+MESSAGE_BATCH_EVENT = "message_batch"
 
 
 class AppStatus(IntEnum):
@@ -255,6 +269,12 @@ class App:
 	session_timeout: float
 	connection_status: ConnectionStatusConfig
 	render_loop_limit: int
+	render_chunk_size: int | None
+	vdom_templates: bool
+	prop_patches: bool
+	profiler: RenderProfiler | None
+	wire_format: WireFormat
+	compression: Compression | None
 	prerender_queue_timeout: float
 	disconnect_queue_timeout: float
 
@@ -280,6 +300,12 @@ class App:
 		disconnect_queue_timeout: float = 300.0,
 		connection_status: ConnectionStatusConfig | None = None,
 		render_loop_limit: int = 50,
+		render_chunk_size: int | None = None,
+		vdom_templates: bool = False,
+		prop_patches: bool = False,
+		profiler: RenderProfiler | None = None,
+		wire_format: WireFormat = "json",
+		compression: Compression | None = None,
 	):
 		# Resolve mode from environment and expose on the app instance
 		self.env = envvars.pulse_env
@@ -343,6 +369,12 @@ class App:
 		self.disconnect_queue_timeout = disconnect_queue_timeout
 		self.connection_status = connection_status or ConnectionStatusConfig()
 		self.render_loop_limit = render_loop_limit
+		self.render_chunk_size = render_chunk_size
+		self.vdom_templates = vdom_templates
+		self.prop_patches = prop_patches
+		self.profiler = profiler
+		self.wire_format = wire_format
+		self.compression = compression
 
 		self.codegen = Codegen(
 			self.routes,
@@ -636,6 +668,27 @@ class App:
 		def set_cookies():  # pyright: ignore[reportUnusedFunction]
 			return {"health": "ok", "message": "Cookies updated"}
 
+		profiler = self.profiler
+		compression = self.compression
+		if self.env == "dev" and (profiler is not None or compression is not None):
+
+			@framework.get(f"{prefix}/profile")
+			def get_profile(by: ProfileSort = "self_time"):  # pyright: ignore[reportUnusedFunction]
+				snapshot: dict[str, Any] = {}
+				if profiler is not None:
+					snapshot.update(profiler.snapshot(by=by))
+				if compression is not None:
+					snapshot["compression"] = compression.snapshot()
+				return snapshot
+
+			@framework.delete(f"{prefix}/profile")
+			def reset_profile():  # pyright: ignore[reportUnusedFunction]
+				if profiler is not None:
+					profiler.reset()
+				if compression is not None:
+					compression.reset()
+				return {"ok": True}
+
 		# RouteInfo is the request body
 		@framework.post(f"{prefix}/prerender")
 		async def prerender(payload: PrerenderPayload, request: Request):  # pyright: ignore[reportUnusedFunction]
@@ -703,10 +756,9 @@ class App:
 						},
 					}
 
-					captured = render.prerender(paths, route_info)
-
-					for p in paths:
-						res = _normalize_prerender_result(captured[p])
+					# Stop rendering at the first redirect or not found
+					for p, captured in render.iter_prerender(paths, route_info):
+						res = _normalize_prerender_result(captured)
 						if isinstance(res, Ok):
 							# Aggregate results
 							result_data["views"][p] = res.payload
@@ -740,7 +792,10 @@ class App:
 
 			# Handle Ok result - serialize the payload (PrerenderResultData)
 			if isinstance(result, Ok):
-				resp = JSONResponse(serialize(result.payload))
+				# Views and directives are plain trees
+				resp = JSONResponse(serialize(result.payload, track_refs=False))
+				if self.compression is not None:
+					self.compression.compress_response(request, resp)
 				await session.handle_response(resp)
 				return resp
 
@@ -759,7 +814,10 @@ class App:
 			if not render:
 				raise HTTPException(status_code=410, detail="Render session expired")
 
-			return await render.forms.handle_submit(form_id, request, session)
+			response = await render.forms.handle_submit(form_id, request, session)
+			if self.compression is not None:
+				self.compression.compress_response(request, response)
+			return response
 
 		self.fastapi.include_router(framework)
 
@@ -904,11 +962,41 @@ class App:
 							self.close_session_if_inactive(session.sid)
 						raise ConnectionRefusedError("Socket connection denied")
 
+					wire_format = negotiate_wire_format(
+						auth.get(WIRE_FORMATS_AUTH_KEY) if auth else None,
+						self.wire_format,
+					)
+					compression = self.compression
+					if compression is not None and not compression.accepts_socket(
+						auth.get(COMPRESSION_AUTH_KEY) if auth else None
+					):
+						compression = None
+
+					# Messages are encoded as they're sent and emitted together at
+					# the next loop iteration, so a batch flush that updates many
+					# mounts and channels goes out as a single frame.
+					outbox: list[Any] = []
+
+					async def flush_outbox():
+						batch = outbox[:]
+						del outbox[: len(batch)]
+						if len(batch) == 1:
+							await self.sio.emit("message", batch[0], to=sid)
+						elif batch:
+							await self.sio.emit(MESSAGE_BATCH_EVENT, batch, to=sid)
+
 					def on_message(message: ServerMessage):
-						payload = list(serialize(message))
-						self._tasks.create_task(
-							self.sio.emit("message", payload, to=sid)
-						)
+						track_refs = message["type"] not in TREE_MESSAGES
+						payload: Any
+						if wire_format == "msgpack":
+							payload = encode_msgpack(message, track_refs=track_refs)
+						else:
+							payload = list(serialize(message, track_refs=track_refs))
+						if compression is not None:
+							payload = compression.compress_message(payload)
+						outbox.append(payload)
+						if len(outbox) == 1:
+							self._tasks.create_task(flush_outbox())
 
 					old_sid = self._render_to_socket.get(rid)
 					if old_sid is not None and old_sid != sid:
@@ -1255,6 +1343,10 @@ class App:
 			dev_strict_mode_detach_timeout=0.1 if self.env == "dev" else 0.0,
 			disconnect_queue_timeout=self.disconnect_queue_timeout,
 			render_loop_limit=self.render_loop_limit,
+			render_chunk_size=self.render_chunk_size,
+			vdom_templates=self.vdom_templates,
+			prop_patches=self.prop_patches,
+			profiler=self.profiler,
 		)
 		self.render_sessions[rid] = render
 		self._render_to_user[rid] = session.sid
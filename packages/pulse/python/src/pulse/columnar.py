@@ -0,0 +1,154 @@
+"""Columnar encoding of NumPy arrays and pandas DataFrames/Series.
+
+NumPy and pandas are optional: they're looked up in ``sys.modules`` instead of
+imported, since a value can only be one of their types once the library has
+been imported by the app.
+
+Numeric arrays are sent as raw little-endian buffers::
+
+    {"dtype": "float64", "shape": [100000], "data": <bytes>}
+
+which the client turns into typed arrays (nested arrays of typed rows for
+more than one dimension). ``int64``/``uint64`` data is sent as ``float64``,
+like any JS number, and ``float16`` as ``float32``. Arrays of other dtypes
+(bool, strings, datetimes, objects) are sent as plain lists.
+
+Unlike float values elsewhere in a payload, NaN stays NaN inside a buffer
+instead of becoming None. Infinity is rejected, as it is elsewhere.
+
+A DataFrame is sent as its columns, each one an array as above or a plain
+list, and the client rebuilds the rows::
+
+    {"columns": ["x", "y"], "data": [<column x>, <column y>]}
+
+A Series is sent as its values; indexes are not sent. The serializer marks
+both payloads in its ``arrays`` metadata list.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+# Buffer dtypes -> little-endian NumPy type codes
+BUFFER_DTYPES = {
+	"int8": "|i1",
+	"uint8": "|u1",
+	"int16": "<i2",
+	"uint16": "<u2",
+	"int32": "<i4",
+	"uint32": "<u4",
+	"float32": "<f4",
+	"float64": "<f8",
+}
+# Buffer dtypes -> `array` type codes, for decoding without NumPy
+_ARRAY_CODES = {
+	"int8": "b",
+	"uint8": "B",
+	"int16": "h",
+	"uint16": "H",
+	"int32": "i",
+	"uint32": "I",
+	"float32": "f",
+	"float64": "d",
+}
+_WIDENED_DTYPES = {"int64": "float64", "uint64": "float64", "float16": "float32"}
+
+
+@dataclass(slots=True)
+class ColumnBuffer:
+	"""A numeric array, as a little-endian buffer."""
+
+	dtype: str
+	shape: list[int]
+	data: bytes
+
+
+@dataclass(slots=True)
+class ColumnFrame:
+	"""A DataFrame, as its column names and columns."""
+
+	columns: list[str]
+	data: list[ColumnBuffer | list[Any]]
+
+
+def encode_columnar(value: Any) -> ColumnBuffer | ColumnFrame | list[Any] | None:
+	"""Columnar form of a NumPy/pandas value, or None for any other value.
+
+	Arrays and Series that can't be sent as a buffer come back as a list of
+	their items.
+	"""
+	np = sys.modules.get("numpy")
+	if np is not None and isinstance(value, np.ndarray):
+		return _encode_array(value)
+	pd = sys.modules.get("pandas")
+	if pd is not None:
+		if isinstance(value, pd.Series):
+			return _encode_series(value)
+		if isinstance(value, pd.DataFrame):
+			return ColumnFrame(
+				columns=[str(name) for name in value.columns],
+				data=[_encode_series(value.iloc[:, i]) for i in range(value.shape[1])],
+			)
+	return None
+
+
+def _encode_series(series: Any) -> ColumnBuffer | list[Any]:
+	values = series.to_numpy()
+	if _buffer_dtype(values) is None:
+		# Nullable, object and datetime columns; missing values become None
+		return series.astype(object).where(series.notna(), None).tolist()
+	return _encode_array(values)
+
+
+def _encode_array(value: Any) -> ColumnBuffer | list[Any]:
+	dtype = _buffer_dtype(value)
+	if dtype is None:
+		if value.dtype.kind == "M":
+			# Nanosecond datetimes would come out as ints
+			value = value.astype("datetime64[ms]")
+		return value.tolist()
+	if value.dtype.kind == "f" and sys.modules["numpy"].isinf(value).any():
+		raise ValueError(
+			"Cannot serialize an array containing Infinity. "
+			+ "Replace it with NaN or a sentinel value."
+		)
+	return ColumnBuffer(
+		dtype=dtype,
+		shape=list(value.shape),
+		data=value.astype(BUFFER_DTYPES[dtype], copy=False).tobytes(),
+	)
+
+
+def _buffer_dtype(value: Any) -> str | None:
+	name = value.dtype.name
+	name = _WIDENED_DTYPES.get(name, name)
+	return name if name in BUFFER_DTYPES else None
+
+
+def decode_array(dtype: str, shape: list[int], data: bytes) -> Any:
+	"""Rebuild a buffer payload as (nested) lists, without NumPy."""
+	items = array.array(_ARRAY_CODES[dtype])
+	items.frombytes(data)
+	if sys.byteorder == "big":
+		items.byteswap()
+	if not shape:
+		return items[0]
+	return _reshape(items.tolist(), shape)
+
+
+def _reshape(values: list[Any], shape: list[int]) -> list[Any]:
+	if len(shape) == 1:
+		return values
+	size = math.prod(shape[1:])
+	return [
+		_reshape(values[i * size : (i + 1) * size], shape[1:]) for i in range(shape[0])
+	]
+
+
+def rows_from_columns(columns: list[str], data: list[Any]) -> list[dict[str, Any]]:
+	"""Rebuild DataFrame rows from decoded columns."""
+	return [dict(zip(columns, row, strict=True)) for row in zip(*data, strict=True)]
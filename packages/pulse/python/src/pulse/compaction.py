@@ -0,0 +1,381 @@
+"""Compaction of VDOM update operations.
+
+A list of operations is applied by the client in order, each path resolved
+against the tree left by the operations before it. `compact_operations`
+rewrites such a list into a shorter one with the same end result:
+
+- operations inside a subtree that is later replaced are dropped;
+- operations on a subtree that was replaced earlier in the list are folded
+  into the replacement's VDOM;
+- `update_props` operations on the same element are merged into one delta;
+- consecutive reconciliations of the same children are composed into one.
+
+Operations are only combined across operations on unrelated paths (neither
+an ancestor nor a descendant), which the client applies independently.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from pulse.patches import apply_patch
+from pulse.renderer import longest_increasing_subsequence
+from pulse.transpiler.vdom import (
+	VDOM,
+	ReconciliationOperation,
+	ReplaceOperation,
+	UpdatePropsDelta,
+	UpdatePropsOperation,
+	VDOMOperation,
+)
+
+Segments = tuple[str, ...]
+
+# Where a child of a reconciled list comes from: ("new", vdom) or ("old", index)
+ChildSource = tuple[str, Any]
+
+
+def compact_operations(operations: list[VDOMOperation]) -> list[VDOMOperation]:
+	"""Return an equivalent, usually shorter, list of operations."""
+	if len(operations) < 2:
+		return operations
+	out: list[tuple[Segments, VDOMOperation]] = []
+	for op in operations:
+		segments = split_path(op["path"])
+		if op["type"] == "replace":
+			_drop_shadowed(out, segments)
+		if not _combine(out, segments, op):
+			out.append((segments, op))
+	if len(out) == len(operations):
+		return operations
+	return [op for _, op in out]
+
+
+def split_path(path: str) -> Segments:
+	return tuple(path.split(".")) if path else ()
+
+
+def _is_prefix(prefix: Segments, path: Segments) -> bool:
+	return len(prefix) <= len(path) and path[: len(prefix)] == prefix
+
+
+def _related(a: Segments, b: Segments) -> bool:
+	return _is_prefix(a, b) or _is_prefix(b, a)
+
+
+def _drop_shadowed(out: list[tuple[Segments, VDOMOperation]], path: Segments) -> None:
+	"""Drop earlier operations inside `path`, which is about to be replaced."""
+	idx = len(out) - 1
+	while idx >= 0:
+		segments, _ = out[idx]
+		if _is_prefix(path, segments):
+			del out[idx]
+		elif _is_prefix(segments, path):
+			# An ancestor changed in between; `path` may no longer name the
+			# same node before that point.
+			return
+		idx -= 1
+
+
+def _combine(
+	out: list[tuple[Segments, VDOMOperation]], path: Segments, op: VDOMOperation
+) -> bool:
+	"""Fold `op` into the closest related earlier operation, if possible."""
+	for idx in range(len(out) - 1, -1, -1):
+		segments, prev = out[idx]
+		if not _related(segments, path):
+			continue
+		combined: VDOMOperation | None = None
+		if prev["type"] == "replace" and _is_prefix(segments, path):
+			data = _apply(prev["data"], path[len(segments) :], op)
+			if data is not None:
+				combined = ReplaceOperation(
+					type="replace", path=prev["path"], data=data
+				)
+		elif segments == path:
+			if prev["type"] == "update_props" and op["type"] == "update_props":
+				delta = merge_props_deltas(prev["data"], op["data"])
+				if delta is not None:
+					combined = UpdatePropsOperation(
+						type="update_props", path=prev["path"], data=delta
+					)
+			elif prev["type"] == "reconciliation" and op["type"] == "reconciliation":
+				combined = compose_reconciliations(prev, op)
+		if combined is None:
+			return False
+		out[idx] = (segments, combined)
+		return True
+	return False
+
+
+# ----------------------------------------------------------------------
+# update_props
+# ----------------------------------------------------------------------
+
+
+def merge_props_deltas(
+	first: UpdatePropsDelta, second: UpdatePropsDelta
+) -> UpdatePropsDelta | None:
+	"""Single delta equivalent to applying `first` then `second`.
+
+	Returns None when the result could differ on the client: `set` values are
+	interpreted against the element's eval keys, so a key set by `first`
+	must keep its eval status under the merged eval list.
+	"""
+	second_set = second.get("set") or {}
+	second_remove = second.get("remove") or []
+	second_eval = second.get("eval")
+	first_eval = first.get("eval")
+	if second_eval is not None:
+		if first_eval is None:
+			# The eval list `first` was applied under is unknown here
+			surviving = (
+				set(first.get("set") or {}) - set(second_set) - set(second_remove)
+			)
+			if surviving:
+				return None
+		elif not (set(first_eval) ^ set(second_eval)) <= {*second_set, *second_remove}:
+			return None
+
+	merged_set = {
+		key: value
+		for key, value in (first.get("set") or {}).items()
+		if key not in second_remove
+	}
+	merged_set.update(second_set)
+	merged_remove = [key for key in first.get("remove") or [] if key not in second_set]
+	merged_remove.extend(key for key in second_remove if key not in merged_remove)
+
+	# Patches apply after `set`: a later set or remove overrides them, and a
+	# patch of a value set earlier is folded into that value.
+	merged_patch = {
+		key: ops
+		for key, ops in (first.get("patch") or {}).items()
+		if key not in second_set and key not in second_remove
+	}
+	for key, ops in (second.get("patch") or {}).items():
+		if key in merged_set:
+			merged_set[key] = apply_patch(merged_set[key], ops)
+		elif key in merged_remove:
+			return None
+		else:
+			merged_patch[key] = [*merged_patch.get(key, ()), *ops]
+
+	delta: UpdatePropsDelta = {}
+	if merged_set:
+		delta["set"] = merged_set
+	if merged_remove:
+		delta["remove"] = sorted(merged_remove)
+	if merged_patch:
+		delta["patch"] = merged_patch
+	eval_keys = second_eval if second_eval is not None else first_eval
+	if eval_keys is not None:
+		delta["eval"] = eval_keys
+	return delta
+
+
+def _element(node: VDOM) -> dict[str, Any] | None:
+	"""The element behind `node` as a plain dict, or None for other nodes."""
+	if not isinstance(node, dict) or "tag" not in node:
+		return None
+	return cast(dict[str, Any], cast(object, node))
+
+
+def _as_vdom(element: dict[str, Any]) -> VDOM:
+	return cast(VDOM, cast(object, element))
+
+
+def _apply_props(node: VDOM, delta: UpdatePropsDelta) -> VDOM | None:
+	element = _element(node)
+	if element is None:
+		return None
+	updated = dict(element)
+	props = dict(element.get("props") or {})
+	set_values = delta.get("set") or {}
+	removed = delta.get("remove") or []
+	eval_keys = delta.get("eval")
+	if eval_keys is not None:
+		# Keys changing eval status must be rewritten by the delta, otherwise
+		# a fresh render would interpret their current value differently.
+		if not (set(element.get("eval") or []) ^ set(eval_keys)) <= {
+			*set_values,
+			*removed,
+		}:
+			return None
+		if eval_keys:
+			updated["eval"] = eval_keys
+		else:
+			updated.pop("eval", None)
+	for key in removed:
+		props.pop(key, None)
+	props.update(set_values)
+	for key, ops in (delta.get("patch") or {}).items():
+		if key not in props:
+			return None
+		props[key] = apply_patch(props[key], ops)
+	if props:
+		updated["props"] = props
+	else:
+		updated.pop("props", None)
+	return _as_vdom(updated)
+
+
+# ----------------------------------------------------------------------
+# Reconciliation
+# ----------------------------------------------------------------------
+
+
+def reconciliation_sources(op: ReconciliationOperation) -> list[ChildSource]:
+	"""Where each child after `op` comes from, by index."""
+	new_indices, new_values = op["new"]
+	reuse_dests, reuse_sources = op["reuse"]
+	sources: list[ChildSource | None] = [None] * op["N"]
+	for idx, value in zip(new_indices, new_values, strict=True):
+		sources[idx] = ("new", value)
+	for dest, src in zip(reuse_dests, reuse_sources, strict=True):
+		sources[dest] = ("old", src)
+	removed = op.get("removed")
+	if removed is None:
+		return [
+			source if source is not None else ("old", idx)
+			for idx, source in enumerate(sources)
+		]
+	# Relative mode: stable children fill the free slots in order. Every
+	# previous child is either removed, moved or stable.
+	free = sum(1 for source in sources if source is None)
+	previous = free + len(removed) + len(reuse_sources)
+	skipped = {*removed, *reuse_sources}
+	stable = iter(idx for idx in range(previous) if idx not in skipped)
+	return [
+		source if source is not None else ("old", next(stable)) for source in sources
+	]
+
+
+def reconciliation_from_sources(
+	path: str, sources: list[ChildSource], previous: int | None
+) -> ReconciliationOperation:
+	"""Smallest reconciliation producing `sources` from `previous` children.
+
+	Without the previous child count, only the absolute form can be used.
+	"""
+	op = ReconciliationOperation(
+		type="reconciliation", path=path, N=len(sources), new=([], []), reuse=([], [])
+	)
+	reuse_dests: list[int] = []
+	reuse_sources: list[int] = []
+	for idx, (kind, value) in enumerate(sources):
+		if kind == "new":
+			op["new"][0].append(idx)
+			op["new"][1].append(value)
+		else:
+			reuse_dests.append(idx)
+			reuse_sources.append(value)
+
+	shifted = [
+		idx
+		for idx, (dest, src) in enumerate(zip(reuse_dests, reuse_sources, strict=True))
+		if dest != src
+	]
+	removed: list[int] = []
+	moved: list[int] = []
+	relative = False
+	if previous is not None and shifted:
+		kept = set(reuse_sources)
+		removed = [idx for idx in range(previous) if idx not in kept]
+		stable = longest_increasing_subsequence(reuse_sources)
+		moved = [idx for idx in range(len(reuse_sources)) if idx not in stable]
+		relative = len(removed) + len(moved) < len(shifted)
+	for idx in moved if relative else shifted:
+		op["reuse"][0].append(reuse_dests[idx])
+		op["reuse"][1].append(reuse_sources[idx])
+	if relative:
+		op["removed"] = removed
+	return op
+
+
+def compose_reconciliations(
+	first: ReconciliationOperation, second: ReconciliationOperation
+) -> ReconciliationOperation:
+	"""Single reconciliation equivalent to `first` then `second`."""
+	before = reconciliation_sources(first)
+	after = [
+		(kind, value) if kind == "new" else before[value]
+		for kind, value in reconciliation_sources(second)
+	]
+	removed = first.get("removed")
+	# Absolute mode doesn't say how many children there were before, which
+	# the relative form needs.
+	previous = (
+		None if removed is None else first["N"] - len(first["new"][0]) + len(removed)
+	)
+	return reconciliation_from_sources(first["path"], after, previous)
+
+
+def _apply_reconciliation(node: VDOM, op: ReconciliationOperation) -> VDOM | None:
+	element = _element(node)
+	if element is None:
+		return None
+	children: list[Any] = element.get("children") or []
+	sources = reconciliation_sources(op)
+	if any(kind == "old" and value >= len(children) for kind, value in sources):
+		return None
+	updated = dict(element)
+	next_children = [
+		value if kind == "new" else children[value] for kind, value in sources
+	]
+	if next_children:
+		updated["children"] = next_children
+	else:
+		updated.pop("children", None)
+	return _as_vdom(updated)
+
+
+# ----------------------------------------------------------------------
+# Folding into a replaced subtree
+# ----------------------------------------------------------------------
+
+
+def _apply(node: VDOM, path: Segments, op: VDOMOperation) -> VDOM | None:
+	"""Apply `op` at `path` below `node`, copying what changes.
+
+	Returns None if the operation can't be resolved against the VDOM.
+	"""
+	if path:
+		element = _element(node)
+		if element is None:
+			return None
+		head, rest = path[0], path[1:]
+		if head.isdigit():
+			children = list(element.get("children") or [])
+			idx = int(head)
+			if idx >= len(children):
+				return None
+			child = _apply(children[idx], rest, op)
+			if child is None:
+				return None
+			children[idx] = child
+			return _as_vdom({**element, "children": children})
+		# Render prop
+		props = dict(element.get("props") or {})
+		if head not in props or head not in (element.get("eval") or []):
+			return None
+		value = _apply(props[head], rest, op)
+		if value is None:
+			return None
+		props[head] = value
+		return _as_vdom({**element, "props": props})
+
+	if op["type"] == "replace":
+		return op["data"]
+	if op["type"] == "update_props":
+		return _apply_props(node, op["data"])
+	return _apply_reconciliation(node, op)
+
+
+__all__ = [
+	"compact_operations",
+	"compose_reconciliations",
+	"merge_props_deltas",
+	"reconciliation_from_sources",
+	"reconciliation_sources",
+]
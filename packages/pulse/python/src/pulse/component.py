@@ -12,6 +12,7 @@ from types import CodeType
 from typing import Any, Generic, ParamSpec, TypeVar, overload, override
 
 from pulse.code_analysis import is_stub_function
+from pulse.helpers import values_equal
 from pulse.hooks.init import rewrite_init_blocks
 from pulse.transpiler.nodes import (
 	Children,
@@ -28,6 +29,10 @@ _T = TypeVar("_T")
 
 _COMPONENT_CODES: set[CodeType] = set()
 
+MemoCompare = Callable[[PulseNode, PulseNode], bool]
+"""Memo comparator: receives the previous and next `PulseNode` and returns
+True when the component can keep its previous output."""
+
 
 def is_component_code(code: CodeType) -> bool:
 	return code in _COMPONENT_CODES
@@ -42,6 +47,8 @@ class Component(Generic[P]):
 	Attributes:
 		name: Display name of the component (defaults to function name).
 		fn: The underlying render function (lazily initialized for stubs).
+		memo: Comparator used to skip re-rendering when the parent re-renders
+			with unchanged arguments, or None for regular components.
 
 	Example:
 
@@ -58,17 +65,31 @@ class Component(Generic[P]):
 	_raw_fn: Callable[P, Any]
 	_fn: Callable[P, Any] | None
 	name: str
+	memo: MemoCompare | None
 	_takes_children: bool | None
 
-	def __init__(self, fn: Callable[P, Any], name: str | None = None) -> None:
+	def __init__(
+		self,
+		fn: Callable[P, Any],
+		name: str | None = None,
+		*,
+		memo: bool | MemoCompare = False,
+	) -> None:
 		"""Initialize a Component.
 
 		Args:
 			fn: The function to wrap as a component.
 			name: Custom display name. Defaults to the function's `__name__`.
+			memo: True to memoize with `args_equal`, or a custom comparator.
 		"""
 		self._raw_fn = fn
 		self.name = name or _infer_component_name(fn)
+		if memo is True:
+			self.memo = args_equal
+		elif memo is False:
+			self.memo = None
+		else:
+			self.memo = memo
 		# Only lazy-init for stubs (avoid heavy work for JS module bindings)
 		# Real components need immediate rewrite for early error detection
 		if is_stub_function(fn):
@@ -116,7 +137,14 @@ class Component(Generic[P]):
 			)
 			args = tuple(flattened)  # pyright: ignore[reportAssignmentType]
 
-		return PulseNode(fn=self.fn, args=args, kwargs=kwargs, key=key, name=self.name)
+		return PulseNode(
+			fn=self.fn,
+			args=args,
+			kwargs=kwargs,
+			key=key,
+			name=self.name,
+			memo=self.memo,
+		)
 
 	@override
 	def __repr__(self) -> str:
@@ -133,13 +161,16 @@ def component(fn: Callable[P, Any]) -> Component[P]: ...
 
 @overload
 def component(
-	fn: None = None, *, name: str | None = None
+	fn: None = None, *, name: str | None = None, memo: bool | MemoCompare = False
 ) -> Callable[[Callable[P, Any]], Component[P]]: ...
 
 
 # The explicit return type is necessary for the type checker to be happy
 def component(
-	fn: Callable[P, Any] | None = None, *, name: str | None = None
+	fn: Callable[P, Any] | None = None,
+	*,
+	name: str | None = None,
+	memo: bool | MemoCompare = False,
 ) -> Component[P] | Callable[[Callable[P, Any]], Component[P]]:
 	"""Decorator that creates a Pulse component from a function.
 
@@ -151,6 +182,9 @@ def component(
 			parentheses, this is the decorated function.
 		name: Custom component name for debugging/dev tools. Defaults to the
 			function's `__name__`.
+		memo: Skip re-rendering when the parent re-renders with unchanged
+			arguments. True compares with `args_equal`; a callable is used as a
+			custom comparator. See `memo`.
 
 	Returns:
 		A `Component` instance if `fn` is provided, otherwise a decorator.
@@ -189,13 +223,76 @@ def component(
 	"""
 
 	def decorator(fn: Callable[P, Any]) -> Component[P]:
-		return Component(fn, name)
+		return Component(fn, name, memo=memo)
 
 	if fn is not None:
 		return decorator(fn)
 	return decorator
 
 
+@overload
+def memo(fn: Callable[P, Any]) -> Component[P]: ...
+
+
+@overload
+def memo(
+	fn: None = None,
+	*,
+	name: str | None = None,
+	compare: MemoCompare | None = None,
+) -> Callable[[Callable[P, Any]], Component[P]]: ...
+
+
+def memo(
+	fn: Callable[P, Any] | None = None,
+	*,
+	name: str | None = None,
+	compare: MemoCompare | None = None,
+) -> Component[P] | Callable[[Callable[P, Any]], Component[P]]:
+	"""Decorator that creates a memoized Pulse component.
+
+	When its parent re-renders, a memo component whose arguments compare
+	equal keeps its previous output: the function is not called and no
+	update operations are emitted. Reactive state read inside the component
+	still re-renders it when it changes.
+
+	Args:
+		fn: Function to wrap as a component.
+		name: Custom component name. Defaults to the function's `__name__`.
+		compare: Custom comparator receiving the previous and next `PulseNode`.
+			Defaults to `args_equal`.
+
+	Returns:
+		A `Component` instance if `fn` is provided, otherwise a decorator.
+
+	Example:
+
+	```python
+	@ps.memo
+	def Sidebar(items: list[str]):
+	    return ps.ul(*[ps.li(item, key=item) for item in items])
+
+	@ps.memo(compare=lambda prev, next: prev.kwargs["id"] == next.kwargs["id"])
+	def Row(id: int, label: str):
+	    return ps.div(label)
+	```
+	"""
+
+	def decorator(fn: Callable[P, Any]) -> Component[P]:
+		return Component(fn, name, memo=compare or True)
+
+	if fn is not None:
+		return decorator(fn)
+	return decorator
+
+
+def args_equal(previous: PulseNode, current: PulseNode) -> bool:
+	"""Default memo comparator: positional and keyword arguments are equal."""
+	return values_equal(previous.args, current.args) and values_equal(
+		previous.kwargs, current.kwargs
+	)
+
+
 def _takes_children(fn: Callable[..., Any]) -> bool:
 	try:
 		sig = signature(fn)
@@ -230,8 +327,11 @@ __all__ = [
 	"Children",
 	"Component",
 	"Element",
+	"MemoCompare",
 	"Primitive",
 	"VDOMNode",
+	"args_equal",
 	"component",
 	"is_component_code",
+	"memo",
 ]
@@ -0,0 +1,220 @@
+"""Opt-in compression of large socket messages and HTTP responses.
+
+permessage-deflate isn't negotiated through every proxy a deployment may sit
+behind, so Pulse can compress large payloads itself:
+
+```python
+compression = ps.Compression(threshold=16_384, level=6)
+app = ps.App(routes=[...], compression=compression)
+
+# Later, e.g. from a periodic task or an admin route
+for stats in compression.stats.values():
+	print(stats.transport, stats.encoding, stats.ratio, stats.time)
+```
+
+In dev, the same data is served as JSON from `GET /_pulse/profile`, under
+`"compression"`.
+
+Socket messages at least `threshold` bytes long once encoded are gzipped.
+Clients advertise support in their socket auth, and get every message as
+binary: the gzip magic bytes tell compressed messages apart, and the first
+(decompressed) byte tells JSON (`[`) from MessagePack (a map).
+
+Prerender and form responses are compressed with brotli or gzip, whichever
+the request's `Accept-Encoding` prefers. Brotli is only offered when the
+`brotli` package is installed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import zlib
+from dataclasses import asdict, dataclass
+from functools import cache
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Literal
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+Encoding = Literal["gzip", "br"]
+Transport = Literal["socket", "http"]
+
+# Socket auth key listing the encodings a client can decompress, comma-separated
+COMPRESSION_AUTH_KEY = "__pulse_compression"
+
+# zlib window bits for a gzip header and trailer
+_GZIP_WBITS = 31
+
+
+@dataclass(slots=True)
+class CompressionStats:
+	"""Accumulated compression work for one transport and encoding.
+
+	`bytes_in` and `bytes_out` count payloads before and after compression;
+	`time` is the CPU time spent compressing, in seconds.
+	"""
+
+	transport: Transport
+	encoding: Encoding
+	calls: int = 0
+	bytes_in: int = 0
+	bytes_out: int = 0
+	time: float = 0.0
+
+	@property
+	def ratio(self) -> float:
+		"""Compressed size over original size (lower is better)."""
+		return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+
+class Compression:
+	"""Compresses large socket messages and HTTP responses, and records the cost.
+
+	Args:
+		threshold: Payloads smaller than this many bytes are sent as-is.
+		level: gzip compression level, from 1 (fastest) to 9 (smallest).
+		brotli_quality: brotli quality, from 0 (fastest) to 11 (smallest).
+		socket: Compress socket messages for clients that support it.
+		http: Compress prerender and form responses.
+	"""
+
+	threshold: int
+	level: int
+	brotli_quality: int
+	socket: bool
+	http: bool
+	stats: dict[tuple[Transport, Encoding], CompressionStats]
+
+	def __init__(
+		self,
+		*,
+		threshold: int = 16_384,
+		level: int = 6,
+		brotli_quality: int = 4,
+		socket: bool = True,
+		http: bool = True,
+	) -> None:
+		if not 1 <= level <= 9:
+			raise ValueError(f"gzip level must be between 1 and 9, got {level}")
+		if not 0 <= brotli_quality <= 11:
+			raise ValueError(
+				f"brotli quality must be between 0 and 11, got {brotli_quality}"
+			)
+		self.threshold = threshold
+		self.level = level
+		self.brotli_quality = brotli_quality
+		self.socket = socket
+		self.http = http
+		self.stats = {}
+
+	def accepts_socket(self, offered: str | None) -> bool:
+		"""Whether to compress messages for a client offering `offered`."""
+		return self.socket and bool(offered) and "gzip" in str(offered).split(",")
+
+	def compress_message(self, payload: Any) -> bytes:
+		"""Encode a socket message to bytes, gzipped if it is large enough.
+
+		`payload` is either MessagePack bytes or the JSON form produced by
+		`serialize()`. The JSON form is encoded once here and those bytes are
+		sent, compressed or not, instead of letting socket.io encode it again.
+		"""
+		if isinstance(payload, bytes):
+			data = payload
+		else:
+			data = json.dumps(payload, separators=(",", ":")).encode()
+		if len(data) < self.threshold:
+			return data
+		compressed = self._compress("socket", "gzip", data)
+		return data if compressed is None else compressed
+
+	def compress_response(self, request: Request, response: Response) -> Response:
+		"""Compress `response`'s body in place, if the client accepts it."""
+		if not self.http or "content-encoding" in response.headers:
+			return response
+		body = getattr(response, "body", None)
+		if not isinstance(body, bytes) or len(body) < self.threshold:
+			return response
+		encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+		if encoding is None:
+			return response
+		compressed = self._compress("http", encoding, body)
+		if compressed is None:
+			return response
+		response.body = compressed
+		response.headers["content-encoding"] = encoding
+		response.headers["content-length"] = str(len(compressed))
+		response.headers.add_vary_header("Accept-Encoding")
+		return response
+
+	def snapshot(self) -> list[dict[str, Any]]:
+		"""JSON-ready copy of everything recorded so far."""
+		return [
+			{**asdict(stats), "ratio": stats.ratio} for stats in self.stats.values()
+		]
+
+	def reset(self) -> None:
+		self.stats.clear()
+
+	def _compress(
+		self, transport: Transport, encoding: Encoding, data: bytes
+	) -> bytes | None:
+		"""Compress `data`, or return None if that doesn't make it smaller."""
+		start = perf_counter()
+		brotli = _brotli() if encoding == "br" else None
+		if brotli is not None:
+			compressed = brotli.compress(data, quality=self.brotli_quality)
+		else:
+			compressed = zlib.compress(data, self.level, wbits=_GZIP_WBITS)
+		elapsed = perf_counter() - start
+		stats = self.stats.get((transport, encoding))
+		if stats is None:
+			stats = self.stats[transport, encoding] = CompressionStats(
+				transport=transport, encoding=encoding
+			)
+		stats.calls += 1
+		stats.bytes_in += len(data)
+		stats.time += elapsed
+		if len(compressed) >= len(data):
+			stats.bytes_out += len(data)
+			return None
+		stats.bytes_out += len(compressed)
+		return compressed
+
+
+def negotiate_encoding(accept_encoding: str | None) -> Encoding | None:
+	"""Preferred encoding among those an `Accept-Encoding` header allows.
+
+	Brotli wins ties when it is installed; encodings with `q=0` are refused.
+	"""
+	if not accept_encoding:
+		return None
+	weights: dict[str, float] = {}
+	for part in accept_encoding.split(","):
+		name, _, params = part.partition(";")
+		name = name.strip().lower()
+		weight = 1.0
+		params = params.strip()
+		if params.startswith("q="):
+			try:
+				weight = float(params[2:])
+			except ValueError:
+				weight = 0.0
+		weights[name] = weight
+	wildcard = weights.get("*", 0.0)
+	candidates: list[tuple[float, Encoding]] = []
+	if _brotli() is not None:
+		candidates.append((weights.get("br", wildcard), "br"))
+	candidates.append((weights.get("gzip", wildcard), "gzip"))
+	weight, encoding = max(candidates, key=lambda c: c[0])
+	return encoding if weight > 0 else None
+
+
+@cache
+def _brotli() -> ModuleType | None:
+	try:
+		return importlib.import_module("brotli")
+	except ImportError:
+		return None
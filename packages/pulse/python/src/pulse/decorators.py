@@ -14,9 +14,10 @@ from pulse.reactive import (
 	Effect,
 	EffectCleanup,
 	EffectFn,
+	Selector,
 	Signal,
 )
-from pulse.state.property import ComputedProperty, StateEffect
+from pulse.state.property import ComputedProperty, SelectorProperty, StateEffect
 from pulse.state.state import State
 
 T = TypeVar("T")
@@ -82,6 +83,58 @@ def computed(fn: Callable[..., Any]) -> Computed[T] | ComputedProperty[T]:
 	return Computed(fn, name=fn.__name__)
 
 
+@overload
+def selector(fn: Callable[[], T]) -> Selector[T]: ...
+@overload
+def selector(fn: Callable[[TState], T]) -> SelectorProperty[T]: ...
+
+
+def selector(fn: Callable[..., Any]) -> Selector[T] | SelectorProperty[T]:
+	"""
+	Decorator for keyed selectors.
+
+	Turns a function returning the selected key into a Selector. Calling the
+	selector with a key returns whether that key is selected, and only
+	subscribes to that key: when the selection changes, only the readers of the
+	previous and the new key are notified, instead of every reader.
+
+	Can be used in two ways:
+	1. On a State method (with single `self` argument) - creates a SelectorProperty
+	2. As a standalone function (with no arguments) - creates a Selector
+
+	Args:
+		fn: The function returning the selected key. Must take no arguments (standalone) or only `self` (State method).
+
+	Returns:
+		Selector or SelectorProperty depending on usage.
+
+	Raises:
+		TypeError: If the function takes arguments other than `self`.
+
+	Example:
+		On a State method:
+
+		    class TableState(ps.State):
+		        selected_id: int | None = None
+
+		        @ps.selector
+		        def is_selected(self):
+		            return self.selected_id
+
+		    # In each row component
+		    active = state.is_selected(row["id"])
+	"""
+	sig = inspect.signature(fn)
+	params = list(sig.parameters.values())
+	if len(params) == 1 and params[0].name == "self":
+		return SelectorProperty(fn.__name__, fn)
+	if len(params) > 0:
+		raise TypeError(
+			f"@selector: Function '{fn.__name__}' must take no arguments or a single 'self' argument"
+		)
+	return Selector(fn, name=fn.__name__)
+
+
 StateEffectFn = Callable[[TState], EffectCleanup | None]
 AsyncStateEffectFn = Callable[[TState], Awaitable[EffectCleanup | None]]
 
@@ -137,6 +137,7 @@ def data(**attrs: Any):
 
 
 class Disposable(ABC):
+	__slots__ = ()
 	__disposed__: bool = False
 
 	@abstractmethod
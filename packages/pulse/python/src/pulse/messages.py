@@ -1,7 +1,13 @@
 from typing import Any, Literal, NotRequired, TypedDict
 
 from pulse.routing import RouteInfo
-from pulse.transpiler.vdom import VDOM, VDOMNode, VDOMOperation
+from pulse.transpiler.vdom import (
+	VDOM,
+	TemplateRef,
+	VDOMNode,
+	VDOMOperation,
+	VDOMTemplate,
+)
 
 
 # ====================
@@ -10,7 +16,9 @@ from pulse.transpiler.vdom import VDOM, VDOMNode, VDOMOperation
 class ServerInitMessage(TypedDict):
 	type: Literal["vdom_init"]
 	path: str
-	vdom: VDOM
+	vdom: VDOM | TemplateRef
+	# Present when `vdom` refers to templates (`App(vdom_templates=True)`)
+	templates: NotRequired[list[VDOMTemplate]]
 
 
 class ServerUpdateMessage(TypedDict):
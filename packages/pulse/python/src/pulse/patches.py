@@ -0,0 +1,271 @@
+"""Structural patches for large list/dict prop values.
+
+With `App(prop_patches=True)`, a plain list or dict prop that changed is sent
+as a list of patch operations against its previous value instead of in full,
+when that is smaller. Appending a point to a 10k-element chart series then
+sends one item rather than the whole series.
+
+Operations apply in order, each to the value left by the ones before it, and
+address a container by its path of keys and indices from the prop value:
+
+- `splice`: at the list at `path`, remove `delete` items from `start` and
+  insert `items` there;
+- `set`: set the key or index that ends `path` to `value`;
+- `del`: delete the key that ends `path`.
+
+Unchanged parts are found with `values_equal`, the same comparison that
+decides whether a prop changed at all. `apply_patch` is the reference
+implementation, mirrored by the client.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pulse.helpers import values_equal
+from pulse.transpiler.vdom import PatchDelete, PatchOp, PatchPath, PatchSet, PatchSplice
+
+# Values smaller than this are always sent in full
+MIN_PATCH_SIZE = 16
+# Give up once a patch has more operations than this
+MAX_PATCH_OPS = 32
+# Look this far for items shifted in or out at the front of a list
+MAX_SHIFT = 8
+# Lists are compared this many items at a time when looking for changes
+COMPARE_CHUNK = 256
+
+
+def diff_value(old: Any, new: Any) -> list[PatchOp] | None:
+	"""Operations turning `old` into `new`, or None to send `new` in full.
+
+	Only plain lists and dicts are patched. Returns None when either value is
+	something else or small, or when the patch wouldn't be much smaller than
+	`new`.
+	"""
+	if not _same_container(old, new):
+		return None
+	size = _count_items(new)
+	if size < MIN_PATCH_SIZE:
+		return None
+	ops: list[PatchOp] = []
+	budget = _Budget(size)
+	if not _diff(old, new, [], ops, budget) or not ops:
+		return None
+	return ops
+
+
+def apply_patch(value: Any, ops: list[PatchOp]) -> Any:
+	"""Apply `ops` to `value`, copying containers instead of mutating them."""
+	root = [value]
+	copies: dict[int, Any] = {}
+	for op in ops:
+		path = op["path"]
+		steps = path if op["t"] == "splice" else path[:-1]
+		parent: Any = root
+		key: str | int = 0
+		for step in steps:
+			parent, key = _writable(parent, key, copies), step
+		target = _writable(parent, key, copies)
+		if op["t"] == "splice":
+			start = op["start"]
+			target[start : start + op["delete"]] = op["items"]
+		elif op["t"] == "set":
+			target[path[-1]] = op["value"]
+		else:
+			del target[path[-1]]
+	return root[0]
+
+
+class _Budget:
+	"""Limits on the size of a patch, shared by a whole diff."""
+
+	__slots__ = ("ops", "items")
+
+	def __init__(self, size: int) -> None:
+		self.ops = MAX_PATCH_OPS
+		# Items sent through the patch, at most half of the new value's
+		self.items = size // 2
+
+	def spend(self, items: int) -> bool:
+		self.ops -= 1
+		self.items -= items
+		return self.ops >= 0 and self.items >= 0
+
+
+def _diff(
+	old: Any, new: Any, path: PatchPath, ops: list[PatchOp], budget: _Budget
+) -> bool:
+	if isinstance(new, list):
+		return _diff_list(old, new, path, ops, budget)
+	return _diff_dict(old, new, path, ops, budget)
+
+
+def _diff_dict(
+	old: dict[str, Any],
+	new: dict[str, Any],
+	path: PatchPath,
+	ops: list[PatchOp],
+	budget: _Budget,
+) -> bool:
+	for key in old:
+		if key not in new:
+			ops.append(PatchDelete(t="del", path=[*path, key]))
+			if not budget.spend(0):
+				return False
+	for key, value in new.items():
+		if key in old:
+			previous = old[key]
+			if values_equal(previous, value):
+				continue
+			if (
+				_same_container(previous, value)
+				and _count_items(value) >= MIN_PATCH_SIZE
+			):
+				if not _diff(previous, value, [*path, key], ops, budget):
+					return False
+				continue
+		ops.append(PatchSet(t="set", path=[*path, key], value=value))
+		if not budget.spend(1):
+			return False
+	return True
+
+
+def _diff_list(
+	old: list[Any],
+	new: list[Any],
+	path: PatchPath,
+	ops: list[PatchOp],
+	budget: _Budget,
+) -> bool:
+	# Items dropped from or added to the front, as in a sliding window
+	shift = _front_shift(old, new)
+	if shift > 0:
+		ops.append(PatchSplice(t="splice", path=path, start=0, delete=shift, items=[]))
+		if not budget.spend(0):
+			return False
+		old = old[shift:]
+	elif shift < 0:
+		items = new[:-shift]
+		ops.append(PatchSplice(t="splice", path=path, start=0, delete=0, items=items))
+		if not budget.spend(len(items)):
+			return False
+		new = new[-shift:]
+	n, m = len(old), len(new)
+	start = _common_prefix(old, new, min(n, m))
+	common = _common_suffix(old, new, min(n, m) - start)
+	old_end, new_end = n - common, m - common
+	offset = -shift if shift < 0 else 0
+	if old_end - start == new_end - start:
+		# Same length: patch the items that changed in place
+		for i in range(start, old_end):
+			previous, value = old[i], new[i]
+			if values_equal(previous, value):
+				continue
+			if _same_container(previous, value):
+				if not _diff(previous, value, [*path, offset + i], ops, budget):
+					return False
+			else:
+				ops.append(PatchSet(t="set", path=[*path, offset + i], value=value))
+				if not budget.spend(1):
+					return False
+		return True
+	items = new[start:new_end]
+	ops.append(
+		PatchSplice(
+			t="splice",
+			path=path,
+			start=offset + start,
+			delete=old_end - start,
+			items=items,
+		)
+	)
+	return budget.spend(len(items))
+
+
+def _common_prefix(a: list[Any], b: list[Any], limit: int) -> int:
+	"""Length of the common prefix of `a` and `b`, at most `limit`."""
+	# Compare slices a chunk at a time, then narrow down item by item
+	start = 0
+	while start < limit:
+		end = min(start + COMPARE_CHUNK, limit)
+		if not _slices_equal(a, b, start, start, end - start):
+			break
+		start = end
+	while start < limit and values_equal(a[start], b[start]):
+		start += 1
+	return start
+
+
+def _common_suffix(a: list[Any], b: list[Any], limit: int) -> int:
+	"""Length of the common suffix of `a` and `b`, at most `limit`."""
+	n, m = len(a), len(b)
+	count = 0
+	while count < limit:
+		size = min(COMPARE_CHUNK, limit - count)
+		if not _slices_equal(a, b, n - count - size, m - count - size, size):
+			break
+		count += size
+	while count < limit and values_equal(a[n - count - 1], b[m - count - 1]):
+		count += 1
+	return count
+
+
+def _slices_equal(a: list[Any], b: list[Any], i: int, j: int, size: int) -> bool:
+	try:
+		result = a[i : i + size] == b[j : j + size]
+	except Exception:
+		# Items without a plain boolean `==` (NumPy arrays, DataFrames)
+		return all(values_equal(a[i + k], b[j + k]) for k in range(size))
+	return result is True
+
+
+def _front_shift(old: list[Any], new: list[Any]) -> int:
+	"""How many items were removed (> 0) or added (< 0) at the front."""
+	if not old or not new or values_equal(old[0], new[0]):
+		return 0
+	for shift in range(1, min(MAX_SHIFT, len(old) - 1) + 1):
+		if values_equal(old[shift], new[0]) and _starts_with(old, new, shift):
+			return shift
+	for shift in range(1, min(MAX_SHIFT, len(new) - 1) + 1):
+		if values_equal(new[shift], old[0]) and _starts_with(new, old, shift):
+			return -shift
+	return 0
+
+
+def _starts_with(longer: list[Any], other: list[Any], shift: int) -> bool:
+	"""Whether `longer[shift:]` and `other` agree on their common length."""
+	return _slices_equal(longer, other, shift, 0, min(len(longer) - shift, len(other)))
+
+
+def _same_container(a: Any, b: Any) -> bool:
+	return (isinstance(a, list) and isinstance(b, list)) or (
+		isinstance(a, dict) and isinstance(b, dict)
+	)
+
+
+def _count_items(value: list[Any] | dict[str, Any]) -> int:
+	"""Estimated number of values in `value`, nested ones included.
+
+	Lists are assumed to hold items like their first one, so this stays cheap
+	for long lists of records.
+	"""
+	if isinstance(value, list):
+		if not value:
+			return 0
+		first = value[0]
+		per_item = 1 + _count_items(first) if isinstance(first, (list, dict)) else 1
+		return len(value) * per_item
+	return sum(
+		1 + _count_items(item) if isinstance(item, (list, dict)) else 1
+		for item in value.values()
+	)
+
+
+def _writable(parent: Any, key: str | int, copies: dict[int, Any]) -> Any:
+	"""`parent[key]`, replaced by a copy the first time it is written to."""
+	value = parent[key]
+	if id(value) in copies:
+		return value
+	copy = list(value) if isinstance(value, list) else dict(value)
+	parent[key] = copies[id(copy)] = copy
+	return copy
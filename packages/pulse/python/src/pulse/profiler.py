@@ -0,0 +1,208 @@
+"""Opt-in render profiler.
+
+Records, per route and per component, how often components render, how long
+they take and how many VDOM operations and payload bytes they produce:
+
+```python
+profiler = ps.RenderProfiler()
+app = ps.App(routes=[...], profiler=profiler)
+
+# Later, e.g. from a periodic task or an admin route
+for entry in profiler.top(10):
+	print(entry.route, entry.name, entry.self_time)
+```
+
+In dev, the same data is served as JSON from `GET /_pulse/profile`.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any, Literal, TypedDict
+
+from pulse.serializer import serialize
+from pulse.transpiler.nodes import PulseNode
+
+
+@dataclass(slots=True)
+class ComponentProfile:
+	"""Accumulated cost of one component on one route.
+
+	Times are in seconds. `total_time` includes nested components,
+	`self_time` excludes them. `operations` and `bytes` count the update
+	operations emitted while this component was the innermost one rendering
+	(initial renders emit none; their size is on the route profile).
+	"""
+
+	route: str
+	name: str
+	calls: int = 0
+	total_time: float = 0.0
+	self_time: float = 0.0
+	operations: int = 0
+	bytes: int = 0
+
+
+@dataclass(slots=True)
+class RouteProfile:
+	"""Accumulated cost of the messages produced for one route."""
+
+	route: str
+	inits: int = 0
+	updates: int = 0
+	time: float = 0.0
+	operations: int = 0
+	bytes: int = 0
+
+
+class ProfileSnapshot(TypedDict):
+	routes: list[dict[str, Any]]
+	components: list[dict[str, Any]]
+
+
+ProfileSort = Literal["self_time", "total_time", "calls", "operations", "bytes"]
+
+
+@dataclass(slots=True)
+class _Frame:
+	profile: ComponentProfile
+	start: float
+	first_op: int
+	child_time: float = 0.0
+	# [start, end) ranges of operations already attributed to children
+	child_ops: list[tuple[int, int]] = field(default_factory=list)
+
+
+class RenderProfiler:
+	"""Collects render timings for every route of an app.
+
+	Args:
+		measure_bytes: Serialize emitted operations to count payload bytes.
+			This is the most expensive part of profiling; disable it to only
+			collect counts and timings.
+	"""
+
+	measure_bytes: bool
+	components: dict[tuple[str, str], ComponentProfile]
+	routes: dict[str, RouteProfile]
+
+	def __init__(self, *, measure_bytes: bool = True) -> None:
+		self.measure_bytes = measure_bytes
+		self.components = {}
+		self.routes = {}
+
+	def route(self, route: str) -> RouteProfiler:
+		"""Profiler bound to one route, attached to that route's render tree."""
+		return RouteProfiler(self, route)
+
+	def payload_size(self, payload: Any) -> int:
+		if not self.measure_bytes:
+			return 0
+		return len(
+			json.dumps(serialize(payload, track_refs=False), separators=(",", ":"))
+		)
+
+	def record_message(
+		self, route: str, elapsed: float, message: dict[str, Any] | None
+	) -> None:
+		"""Record one render pass of a route and the message it produced."""
+		profile = self.routes.get(route)
+		if profile is None:
+			profile = self.routes[route] = RouteProfile(route=route)
+		profile.time += elapsed
+		if message is None:
+			return
+		kind = message.get("type")
+		if kind == "vdom_init":
+			profile.inits += 1
+		elif kind == "vdom_update":
+			profile.updates += 1
+			profile.operations += len(message["ops"])
+		else:
+			return
+		profile.bytes += self.payload_size(message)
+
+	def top(
+		self, n: int = 20, *, by: ProfileSort = "self_time"
+	) -> list[ComponentProfile]:
+		"""The `n` most expensive components, across all routes."""
+		return sorted(
+			self.components.values(), key=lambda p: getattr(p, by), reverse=True
+		)[:n]
+
+	def snapshot(self, *, by: ProfileSort = "self_time") -> ProfileSnapshot:
+		"""JSON-ready copy of everything recorded so far."""
+		return {
+			"routes": [
+				asdict(p)
+				for p in sorted(
+					self.routes.values(), key=lambda p: p.time, reverse=True
+				)
+			],
+			"components": [asdict(p) for p in self.top(len(self.components), by=by)],
+		}
+
+	def reset(self) -> None:
+		self.components.clear()
+		self.routes.clear()
+
+
+class RouteProfiler:
+	"""Times the components rendered by one render tree."""
+
+	profiler: RenderProfiler
+	route: str
+	_stack: list[_Frame]
+
+	def __init__(self, profiler: RenderProfiler, route: str) -> None:
+		self.profiler = profiler
+		self.route = route
+		self._stack = []
+
+	def enter(self, node: PulseNode, operations: Sequence[Any]) -> _Frame:
+		name = node.name or getattr(node.fn, "__name__", "Component")
+		key = (self.route, name)
+		profile = self.profiler.components.get(key)
+		if profile is None:
+			profile = self.profiler.components[key] = ComponentProfile(
+				route=self.route, name=name
+			)
+		frame = _Frame(profile=profile, start=perf_counter(), first_op=len(operations))
+		self._stack.append(frame)
+		return frame
+
+	def exit(self, frame: _Frame, operations: Sequence[Any]) -> None:
+		elapsed = perf_counter() - frame.start
+		# Unwind frames left open by an exception in a nested component
+		while self._stack and self._stack.pop() is not frame:
+			pass
+		last_op = len(operations)
+		profile = frame.profile
+		profile.calls += 1
+		profile.total_time += elapsed
+		profile.self_time += elapsed - frame.child_time
+
+		idx = frame.first_op
+		for start, end in [*frame.child_ops, (last_op, last_op)]:
+			for op in operations[idx:start]:
+				profile.operations += 1
+				profile.bytes += self.profiler.payload_size(op)
+			idx = end
+
+		if self._stack:
+			parent = self._stack[-1]
+			parent.child_time += elapsed
+			parent.child_ops.append((frame.first_op, last_op))
+
+
+__all__ = [
+	"ComponentProfile",
+	"ProfileSnapshot",
+	"ProfileSort",
+	"RenderProfiler",
+	"RouteProfile",
+	"RouteProfiler",
+]
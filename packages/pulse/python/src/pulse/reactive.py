@@ -9,6 +9,7 @@ from typing import (
 	Generic,
 	Literal,
 	ParamSpec,
+	Protocol,
 	TypeVar,
 	override,
 )
@@ -29,6 +30,16 @@ T_co = TypeVar("T_co", covariant=True)
 P = ParamSpec("P")
 
 
+class Observer(Protocol):
+	"""Notified by the signals and computeds it depends on when they change.
+
+	`Computed`, `Effect` and `Selector` are observers; so is a mounted
+	component's hook context (`pulse.renderer.ComponentHooks`).
+	"""
+
+	def push_change(self) -> None: ...
+
+
 class Signal(Generic[T]):
 	"""A reactive value container.
 
@@ -53,15 +64,21 @@ class Signal(Generic[T]):
 	```
 	"""
 
+	__slots__ = ("value", "name", "last_change", "obs", "_obs_change_listeners")
+
 	value: T
 	name: str | None
 	last_change: int
+	# Observers, as an insertion-ordered set
+	obs: dict[Observer, None]
+	# Allocated on the first `on_observer_change()`
+	_obs_change_listeners: list[Callable[[int], None]] | None
 
 	def __init__(self, value: T, name: str | None = None):
 		self.value = value
 		self.name = name
-		self.obs: list[Computed[Any] | Effect] = []
-		self._obs_change_listeners: list[Callable[[int], None]] = []
+		self.obs = {}
+		self._obs_change_listeners = None
 		self.last_change = -1
 
 	def read(self) -> T:
@@ -102,26 +119,31 @@ class Signal(Generic[T]):
 		memo[id(self)] = new_signal
 		return new_signal
 
-	def add_obs(self, obs: "Computed[Any] | Effect"):
-		prev = len(self.obs)
-		self.obs.append(obs)
-		if prev == 0 and len(self.obs) == 1:
+	def add_obs(self, obs: Observer):
+		if obs in self.obs:
+			return
+		self.obs[obs] = None
+		if len(self.obs) == 1 and self._obs_change_listeners:
 			for cb in list(self._obs_change_listeners):
-				cb(len(self.obs))
+				cb(1)
 
-	def remove_obs(self, obs: "Computed[Any] | Effect"):
-		if obs in self.obs:
-			self.obs.remove(obs)
-			if len(self.obs) == 0:
-				for cb in list(self._obs_change_listeners):
-					cb(0)
+	def remove_obs(self, obs: Observer):
+		if obs not in self.obs:
+			return
+		del self.obs[obs]
+		if len(self.obs) == 0 and self._obs_change_listeners:
+			for cb in list(self._obs_change_listeners):
+				cb(0)
 
 	def on_observer_change(self, cb: Callable[[int], None]) -> Callable[[], None]:
-		self._obs_change_listeners.append(cb)
+		if self._obs_change_listeners is None:
+			self._obs_change_listeners = []
+		listeners = self._obs_change_listeners
+		listeners.append(cb)
 
 		def off():
 			try:
-				self._obs_change_listeners.remove(cb)
+				listeners.remove(cb)
 			except ValueError:
 				pass
 
@@ -140,7 +162,8 @@ class Signal(Generic[T]):
 		increment_epoch()
 		self.value = value
 		self.last_change = epoch()
-		for obs in self.obs:
+		# Observers may subscribe or unsubscribe while being notified
+		for obs in tuple(self.obs):
 			obs.push_change()
 
 
@@ -173,11 +196,29 @@ class Computed(Generic[T_co]):
 	```
 	"""
 
+	__slots__ = (
+		"fn",
+		"name",
+		"value",
+		"dirty",
+		"on_stack",
+		"last_change",
+		"deps",
+		"obs",
+		"_obs_change_listeners",
+		"accepts_prev_value",
+	)
+
 	fn: Callable[..., T_co]
 	name: str | None
 	value: Any
 	dirty: bool
 	on_stack: bool
+	last_change: int
+	# Dep -> last_change
+	deps: "dict[Signal[Any] | Computed[Any], int]"
+	obs: dict[Observer, None]
+	_obs_change_listeners: list[Callable[[int], None]] | None
 	accepts_prev_value: bool
 
 	def __init__(
@@ -192,11 +233,10 @@ class Computed(Generic[T_co]):
 		self.name = name
 		self.dirty = False
 		self.on_stack = False
-		self.last_change: int = -1
-		# Dep -> last_change
-		self.deps: dict[Signal[Any] | Computed[Any], int] = {}
-		self.obs: list[Computed[Any] | Effect] = []
-		self._obs_change_listeners: list[Callable[[int], None]] = []
+		self.last_change = -1
+		self.deps = {}
+		self.obs = {}
+		self._obs_change_listeners = None
 		sig = inspect.signature(self.fn)
 		params = list(sig.parameters.values())
 		# Check if function has at least one positional parameter
@@ -264,7 +304,7 @@ class Computed(Generic[T_co]):
 			return
 
 		self.dirty = True
-		for obs in self.obs:
+		for obs in tuple(self.obs):
 			obs.push_change()
 
 	def _recompute(self):
@@ -326,32 +366,165 @@ class Computed(Generic[T_co]):
 
 		self.dirty = False
 
-	def add_obs(self, obs: "Computed[Any] | Effect"):
-		prev = len(self.obs)
-		self.obs.append(obs)
-		if prev == 0 and len(self.obs) == 1:
+	def add_obs(self, obs: Observer):
+		if obs in self.obs:
+			return
+		self.obs[obs] = None
+		if len(self.obs) == 1 and self._obs_change_listeners:
 			for cb in list(self._obs_change_listeners):
-				cb(len(self.obs))
+				cb(1)
 
-	def remove_obs(self, obs: "Computed[Any] | Effect"):
-		if obs in self.obs:
-			self.obs.remove(obs)
-			if len(self.obs) == 0:
-				for cb in list(self._obs_change_listeners):
-					cb(0)
+	def remove_obs(self, obs: Observer):
+		if obs not in self.obs:
+			return
+		del self.obs[obs]
+		if len(self.obs) == 0 and self._obs_change_listeners:
+			for cb in list(self._obs_change_listeners):
+				cb(0)
 
 	def on_observer_change(self, cb: Callable[[int], None]) -> Callable[[], None]:
-		self._obs_change_listeners.append(cb)
+		if self._obs_change_listeners is None:
+			self._obs_change_listeners = []
+		listeners = self._obs_change_listeners
+		listeners.append(cb)
 
 		def off():
 			try:
-				self._obs_change_listeners.remove(cb)
+				listeners.remove(cb)
 			except ValueError:
 				pass
 
 		return off
 
 
+class Selector(Disposable, Generic[T]):
+	"""Per-key boolean signals telling whether a key is the selected one.
+
+	Reading `selector(key)` is equivalent to `source() == key`, but each key
+	gets its own signal: when the source changes, only the observers of the
+	previous and the new key are notified, instead of every reader of the
+	source. Key signals are created on their first tracked read and dropped
+	once they lose their last observer. Keys must be hashable. Keys that
+	compare equal, like `1`, `1.0` and `True`, share a signal, as they are
+	all selected when the source equals any of them.
+
+	Args:
+		source: The selected key, as a Signal, a Computed or a function, which
+			is wrapped in a Computed.
+		name: Debug name for the selector.
+
+	Attributes:
+		source: The Signal or Computed providing the selected key.
+		value: The currently selected key (direct access, no tracking).
+		name: Debug name.
+
+	Example:
+
+	```python
+	selected_id = Signal(1)
+	is_selected = Selector(selected_id)
+	print(is_selected(1))  # True (only notified when key 1 changes)
+	selected_id.write(2)   # Notifies the readers of keys 1 and 2
+	is_selected.dispose()
+	```
+	"""
+
+	__slots__ = ("__disposed__", "source", "name", "value", "signals", "_owned")
+
+	source: "Signal[T] | Computed[T]"
+	name: str | None
+	value: T
+	# Key -> signal, for keys read in a tracking scope
+	signals: dict[Any, Signal[bool]]
+	# The Computed wrapping a function source, disposed with the selector
+	_owned: "Computed[T] | None"
+
+	def __init__(
+		self,
+		source: "Signal[T] | Computed[T] | Callable[[], T]",
+		name: str | None = None,
+	):
+		self.__disposed__ = False
+		self._owned = None
+		if not isinstance(source, (Signal, Computed)):
+			source = Computed(source, name=f"{name}.source" if name else None)
+			self._owned = source
+		self.source = source
+		self.name = name
+		self.signals = {}
+		self.value = self._read_source()
+		source.add_obs(self)
+
+	def _read_source(self) -> T:
+		# Read without registering a dependency in the current scope
+		source = self.source
+		if isinstance(source, Computed):
+			source.recompute_if_necessary()
+		return source.value
+
+	def read(self, key: Any) -> bool:
+		"""Check whether `key` is selected, registering a dependency on that key.
+
+		Args:
+			key: The key to compare with the source.
+
+		Returns:
+			True if the source currently equals `key`.
+		"""
+		rc = REACTIVE_CONTEXT.get()
+		if rc.scope is None or isinstance(rc.scope, Untrack):
+			return values_equal(key, self.value)
+		sig = self.signals.get(key)
+		if sig is None:
+			sig = Signal(values_equal(key, self.value), name=self.name)
+			self.signals[key] = sig
+			self._forget_when_unobserved(key, sig)
+		return sig.read()
+
+	def __call__(self, key: Any) -> bool:
+		"""Alias for read().
+
+		Returns:
+			True if the source currently equals `key`.
+		"""
+		return self.read(key)
+
+	def _forget_when_unobserved(self, key: Any, sig: Signal[bool]):
+		def on_change(count: int):
+			if count == 0 and self.signals.get(key) is sig:
+				del self.signals[key]
+
+		sig.on_observer_change(on_change)
+
+	def push_change(self):
+		value = self._read_source()
+		prev = self.value
+		if values_equal(value, prev):
+			return
+		self.value = value
+		if (sig := self.signals.get(prev)) is not None:
+			sig.write(False)
+		if (sig := self.signals.get(value)) is not None:
+			sig.write(True)
+
+	@override
+	def dispose(self):
+		"""Stop tracking the source."""
+		self.source.remove_obs(self)
+		self.signals.clear()
+		owned = self._owned
+		if owned is not None and not owned.obs:
+			# Unsubscribe the Computed we created from the signals it reads
+			for dep in owned.deps:
+				dep.remove_obs(owned)
+			owned.deps = {}
+
+
+# Batch flushes run pending effects by rank, lowest first. State effects may
+# write signals, so they settle before the render effects that read them.
+STATE_EFFECT_RANK = 0
+RENDER_EFFECT_RANK = 1
+
 EffectCleanup = Callable[[], None]
 # Split effect function types into sync and async for clearer typing
 EffectFn = Callable[[], EffectCleanup | None]
@@ -364,6 +537,9 @@ class Effect(Disposable):
 	Synchronous effect and base class. Use AsyncEffect for async effects.
 	Both are isinstance(Effect).
 
+	Within a batch flush, effects run by `rank` (state effects, then render
+	effects), each group in the order it was scheduled.
+
 	Args:
 		fn: Effect function. May return a cleanup function to run before the
 			next execution or on disposal.
@@ -387,11 +563,38 @@ class Effect(Disposable):
 	```
 	"""
 
+	__slots__ = (
+		"__disposed__",
+		"fn",
+		"name",
+		"on_error",
+		"cleanup_fn",
+		"deps",
+		"children",
+		"parent",
+		"runs",
+		"last_run",
+		"scope",
+		"batch",
+		"update_deps",
+		"immediate",
+		"_lazy",
+		"_interval",
+		"_interval_handle",
+		"paused",
+	)
+
 	fn: EffectFn
 	name: str | None
+	rank: int = STATE_EFFECT_RANK
 	on_error: Callable[[Exception], None] | None
+	cleanup_fn: EffectCleanup | None
+	deps: dict[Signal[Any] | Computed[Any], int]
+	children: "list[Effect]"
+	parent: "Effect | None"
 	runs: int
 	last_run: int
+	scope: "Scope | None"
 	immediate: bool
 	_lazy: bool
 	_interval: float | None
@@ -411,16 +614,17 @@ class Effect(Disposable):
 		update_deps: bool | None = None,
 		interval: float | None = None,
 	):
+		self.__disposed__ = False
 		self.fn = fn  # type: ignore[assignment]
 		self.name = name
 		self.on_error = on_error
-		self.cleanup_fn: EffectCleanup | None = None
-		self.deps: dict[Signal[Any] | Computed[Any], int] = {}
-		self.children: list[Effect] = []
-		self.parent: Effect | None = None
+		self.cleanup_fn = None
+		self.deps = {}
+		self.children = []
+		self.parent = None
 		self.runs = 0
 		self.last_run = -1
-		self.scope: Scope | None = None
+		self.scope = None
 		self.batch = None
 		if deps is None:
 			self.update_deps = True if update_deps is None else update_deps
@@ -465,7 +669,8 @@ class Effect(Disposable):
 		if self.cleanup_fn:
 			self.cleanup_fn()
 		for dep in self.deps:
-			dep.obs.remove(self)
+			dep.remove_obs(self)
+		self.deps = {}
 		if self.parent and self in self.parent.children:
 			self.parent.children.remove(self)
 
@@ -522,7 +727,7 @@ class Effect(Disposable):
 			cancel_interval: If True (default), also cancels the interval timer.
 		"""
 		if self.batch is not None:
-			self.batch.effects.remove(self)
+			self.batch.unregister_effect(self)
 			self.batch = None
 		if cancel_interval:
 			self._cancel_interval()
@@ -531,8 +736,8 @@ class Effect(Disposable):
 		if self.paused:
 			return
 		# Short-circuit if already scheduled in a batch.
-		# This avoids redundant schedule() calls and O(n) list checks
-		# when the same effect is reached through multiple dependency paths.
+		# This avoids redundant schedule() calls when the same effect is
+		# reached through multiple dependency paths.
 		if self.batch is not None:
 			return
 		self.schedule()
@@ -555,7 +760,7 @@ class Effect(Disposable):
 	def flush(self):
 		"""If scheduled in a batch, remove and run immediately."""
 		if self.batch is not None:
-			self.batch.effects.remove(self)
+			self.batch.unregister_effect(self)
 			self.batch = None
 			# Run now (respects IS_PRERENDERING and error handling)
 			self.run()
@@ -889,7 +1094,8 @@ class AsyncEffect(Effect):
 		if self.cleanup_fn:
 			self.cleanup_fn()
 		for dep in self.deps:
-			dep.obs.remove(self)
+			dep.remove_obs(self)
+		self.deps = {}
 		if self.parent and self in self.parent.children:
 			self.parent.children.remove(self)
 
@@ -901,6 +1107,11 @@ class Batch:
 	next event loop iteration. Use as a context manager to create an explicit
 	batch that flushes on exit.
 
+	Scheduled effects are kept in insertion order, each at most once. A flush
+	runs the lowest-ranked ones first (see `Effect.rank`); effects they
+	schedule run later in the same flush. Computeds are lazy: they recompute
+	when an effect that depends on them checks whether it should run.
+
 	Args:
 		effects: Initial list of effects to schedule.
 		name: Debug name for the batch.
@@ -919,11 +1130,16 @@ class Batch:
 
 	name: str | None
 	flush_id: int
+	# Scheduled effects, as an insertion-ordered set
+	effects: dict[Effect, None]
 
 	def __init__(
 		self, effects: list[Effect] | None = None, name: str | None = None
 	) -> None:
-		self.effects: list[Effect] = effects or []
+		self.effects = {}
+		for effect in effects or ():
+			self.effects[effect] = None
+			effect.batch = self
 		self.name = name
 		self.flush_id = 0
 		self._token: "Token[ReactiveContext] | None" = None
@@ -934,8 +1150,15 @@ class Batch:
 		Args:
 			effect: The effect to schedule.
 		"""
-		if effect not in self.effects:
-			self.effects.append(effect)
+		self.effects[effect] = None
+
+	def unregister_effect(self, effect: Effect):
+		"""Remove a scheduled effect, if present.
+
+		Args:
+			effect: The effect to unschedule.
+		"""
+		self.effects.pop(effect, None)
 
 	def flush(self):
 		"""Run all scheduled effects."""
@@ -958,10 +1181,22 @@ class Batch:
 			# This ensures the epoch is incremented *after* all the signal
 			# writes and associated effects have been run.
 
-			current_effects = self.effects
-			self.effects = []
+			pending = self.effects
+			self.effects = {}
+			# Run the lowest rank now; the others wait, ahead of any effect
+			# scheduled by this pass.
+			rank = min(effect.rank for effect in pending)
+			current_effects: list[Effect] = []
+			for effect in pending:
+				if effect.rank == rank:
+					current_effects.append(effect)
+				else:
+					self.effects[effect] = None
 
 			for effect in current_effects:
+				# Skip effects cancelled or flushed earlier in this pass
+				if effect.batch is None:
+					continue
 				effect.batch = None
 				if not effect.should_run():
 					continue
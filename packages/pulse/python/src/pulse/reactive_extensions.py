@@ -12,7 +12,9 @@ from dataclasses import is_dataclass
 from typing import Any as _Any
 from typing import (
 	Generic,
+	Literal,
 	Protocol,
+	Self,
 	SupportsIndex,
 	TypeAlias,
 	TypeVar,
@@ -21,6 +23,7 @@ from typing import (
 	override,
 )
 
+from pulse.helpers import values_equal
 from pulse.reactive import Computed, Signal, Untrack
 
 T1 = TypeVar("T1")
@@ -37,13 +40,26 @@ KT = TypeVar
 
 _MISSING = object()
 
+# How a container wraps the values stored in it:
+# - deep: nested collections are wrapped when stored (the default)
+# - shallow: values are stored as given and never wrapped
+# - lazy: values are stored as given and nested collections are wrapped, in
+#   lazy mode too, on their first read
+_WrapMode: TypeAlias = Literal["deep", "shallow", "lazy"]
+
+
+def _wrap_mode(shallow: bool, lazy: bool) -> _WrapMode:
+	if shallow and lazy:
+		raise ValueError("shallow and lazy wrapping are mutually exclusive")
+	return "shallow" if shallow else "lazy" if lazy else "deep"
+
 
 class SupportsKeysAndGetItem(Protocol[T1, T2_co]):
 	def keys(self) -> Iterable[T1]: ...
 	def __getitem__(self, key: T1, /) -> T2_co: ...
 
 
-# Return an iterable view that subscribes to per-key signals during iteration
+# Iterable views that subscribe to structural changes and replaced values
 class ReactiveDictItems(Generic[T1, T2]):
 	__slots__ = ("_host",)  # pyright: ignore[reportUnannotatedClassAttribute]
 	_host: ReactiveDict[T1, T2]
@@ -52,8 +68,11 @@ class ReactiveDictItems(Generic[T1, T2]):
 		self._host = host
 
 	def __iter__(self):
-		for k in self._host:
-			yield (k, self._host[k])
+		host = self._host
+		host._read_contents()  # pyright: ignore[reportPrivateUsage]
+		if host._mode == "lazy":  # pyright: ignore[reportPrivateUsage]
+			return ((k, host._load(k)) for k in dict.keys(host))  # pyright: ignore[reportPrivateUsage]
+		return iter(dict.items(host))
 
 	def __len__(self) -> int:
 		return len(self._host)
@@ -67,8 +86,11 @@ class ReactiveDictValues(Generic[T1, T2]):
 		self._host = host
 
 	def __iter__(self):
-		for k in self._host:
-			yield self._host[k]
+		host = self._host
+		host._read_contents()  # pyright: ignore[reportPrivateUsage]
+		if host._mode == "lazy":  # pyright: ignore[reportPrivateUsage]
+			return (host._load(k) for k in dict.keys(host))  # pyright: ignore[reportPrivateUsage]
+		return iter(dict.values(host))
 
 	def __len__(self) -> int:
 		return len(self._host)
@@ -77,12 +99,18 @@ class ReactiveDictValues(Generic[T1, T2]):
 class ReactiveDict(dict[T1, T2]):
 	"""A dict-like container with per-key reactivity.
 
-	Reading a key registers a dependency on that key's Signal. Writing a key
-	updates only that key's Signal. Iteration, membership checks, and len are
-	reactive to structural changes.
+	Reading a key registers a dependency on that key's Signal, which is created
+	on the first read of the key. Writing a key updates only that key's Signal.
+	Iteration, membership checks, and len are reactive to structural changes.
+	`values()`, `items()` and `unwrap()` are also reactive to replaced values,
+	through a single Signal for the whole dict. Bulk operations (`update`,
+	`clear`) notify once.
 
 	Args:
 		initial: Initial key-value pairs to populate the dict.
+		shallow: Store values as given, without wrapping nested collections.
+		lazy: Store values as given and wrap nested collections (lazily too)
+			on their first read.
 
 	Example:
 
@@ -94,29 +122,89 @@ class ReactiveDict(dict[T1, T2]):
 	```
 	"""
 
-	__slots__ = ("_signals", "_structure")  # pyright: ignore[reportUnannotatedClassAttribute]
+	__slots__ = ("_signals", "_structure", "_contents", "_mode")  # pyright: ignore[reportUnannotatedClassAttribute]
 
-	def __init__(self, initial: Mapping[T1, T2] | None = None) -> None:
+	def __init__(
+		self,
+		initial: Mapping[T1, T2] | None = None,
+		*,
+		shallow: bool = False,
+		lazy: bool = False,
+	) -> None:
 		super().__init__()
+		# Per-key signals, created on the first read of a key
 		self._signals: dict[T1, Signal[_Any]] = {}
 		self._structure: Signal[int] = Signal(0)
+		# Changes when a value is replaced, created on the first read of all values
+		self._contents: Signal[int] | None = None
+		self._mode: _WrapMode = _wrap_mode(shallow, lazy)
 		if initial:
-			for k, v in initial.items():
-				v = reactive(v)
-				super().__setitem__(k, v)
-				self._signals[k] = Signal(v)
+			if self._mode == "deep":
+				super().update((k, reactive(v)) for k, v in initial.items())
+			else:
+				super().update(initial)
 
 	# ---- helpers ----
 	def _bump_structure(self) -> None:
 		self._structure.write(self._structure.read() + 1)
 
+	def _bump_contents(self) -> None:
+		if self._contents is not None:
+			self._contents.write(self._contents.value + 1)
+
+	def _read_contents(self) -> None:
+		self._structure.read()
+		if self._contents is None:
+			self._contents = Signal(0)
+		self._contents.read()
+
+	def _like(
+		self, initial: Mapping[_Any, _Any] | None = None
+	) -> ReactiveDict[_Any, _Any]:
+		return type(self)(
+			initial, shallow=self._mode == "shallow", lazy=self._mode == "lazy"
+		)
+
+	def _wrap(self, value: _Any) -> _Any:
+		return reactive(value) if self._mode == "deep" else value
+
+	def _load(self, key: T1) -> _Any:
+		"""Stored value of a key (or `_MISSING`), wrapped if the dict is lazy."""
+		value = dict.get(self, key, _MISSING)
+		if self._mode == "lazy" and value is not _MISSING:
+			wrapped = reactive(value, lazy=True)
+			if wrapped is not value:
+				super().__setitem__(key, wrapped)
+			return wrapped
+		return value
+
+	def _signal(self, key: T1) -> Signal[_Any]:
+		sig = self._signals.get(key)
+		if sig is None:
+			# Missing keys get a sentinel so their presence can be reactive
+			sig = Signal(self._load(key))
+			self._signals[key] = sig
+		return sig
+
+	def _store(self, key: T1, value: _Any) -> _Any:
+		"""Store a wrapped value and return the previous one (or `_MISSING`)."""
+		old = dict.get(self, key, _MISSING)
+		super().__setitem__(key, value)
+		sig = self._signals.get(key)
+		if sig is not None:
+			sig.write(self._load(key))
+		return old
+
+	def _discard(self, key: T1) -> None:
+		# Preserve the signal object for subscribers, marking the key absent
+		sig = self._signals.get(key)
+		if sig is not None:
+			sig.write(_MISSING)
+
 	# --- Mapping protocol ---
 	@override
 	def __getitem__(self, key: T1) -> T2:
-		if key not in self._signals:
-			# Lazily create missing key with sentinel so it can be reactive
-			self._signals[key] = Signal(_MISSING)
-		val = self._signals[key].read()
+		val = self._signal(key).read()
 		# Preserve dict.__getitem__ typing by casting. Semantics: return None
 		# only if the stored value is explicitly None; otherwise unwrap sentinel.
 		return cast(T2, None) if val is _MISSING else cast(T2, val)
@@ -128,10 +216,7 @@ class ReactiveDict(dict[T1, T2]):
 	@override
 	def __delitem__(self, key: T1) -> None:
 		# Remove from mapping but preserve signal object for subscribers
-		if key not in self._signals:
-			self._signals[key] = Signal(_MISSING)
-		else:
-			self._signals[key].write(_MISSING)
+		self._discard(key)
 		if super().__contains__(key):
 			super().__delitem__(key)
 			self._bump_structure()
@@ -145,11 +230,7 @@ class ReactiveDict(dict[T1, T2]):
 	@override
 	def get(self, key: T1, default: T3 | None = None) -> T2 | T3 | None:
 		# Ensure a per-key signal exists so get() can subscribe even when absent
-		sig = self._signals.get(key)
-		if sig is None:
-			sig = cast(Signal[T2], Signal(_MISSING))
-			self._signals[key] = sig
-		val = sig.read()
+		val = self._signal(key).read()
 		return default if val is _MISSING else val
 
 	@override
@@ -167,25 +248,17 @@ class ReactiveDict(dict[T1, T2]):
 	@override
 	def __contains__(self, key: T1) -> bool:  # pyright: ignore[reportIncompatibleMethodOverride]
 		# Subscribe to the per-key value signal so presence checks are reactive
-		sig = self._signals.get(key)
-		if sig is None:
-			sig = Signal(_MISSING)
-			self._signals[key] = sig
-		sig.read()
+		self._signal(key).read()
 		return dict.__contains__(self, key)
 
 	# --- Mutation helpers ---
 	def set(self, key: T1, value: T2) -> None:
-		value = reactive(value)
-		was_present = super().__contains__(key)
-		sig = self._signals.get(key)
-		if sig is None:
-			self._signals[key] = Signal(value)
-		else:
-			sig.write(value)
-		super().__setitem__(key, value)
-		if not was_present:
+		value = self._wrap(value)
+		old = self._store(key, value)
+		if old is _MISSING:
 			self._bump_structure()
+		elif not values_equal(old, value):
+			self._bump_contents()
 
 	@overload
 	def update(self, m: SupportsKeysAndGetItem[T1, T2], /) -> None: ...
@@ -213,27 +286,37 @@ class ReactiveDict(dict[T1, T2]):
 		**kwargs: T2,
 	) -> None:
 		# Match dict.update semantics
+		pairs: list[tuple[T1, _Any]] = []
 		if other is not None:
 			if isinstance(other, Mapping) or hasattr(other, "keys"):
 				# Mapping-like: iterate keys and fetch via __getitem__
 				keys_iter = other.keys()
-				for k in keys_iter:
-					self.set(cast(T1, k), cast(T2, other[k]))
+				pairs.extend((cast(T1, k), other[k]) for k in keys_iter)
 			else:
 				# Iterable of key/value pairs
-				for k, v in other:
-					self.set(k, v)
+				pairs.extend(other)
 		if kwargs:
-			for k, v in kwargs.items():
-				self.set(cast(T1, k), v)
+			pairs.extend((cast(T1, k), v) for k, v in kwargs.items())
+		# Notify structural changes and replaced values once
+		added = replaced = False
+		for k, v in pairs:
+			v = self._wrap(v)
+			old = self._store(k, v)
+			if old is _MISSING:
+				added = True
+			elif not values_equal(old, v):
+				replaced = True
+		if added:
+			self._bump_structure()
+		if replaced:
+			self._bump_contents()
 
 	def delete(self, key: T1) -> None:
-		if key in self._signals:
-			# Preserve signal and mark as not present; do not raise
-			self._signals[key].write(_MISSING)
-			if super().__contains__(key):
-				super().__delitem__(key)
-				self._bump_structure()
+		# Preserve signal and mark as not present; do not raise
+		self._discard(key)
+		if super().__contains__(key):
+			super().__delitem__(key)
+			self._bump_structure()
 
 	# ---- standard dict methods ----
 	# I have no idea why Pyright is not happy with this override, but *shrug*
@@ -276,11 +359,7 @@ class ReactiveDict(dict[T1, T2]):
 			raise KeyError("popitem(): dictionary is empty")
 		k, v = super().popitem()
 		# Preserve and update reactive metadata
-		sig = self._signals.get(k)
-		if sig is None:
-			self._signals[k] = Signal(_MISSING)
-		else:
-			sig.write(_MISSING)
+		self._discard(k)
 		self._bump_structure()
 		return k, v
 
@@ -293,34 +372,32 @@ class ReactiveDict(dict[T1, T2]):
 	def setdefault(self, key: T1, default: T2 | None = None) -> T2 | None:
 		if super().__contains__(key):
 			# Return current value without structural change
-			if key not in self._signals:
-				self._signals[key] = Signal(_MISSING)
-			return self._signals[key].read()
+			return self._signal(key).read()
 		# Insert default
 		self.set(key, default)  # pyright: ignore[reportArgumentType]
 		# Read structure after write to suppress immediate rerun of the current
 		# effect (if this is used in an effect) caused by the structural bump
 		# performed in set().
 		self._structure.read()
-		sig = self._signals.get(key)
-		if sig is None:
-			sig = cast(Signal[T2], Signal(_MISSING))
-			self._signals[key] = sig
-		return sig.read()
+		return self._signal(key).read()
 
 	@override
 	def clear(self) -> None:
 		if not super().__len__():
 			return
-		for k in list(super().keys()):
-			# Use our deletion to keep signals/presence updated
-			self.__delitem__(k)
-		# bump already done per key; nothing else needed
+		super().clear()
+		# Signals of absent keys already hold the sentinel
+		for sig in tuple(self._signals.values()):
+			sig.write(_MISSING)
+		self._bump_structure()
 
 	@override
 	def copy(self):
 		# Shallow copy preserving current values
-		return ReactiveDict(self)
+		self._read_contents()
+		result = self._like()
+		dict.update(result, dict.items(self))
+		return result
 
 	def __copy__(self):
 		return self.copy()
@@ -328,7 +405,7 @@ class ReactiveDict(dict[T1, T2]):
 	def __deepcopy__(self, memo: dict[int, _Any]):
 		if id(self) in memo:
 			return memo[id(self)]
-		result = type(self)()
+		result = self._like()
 		memo[id(self)] = result
 		for key in dict.__iter__(self):
 			key = cast(T1, key)
@@ -364,27 +441,24 @@ class ReactiveDict(dict[T1, T2]):
 
 	@override
 	def __or__(self, other: Mapping[T1, T2]) -> ReactiveDict[T1, T2]:  # pyright: ignore[reportIncompatibleMethodOverride]
-		result = ReactiveDict(self)
+		result = self.copy()
 		result.update(other)
 		return result
 
 	@override
 	def __ror__(self, other: Mapping[T1, T2]) -> ReactiveDict[T1, T2]:  # pyright: ignore[reportIncompatibleMethodOverride]
-		result = ReactiveDict(other)
+		result = self._like(other)
 		result.update(self)
 		return result
 
 	def unwrap(self) -> dict[T1, _Any]:
-		"""Return a plain dict while subscribing to contained signals.
+		"""Return a plain dict while subscribing to structure and values.
 
 		Returns:
 			A plain dict with all reactive containers recursively unwrapped.
 		"""
-		self._structure.read()
-		result: dict[T1, _Any] = {}
-		for key in dict.__iter__(self):
-			result[key] = unwrap(self[key])
-		return result
+		self._read_contents()
+		return {key: unwrap(value) for key, value in dict.items(self)}
 
 
 # Copied from the built-in types
@@ -414,13 +488,19 @@ SupportsRichComparisonT = TypeVar(
 class ReactiveList(list[T1]):
 	"""A list with item-level reactivity and structural change signaling.
 
-	Index reads depend on that index's Signal. Setting an index writes to that
-	index's Signal. Structural operations (append/insert/pop/etc.) trigger a
-	structural version Signal. Iteration subscribes to all item signals and
-	structural changes. len() subscribes to structural changes.
+	Index reads depend on that index's Signal, which is created on the first
+	read of the index. Setting an index writes to that index's Signal.
+	Structural operations (append/insert/pop/etc.) trigger a structural version
+	Signal, once for bulk operations (`extend`, `sort`, slice assignment and
+	deletion). len() subscribes to structural changes. Iteration, slices and
+	`unwrap()` subscribe to structural changes and to replaced items, through
+	a single Signal for the whole list.
 
 	Args:
 		initial: Initial items to populate the list.
+		shallow: Store items as given, without wrapping nested collections.
+		lazy: Store items as given and wrap nested collections (lazily too) on
+			their first read.
 
 	Example:
 
@@ -432,22 +512,65 @@ class ReactiveList(list[T1]):
 	```
 	"""
 
-	__slots__ = ("_signals", "_structure")  # pyright: ignore[reportUnannotatedClassAttribute]
+	__slots__ = ("_signals", "_structure", "_contents", "_mode")  # pyright: ignore[reportUnannotatedClassAttribute]
 
-	def __init__(self, initial: Iterable[T1] | None = None) -> None:
-		super().__init__()
-		self._signals: list[Signal[T1]] = []
+	def __init__(
+		self,
+		initial: Iterable[T1] | None = None,
+		*,
+		shallow: bool = False,
+		lazy: bool = False,
+	) -> None:
+		self._mode: _WrapMode = _wrap_mode(shallow, lazy)
+		if self._mode == "deep":
+			super().__init__(reactive(item) for item in initial or ())
+		else:
+			super().__init__(initial or ())
+		# Per-index signals, created on the first read of an index
+		self._signals: list[Signal[T1] | None] = [None] * super().__len__()
 		self._structure: Signal[int] = Signal(0)
-		if initial:
-			for item in initial:
-				v = reactive(item)
-				self._signals.append(Signal(v))
-				super().append(v)
+		# Changes when an item is replaced, created on the first iteration
+		self._contents: Signal[int] | None = None
 
 	# ---- helpers ----
 	def _bump_structure(self):
 		self._structure.write(self._structure.read() + 1)
 
+	def _bump_contents(self) -> None:
+		if self._contents is not None:
+			self._contents.write(self._contents.value + 1)
+
+	def _read_contents(self) -> None:
+		self._structure.read()
+		if self._contents is None:
+			self._contents = Signal(0)
+		self._contents.read()
+
+	def _like(self, initial: Iterable[_Any] | None = None) -> ReactiveList[_Any]:
+		return type(self)(
+			initial, shallow=self._mode == "shallow", lazy=self._mode == "lazy"
+		)
+
+	def _wrap(self, value: _Any) -> _Any:
+		return reactive(value) if self._mode == "deep" else value
+
+	def _load(self, idx: SupportsIndex) -> T1:
+		"""Stored item at an index, wrapped if the list is lazy."""
+		value = super().__getitem__(idx)
+		if self._mode == "lazy":
+			wrapped = reactive(value, lazy=True)
+			if wrapped is not value:
+				super().__setitem__(idx, wrapped)
+			return wrapped
+		return value
+
+	def _signal(self, idx: SupportsIndex) -> Signal[T1]:
+		sig = self._signals[idx]
+		if sig is None:
+			sig = Signal(self._load(idx))
+			self._signals[idx] = sig
+		return sig
+
 	@property
 	def version(self) -> int:
 		"""Reactive counter that increments on any structural change."""
@@ -466,10 +589,12 @@ class ReactiveList(list[T1]):
 	@override
 	def __getitem__(self, idx: SupportsIndex | slice):
 		if isinstance(idx, slice):
-			# Return a plain list of values (non-reactive slice)
-			start, stop, step = idx.indices(len(self))
-			return [self._signals[i].read() for i in range(start, stop, step)]
-		return self._signals[idx].read()
+			# Return a plain list of values, reactive to any change in the list
+			self._read_contents()
+			if self._mode == "lazy":
+				return [self._load(i) for i in range(*idx.indices(super().__len__()))]
+			return super().__getitem__(idx)
+		return self._signal(idx).read()
 
 	@overload
 	def __setitem__(self, key: SupportsIndex, value: T1, /) -> None:
@@ -485,34 +610,35 @@ class ReactiveList(list[T1]):
 	def __setitem__(self, key: SupportsIndex | slice, value: T1 | Iterable[T1]):
 		if isinstance(key, slice):
 			value = cast(Iterable[T1], value)
-			replacement_seq = list(value)
-			start, stop, step = key.indices(len(self))
-			target_indices = list(range(start, stop, step))
-
-			if len(replacement_seq) == len(target_indices):
-				wrapped = [reactive(v) for v in replacement_seq]
-				super().__setitem__(key, wrapped)
-				for i, v in zip(target_indices, wrapped, strict=True):
-					self._signals[i].write(v)
+			if self._mode == "deep":
+				wrapped = [reactive(v) for v in value]
+			else:
+				wrapped = list(value)
+			target_indices = range(*key.indices(super().__len__()))
+			super().__setitem__(key, wrapped)
+			if len(wrapped) == len(target_indices):
+				for i in target_indices:
+					sig = self._signals[i]
+					if sig is not None:
+						sig.write(self._load(i))
+				self._bump_contents()
 				return
-
-			super().__setitem__(key, replacement_seq)
-			self._signals = [Signal(reactive(v)) for v in super().__iter__()]
+			self._signals[key] = [None] * len(wrapped)
 			self._bump_structure()
 			return
 		# normal index
 		value = cast(T1, value)
-		v = reactive(value)
+		v = self._wrap(value)
+		old = super().__getitem__(key)
 		super().__setitem__(key, v)
-		self._signals[key].write(v)
+		sig = self._signals[key]
+		if sig is not None:
+			sig.write(self._load(key))
+		if not values_equal(old, v):
+			self._bump_contents()
 
 	@override
 	def __delitem__(self, idx: SupportsIndex | slice):
-		if isinstance(idx, slice):
-			super().__delitem__(idx)
-			self._signals = [Signal(v) for v in super().__iter__()]
-			self._bump_structure()
-			return
 		super().__delitem__(idx)
 		del self._signals[idx]
 		self._bump_structure()
@@ -520,27 +646,30 @@ class ReactiveList(list[T1]):
 	# ---- structural operations ----
 	@override
 	def append(self, value: T1) -> None:
-		v = reactive(value)
-		super().append(v)
-		self._signals.append(Signal(v))
+		super().append(self._wrap(value))
+		self._signals.append(None)
 		self._bump_structure()
 
 	@override
 	def extend(self, values: Iterable[T1]) -> None:
-		any_added = False
-		for v in values:
-			vv = reactive(v)
-			super().append(vv)
-			self._signals.append(Signal(vv))
-			any_added = True
-		if any_added:
+		if self._mode == "deep":
+			wrapped = [reactive(v) for v in values]
+		else:
+			wrapped = list(values)
+		if wrapped:
+			super().extend(wrapped)
+			self._signals.extend([None] * len(wrapped))
 			self._bump_structure()
 
+	@override
+	def __iadd__(self, values: Iterable[T1]) -> Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+		self.extend(values)
+		return self
+
 	@override
 	def insert(self, index: SupportsIndex, value: T1) -> None:
-		v = reactive(value)
-		super().insert(index, v)
-		self._signals.insert(index, Signal(v))
+		super().insert(index, self._wrap(value))
+		self._signals.insert(index, None)
 		self._bump_structure()
 
 	@override
@@ -551,13 +680,13 @@ class ReactiveList(list[T1]):
 		return val
 
 	def unwrap(self) -> list[_Any]:
-		"""Return a plain list while subscribing to element signals.
+		"""Return a plain list while subscribing to structure and items.
 
 		Returns:
 			A plain list with all reactive containers recursively unwrapped.
 		"""
-		self._structure()
-		return [unwrap(self[i]) for i in range(len(self._signals))]
+		self._read_contents()
+		return [unwrap(v) for v in super().__iter__()]
 
 	@override
 	def remove(self, value: _Any) -> None:
@@ -619,6 +748,11 @@ class ReactiveList(list[T1]):
 		key: Callable[[T1], SupportsRichComparison] | None = None,
 		reverse: bool = False,
 	) -> None:
+		if not any(self._signals):
+			# No item signals to reorder
+			super().sort(key=key, reverse=reverse)  # pyright: ignore[reportCallIssue, reportArgumentType]
+			self._bump_structure()
+			return
 		# To preserve per-index subscriptions, we have to reorder signals to match
 		# new order. We'll compute the permutation by sorting indices based on
 		# current values.
@@ -630,9 +764,9 @@ class ReactiveList(list[T1]):
 			v = current[i]
 			return key(v) if callable(key) else v
 
-		# Apply sort to underlying list
 		idxs.sort(key=key_for_index, reverse=reverse)  # pyright: ignore[reportCallIssue, reportArgumentType]
-		# Reorder signals to match
+		# Apply the permutation to the underlying list and reorder signals to match
+		super().__setitem__(slice(None), [current[i] for i in idxs])
 		self._signals = [self._signals[i] for i in idxs]
 		self._bump_structure()
 
@@ -644,23 +778,28 @@ class ReactiveList(list[T1]):
 
 	@override
 	def __iter__(self) -> Iterator[T1]:
-		self._structure.read()
-		for sig in self._signals:
-			yield sig.read()
+		self._read_contents()
+		if self._mode == "lazy":
+			return self._iter_lazy()
+		return super().__iter__()
+
+	def _iter_lazy(self) -> Iterator[T1]:
+		# Checks the length at each step, like list iteration, so the loop
+		# body can shrink or grow the list
+		i = 0
+		while i < super().__len__():
+			yield self._load(i)
+			i += 1
 
 	def __copy__(self):
-		result = type(self)()
-		for value in super().__iter__():
-			result.append(copy.copy(value))
-		return result
+		return self._like(copy.copy(value) for value in super().__iter__())
 
 	def __deepcopy__(self, memo: dict[int, _Any]):
 		if id(self) in memo:
 			return memo[id(self)]
-		result = type(self)()
+		result = self._like()
 		memo[id(self)] = result
-		for value in super().__iter__():
-			result.append(copy.deepcopy(value, memo))
+		result.extend(copy.deepcopy(value, memo) for value in super().__iter__())
 		return result
 
 
@@ -1041,17 +1180,41 @@ def reactive_dataclass(
 
 @overload
 def reactive(
-	value: dict[T1, T2], *, allow_frozen: bool = False
+	value: dict[T1, T2],
+	*,
+	allow_frozen: bool = False,
+	shallow: bool = False,
+	lazy: bool = False,
 ) -> ReactiveDict[T1, T2]: ...
 @overload
-def reactive(value: list[T1], *, allow_frozen: bool = False) -> ReactiveList[T1]: ...
+def reactive(
+	value: list[T1],
+	*,
+	allow_frozen: bool = False,
+	shallow: bool = False,
+	lazy: bool = False,
+) -> ReactiveList[T1]: ...
 @overload
-def reactive(value: set[T1], *, allow_frozen: bool = False) -> ReactiveSet[T1]: ...
+def reactive(
+	value: set[T1],
+	*,
+	allow_frozen: bool = False,
+	shallow: bool = False,
+	lazy: bool = False,
+) -> ReactiveSet[T1]: ...
 @overload
-def reactive(value: T1, *, allow_frozen: bool = False) -> T1: ...
+def reactive(
+	value: T1, *, allow_frozen: bool = False, shallow: bool = False, lazy: bool = False
+) -> T1: ...
 
 
-def reactive(value: _Any, *, allow_frozen: bool = False) -> _Any:
+def reactive(
+	value: _Any,
+	*,
+	allow_frozen: bool = False,
+	shallow: bool = False,
+	lazy: bool = False,
+) -> _Any:
 	"""Wrap built-in collections in their reactive counterparts if not already reactive.
 
 	Converts:
@@ -1065,10 +1228,20 @@ def reactive(value: _Any, *, allow_frozen: bool = False) -> _Any:
 	Frozen dataclass instances also pass through unchanged. Frozen dataclass
 	classes raise unless allow_frozen=True.
 
+	Nested dicts and lists are converted along with their parent by default.
+	With `shallow=True`, only the top-level dict or list is converted and the
+	values stored in it are never wrapped. With `lazy=True`, nested collections
+	are converted (lazily too) on their first read, so large data that is only
+	partially read only pays for what it uses. Both modes carry over to values
+	stored later in the same container. For a dataclass instance, they apply
+	to the values its fields hold when it is converted.
+
 	Args:
 		value: The value to make reactive.
 		allow_frozen: Allow frozen dataclass classes to use the reactive
 			class-factory path. Frozen dataclass instances still pass through.
+		shallow: Only convert the top-level dict or list.
+		lazy: Convert nested collections on their first read.
 
 	Returns:
 		The reactive version of the value, or the original if already reactive
@@ -1080,6 +1253,7 @@ def reactive(value: _Any, *, allow_frozen: bool = False) -> _Any:
 	data = reactive({"key": "value"})  # ReactiveDict
 	items = reactive([1, 2, 3])        # ReactiveList
 	tags = reactive({"a", "b"})        # ReactiveSet
+	rows = reactive(response, lazy=True)  # rows wrapped when read
 	```
 	"""
 	if isinstance(value, ReactiveDict | ReactiveList | ReactiveSet):
@@ -1111,14 +1285,14 @@ def reactive(value: _Any, *, allow_frozen: bool = False) -> _Any:
 		_INITIALIZING_OBJECT_IDS.add(id(value))
 		try:
 			for name, v in field_values.items():
-				object.__setattr__(value, name, reactive(v))
+				object.__setattr__(value, name, reactive(v, shallow=shallow, lazy=lazy))
 		finally:
 			_INITIALIZING_OBJECT_IDS.discard(id(value))
 		return value
 	if isinstance(value, dict):
-		return ReactiveDict(value)  # pyright: ignore[reportUnknownArgumentType]
+		return ReactiveDict(value, shallow=shallow, lazy=lazy)  # pyright: ignore[reportUnknownArgumentType]
 	if isinstance(value, list):
-		return ReactiveList(value)  # pyright: ignore[reportUnknownArgumentType]
+		return ReactiveList(value, shallow=shallow, lazy=lazy)  # pyright: ignore[reportUnknownArgumentType]
 	if isinstance(value, set):
 		return ReactiveSet(value)  # pyright: ignore[reportUnknownArgumentType]
 	if isinstance(value, type) and is_dataclass(value):
@@ -1131,6 +1305,42 @@ def reactive(value: _Any, *, allow_frozen: bool = False) -> _Any:
 	return value
 
 
+@overload
+def shallow(value: dict[T1, T2]) -> ReactiveDict[T1, T2]: ...
+@overload
+def shallow(value: list[T1]) -> ReactiveList[T1]: ...
+@overload
+def shallow(value: T1) -> T1: ...
+
+
+def shallow(value: _Any) -> _Any:
+	"""Wrap a dict or list in a reactive container without wrapping its values.
+
+	Reading or writing an item is reactive, but nested collections are stored
+	as given, including values written later. Use it for large data that is
+	replaced as a whole, such as API responses assigned to a State field.
+	Shorthand for `reactive(value, shallow=True)`.
+
+	Args:
+		value: The value to make reactive.
+
+	Returns:
+		A shallow ReactiveDict or ReactiveList, or the value as `reactive()`
+		returns it for other types.
+
+	Example:
+
+	```python
+	class ResultsState(ps.State):
+	    rows: list[dict[str, Any]] = []
+
+	    async def load(self):
+	        self.rows = ps.shallow(await fetch_rows())  # rows stay plain dicts
+	```
+	"""
+	return reactive(value, shallow=True)
+
+
 def unwrap(value: _Any, untrack: bool = False) -> _Any:
 	"""Recursively unwrap reactive containers into plain Python values.
 
@@ -3,10 +3,12 @@ import logging
 import traceback
 import uuid
 from asyncio import iscoroutine
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast, overload
 
 from pulse.channel import Channel
+from pulse.compaction import compact_operations
 from pulse.context import PulseContext
 from pulse.hooks.runtime import NotFoundInterrupt, RedirectInterrupt
 from pulse.messages import (
@@ -18,8 +20,15 @@ from pulse.messages import (
 	ServerNavigateToMessage,
 	ServerUpdateMessage,
 )
+from pulse.profiler import RenderProfiler
 from pulse.queries.store import QueryStore
-from pulse.reactive import REACTIVE_CONTEXT, Effect, Untrack, flush_effects
+from pulse.reactive import (
+	REACTIVE_CONTEXT,
+	RENDER_EFFECT_RANK,
+	Effect,
+	Untrack,
+	flush_effects,
+)
 from pulse.reactive_extensions import ReactiveDict
 from pulse.renderer import RenderTree
 from pulse.routing import (
@@ -38,6 +47,7 @@ from pulse.scheduling import (
 )
 from pulse.state.query_param import QueryParamSync
 from pulse.state.state import State
+from pulse.templates import extract_templates
 from pulse.transpiler.id import next_id
 from pulse.transpiler.nodes import Expr
 
@@ -103,6 +113,12 @@ class SessionUrl(TypedDict):
 	queryParams: dict[str, str]
 
 
+class RouteRenderEffect(Effect):
+	"""Re-renders a mounted route, after the state effects of the same flush."""
+
+	rank = RENDER_EFFECT_RANK
+
+
 class RouteMount:
 	render: "RenderSession"
 	path: str
@@ -119,6 +135,7 @@ class RouteMount:
 	mount_id: str
 	render_batch_id: int
 	render_batch_renders: int
+	stream_task: asyncio.Task[Any] | None
 
 	def __init__(
 		self,
@@ -133,6 +150,9 @@ class RouteMount:
 		self.effect = None
 		self._pulse_ctx = None
 		self.tree = RenderTree(route.render())
+		if render.profiler is not None:
+			self.tree.profiler = render.profiler.route(self.path)
+		self.tree.prop_patches = render.prop_patches
 		self.initialized = False
 		self.state = "pending"
 		self.ever_active = False
@@ -142,6 +162,7 @@ class RouteMount:
 		self.mount_id = uuid.uuid4().hex
 		self.render_batch_id = -1
 		self.render_batch_renders = 0
+		self.stream_task = None
 
 	def update_route(self, route_info: RouteInfo) -> None:
 		self.route.update(route_info)
@@ -207,6 +228,21 @@ class RouteMount:
 		if self.state == "pending":
 			if self.queue is None:
 				raise RuntimeError(f"Pending mount missing queue for {self.path!r}")
+			last = self.queue[-1] if self.queue else None
+			if (
+				message["type"] == "vdom_update"
+				and last is not None
+				and last["type"] == "vdom_update"
+				and last["path"] == message["path"]
+			):
+				# The client applies queued updates back to back; send them as
+				# one compacted update.
+				self.queue[-1] = ServerUpdateMessage(
+					type="vdom_update",
+					path=message["path"],
+					ops=compact_operations([*last["ops"], *message["ops"]]),
+				)
+				return
 			self.queue.append(message)
 			return
 		if self.state == "active":
@@ -239,7 +275,7 @@ class RouteMount:
 				}
 			self.render.report_error(self.path, "render", exc, details)
 
-		self.effect = Effect(
+		self.effect = RouteRenderEffect(
 			_render_effect,
 			immediate=False,
 			name=f"{self.path}:render",
@@ -251,6 +287,9 @@ class RouteMount:
 
 	def dispose(self) -> None:
 		self._cancel_pending_timeout()
+		if self.stream_task is not None:
+			self.stream_task.cancel()
+			self.stream_task = None
 		self.state = "closed"
 		self.queue = None
 		self.tree.unmount()
@@ -272,6 +311,10 @@ class RenderSession:
 	dev_strict_mode_detach_timeout: float
 	disconnect_queue_timeout: float
 	render_loop_limit: int
+	render_chunk_size: int | None
+	vdom_templates: bool
+	prop_patches: bool
+	profiler: RenderProfiler | None
 	_server_address: str | None
 	_client_address: str | None
 	_send_message: Callable[[ServerMessage], Any] | None
@@ -295,10 +338,17 @@ class RenderSession:
 		dev_strict_mode_detach_timeout: float = 0.0,
 		disconnect_queue_timeout: float = 300.0,
 		render_loop_limit: int = 50,
+		render_chunk_size: int | None = None,
+		vdom_templates: bool = False,
+		prop_patches: bool = False,
+		profiler: RenderProfiler | None = None,
 	) -> None:
 		from pulse.channel import ChannelsManager
 		from pulse.forms import FormRegistry
 
+		if render_chunk_size is not None and render_chunk_size < 1:
+			raise ValueError("render_chunk_size must be a positive integer")
+
 		self.id = id
 		self.routes = routes
 		self.route_mounts = {}
@@ -329,6 +379,10 @@ class RenderSession:
 		self.dev_strict_mode_detach_timeout = dev_strict_mode_detach_timeout
 		self.disconnect_queue_timeout = disconnect_queue_timeout
 		self.render_loop_limit = render_loop_limit
+		self.render_chunk_size = render_chunk_size
+		self.vdom_templates = vdom_templates
+		self.prop_patches = prop_patches
+		self.profiler = profiler
 
 	@property
 	def server_address(self) -> str:
@@ -492,9 +546,16 @@ class RenderSession:
 		Synchronous render for SSR. Returns per-path init or navigate_to messages.
 		- Creates mounts in PENDING state and starts queue
 		"""
-		normalized = [ensure_absolute_path(path) for path in paths]
+		return dict(self.iter_prerender(paths, route_info))
 
-		results: dict[str, ServerInitMessage | ServerNavigateToMessage] = {}
+	def iter_prerender(
+		self, paths: list[str], route_info: RouteInfo | None = None
+	) -> Iterator[tuple[str, ServerInitMessage | ServerNavigateToMessage]]:
+		"""
+		Like `prerender`, but renders each path only when the previous one has
+		been consumed, so callers can send it or stop early.
+		"""
+		normalized = [ensure_absolute_path(path) for path in paths]
 
 		for path in normalized:
 			route = self.routes.find(path)
@@ -518,13 +579,10 @@ class RenderSession:
 			with mount.effect.capture_deps(update_deps=True):
 				message = self.render(mount, path)
 
-			results[path] = message
 			if message["type"] == "navigate_to":
 				mount.dispose()
 				del self.route_mounts[path]
-				continue
-
-		return results
+			yield path, message
 
 	# ---- Client lifecycle ----
 
@@ -637,6 +695,7 @@ class RenderSession:
 		*,
 		session: Any | None = None,
 		render_fn: Callable[[], T_Render],
+		check_loop: bool = True,
 	) -> T_Render | ServerNavigateToMessage:
 		ctx = PulseContext.get()
 		render_session = ctx.session if session is None else session
@@ -653,8 +712,16 @@ class RenderSession:
 			source_mount_id=source_mount_id,
 		):
 			try:
-				self._check_render_loop(mount, path)
-				return render_fn()
+				if check_loop:
+					self._check_render_loop(mount, path)
+				if self.profiler is None:
+					return render_fn()
+				start = perf_counter()
+				result = render_fn()
+				self.profiler.record_message(
+					mount.path, perf_counter() - start, cast(Any, result)
+				)
+				return result
 			except RedirectInterrupt as r:
 				return ServerNavigateToMessage(
 					type="navigate_to",
@@ -675,22 +742,79 @@ class RenderSession:
 		self, mount: RouteMount, path: str, *, session: Any | None = None
 	) -> ServerInitMessage | ServerNavigateToMessage:
 		def _render() -> ServerInitMessage:
-			vdom = mount.tree.render()
+			vdom = mount.tree.render(chunk_size=self.render_chunk_size)
 			mount.initialized = True
+			if self.vdom_templates:
+				vdom, templates = extract_templates(vdom)
+				if templates:
+					return ServerInitMessage(
+						type="vdom_init", path=path, vdom=vdom, templates=templates
+					)
 			return ServerInitMessage(type="vdom_init", path=path, vdom=vdom)
 
 		message = self._render_with_interrupts(
 			mount, path, session=session, render_fn=_render
 		)
+		if mount.tree.deferred and mount.stream_task is None:
+			if session is None:
+				session = PulseContext.get().session
+			mount.stream_task = self.create_task(
+				self._stream_deferred(mount, path, session),
+				name=f"render:{path}:stream",
+			)
 		return message
 
+	async def _stream_deferred(
+		self, mount: RouteMount, path: str, session: Any | None
+	) -> None:
+		"""Send the children left out of a chunked initial render.
+
+		Renders one chunk per loop iteration and sends it as a `vdom_update`,
+		so the rest of the process keeps being served while a large page
+		fills in. Updates queue on pending mounts like any other; a suspended
+		mount stops streaming, since resuming renders the full tree anyway.
+		"""
+		try:
+			while True:
+				await asyncio.sleep(0)
+				if mount.state in ("closed", "suspended") or not mount.tree.deferred:
+					return
+
+				def _render_chunk() -> ServerUpdateMessage | None:
+					with Untrack():
+						ops = mount.tree.render_deferred(self.render_chunk_size)
+					if ops:
+						return ServerUpdateMessage(
+							type="vdom_update", path=path, ops=ops
+						)
+					return None
+
+				try:
+					message = self._render_with_interrupts(
+						mount,
+						path,
+						session=session,
+						render_fn=_render_chunk,
+						check_loop=False,
+					)
+				except Exception as exc:
+					self.report_error(path, "render", exc)
+					return
+				if message is not None:
+					self.send(message)
+					if message["type"] == "navigate_to":
+						return
+		finally:
+			if mount.stream_task is asyncio.current_task():
+				mount.stream_task = None
+
 	def rerender(
 		self, mount: RouteMount, path: str, *, session: Any | None = None
 	) -> ServerUpdateMessage | ServerNavigateToMessage | None:
 		def _rerender() -> ServerUpdateMessage | None:
 			if not mount.initialized:
 				raise RuntimeError(f"rerender called before init for {path!r}")
-			ops = mount.tree.rerender()
+			ops = compact_operations(mount.tree.rerender())
 			if ops:
 				return ServerUpdateMessage(type="vdom_update", path=path, ops=ops)
 			return None
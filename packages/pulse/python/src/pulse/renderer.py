@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from contextvars import Token
 from dataclasses import dataclass
-from types import NoneType
-from typing import Any, NamedTuple, TypeAlias, cast
+from functools import partial
+from itertools import count, repeat
+from types import FunctionType, MethodType, NoneType
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, cast, override
+from typing import Literal as Lit
 
 from pulse.debounce import Debounced
 from pulse.helpers import values_equal
 from pulse.hooks.core import HookContext
+from pulse.patches import diff_value
+from pulse.reactive import (
+	REACTIVE_CONTEXT,
+	Computed,
+	Effect,
+	ReactiveContext,
+	Scope,
+	Signal,
+	Untrack,
+)
 from pulse.refs import RefHandle
 from pulse.transpiler import Import
 from pulse.transpiler.function import Constant, JsFunction, JsxFunction
@@ -24,17 +40,20 @@ from pulse.transpiler.nodes import (
 )
 from pulse.transpiler.vdom import (
 	VDOM,
+	PatchOp,
 	ReconciliationOperation,
 	RegistryRef,
 	ReplaceOperation,
 	UpdatePropsDelta,
 	UpdatePropsOperation,
 	VDOMElement,
-	VDOMNode,
 	VDOMOperation,
 	VDOMPropValue,
 )
 
+if TYPE_CHECKING:
+	from pulse.profiler import RouteProfiler
+
 PropValue: TypeAlias = Node | Callable[..., Any] | Debounced[Any, Any] | RefHandle[Any]
 
 FRAGMENT_TAG = ""
@@ -56,6 +75,7 @@ class DiffPropsResult:
 	normalized: dict[str, PropValue]
 	delta_set: dict[str, VDOMPropValue]
 	delta_remove: set[str]
+	delta_patch: dict[str, list[PatchOp]]
 	render_prop_reconciles: list["RenderPropTask"]
 	eval_keys: set[str]
 	eval_changed: bool
@@ -68,29 +88,300 @@ class RenderPropTask(NamedTuple):
 	path: str
 
 
+@dataclass(slots=True)
+class DeferredChildren:
+	"""Children of a mounted element whose rendering was postponed.
+
+	`children` is the element's rendered children list; chunks append to it in
+	place, so it stays in sync with what the client has. Reconciling or
+	unmounting the element replaces that list, which retires the entry.
+	"""
+
+	element: Element
+	path: str
+	children: list[Node]
+	pending: list[Node]
+	# Callback keys of the component (or tree) that rendered the element
+	callback_keys: set[str]
+
+
+# Tasks of the render and reconcile work stack, see `Renderer.run`
+Task: TypeAlias = tuple[Any, ...]
+# (kind, node, path, vdoms, nodes, idx)
+_TASK_RENDER = 0
+# (kind, previous, current, path, nodes, idx)
+_TASK_RECONCILE = 1
+# (kind, node, path, reconciliation op, nodes, idx)
+_TASK_RENDER_NEW = 2
+# (kind, op)
+_TASK_APPEND_OP = 3
+# (kind, element, normalized props, normalized children, nodes, idx)
+_TASK_ELEMENT_DONE = 4
+# (kind, op, previous children, start, reused, reuse dests, reuse sources)
+_TASK_CHILDREN_DONE = 5
+# (kind, component, hooks, outer keys, profiler frame, content vdom slot,
+# content node slot, vdoms, nodes, idx)
+_TASK_COMPONENT_DONE = 6
+
+
+class NormalizedChildren(list[Node]):
+	"""Children list of a rendered element: flat, unwrapped, with unique keys.
+
+	The renderer stores one on every element it renders or reconciles, and
+	`normalize_children` returns it as-is, so later reconciliations and the
+	final unmount don't walk and validate the same list again.
+	"""
+
+	__slots__ = ()
+
+
+_component_seq = count()
+
+
+class ComponentScope(Scope):
+	"""Dependency scope shared by the components of one tree.
+
+	Entering a component's hooks points it at fresh collections for that
+	render, so components don't each need a scope and a reactive context.
+	"""
+
+	# Collections of the component being rendered
+	deps: dict[Signal[Any] | Computed[Any], int]
+	effects: list[Effect]
+	# Reactive context that tracks into this scope, and the one it extends
+	context: ReactiveContext | None
+	outer: ReactiveContext | None
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.context = None
+		self.outer = None
+
+	def enter(self) -> Token[ReactiveContext] | None:
+		"""Make this scope current; None if it already is (nested components)."""
+		rc = REACTIVE_CONTEXT.get()
+		context = self.context
+		if rc is context:
+			return None
+		if context is None or self.outer is not rc:
+			context = ReactiveContext(rc.epoch, rc.batch, self, rc.on_effect_error)
+			self.context = context
+			self.outer = rc
+		return REACTIVE_CONTEXT.set(context)
+
+	@override
+	def register_effect(self, effect: Effect):
+		if self.effects is _NO_EFFECTS:
+			# Allocated on demand: most renders create no effects
+			self.effects = []
+		super().register_effect(effect)
+
+
+class ComponentHooks(HookContext):
+	"""Hook context of a mounted component, which also tracks its renders.
+
+	Entering it for a render records the signals read by the component
+	function and the effects it creates. When one of those signals changes,
+	the component is marked dirty on its tree instead of being re-rendered on
+	the spot; the owning route re-renders dirty components on its next pass.
+	"""
+
+	# Set by the renderer each time it enters the component
+	tree: "RenderTree | None"
+	node: PulseNode | None
+	path: str
+	seq: int
+	# Callback paths registered by this component's own elements (not by
+	# nested components), so stale entries can be dropped without a scan.
+	callback_keys: AbstractSet[str]
+	# Signals and computeds read by the last render -> their last_change then
+	deps: dict[Signal[Any] | Computed[Any], int]
+	# Effects created by the last render (inline `@ps.effect`s excluded)
+	effects: list[Effect]
+	# While rendering: the tree scope's token, if entering made it current,
+	# and the collections it had
+	_scope_token: Token[ReactiveContext] | None
+	_outer_deps: dict[Signal[Any] | Computed[Any], int]
+	_outer_effects: list[Effect]
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.tree = None
+		self.node = None
+		self.path = ""
+		self.callback_keys = _NO_KEYS
+		self.deps = _NO_DEPS
+		self.effects = _NO_EFFECTS
+		self._scope_token = None
+		self._outer_deps = _NO_DEPS
+		self._outer_effects = _NO_EFFECTS
+		# Creation order breaks depth ties: a component rendering another
+		# component directly shares its path, and is always created first.
+		self.seq = next(_component_seq)
+
+	def push_change(self) -> None:
+		if self.tree is not None:
+			self.tree.invalidate(self)
+
+	def changed(self) -> bool:
+		"""Whether a dependency changed since the last render read it."""
+		for dep, last_seen in self.deps.items():
+			if isinstance(dep, Computed):
+				dep.recompute_if_necessary()
+			if dep.last_change > last_seen:
+				return True
+		return False
+
+	def depth(self) -> tuple[int, int]:
+		depth = self.path.count(".") + 1 if self.path else 0
+		return depth, self.seq
+
+	@override
+	def __enter__(self):
+		if self.effects:
+			# Effects created by the previous render clean up before the next
+			with Untrack():
+				for effect in self.effects:
+					if effect.__disposed__:
+						continue
+					try:
+						effect._cleanup_before_run()  # pyright: ignore[reportPrivateUsage]
+					except Exception as e:
+						effect.handle_error(e)
+		tree = self.tree
+		assert tree is not None, "Component hooks are entered by the renderer"
+		scope = tree.scope
+		# Saved for nested renders, which share the tree's scope
+		self._outer_deps = scope.deps
+		self._outer_effects = scope.effects
+		scope.deps = {}
+		scope.effects = _NO_EFFECTS
+		self._scope_token = scope.enter()
+		return super().__enter__()
+
+	@override
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: Any,
+	) -> Lit[False]:
+		try:
+			super().__exit__(exc_type, exc_val, exc_tb)
+		finally:
+			token = self._scope_token
+			assert self.tree is not None
+			if token is not None:
+				self._scope_token = None
+				REACTIVE_CONTEXT.reset(token)
+			scope = self.tree.scope
+			deps = scope.deps
+			self.effects = scope.effects
+			scope.deps = self._outer_deps
+			scope.effects = self._outer_effects
+			self.set_deps(deps or _NO_DEPS)
+		return False
+
+	def set_deps(self, deps: dict[Signal[Any] | Computed[Any], int]) -> None:
+		prev = self.deps
+		self.deps = deps
+		for dep in prev:
+			if dep not in deps:
+				dep.remove_obs(self)
+		stale = False
+		for dep, last_seen in deps.items():
+			dep.add_obs(self)
+			# Written after the render read it, before it was subscribed
+			if dep.last_change > last_seen or (isinstance(dep, Computed) and dep.dirty):
+				stale = True
+		if stale:
+			self.push_change()
+
+	@override
+	def unmount(self) -> None:
+		super().unmount()
+		tree = self.tree
+		if tree is not None:
+			tree.dirty.pop(self, None)
+			for key in self.callback_keys:
+				tree.callbacks.pop(key, None)
+			self.tree = None
+		for dep in self.deps:
+			dep.remove_obs(self)
+		self.deps = _NO_DEPS
+		for effect in self.effects:
+			if not effect.__disposed__:
+				effect.dispose()
+		self.effects = _NO_EFFECTS
+
+
+# Shared initial values of `ComponentHooks`, never mutated: renders and
+# callback collection replace them with their own collections.
+_NO_KEYS: frozenset[str] = frozenset()
+_NO_DEPS: dict[Signal[Any] | Computed[Any], int] = {}
+_NO_EFFECTS: list[Effect] = []
+
+
 class RenderTree:
 	element: Node
 	callbacks: Callbacks
 	rendered: bool
+	# Components whose dependencies changed since they last rendered, in the
+	# order they were invalidated.
+	dirty: dict[ComponentHooks, None]
+	# Bumped whenever a component is marked dirty. Reading it from render()
+	# and rerender() lets the route effect re-run only when there is work.
+	version: Signal[int]
+	# Callback paths registered by elements outside of any component.
+	callback_keys: AbstractSet[str]
+	# Children left out of a chunked render, keyed by id() of their element,
+	# in the order they should be streamed.
+	deferred: dict[int, DeferredChildren]
+	# Records component timings when profiling is enabled
+	profiler: "RouteProfiler | None"
+	# Send changed list/dict props as patches when smaller (`pulse.patches`)
+	prop_patches: bool
+	# Tracks what each component reads while it renders
+	scope: ComponentScope
 
 	def __init__(self, element: Node) -> None:
 		self.element = element
 		self.callbacks = {}
 		self.rendered = False
-
-	def render(self) -> VDOM:
+		self.dirty = {}
+		self.callback_keys = _NO_KEYS
+		self.deferred = {}
+		self.profiler = None
+		self.prop_patches = False
+		self.version = Signal(0, name="render_tree.version")
+		self.scope = ComponentScope()
+
+	def invalidate(self, hooks: ComponentHooks) -> None:
+		self.dirty[hooks] = None
+		self.version.write(self.version.value + 1)
+
+	def render(self, *, chunk_size: int | None = None) -> VDOM:
 		"""Render and return the full VDOM.
 
+		With `chunk_size`, elements with more children than that only render
+		their first `chunk_size` children; the rest are left in `deferred` for
+		`render_deferred()` to stream as update operations.
+
 		On an already-rendered tree (re-prerender, resume after suspend),
-		reconciles in place first so component hook state is preserved, then
-		serializes without re-invoking components.
+		re-renders dirty components in place first so hook state is preserved,
+		then serializes without re-invoking components. Deferred children are
+		rendered first, so the result is always complete.
 		"""
+		self.version.read()
 		if self.rendered:
 			self.rerender()
-			renderer = Renderer(reuse_contents=True)
+			while self.deferred:
+				self.render_deferred()
+			renderer = Renderer(self, reuse_contents=True)
 		else:
-			renderer = Renderer()
-		vdom, self.element = renderer.render_tree(self.element)
+			renderer = Renderer(self, chunk_size=chunk_size)
+		with renderer.collect_callbacks(self):
+			vdom, self.element = renderer.render_tree(self.element)
 		self.callbacks = renderer.callbacks
 		self.rendered = True
 		return vdom
@@ -98,15 +389,80 @@ class RenderTree:
 	def rerender(self, new_element: Node | None = None) -> list[VDOMOperation]:
 		"""Re-render and return update operations.
 
-		If new_element is provided, reconciles against it (for testing).
-		Otherwise, reconciles against the current element (production use).
+		If new_element is provided, reconciles the whole tree against it (for
+		testing). Otherwise, re-renders only the dirty components, each at its
+		own path, shallowest first (production use).
 		"""
 		if not self.rendered:
 			raise RuntimeError("render() must be called before rerender()")
-		target = new_element if new_element is not None else self.element
-		renderer = Renderer()
-		self.element = renderer.reconcile_tree(self.element, target, path="")
-		self.callbacks = renderer.callbacks
+		self.version.read()
+		renderer = Renderer(self)
+		if new_element is not None:
+			with renderer.collect_callbacks(self):
+				self.element = renderer.reconcile_tree(
+					self.element, new_element, path=""
+				)
+		else:
+			for hooks in sorted(self.dirty, key=ComponentHooks.depth):
+				# Re-rendering an ancestor re-renders (or unmounts) its dirty
+				# descendants, which drops them from the dirty set.
+				if hooks not in self.dirty:
+					continue
+				if hooks.changed():
+					renderer.rerender_component(hooks)
+				else:
+					# Only computeds it reads were invalidated, to equal values
+					del self.dirty[hooks]
+		# Stale entries were dropped as their owners re-rendered or unmounted.
+		self.callbacks.update(renderer.callbacks)
+		return renderer.operations
+
+	def defer(self, entry: DeferredChildren) -> None:
+		self.deferred[id(entry.element)] = entry
+
+	def render_deferred(self, chunk_size: int | None = None) -> list[VDOMOperation]:
+		"""Render up to `chunk_size` deferred children (all if None).
+
+		Returns one reconciliation operation per element that grew, appending
+		the new children. Large lists inside the rendered children are
+		deferred again and picked up by later calls.
+		"""
+		if not self.rendered:
+			raise RuntimeError("render() must be called before render_deferred()")
+		renderer = Renderer(self, chunk_size=chunk_size)
+		budget = chunk_size
+		while self.deferred and (budget is None or budget > 0):
+			key, entry = next(iter(self.deferred.items()))
+			if entry.element.children is not entry.children:
+				# Reconciled or unmounted since the chunk was deferred
+				del self.deferred[key]
+				continue
+			count = len(entry.pending) if budget is None else budget
+			batch = entry.pending[:count]
+			del entry.pending[:count]
+			if not entry.pending:
+				del self.deferred[key]
+			if budget is not None:
+				budget -= len(batch)
+
+			start = len(entry.children)
+			op = ReconciliationOperation(
+				type="reconciliation",
+				path=entry.path,
+				N=start + len(batch),
+				new=([], []),
+				reuse=([], []),
+			)
+			renderer.operations.append(op)
+			renderer.callback_keys = entry.callback_keys
+			for idx, child in enumerate(batch, start):
+				vdom, normalized = renderer.render_tree(
+					child, join_path(entry.path, idx)
+				)
+				op["new"][0].append(idx)
+				op["new"][1].append(vdom)
+				entry.children.append(normalized)
+		self.callbacks.update(renderer.callbacks)
 		return renderer.operations
 
 	def unmount(self) -> None:
@@ -114,49 +470,227 @@ class RenderTree:
 			unmount_element(self.element)
 			self.rendered = False
 		self.callbacks.clear()
+		self.callback_keys = _NO_KEYS
+		self.dirty.clear()
+		self.deferred.clear()
 
 
 class Renderer:
+	tree: RenderTree
 	# Serialize already-rendered components from their contents instead of
 	# re-invoking them (which would mint fresh hook state for children).
 	reuse_contents: bool
+	# Render at most this many children per element; the rest are deferred
+	# on the tree. Only applies to freshly rendered elements.
+	chunk_size: int | None
 
-	def __init__(self, *, reuse_contents: bool = False) -> None:
+	def __init__(
+		self,
+		tree: RenderTree,
+		*,
+		reuse_contents: bool = False,
+		chunk_size: int | None = None,
+	) -> None:
+		self.tree = tree
 		self.callbacks: Callbacks = {}
+		# Keys registered for the current owner; `_NO_KEYS` until the first
+		# one, so components without callbacks don't each keep a set.
+		self.callback_keys: AbstractSet[str] = _NO_KEYS
 		self.operations: list[VDOMOperation] = []
 		self.reuse_contents = reuse_contents
+		self.chunk_size = chunk_size
+
+	@contextmanager
+	def collect_callbacks(self, owner: ComponentHooks | RenderTree) -> Iterator[None]:
+		"""Attribute callbacks registered inside the block to `owner`."""
+		outer = self.enter_callbacks()
+		try:
+			yield
+		finally:
+			self.exit_callbacks(owner, outer)
+
+	def enter_callbacks(self) -> AbstractSet[str]:
+		outer = self.callback_keys
+		self.callback_keys = _NO_KEYS
+		return outer
+
+	def exit_callbacks(
+		self, owner: ComponentHooks | RenderTree, outer: AbstractSet[str]
+	) -> None:
+		keys = self.callback_keys
+		self.callback_keys = outer
+		for key in owner.callback_keys - keys:
+			self.tree.callbacks.pop(key, None)
+		owner.callback_keys = keys
+
+	def owned_callback_keys(self) -> set[str]:
+		"""The current owner's callback keys, as a set it will keep."""
+		keys = self.callback_keys
+		if not isinstance(keys, set):
+			keys = self.callback_keys = set()
+		return keys
+
+	def register_callback(self, path: str, fn: Callable[..., Any]) -> None:
+		register_callback(self.callbacks, path, fn)
+		self.owned_callback_keys().add(path)
+
+	# ------------------------------------------------------------------
+	# Work stack
+	#
+	# Rendering and reconciliation walk the tree with an explicit stack of
+	# tasks instead of recursing, so the depth of a tree costs no Python
+	# frames. Tasks are tuples tagged with one of the `_TASK_*` constants;
+	# results are written into the slot (`list`, index) given by the parent.
+	# Render props are handled by a nested walk, which only costs frames
+	# per level of render props.
+	# ------------------------------------------------------------------
+
+	def run(self, stack: list[Task]) -> None:
+		try:
+			while stack:
+				task = stack.pop()
+				kind = task[0]
+				if kind == _TASK_RENDER:
+					_, node, path, vdoms, nodes, idx = task
+					if isinstance(node, PulseNode):
+						self.render_component(node, path, vdoms, nodes, idx, stack)
+					elif isinstance(node, Element):
+						self.render_node(node, path, vdoms, nodes, idx, stack)
+					elif isinstance(node, Value):
+						vdoms[idx] = nodes[idx] = node.value
+					elif isinstance(node, Expr):
+						vdoms[idx] = node.render()
+						nodes[idx] = node
+					else:
+						# Pass through any other value - serializer will validate
+						vdoms[idx] = nodes[idx] = node
+				elif kind == _TASK_RECONCILE:
+					_, previous, current, path, nodes, idx = task
+					self.reconcile_node(previous, current, path, nodes, idx, stack)
+				elif kind == _TASK_RENDER_NEW:
+					_, node, path, op, nodes, idx = task
+					vdom, nodes[idx] = self.render_tree(node, path)
+					op["new"][0].append(idx)
+					op["new"][1].append(vdom)
+				elif kind == _TASK_APPEND_OP:
+					self.operations.append(task[1])
+				elif kind == _TASK_ELEMENT_DONE:
+					_, element, props, children, nodes, idx = task
+					element.props = props or None
+					element.children = children
+					nodes[idx] = element
+				elif kind == _TASK_CHILDREN_DONE:
+					self.finish_children(task)
+				else:
+					(
+						_,
+						component,
+						hooks,
+						outer,
+						frame,
+						vdom,
+						node,
+						vdoms,
+						nodes,
+						idx,
+					) = task
+					self.exit_component(hooks, outer, frame)
+					component.contents = node[0]
+					if vdoms is not None:
+						vdoms[idx] = vdom[0]
+					nodes[idx] = component
+		except BaseException:
+			# Leave the components that were still rendering, innermost first
+			while stack:
+				task = stack.pop()
+				if task[0] == _TASK_COMPONENT_DONE:
+					self.exit_component(task[2], task[3], task[4])
+			raise
+
+	def enter_component(
+		self,
+		component: PulseNode,
+		path: str,
+		stack: list[Task],
+		vdoms: list[Any] | None,
+		nodes: list[Any],
+		idx: int,
+		profile: bool = True,
+	) -> tuple[ComponentHooks, list[Any], list[Any]]:
+		"""Start rendering a component; returns its hooks and content slots."""
+		hooks = self.component_hooks(component, path)
+		profiler = self.tree.profiler
+		frame = (
+			profiler.enter(component, self.operations) if profiler and profile else None
+		)
+		outer = self.enter_callbacks()
+		vdom: list[Any] = [None]
+		node: list[Any] = [component.contents]
+		stack.append(
+			(
+				_TASK_COMPONENT_DONE,
+				component,
+				hooks,
+				outer,
+				frame,
+				vdom,
+				node,
+				vdoms,
+				nodes,
+				idx,
+			)
+		)
+		return hooks, vdom, node
+
+	def exit_component(
+		self, hooks: ComponentHooks, outer: AbstractSet[str], frame: Any
+	) -> None:
+		self.exit_callbacks(hooks, outer)
+		profiler = self.tree.profiler
+		if profiler is not None and frame is not None:
+			profiler.exit(frame, self.operations)
 
 	# ------------------------------------------------------------------
 	# Rendering helpers
 	# ------------------------------------------------------------------
 
 	def render_tree(self, node: Node, path: str = "") -> tuple[Any, Node]:
-		if isinstance(node, PulseNode):
-			return self.render_component(node, path)
-		if isinstance(node, Element):
-			return self.render_node(node, path)
-		if isinstance(node, Value):
-			return node.value, node.value
-		if isinstance(node, Expr):
-			return node.render(), node
-		# Pass through any other value - serializer will validate
-		return node, node
+		vdoms: list[Any] = [None]
+		nodes: list[Any] = [None]
+		self.run([(_TASK_RENDER, node, path, vdoms, nodes, 0)])
+		return vdoms[0], nodes[0]
 
 	def render_component(
-		self, component: PulseNode, path: str
-	) -> tuple[VDOM, PulseNode]:
+		self,
+		component: PulseNode,
+		path: str,
+		vdoms: list[Any],
+		nodes: list[Any],
+		idx: int,
+		stack: list[Task],
+	) -> None:
 		if self.reuse_contents and component.contents is not None:
-			vdom, component.contents = self.render_tree(component.contents, path)
-			return vdom, component
-		if component.hooks is None:
-			component.hooks = HookContext()
-		with component.hooks:
+			_, vdom, node = self.enter_component(
+				component, path, stack, vdoms, nodes, idx, profile=False
+			)
+			stack.append((_TASK_RENDER, component.contents, path, vdom, node, 0))
+			return
+		hooks, vdom, node = self.enter_component(
+			component, path, stack, vdoms, nodes, idx
+		)
+		with hooks:
 			rendered = component.fn(*component.args, **component.kwargs)
-		vdom, normalized_child = self.render_tree(rendered, path)
-		component.contents = normalized_child
-		return vdom, component
+		stack.append((_TASK_RENDER, rendered, path, vdom, node, 0))
 
-	def render_node(self, element: Element, path: str) -> tuple[VDOMNode, Element]:
+	def render_node(
+		self,
+		element: Element,
+		path: str,
+		vdoms: list[Any],
+		nodes: list[Any],
+		idx: int,
+		stack: list[Task],
+	) -> None:
 		tag = self.render_tag(element.tag)
 		vdom_node: VDOMElement = {"tag": tag}
 		if (key_val := key_value(element)) is not None:
@@ -177,19 +711,53 @@ class Renderer:
 
 		element.props = props_result.normalized or None
 
-		children_vdom: list[VDOM] = []
-		normalized_children: list[Node] = []
-		for idx, child in enumerate(normalize_children(element.children)):
-			child_path = join_path(path, idx)
-			child_vdom, normalized_child = self.render_tree(child, child_path)
-			children_vdom.append(child_vdom)
-			normalized_children.append(normalized_child)
-
-		if children_vdom:
+		children = normalize_children(element.children)
+		pending: list[Node] = []
+		if (
+			self.chunk_size is not None
+			and not self.reuse_contents
+			and len(children) > self.chunk_size
+		):
+			pending = children[self.chunk_size :]
+			children = children[: self.chunk_size]
+
+		# Filled in by the child tasks, which run before anything after them
+		# on the stack.
+		normalized_children: list[Any] = NormalizedChildren(repeat(None, len(children)))
+		if children:
+			children_vdom: list[Any] = [None] * len(children)
 			vdom_node["children"] = children_vdom
+			for child_idx in range(len(children) - 1, -1, -1):
+				child = children[child_idx]
+				if not isinstance(child, (Expr, PulseNode)):
+					# Text and other plain values render to themselves
+					children_vdom[child_idx] = normalized_children[child_idx] = child
+					continue
+				stack.append(
+					(
+						_TASK_RENDER,
+						child,
+						join_path(path, child_idx),
+						children_vdom,
+						normalized_children,
+						child_idx,
+					)
+				)
+
 		element.children = normalized_children
+		if pending:
+			self.tree.defer(
+				DeferredChildren(
+					element=element,
+					path=path,
+					children=normalized_children,
+					pending=pending,
+					callback_keys=self.owned_callback_keys(),
+				)
+			)
 
-		return vdom_node, element
+		vdoms[idx] = vdom_node
+		nodes[idx] = element
 
 	# ------------------------------------------------------------------
 	# Reconciliation
@@ -201,58 +769,112 @@ class Renderer:
 		current: Node,
 		path: str = "",
 	) -> Node:
+		nodes: list[Any] = [None]
+		self.run([(_TASK_RECONCILE, previous, current, path, nodes, 0)])
+		return nodes[0]
+
+	def reconcile_node(
+		self,
+		previous: Node,
+		current: Node,
+		path: str,
+		nodes: list[Any],
+		idx: int,
+		stack: list[Task],
+	) -> None:
 		if isinstance(current, Value):
 			current = current.value
 		if isinstance(previous, Value):
 			previous = previous.value
 		if not same_node(previous, current):
 			unmount_element(previous)
-			new_vdom, normalized = self.render_tree(current, path)
+			new_vdom, nodes[idx] = self.render_tree(current, path)
 			self.operations.append(
 				ReplaceOperation(type="replace", path=path, data=new_vdom)
 			)
-			return normalized
-
-		if isinstance(previous, PulseNode) and isinstance(current, PulseNode):
-			return self.reconcile_component(previous, current, path)
-
-		if isinstance(previous, Element) and isinstance(current, Element):
-			return self.reconcile_element(previous, current, path)
-
-		return current
+		elif isinstance(previous, PulseNode) and isinstance(current, PulseNode):
+			self.reconcile_component(previous, current, path, nodes, idx, stack)
+		elif isinstance(previous, Element) and isinstance(current, Element):
+			self.reconcile_element(previous, current, path, nodes, idx, stack)
+		else:
+			nodes[idx] = current
 
 	def reconcile_component(
 		self,
 		previous: PulseNode,
 		current: PulseNode,
 		path: str,
-	) -> PulseNode:
+		nodes: list[Any],
+		idx: int,
+		stack: list[Task],
+	) -> None:
 		current.hooks = previous.hooks
 		current.contents = previous.contents
 
-		if current.hooks is None:
-			current.hooks = HookContext()
+		if self.can_skip_component(previous, current, path):
+			current.hooks.node = current
+			nodes[idx] = current
+			return
 
-		with current.hooks:
+		hooks, _, node = self.enter_component(current, path, stack, None, nodes, idx)
+		with hooks:
 			rendered = current.fn(*current.args, **current.kwargs)
 
 		if current.contents is None:
-			new_vdom, normalized = self.render_tree(rendered, path)
-			current.contents = normalized
+			new_vdom, node[0] = self.render_tree(rendered, path)
 			self.operations.append(
 				ReplaceOperation(type="replace", path=path, data=new_vdom)
 			)
 		else:
-			current.contents = self.reconcile_tree(current.contents, rendered, path)
-
-		return current
+			stack.append((_TASK_RECONCILE, current.contents, rendered, path, node, 0))
+
+	def can_skip_component(
+		self, previous: PulseNode, current: PulseNode, path: str
+	) -> bool:
+		"""Whether a memo component can keep its previous output as-is."""
+		if current.memo is None or previous is current:
+			return False
+		hooks = current.hooks
+		# Only components that rendered at this very path and have no pending
+		# reactive update: their subtree paths and callbacks are still valid.
+		if (
+			hooks is None
+			or current.contents is None
+			or hooks.path != path
+			or hooks in self.tree.dirty
+		):
+			return False
+		return bool(current.memo(previous, current))
+
+	def rerender_component(self, hooks: ComponentHooks) -> None:
+		"""Re-enter the tree at a dirty component and reconcile its subtree."""
+		node = hooks.node
+		assert node is not None
+		nodes: list[Any] = [None]
+		stack: list[Task] = []
+		self.reconcile_component(node, node, hooks.path, nodes, 0, stack)
+		self.run(stack)
+
+	def component_hooks(self, component: PulseNode, path: str) -> ComponentHooks:
+		hooks = component.hooks
+		if hooks is None:
+			hooks = ComponentHooks()
+			component.hooks = hooks
+		hooks.tree = self.tree
+		hooks.node = component
+		hooks.path = path
+		self.tree.dirty.pop(hooks, None)
+		return hooks
 
 	def reconcile_element(
 		self,
 		previous: Element,
 		current: Element,
 		path: str,
-	) -> Element:
+		nodes: list[Any],
+		idx: int,
+		stack: list[Task],
+	) -> None:
 		prev_props = previous.props_dict()
 		new_props = current.props_dict()
 		prev_eval = eval_keys_for_props(prev_props)
@@ -261,6 +883,7 @@ class Renderer:
 		if (
 			props_result.delta_set
 			or props_result.delta_remove
+			or props_result.delta_patch
 			or props_result.eval_changed
 		):
 			delta: UpdatePropsDelta = {}
@@ -268,6 +891,8 @@ class Renderer:
 				delta["set"] = props_result.delta_set
 			if props_result.delta_remove:
 				delta["remove"] = sorted(props_result.delta_remove)
+			if props_result.delta_patch:
+				delta["patch"] = props_result.delta_patch
 			if props_result.eval_changed:
 				delta["eval"] = sorted(props_result.eval_keys)
 			self.operations.append(
@@ -280,45 +905,66 @@ class Renderer:
 			)
 			props_result.normalized[task.key] = normalized_value
 
+		# The new children list is reconciled in full, so anything still
+		# deferred under the previous element is covered by these operations.
+		self.tree.deferred.pop(id(previous), None)
 		prev_children = normalize_children(previous.children)
 		next_children = normalize_children(current.children)
-		normalized_children = self.reconcile_children(
-			prev_children, next_children, path
+		normalized_children: list[Any] = NormalizedChildren(
+			repeat(None, len(next_children))
+		)
+		stack.append(
+			(
+				_TASK_ELEMENT_DONE,
+				current,
+				props_result.normalized,
+				normalized_children,
+				nodes,
+				idx,
+			)
+		)
+		self.reconcile_children(
+			prev_children, next_children, path, normalized_children, stack
 		)
-
-		current.props = props_result.normalized or None
-		current.children = normalized_children
-		return current
 
 	def reconcile_children(
 		self,
 		c1: list[Node],
 		c2: list[Node],
 		path: str,
-	) -> list[Node]:
+		norm: list[Any],
+		stack: list[Task],
+	) -> None:
+		"""Plan the reconciliation of two child lists onto the stack.
+
+		Which children are reused, moved or rendered anew only depends on keys
+		and tags, so the whole plan is made up front; the children themselves
+		are reconciled by the tasks, in index order.
+		"""
 		if not c1 and not c2:
-			return []
+			return
 
 		N1 = len(c1)
 		N2 = len(c2)
-		norm: list[Node | None] = [None] * N2
 		N = min(N1, N2)
+		tasks: list[Task] = []
 		i = 0
 		while i < N:
 			x1 = c1[i]
 			x2 = c2[i]
 			if not same_node(x1, x2):
 				break
-			norm[i] = self.reconcile_tree(x1, x2, join_path(path, i))
+			tasks.append((_TASK_RECONCILE, x1, x2, join_path(path, i), norm, i))
 			i += 1
 
 		if i == N1 == N2:
-			return norm
+			stack.extend(reversed(tasks))
+			return
 
 		op = ReconciliationOperation(
 			type="reconciliation", path=path, N=len(c2), new=([], []), reuse=([], [])
 		)
-		self.operations.append(op)
+		tasks.append((_TASK_APPEND_OP, op))
 
 		keys_to_old_idx: dict[str, int] = {}
 		for j1 in range(i, N1):
@@ -327,6 +973,9 @@ class Renderer:
 				keys_to_old_idx[key] = j1
 
 		reused = [False] * (N1 - i)
+		# Destination and source index of every reused child, in new order
+		reuse_dests: list[int] = []
+		reuse_sources: list[int] = []
 		for j2 in range(i, N2):
 			x2 = c2[j2]
 			k = key_value(x2)
@@ -335,29 +984,57 @@ class Renderer:
 				if j1 is not None:
 					x1 = c1[j1]
 					if same_node(x1, x2):
-						norm[j2] = self.reconcile_tree(x1, x2, join_path(path, j2))
+						tasks.append(
+							(_TASK_RECONCILE, x1, x2, join_path(path, j2), norm, j2)
+						)
 						reused[j1 - i] = True
-						if j1 != j2:
-							op["reuse"][0].append(j2)
-							op["reuse"][1].append(j1)
+						reuse_dests.append(j2)
+						reuse_sources.append(j1)
 						continue
 			if k is None and j2 < N1:
 				x1 = c1[j2]
 				if same_node(x1, x2):
 					reused[j2 - i] = True
-					norm[j2] = self.reconcile_tree(x1, x2, join_path(path, j2))
+					tasks.append(
+						(_TASK_RECONCILE, x1, x2, join_path(path, j2), norm, j2)
+					)
+					reuse_dests.append(j2)
+					reuse_sources.append(j2)
 					continue
 
-			vdom, el = self.render_tree(x2, join_path(path, j2))
-			op["new"][0].append(j2)
-			op["new"][1].append(vdom)
-			norm[j2] = el
+			tasks.append((_TASK_RENDER_NEW, x2, join_path(path, j2), op, norm, j2))
 
-		for j1 in range(i, N1):
+		tasks.append(
+			(_TASK_CHILDREN_DONE, op, c1, i, reused, reuse_dests, reuse_sources)
+		)
+		stack.extend(reversed(tasks))
+
+	def finish_children(self, task: Task) -> None:
+		"""Unmount the children left behind and record moves on the operation."""
+		_, op, c1, i, reused, reuse_dests, reuse_sources = task
+		removed: list[int] = []
+		for j1 in range(i, len(c1)):
 			if not reused[j1 - i]:
+				removed.append(j1)
 				self.unmount_subtree(c1[j1])
 
-		return norm
+		shifted = [
+			idx
+			for idx, (j2, j1) in enumerate(zip(reuse_dests, reuse_sources, strict=True))
+			if j1 != j2
+		]
+		if not shifted:
+			return
+		# Children on a longest increasing run of sources keep their relative
+		# order; only the others need to move.
+		stable = longest_increasing_subsequence(reuse_sources)
+		moved = [idx for idx in range(len(reuse_sources)) if idx not in stable]
+		relative = len(removed) + len(moved) < len(shifted)
+		for idx in moved if relative else shifted:
+			op["reuse"][0].append(reuse_dests[idx])
+			op["reuse"][1].append(reuse_sources[idx])
+		if relative:
+			op["removed"] = removed
 
 	# ------------------------------------------------------------------
 	# Prop diffing
@@ -371,6 +1048,7 @@ class Renderer:
 		prev_eval: set[str],
 	) -> DiffPropsResult:
 		updated: dict[str, VDOMPropValue] = {}
+		patches: dict[str, list[PatchOp]] = {}
 		normalized: dict[str, PropValue] | None = None
 		render_prop_tasks: list[RenderPropTask] = []
 		eval_keys: set[str] = set()
@@ -378,7 +1056,6 @@ class Renderer:
 
 		for key, value in current.items():
 			old_value = previous.get(key)
-			prop_path = join_path(path, key)
 
 			if value is None:
 				if normalized is None:
@@ -401,11 +1078,13 @@ class Renderer:
 							key=key,
 							previous=old_value,
 							current=value,
-							path=prop_path,
+							path=join_path(path, key),
 						)
 					)
 				else:
-					vdom_value, normalized_value = self.render_tree(value, prop_path)
+					vdom_value, normalized_value = self.render_tree(
+						value, join_path(path, key)
+					)
 					if normalized is None:
 						normalized = current.copy()
 					normalized[key] = normalized_value
@@ -420,7 +1099,7 @@ class Renderer:
 				if isinstance(old_value, (Element, PulseNode)):
 					unmount_element(old_value)
 				if key not in previous or not values_equal(unwrapped, old_value):
-					updated[key] = cast(VDOMPropValue, unwrapped)
+					self.diff_value(key, old_value, unwrapped, updated, patches)
 				continue
 
 			if isinstance(value, Expr):
@@ -460,7 +1139,7 @@ class Renderer:
 				if normalized is None:
 					normalized = current.copy()
 				normalized[key] = value
-				register_callback(self.callbacks, prop_path, value.fn)
+				self.register_callback(join_path(path, key), value.fn)
 				prev_delay = (
 					old_value.delay_ms if isinstance(old_value, Debounced) else None
 				)
@@ -475,7 +1154,7 @@ class Renderer:
 				if normalized is None:
 					normalized = current.copy()
 				normalized[key] = value
-				register_callback(self.callbacks, prop_path, value)
+				self.register_callback(join_path(path, key), value)
 				if not callable(old_value) or isinstance(old_value, Debounced):
 					updated[key] = CALLBACK_PLACEHOLDER
 				continue
@@ -484,7 +1163,7 @@ class Renderer:
 				unmount_element(old_value)
 			# No normalization needed - value passes through unchanged
 			if key not in previous or not values_equal(value, old_value):
-				updated[key] = cast(VDOMPropValue, value)
+				self.diff_value(key, old_value, value, updated, patches)
 
 		for key in removed_keys:
 			old_value = previous.get(key)
@@ -497,11 +1176,28 @@ class Renderer:
 			normalized=normalized_props,
 			delta_set=updated,
 			delta_remove=removed_keys,
+			delta_patch=patches,
 			render_prop_reconciles=render_prop_tasks,
 			eval_keys=eval_keys,
 			eval_changed=eval_changed,
 		)
 
+	def diff_value(
+		self,
+		key: str,
+		previous: Any,
+		current: Any,
+		updated: dict[str, VDOMPropValue],
+		patches: dict[str, list[PatchOp]],
+	) -> None:
+		"""Record a changed plain prop value, as a patch when enabled and smaller."""
+		if self.tree.prop_patches and previous is not None:
+			ops = diff_value(previous, current)
+			if ops is not None:
+				patches[key] = ops
+				return
+		updated[key] = cast(VDOMPropValue, current)
+
 	# ------------------------------------------------------------------
 	# Expression + tag rendering
 	# ------------------------------------------------------------------
@@ -563,41 +1259,44 @@ def eval_keys_for_props(props: dict[str, PropValue]) -> set[str]:
 
 
 def normalize_children(children: Children | None) -> list[Node]:
+	if type(children) is NormalizedChildren:
+		return children
 	if not children:
 		return []
 
 	out: list[Node] = []
 	seen_keys: set[str] = set()
-
-	def register_key(item: Node) -> None:
-		key: str | None = None
-		if isinstance(item, PulseNode):
-			key = item.key
-		elif isinstance(item, Element):
-			key = key_value(item)
-		if key is None:
-			return
-		if key in seen_keys:
-			raise ValueError(f"Duplicate key '{key}'")
-		seen_keys.add(key)
-
-	def visit(item: Child) -> None:
+	# Nested iterables are flattened with a stack of iterators rather than
+	# recursion, so arbitrarily nested child lists are fine.
+	stack: list[Iterator[Child]] = [iter(children)]
+	while stack:
+		item = next(stack[-1], _EXHAUSTED)
+		if item is _EXHAUSTED:
+			stack.pop()
+			continue
 		if isinstance(item, dict):
 			raise TypeError("Dict is not a valid child; wrap in Value for props")
 		if isinstance(item, Iterable) and not isinstance(item, (str, bytes)):
-			for sub in item:
-				visit(sub)
-		else:
-			node = cast(Node, item)
-			register_key(node)
-			out.append(node)
-
-	for child in children:
-		visit(child)
+			stack.append(iter(item))
+			continue
+		node = cast(Node, item)
+		key: str | None = None
+		if isinstance(node, PulseNode):
+			key = node.key
+		elif isinstance(node, Element):
+			key = key_value(node)
+		if key is not None:
+			if key in seen_keys:
+				raise ValueError(f"Duplicate key '{key}'")
+			seen_keys.add(key)
+		out.append(node)
 
 	return out
 
 
+_EXHAUSTED: Any = object()
+
+
 def format_callback_placeholder(delay_ms: float | None) -> str:
 	if delay_ms is None:
 		return CALLBACK_PLACEHOLDER
@@ -613,6 +1312,52 @@ def register_callback(
 	path: str,
 	fn: Callable[..., Any],
 ) -> None:
+	n_args, accepts_varargs = callback_signature(fn)
+	callbacks[path] = Callback(fn=fn, n_args=n_args, accepts_varargs=accepts_varargs)
+
+
+# (n_args, accepts_varargs) keyed by the shape of the callable, see
+# `_signature_key`. Keys hold code objects, so the cache is bounded by the
+# program's source rather than by the number of closures created.
+_CALLBACK_SIGNATURES: dict[Hashable, tuple[int, bool]] = {}
+
+
+def callback_signature(fn: Callable[..., Any]) -> tuple[int, bool]:
+	"""Return (required positional args, accepts *args) for a callback."""
+	key = _signature_key(fn)
+	if key is None:
+		return _inspect_signature(fn)
+	sig = _CALLBACK_SIGNATURES.get(key)
+	if sig is None:
+		sig = _inspect_signature(fn)
+		_CALLBACK_SIGNATURES[key] = sig
+	return sig
+
+
+def _signature_key(fn: Callable[..., Any]) -> Hashable | None:
+	# Closures over different values (e.g. lambdas in a loop) share a code
+	# object; what can vary per function object is the number of defaults and
+	# what partial/bound-method wrappers pre-fill.
+	bound = 0
+	keywords: tuple[str, ...] = ()
+	if isinstance(fn, partial):
+		bound = len(fn.args)
+		keywords = tuple(sorted(fn.keywords))
+		fn = fn.func
+	if isinstance(fn, MethodType):
+		bound += 1
+		fn = fn.__func__
+	if type(fn) is not FunctionType:
+		return None
+	attrs = fn.__dict__
+	# inspect.signature honours these, and they can differ per function object
+	if attrs and ("__wrapped__" in attrs or "__signature__" in attrs):
+		return None
+	defaults = fn.__defaults__
+	return (fn.__code__, len(defaults) if defaults else 0, bound, keywords)
+
+
+def _inspect_signature(fn: Callable[..., Any]) -> tuple[int, bool]:
 	params = inspect.signature(fn).parameters.values()
 	accepts_varargs = any(p.kind is p.VAR_POSITIONAL for p in params)
 	n_args = sum(
@@ -621,7 +1366,34 @@ def register_callback(
 		if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
 		and p.default is p.empty
 	)
-	callbacks[path] = Callback(fn=fn, n_args=n_args, accepts_varargs=accepts_varargs)
+	return n_args, accepts_varargs
+
+
+def longest_increasing_subsequence(seq: list[int]) -> set[int]:
+	"""Positions of one longest strictly increasing subsequence of `seq`."""
+	# tails[k]: position of the smallest tail of an increasing run of length k+1
+	tails: list[int] = []
+	prev = [-1] * len(seq)
+	for idx, value in enumerate(seq):
+		lo, hi = 0, len(tails)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if seq[tails[mid]] < value:
+				lo = mid + 1
+			else:
+				hi = mid
+		if lo > 0:
+			prev[idx] = tails[lo - 1]
+		if lo == len(tails):
+			tails.append(idx)
+		else:
+			tails[lo] = idx
+	out: set[int] = set()
+	idx = tails[-1] if tails else -1
+	while idx != -1:
+		out.add(idx)
+		idx = prev[idx]
+	return out
 
 
 def join_path(prefix: str, path: str | int) -> str:
@@ -650,20 +1422,27 @@ def key_value(node: Node | Node) -> str | None:
 
 
 def unmount_element(element: Node) -> None:
-	if isinstance(element, PulseNode):
-		if element.contents is not None:
-			unmount_element(element.contents)
-			element.contents = None
-		if element.hooks is not None:
-			element.hooks.unmount()
-		return
-
-	if isinstance(element, Element):
-		props = element.props_dict()
-		for value in props.values():
-			if isinstance(value, (Element, PulseNode)):
-				unmount_element(value)
-		for child in normalize_children(element.children):
-			unmount_element(child)
-		element.children = []
-		return
+	# Post-order walk with an explicit stack: a node's entry comes back with
+	# `done` set once everything below it has been unmounted.
+	stack: list[tuple[Node, bool]] = [(element, False)]
+	while stack:
+		node, done = stack.pop()
+		if isinstance(node, PulseNode):
+			if not done:
+				stack.append((node, True))
+				if node.contents is not None:
+					stack.append((node.contents, False))
+				continue
+			node.contents = None
+			if node.hooks is not None:
+				node.hooks.unmount()
+		elif isinstance(node, Element):
+			if done:
+				node.children = []
+				continue
+			stack.append((node, True))
+			for child in reversed(normalize_children(node.children)):
+				stack.append((child, False))
+			for value in reversed(list(node.props_dict().values())):
+				if isinstance(value, (Element, PulseNode)):
+					stack.append((value, False))
@@ -21,6 +21,10 @@ Serialized payload structure::
   items.
 - ``maps``  – indices that are ``Map`` instances; payload is an object mapping
   string keys to child payloads. Python reconstructs these as ``dict``.
+- ``arrays`` – NumPy arrays and pandas DataFrames/Series in columnar form (see
+  ``pulse.columnar``). Only present when non-empty. Numeric buffers are
+  base64 strings in the payload; a frame's columns and data are regular child
+  payloads.
 
 Every payload node is assigned a single global index as it is visited. This
 preserves shared references and cycles across nested structures
@@ -30,15 +34,32 @@ and ``datetime`` objects.
 
 from __future__ import annotations
 
+import base64
 import datetime as dt
 import math
 import types
+from collections.abc import Callable, Iterator
 from dataclasses import fields, is_dataclass
-from typing import Any
+from functools import partial
+from itertools import repeat
+from typing import Any, cast
+
+from pulse.columnar import (
+	ColumnBuffer,
+	ColumnFrame,
+	decode_array,
+	encode_columnar,
+	rows_from_columns,
+)
 
 Primitive = int | float | str | bool | None
 PlainJSON = Primitive | list["PlainJSON"] | dict[str, "PlainJSON"]
-Serialized = tuple[tuple[list[int], list[int], list[int], list[int]], PlainJSON]
+# refs, dates, sets, maps and, when there are any, arrays
+Metadata = (
+	tuple[list[int], list[int], list[int], list[int]]
+	| tuple[list[int], list[int], list[int], list[int], list[int]]
+)
+Serialized = tuple[Metadata, PlainJSON]
 
 __all__ = [
 	"serialize",
@@ -47,7 +68,7 @@ __all__ = [
 ]
 
 
-def serialize(data: Any) -> Serialized:
+def serialize(data: Any, *, track_refs: bool = True) -> Serialized:
 	"""Serialize a Python value to wire format.
 
 	Converts Python values to a JSON-compatible format with metadata for
@@ -55,6 +76,11 @@ def serialize(data: Any) -> Serialized:
 
 	Args:
 		data: Value to serialize.
+		track_refs: Preserve shared references. Pass False for tree-shaped
+			data (VDOM payloads, update operations) to skip the bookkeeping:
+			shared values are then written out at each occurrence and
+			deserialize as separate copies. A value that contains itself is
+			still written as a reference to the enclosing occurrence.
 
 	Returns:
 		Serialized tuple containing metadata and JSON payload.
@@ -70,13 +96,16 @@ def serialize(data: Any) -> Serialized:
 		- datetime.date (converted to ISO 8601 date string)
 		- Dataclasses (serialized as dict of fields)
 		- Objects with __dict__ (public attributes only)
+		- NumPy arrays and pandas DataFrames/Series, encoded as columns (only
+		  when the library is installed and imported)
 
 	Notes:
 		- NaN floats serialize as None
 		- Infinity raises ValueError
 		- Dict keys must be strings
 		- Private attributes (starting with _) are excluded
-		- Shared references and cycles are preserved
+		- Shared references and cycles are preserved. With `track_refs=False`,
+		  shared values are copied; cycles are still preserved
 
 	Example:
 		```python
@@ -91,12 +120,19 @@ def serialize(data: Any) -> Serialized:
 		serialized = ps.serialize(data)
 		```
 	"""
+	if not track_refs:
+		return _serialize_tree(data)
+
 	# Map object id -> assigned global index
 	seen: dict[int, int] = {}
 	refs: list[int] = []
 	dates: list[int] = []
 	sets: list[int] = []
 	maps: list[int] = []
+	arrays: list[int] = []
+	# Columnar values are built during the walk; keep them alive so their ids
+	# aren't reused by later values while `seen` refers to them.
+	keep_alive: list[Any] = []
 
 	global_index = 0
 
@@ -155,6 +191,9 @@ def serialize(data: Any) -> Serialized:
 				items.append(process(entry))
 			return items
 
+		if (columnar := encode_columnar(value)) is not None:
+			return process_columnar(columnar, idx)
+
 		if is_dataclass(value):
 			dc_obj: dict[str, PlainJSON] = {}
 			for f in fields(value):
@@ -174,11 +213,205 @@ def serialize(data: Any) -> Serialized:
 
 		raise TypeError(f"Unsupported value in serialization: {type(value)!r}")
 
+	def process_columnar(
+		value: ColumnBuffer | ColumnFrame | list[Any], idx: int
+	) -> PlainJSON:
+		nonlocal global_index
+		keep_alive.append(value)
+		if isinstance(value, list):
+			return [process(entry) for entry in value]
+		arrays.append(idx)
+		if isinstance(value, ColumnBuffer):
+			return _buffer_payload(value)
+		columns = process(value.columns)
+		global_index += 1  # the list of column data
+		data: list[PlainJSON] = []
+		for column in value.data:
+			column_idx = global_index
+			global_index += 1
+			data.append(process_columnar(column, column_idx))
+		return {"columns": columns, "data": data}
+
 	payload = process(data)
 
+	if arrays:
+		return ((refs, dates, sets, maps, arrays), payload)
 	return ((refs, dates, sets, maps), payload)
 
 
+# Types written to the payload as-is, matched exactly so subclasses (enums,
+# numpy scalars, ...) still go through the full checks.
+_PLAIN_TYPES = frozenset({str, int, bool, types.NoneType})
+
+
+def _serialize_tree(data: Any) -> Serialized:
+	"""`serialize` without shared-reference tracking.
+
+	Dispatches on exact types for the JSON-like values VDOM is made of and
+	handles their plain entries inline; anything else takes the same path as
+	in `serialize`. Node indices are assigned in the same order, so dates and
+	sets are still marked.
+
+	Only the containers enclosing the current value are tracked: a cycle
+	always leads back to one of them, and is written as a reference to it.
+	"""
+	refs: list[int] = []
+	dates: list[int] = []
+	sets: list[int] = []
+	arrays: list[int] = []
+	# Map object id -> index, for the containers enclosing the current value
+	path: dict[int, int] = {}
+	global_index = 0
+
+	def process(value: Any) -> PlainJSON:
+		nonlocal global_index
+		idx = global_index
+		global_index += 1
+		kind = type(value)
+
+		if kind in _PLAIN_TYPES:
+			return value
+		if kind is float:
+			return process_value(value, idx)
+
+		# Dicts and lists only join the path at their first nested entry: one
+		# that is already on it has nested entries, and is found there.
+		obj_id = None
+		if kind is dict:
+			result_dict: dict[str, PlainJSON] = {}
+			for key, entry in value.items():
+				if not isinstance(key, str):
+					raise TypeError(
+						f"Dict keys must be strings, got {type(key).__name__}: {key!r}"  # pyright: ignore[reportUnknownArgumentType]
+					)
+				if type(entry) in _PLAIN_TYPES:
+					global_index += 1
+					result_dict[key] = entry
+					continue
+				if obj_id is None:
+					obj_id = id(value)
+					if obj_id in path:
+						return enclosing(obj_id, idx)
+					path[obj_id] = idx
+				result_dict[key] = process(entry)
+			if obj_id is not None:
+				del path[obj_id]
+			return result_dict
+
+		if kind is list or kind is tuple:
+			result_list: list[PlainJSON] = []
+			for entry in value:
+				if type(entry) in _PLAIN_TYPES:
+					global_index += 1
+					result_list.append(entry)
+					continue
+				if obj_id is None:
+					obj_id = id(value)
+					if obj_id in path:
+						return enclosing(obj_id, idx)
+					path[obj_id] = idx
+				result_list.append(process(entry))
+			if obj_id is not None:
+				del path[obj_id]
+			return result_list
+
+		obj_id = id(value)
+		if obj_id in path:
+			return enclosing(obj_id, idx)
+		path[obj_id] = idx
+		result = process_value(value, idx)
+		del path[obj_id]
+		return result
+
+	def enclosing(obj_id: int, idx: int) -> PlainJSON:
+		"""Write node `idx` as a reference to the enclosing `obj_id`."""
+		nonlocal global_index
+		global_index = idx + 1
+		refs.append(idx)
+		return path[obj_id]
+
+	def process_value(value: Any, idx: int) -> PlainJSON:
+		"""Values other than plain types, dicts, lists and tuples."""
+		if value is None or isinstance(value, (bool, int, str)):
+			return value
+
+		if isinstance(value, float):
+			if math.isnan(value):
+				return None
+			if math.isinf(value):
+				raise ValueError(
+					f"Cannot serialize {value}: Infinity is not valid JSON. "
+					+ "Replace with None or a sentinel value."
+				)
+			return value
+
+		if isinstance(value, dt.datetime):
+			dates.append(idx)
+			return _datetime_to_iso(value)
+
+		if isinstance(value, dt.date):
+			dates.append(idx)
+			return value.isoformat()
+
+		if isinstance(value, dict):
+			result_dict: dict[str, PlainJSON] = {}
+			for key, entry in value.items():
+				if not isinstance(key, str):
+					raise TypeError(
+						f"Dict keys must be strings, got {type(key).__name__}: {key!r}"  # pyright: ignore[reportUnknownArgumentType]
+					)
+				result_dict[key] = process(entry)
+			return result_dict
+
+		if isinstance(value, (list, tuple)):
+			return [process(entry) for entry in value]
+
+		if isinstance(value, set):
+			sets.append(idx)
+			return [process(entry) for entry in value]
+
+		if (columnar := encode_columnar(value)) is not None:
+			return process_columnar(columnar, idx)
+
+		if is_dataclass(value):
+			return {f.name: process(getattr(value, f.name)) for f in fields(value)}
+
+		if callable(value) or isinstance(value, (type, types.ModuleType)):
+			raise TypeError(f"Unsupported value in serialization: {type(value)!r}")
+
+		if hasattr(value, "__dict__"):
+			return {
+				key: process(entry)
+				for key, entry in vars(value).items()
+				if not key.startswith("_")
+			}
+
+		raise TypeError(f"Unsupported value in serialization: {type(value)!r}")
+
+	def process_columnar(
+		value: ColumnBuffer | ColumnFrame | list[Any], idx: int
+	) -> PlainJSON:
+		nonlocal global_index
+		if isinstance(value, list):
+			return [process(entry) for entry in value]
+		arrays.append(idx)
+		if isinstance(value, ColumnBuffer):
+			return _buffer_payload(value)
+		columns = process(value.columns)
+		global_index += 1  # the list of column data
+		data: list[PlainJSON] = []
+		for column in value.data:
+			column_idx = global_index
+			global_index += 1
+			data.append(process_columnar(column, column_idx))
+		return {"columns": columns, "data": data}
+
+	payload = process(data)
+	if arrays:
+		return ((refs, dates, sets, [], arrays), payload)
+	return ((refs, dates, sets, []), payload)
+
+
 def deserialize(
 	payload: Serialized,
 ) -> Any:
@@ -200,7 +433,11 @@ def deserialize(
 		- datetime values are reconstructed as UTC-aware
 		- date values are reconstructed as ``datetime.date``
 		- set values are reconstructed as Python sets
+		- Arrays are reconstructed as (nested) lists and DataFrames as lists
+		  of row dicts, without NumPy or pandas
 		- Shared references and cycles are restored
+		- Payloads without dates, sets, references or arrays, like most
+		  client messages, are returned as-is rather than copied
 
 	Example:
 		```python
@@ -212,70 +449,169 @@ def deserialize(
 		restored = ps.deserialize(serialized)
 		```
 	"""
-	(refs, dates, sets, _maps), data = payload
-	refs = set(refs)
-	dates = set(dates)
-	sets = set(sets)
+	metadata, data = payload
+	refs, dates, sets = metadata[0], metadata[1], metadata[2]
 	# we don't care about maps
+	arrays = metadata[4] if len(metadata) > 4 else None
+	if not (refs or dates or sets or arrays):
+		# Nothing to restore, as in most client messages: the JSON is the value
+		return data
 
-	objects: dict[int, Any] = {}
-	global_index = 0
+	marks: dict[int, int] = dict.fromkeys(refs, _REF)
+	marks.update(dict.fromkeys(dates, _DATE))
+	marks.update(dict.fromkeys(sets, _SET))
+	if arrays:
+		marks.update(dict.fromkeys(arrays, _ARRAY))
+	return _reconstruct(data, marks)
 
-	def reconstruct(value: PlainJSON) -> Any:
-		nonlocal global_index
-		idx = global_index
-		global_index += 1
 
-		if idx in refs:
-			assert isinstance(value, (int, float)), (
-				"Reference payload must be numeric index"
-			)
-			target_index = int(value)
-			assert target_index in objects, (
-				f"Dangling reference to index {target_index}"
-			)
-			return objects[target_index]
-
-		if idx in dates:
-			assert isinstance(value, str), "Date payload must be an ISO string"
-			if _is_date_literal(value):
-				date_value = dt.date.fromisoformat(value)
-				objects[idx] = date_value
-				return date_value
-			dt_value = _datetime_from_iso(value)
-			objects[idx] = dt_value
-			return dt_value
-
-		if value is None:
-			return None
-
-		if isinstance(value, (bool, int, float, str)):
-			return value
+# Kinds of marked payload nodes, see `_reconstruct`
+_REF = 0
+_DATE = 1
+_SET = 2
+_ARRAY = 3
 
-		if isinstance(value, list):
-			if idx in sets:
-				result_set: set[Any] = set()
-				objects[idx] = result_set
-				for entry in value:
-					result_set.add(reconstruct(entry))
-				return result_set
-			result_list: list[Any] = []
-			objects[idx] = result_list
-			for entry in value:
-				result_list.append(reconstruct(entry))
-			return result_list
+_SCALAR_TYPES = frozenset({str, int, float, bool, types.NoneType})
 
-		if isinstance(value, dict):
-			# Both maps and records are reconstructed as dictionaries in Python
-			result_dict: dict[str, Any] = {}
-			objects[idx] = result_dict
-			for key, entry in value.items():
-				result_dict[str(key)] = reconstruct(entry)
-			return result_dict
+# A container being filled: its remaining (key, payload) entries, the
+# container, whether it is a set, and what to run once it is complete
+_Frame = tuple[Iterator[tuple[Any, PlainJSON]], Any, bool, Callable[[], None] | None]
 
-		raise TypeError(f"Unsupported value in deserialization: {type(value)!r}")
 
-	return reconstruct(data)
+def _reconstruct(data: PlainJSON, marks: dict[int, int]) -> Any:
+	"""Rebuild `data`, restoring the nodes marked in `marks` by global index.
+
+	Walks the payload depth-first with an explicit stack, so deeply nested
+	payloads don't hit the recursion limit. Nodes are numbered in the order
+	they are first reached, as in `serialize`.
+	"""
+	objects: dict[int, Any] = {}
+	index = 0
+	# Marked indices in the order they will be reached
+	pending = iter(sorted(marks))
+	next_mark = next(pending, -1)
+	root: list[Any] = [None]
+	stack: list[_Frame] = [(iter(((0, data),)), root, False, None)]
+	while stack:
+		entries, target, is_set, done = stack[-1]
+		for key, value in entries:
+			idx = index
+			index += 1
+			kind = type(value)
+			if idx != next_mark:
+				if kind in _SCALAR_TYPES:
+					if is_set:
+						target.add(value)
+					else:
+						target[key] = value
+					continue
+				mark = None
+			else:
+				mark = marks[idx]
+				next_mark = next(pending, -1)
+			if mark == _REF:
+				assert isinstance(value, (int, float)), (
+					"Reference payload must be numeric index"
+				)
+				target_index = int(value)
+				assert target_index in objects, (
+					f"Dangling reference to index {target_index}"
+				)
+				result = objects[target_index]
+			elif mark == _DATE:
+				assert isinstance(value, str), "Date payload must be an ISO string"
+				if _is_date_literal(value):
+					result = dt.date.fromisoformat(value)
+				else:
+					result = _datetime_from_iso(value)
+				objects[idx] = result
+			elif mark == _ARRAY:
+				assert isinstance(value, dict), "Array payload must be an object"
+				if "columns" in value:
+					# Rows are built once the columns and data are restored
+					parts: list[Any] = [None, None]
+					finish = partial(
+						_finish_frame, parts, target, is_set, key, idx, objects
+					)
+					stack.append(
+						(
+							iter(((0, value["columns"]), (1, value["data"]))),
+							parts,
+							False,
+							finish,
+						)
+					)
+					break
+				result = decode_array(
+					str(value["dtype"]),
+					list(value["shape"]),  # pyright: ignore[reportArgumentType]
+					base64.b64decode(str(value["data"])),
+				)
+				objects[idx] = result
+			elif kind is list:
+				# Checkers don't narrow `value` from its exact type in `kind`
+				items = cast(list[PlainJSON], value)
+				if mark == _SET:
+					result = set()
+					children: Iterator[tuple[Any, PlainJSON]] = zip(
+						repeat(None), items, strict=False
+					)
+				else:
+					result = [None] * len(items)
+					children = enumerate(items)
+				objects[idx] = result
+				_put(target, is_set, key, result)
+				stack.append((children, result, mark == _SET, None))
+				break
+			elif kind is dict:
+				# Both maps and records are reconstructed as dictionaries in Python
+				result = {}
+				objects[idx] = result
+				_put(target, is_set, key, result)
+				entries = cast(dict[str, PlainJSON], value).items()
+				stack.append((iter(entries), result, False, None))
+				break
+			else:
+				raise TypeError(
+					f"Unsupported value in deserialization: {type(value)!r}"
+				)
+			if is_set:
+				target.add(result)
+			else:
+				target[key] = result
+		else:
+			stack.pop()
+			if done is not None:
+				done()
+	return root[0]
+
+
+def _put(target: Any, is_set: bool, key: Any, value: Any) -> None:
+	if is_set:
+		target.add(value)
+	else:
+		target[key] = value
+
+
+def _finish_frame(
+	parts: list[Any],
+	target: Any,
+	is_set: bool,
+	key: Any,
+	idx: int,
+	objects: dict[int, Any],
+) -> None:
+	rows = rows_from_columns(parts[0], parts[1])
+	objects[idx] = rows
+	_put(target, is_set, key, rows)
+
+
+def _buffer_payload(value: ColumnBuffer) -> PlainJSON:
+	return {
+		"dtype": value.dtype,
+		"shape": list(value.shape),
+		"data": base64.b64encode(value.data).decode("ascii"),
+	}
 
 
 def _datetime_to_iso(value: dt.datetime) -> str:
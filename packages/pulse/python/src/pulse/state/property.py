@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Generic, Never, TypeVar, override
 
-from pulse.reactive import AsyncEffect, Computed, Effect, Signal
+from pulse.reactive import AsyncEffect, Computed, Effect, Selector, Signal
 from pulse.reactive_extensions import ReactiveProperty
 
 T = TypeVar("T")
@@ -157,6 +157,69 @@ class ComputedProperty(StateMemberDescriptor, Generic[T]):
 		raise AttributeError(f"Cannot set computed property '{self.name}'")
 
 
+class SelectorProperty(StateMemberDescriptor, Generic[T]):
+	"""
+	Descriptor for keyed selectors on State classes.
+
+	SelectorProperty wraps a method returning the selected key. Reading the
+	property returns a per-instance Selector, and calling it with a key
+	subscribes only to whether that key is selected.
+
+	Created automatically when using the @ps.selector decorator on a State method.
+
+	Args:
+		callable_name: The callable name, used for diagnostics before the descriptor is bound.
+		fn: The method returning the selected key. Must take only `self` as argument.
+
+	Example:
+
+	```python
+	class TableState(ps.State):
+	    selected_id: int | None = None
+
+	    @ps.selector
+	    def is_selected(self):
+	        return self.selected_id
+
+	state = TableState()
+	print(state.is_selected(1))  # False
+	state.selected_id = 1
+	print(state.is_selected(1))  # True
+	```
+	"""
+
+	fn: "Callable[[State], T]"
+
+	def __init__(self, callable_name: str, fn: "Callable[[State], T]"):
+		super().__init__(callable_name)
+		self.fn = fn
+
+	def get_selector(self, obj: Any) -> Selector[T]:
+		from pulse.state.state import State
+
+		if not isinstance(obj, State):
+			raise ValueError(f"Selector {self.name} defined on a non-State class")
+		cache = self.instance_cache(obj)
+		selector: Selector[T] | None = cache.get(self)
+		if selector is None:
+			bound_method = self.fn.__get__(obj, obj.__class__)
+			selector = Selector(
+				bound_method,
+				name=f"{obj.__class__.__name__}.{self.name}",
+			)
+			cache[self] = selector
+		return selector
+
+	def __get__(self, obj: Any, objtype: Any = None) -> Selector[T]:
+		if obj is None:
+			return self  # pyright: ignore[reportReturnType]
+
+		return self.get_selector(obj)
+
+	def __set__(self, obj: Any, value: Any) -> Never:
+		raise AttributeError(f"Cannot set selector '{self.name}'")
+
+
 class StateEffect(StateMemberDescriptor, Generic[T], InitializableProperty):
 	"""
 	Descriptor for side effects on State classes.
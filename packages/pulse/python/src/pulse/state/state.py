@@ -19,6 +19,7 @@ from pulse.state.property import (
 	MEMBER_CACHE_ATTR,
 	ComputedProperty,
 	InitializableProperty,
+	SelectorProperty,
 	StateEffect,
 	StateMemberDescriptor,
 	StateProperty,
@@ -122,7 +123,13 @@ class StateMeta(ABCMeta):
 			# Skip if already set as a descriptor we care about
 			if isinstance(
 				value,
-				(StateProperty, ComputedProperty, StateEffect, InitializableProperty),
+				(
+					StateProperty,
+					ComputedProperty,
+					SelectorProperty,
+					StateEffect,
+					InitializableProperty,
+				),
 			):
 				continue
 			# Skip common callables and descriptors
@@ -0,0 +1,278 @@
+"""Templates for repeated element shapes in `vdom_init` payloads.
+
+Pages built from repeated components (table rows, cards, list items) render
+the same tag/prop skeleton many times with only a few leaf values changing.
+`extract_templates` finds elements sharing a shape: same tag, key presence,
+prop names, eval keys and, recursively, children. Each such shape is sent
+once as a template, and each occurrence as a `TemplateRef` carrying only the
+values that differ between occurrences.
+
+The client expands template references before rendering, so the tree it
+renders, and every path later updates refer to, is the same as without
+templates.
+
+Slot values are listed in a fixed order, which `expand_templates` and the
+client share. For each element, it is the key, then props in prop order, then
+children that are not elements, and finally each child element in turn.
+Values that are the same in every occurrence are baked into the template and
+are not listed.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeGuard, cast
+
+from pulse.transpiler.vdom import (
+	VDOM,
+	TemplateRef,
+	VDOMElement,
+	VDOMNode,
+	VDOMTemplate,
+)
+
+# Approximate size of a `TemplateRef` without its slot values
+REF_OVERHEAD = len('{"t":"tpl","id":0,"slots":[]}')
+
+Shape = tuple[Any, ...]
+
+
+@dataclass(slots=True)
+class ShapeInfo:
+	"""Occurrences of one element shape, and its template once decided."""
+
+	id: int
+	nodes: list[VDOMElement] = field(default_factory=list)
+	# Set by `_decide`: the template (None when not worth it), the indices of
+	# the slot values that vary and each occurrence's slot values
+	decided: bool = False
+	template: VDOMTemplate | None = None
+	template_id: int = -1
+	variable: list[int] = field(default_factory=list)
+	values: list[list[Any]] = field(default_factory=list)
+
+
+def extract_templates(
+	vdom: VDOM,
+) -> tuple[VDOM | TemplateRef, list[VDOMTemplate]]:
+	"""Replace repeated element shapes in `vdom` with template references.
+
+	Returns the rewritten tree and the template table it refers to. Shapes are
+	only turned into templates when that makes the payload smaller; when none
+	qualify, `vdom` is returned unchanged with an empty table.
+	"""
+	shapes: dict[Shape, ShapeInfo] = {}
+	nodes: dict[int, tuple[ShapeInfo, int]] = {}
+	_collect(vdom, shapes, nodes)
+	if all(len(info.nodes) < 2 for info in shapes.values()):
+		return vdom, []
+
+	templates: list[VDOMTemplate] = []
+	result = _replace(vdom, nodes, templates)
+	if not templates:
+		return vdom, []
+	return result, templates
+
+
+def expand_templates(vdom: VDOM | TemplateRef, templates: list[VDOMTemplate]) -> VDOM:
+	"""Inverse of `extract_templates`, as done on the client."""
+	if is_template_ref(vdom):
+		return _expand(templates[vdom["id"]], iter(vdom["slots"]))
+	if not is_element(vdom):
+		return cast(VDOM, vdom)
+	children = vdom.get("children")
+	if not children:
+		return vdom
+	return {
+		**vdom,
+		"children": [expand_templates(child, templates) for child in children],
+	}
+
+
+def is_element(node: Any) -> TypeGuard[VDOMElement]:
+	"""Whether `node` is an element with a static tag (one that can be templated)."""
+	return isinstance(node, dict) and isinstance(node.get("tag"), str)
+
+
+def is_template_ref(node: Any) -> TypeGuard[TemplateRef]:
+	return isinstance(node, dict) and node.get("t") == "tpl"
+
+
+def _collect(
+	node: VDOMNode,
+	shapes: dict[Shape, ShapeInfo],
+	nodes: dict[int, tuple[ShapeInfo, int]],
+) -> int:
+	"""Group the elements of `node` by shape, children first.
+
+	Returns the shape id, or -1 for nodes that are not elements; those are
+	slot values.
+	"""
+	if not is_element(node):
+		return -1
+	children = node.get("children") or []
+	shape: Shape = (
+		node["tag"],
+		"key" in node,
+		tuple(node.get("props") or ()),
+		tuple(node.get("eval") or ()),
+		tuple([_collect(child, shapes, nodes) for child in children]),
+	)
+	info = shapes.get(shape)
+	if info is None:
+		info = shapes[shape] = ShapeInfo(len(shapes))
+	nodes[id(node)] = (info, len(info.nodes))
+	info.nodes.append(node)
+	return info.id
+
+
+def _slot_values(element: VDOMElement, out: list[Any]) -> list[Any]:
+	"""Every value of `element` that a template could leave as a slot, in order."""
+	if "key" in element:
+		out.append(element["key"])
+	props = element.get("props")
+	if props:
+		out.extend(props.values())
+	children = element.get("children")
+	if children:
+		elements = [child for child in children if is_element(child)]
+		if len(elements) < len(children):
+			out.extend([child for child in children if not is_element(child)])
+		for child in elements:
+			_slot_values(child, out)
+	return out
+
+
+def _decide(info: ShapeInfo) -> None:
+	info.decided = True
+	values = [_slot_values(node, []) for node in info.nodes]
+	first = values[0]
+	variable = [
+		i
+		for i, value in enumerate(first)
+		if not all(_same(value, other[i]) for other in values[1:])
+	]
+	varies = set(variable)
+	template = _skeleton(info.nodes[0], (i in varies for i in range(len(first))))
+	size = _size(template)
+	if len(info.nodes) * (size - REF_OVERHEAD) > size:
+		info.template = template
+		info.variable = variable
+		info.values = values
+
+
+def _skeleton(element: VDOMElement, variable: Iterator[bool]) -> VDOMTemplate:
+	# Only elements with a static tag are templated
+	template: VDOMTemplate = {"tag": cast(str, element["tag"])}
+	slots: list[str | int] = []
+	if "key" in element:
+		if next(variable):
+			template["keyed"] = True
+		else:
+			template["key"] = element["key"]
+	props = element.get("props")
+	if props:
+		constant: dict[str, Any] = {}
+		for name, value in props.items():
+			if next(variable):
+				slots.append(name)
+			else:
+				constant[name] = value
+		if constant:
+			template["props"] = constant
+	if "eval" in element:
+		template["eval"] = element["eval"]
+	children = element.get("children")
+	if children:
+		skeleton: list[Any] = list(children)
+		for i, child in enumerate(children):
+			if not is_element(child) and next(variable):
+				skeleton[i] = None
+				slots.append(i)
+		for i, child in enumerate(children):
+			if is_element(child):
+				skeleton[i] = _skeleton(child, variable)
+		template["children"] = skeleton
+	if slots:
+		template["slots"] = slots
+	return template
+
+
+def _replace(
+	node: VDOMNode,
+	nodes: dict[int, tuple[ShapeInfo, int]],
+	templates: list[VDOMTemplate],
+) -> VDOMNode | TemplateRef:
+	if not is_element(node):
+		return node
+	info, index = nodes[id(node)]
+	if len(info.nodes) > 1:
+		if not info.decided:
+			_decide(info)
+		if info.template is not None:
+			if info.template_id < 0:
+				info.template_id = len(templates)
+				templates.append(info.template)
+			values = info.values[index]
+			return TemplateRef(
+				t="tpl", id=info.template_id, slots=[values[i] for i in info.variable]
+			)
+	children = node.get("children")
+	if not children:
+		return node
+	replaced = [_replace(child, nodes, templates) for child in children]
+	# Template references stand in for the elements they replace
+	return {**node, "children": cast(list[VDOMNode], replaced)}
+
+
+def _expand(template: VDOMTemplate, values: Iterator[Any]) -> VDOMElement:
+	element: VDOMElement = {"tag": template["tag"]}
+	if template.get("keyed"):
+		element["key"] = next(values)
+	elif "key" in template:
+		element["key"] = template["key"]
+	props = dict(template.get("props", {}))
+	skeleton = list(template.get("children", ()))
+	for slot in template.get("slots", ()):
+		if isinstance(slot, str):
+			props[slot] = next(values)
+		else:
+			skeleton[slot] = next(values)
+	children: list[VDOMNode] = []
+	for child in skeleton:
+		if is_element(child):
+			# Templates nest templates: a child element here is a `VDOMTemplate`
+			children.append(_expand(cast(VDOMTemplate, cast(object, child)), values))
+		else:
+			children.append(cast(VDOMNode, child))
+	if props:
+		element["props"] = props
+	if "eval" in template:
+		element["eval"] = template["eval"]
+	if children:
+		element["children"] = children
+	return element
+
+
+def _same(a: Any, b: Any) -> bool:
+	"""Strict equality: `1`, `1.0` and `True` are different slot values."""
+	if a is b:
+		return True
+	if type(a) is not type(b):
+		return False
+	if isinstance(a, dict):
+		return a.keys() == b.keys() and all(_same(v, b[k]) for k, v in a.items())
+	if isinstance(a, list):
+		return len(a) == len(b) and all(map(_same, a, b))
+	try:
+		result = a == b
+	except Exception:
+		return False
+	return result if isinstance(result, bool) else False
+
+
+def _size(value: Any) -> int:
+	# Approximate: values JSON can't encode (dates, arrays) count as empty
+	return len(json.dumps(value, separators=(",", ":"), default=lambda _: ""))
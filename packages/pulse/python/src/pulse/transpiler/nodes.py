@@ -778,8 +778,10 @@ class PulseNode:
 	kwargs: dict[str, Any] = field(default_factory=dict)
 	key: str | None = None
 	name: str | None = None  # Optional component name for debug messages.
+	# Callable[[PulseNode, PulseNode], bool]; set for memo components.
+	memo: Any = None
 	# Renderer state (mutable, set during render)
-	hooks: Any = None  # HookContext
+	hooks: Any = None  # ComponentHooks
 	contents: Node | None = None
 
 	def emit(self, out: list[str]) -> None:
@@ -810,6 +812,7 @@ class PulseNode:
 			kwargs=self.kwargs,
 			key=self.key,
 			name=self.name,
+			memo=self.memo,
 		)
 
 
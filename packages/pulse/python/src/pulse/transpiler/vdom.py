@@ -213,6 +213,37 @@ VDOMNode: TypeAlias = VDOMPrimitive | VDOMElement | VDOMExpr
 VDOM: TypeAlias = VDOMNode
 
 
+# =============================================================================
+# Templates (repeated element shapes in `vdom_init`, see `pulse.templates`)
+# =============================================================================
+
+
+class TemplateRef(TypedDict):
+	"""An occurrence of a template: the element it describes with `slots` filled in."""
+
+	t: Literal["tpl"]
+	id: int
+	slots: list[VDOMPropValue]
+
+
+class VDOMTemplate(TypedDict):
+	"""An element skeleton shared by repeated elements.
+
+	Fields mirror `VDOMElement`, holding the values every occurrence has in
+	common. `slots` lists the prop names (str) and child indices (int) each
+	occurrence fills in, in order, after its key when `keyed` is set. Element
+	children are nested templates, whose slots follow their parent's.
+	"""
+
+	tag: str
+	key: NotRequired[str]
+	keyed: NotRequired[bool]
+	props: NotRequired[dict[str, VDOMPropValue]]
+	children: NotRequired[list["VDOMTemplate | VDOMNode"]]
+	eval: NotRequired[list[str]]
+	slots: NotRequired[list[str | int]]
+
+
 # =============================================================================
 # Update operations (reconciliation output)
 # =============================================================================
@@ -232,6 +263,43 @@ class ReconciliationOperation(TypedDict):
 	N: int
 	new: tuple[list[int], list[VDOM]]
 	reuse: tuple[list[int], list[int]]
+	# Relative mode, sent when it is smaller than the absolute form. When
+	# present, lists the previous indices that were removed, and `reuse` only
+	# lists moved children; every other previous child keeps its relative
+	# order and fills the slots not taken by `new` or `reuse`. When absent,
+	# indices not in `new`/`reuse` keep the previous child at the same index.
+	removed: NotRequired[list[int]]
+
+
+PatchPath: TypeAlias = list[str | int]
+
+
+class PatchSplice(TypedDict):
+	"""Remove `delete` items at `start` of the list at `path`, inserting `items`."""
+
+	t: Literal["splice"]
+	path: PatchPath
+	start: int
+	delete: int
+	items: list[JsonValue]
+
+
+class PatchSet(TypedDict):
+	"""Set the key or list index ending `path`."""
+
+	t: Literal["set"]
+	path: PatchPath
+	value: JsonValue
+
+
+class PatchDelete(TypedDict):
+	"""Delete the key ending `path`."""
+
+	t: Literal["del"]
+	path: PatchPath
+
+
+PatchOp: TypeAlias = PatchSplice | PatchSet | PatchDelete
 
 
 class UpdatePropsDelta(TypedDict, total=False):
@@ -239,6 +307,9 @@ class UpdatePropsDelta(TypedDict, total=False):
 	# If the element has `eval`, only those keys may use non-JSON values.
 	set: dict[str, VDOMPropValue]
 	remove: list[str]
+	# Structural patches of plain list/dict props, applied in order to the
+	# previous value (`pulse.patches`). Never on eval keys.
+	patch: dict[str, list[PatchOp]]
 	# Optional eval key list replacement for this element.
 	# - If present, replaces `element.eval` entirely.
 	# - Use [] to clear the eval list.
@@ -0,0 +1,559 @@
+"""Binary (MessagePack) wire format for server -> client socket messages.
+
+Opt-in with `App(wire_format="msgpack")`. Clients that can decode it say so
+in their socket auth; everyone else keeps receiving the JSON form produced by
+`serialize()`. The client tells the two apart by the payload type: binary
+socket.io attachments are MessagePack, anything else is JSON.
+
+The MessagePack form carries the same values as `serialize()` with no
+metadata header. Special values are encoded inline as extension types:
+
+- ``-1`` (the standard timestamp type): ``datetime``, truncated to
+  milliseconds like the JSON form. Naive datetimes are taken as UTC.
+- ``1``: ``date``, as a big-endian int32 count of days since 1970-01-01.
+- ``2``: ``set``; the extension data is a MessagePack array of the items.
+- ``3``: shared reference, as a big-endian uint32 index. Maps, arrays, sets,
+  dates and the two extensions below are numbered in the order they start; a
+  reference points back to one of them. Without reference tracking, only
+  written for a value nested in itself.
+- ``4``: numeric array buffer (see ``pulse.columnar``): a dtype byte (index
+  into ``ARRAY_DTYPES``), a dimension count byte, one big-endian uint32 per
+  dimension, then the little-endian array data.
+- ``5``: DataFrame; the extension data is a MessagePack array holding the
+  column names and the columns.
+
+``bytes``, ``bytearray`` and ``memoryview`` are written as MessagePack bin
+values, which the JSON form can't carry.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import math
+import struct
+import types
+from dataclasses import fields, is_dataclass
+from typing import Any, Literal
+
+from pulse.columnar import (
+	BUFFER_DTYPES,
+	ColumnBuffer,
+	ColumnFrame,
+	decode_array,
+	encode_columnar,
+	rows_from_columns,
+)
+
+WireFormat = Literal["json", "msgpack"]
+
+# Socket auth key listing the formats a client can decode, comma-separated
+WIRE_FORMATS_AUTH_KEY = "__pulse_wire_formats"
+
+EXT_TIMESTAMP = -1
+EXT_DATE = 1
+EXT_SET = 2
+EXT_REF = 3
+EXT_ARRAY = 4
+EXT_FRAME = 5
+
+ARRAY_DTYPES = tuple(BUFFER_DTYPES)
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.UTC)
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+_ONE_MS = dt.timedelta(milliseconds=1)
+
+_pack_double = struct.Struct(">Bd").pack
+
+
+def negotiate_wire_format(offered: str | None, enabled: WireFormat) -> WireFormat:
+	"""Format to use for a client offering `offered` (the auth value)."""
+	if enabled == "msgpack" and offered and "msgpack" in offered.split(","):
+		return "msgpack"
+	return "json"
+
+
+def encode_msgpack(data: Any, *, track_refs: bool = True) -> bytes:
+	"""Encode a value to MessagePack, with Pulse's extension types.
+
+	Supports the same values as `serialize()`, plus byte strings. With
+	`track_refs=False` shared values are written out at each occurrence, and
+	a value nested in itself is written as a reference to the enclosing
+	occurrence, as in `serialize()`'s tree mode.
+	"""
+	out = bytearray()
+	seen: dict[int, int] = {}
+	# Without tracking: map object id -> index, for the containers enclosing
+	# the current value. A cycle always leads back to one of them.
+	path: dict[int, int] = {}
+	# Columnar values are built during the walk; keep them alive so their ids
+	# aren't reused by later values while `seen` refers to them.
+	keep_alive: list[Any] = []
+	count = 0
+
+	def write_ref(idx: int) -> None:
+		out.extend(b"\xd6\x03")
+		out.extend(idx.to_bytes(4, "big"))
+
+	def shared(value: Any) -> bool:
+		"""Write a reference if `value` was already written, else number it."""
+		nonlocal count
+		if track_refs:
+			idx = seen.get(id(value))
+			if idx is not None:
+				write_ref(idx)
+				return True
+			seen[id(value)] = count
+		count += 1
+		return False
+
+	def enter(value: Any) -> bool:
+		"""`shared()` for a container, which `leave()` closes once written."""
+		if track_refs:
+			return shared(value)
+		idx = path.get(id(value))
+		if idx is not None:
+			write_ref(idx)
+			return True
+		path[id(value)] = count
+		return shared(value)
+
+	def leave(value: Any) -> None:
+		if not track_refs:
+			del path[id(value)]
+
+	def write(value: Any) -> None:
+		nonlocal count
+		kind = type(value)
+		if kind is str:
+			_write_str(out, value)
+		elif kind is int:
+			_write_int(out, value)
+		elif value is None:
+			out.append(0xC0)
+		elif kind is bool:
+			out.append(0xC3 if value else 0xC2)
+		elif kind is float:
+			_write_float(out, value)
+		elif kind is dict or kind is list or kind is tuple:
+			# `enter()` and `leave()`, inlined for the common containers
+			obj_id = id(value)
+			if track_refs:
+				if shared(value):
+					return
+			elif obj_id in path:
+				write_ref(path[obj_id])
+				return
+			else:
+				path[obj_id] = count
+				count += 1
+			if kind is dict:
+				write_map(value)
+			else:
+				_write_array_header(out, len(value))
+				for entry in value:
+					write(entry)
+			if not track_refs:
+				del path[obj_id]
+		else:
+			write_other(value)
+
+	def write_map(value: dict[Any, Any]) -> None:
+		_write_map_header(out, len(value))
+		for key, entry in value.items():
+			if type(key) is not str and not isinstance(key, str):
+				raise TypeError(
+					f"Dict keys must be strings, got {type(key).__name__}: {key!r}"  # pyright: ignore[reportUnknownArgumentType]
+				)
+			_write_str(out, key)
+			write(entry)
+
+	def write_other(value: Any) -> None:
+		if isinstance(value, bool):
+			out.append(0xC3 if value else 0xC2)
+		elif isinstance(value, int):
+			_write_int(out, value)
+		elif isinstance(value, str):
+			_write_str(out, value)
+		elif isinstance(value, float):
+			_write_float(out, value)
+		elif isinstance(value, (bytes, bytearray, memoryview)):
+			_write_bin(out, bytes(value))
+		elif isinstance(value, dt.datetime):
+			if not shared(value):
+				_write_timestamp(out, value)
+		elif isinstance(value, dt.date):
+			if not shared(value):
+				out.extend(b"\xd6\x01")
+				out.extend(struct.pack(">i", value.toordinal() - _EPOCH_ORDINAL))
+		elif isinstance(value, dict):
+			if not enter(value):
+				write_map(value)
+				leave(value)
+		elif isinstance(value, (list, tuple)):
+			if not enter(value):
+				_write_array_header(out, len(value))
+				for entry in value:
+					write(entry)
+				leave(value)
+		elif isinstance(value, set):
+			if not enter(value):
+				# The extension's length is only known once its items are written
+				start = len(out)
+				_write_array_header(out, len(value))
+				for entry in value:
+					write(entry)
+				body = bytes(out[start:])
+				del out[start:]
+				_write_ext_header(out, EXT_SET, len(body))
+				out.extend(body)
+				leave(value)
+		elif (columnar := encode_columnar(value)) is not None:
+			if not shared(value):
+				keep_alive.append(columnar)
+				write_columnar(columnar)
+		elif is_dataclass(value) and not isinstance(value, type):
+			if not enter(value):
+				items = [f.name for f in fields(value)]
+				_write_map_header(out, len(items))
+				for name in items:
+					_write_str(out, name)
+					write(getattr(value, name))
+				leave(value)
+		elif callable(value) or isinstance(value, (type, types.ModuleType)):
+			raise TypeError(f"Unsupported value in serialization: {type(value)!r}")
+		elif hasattr(value, "__dict__"):
+			if not enter(value):
+				attrs = [
+					(key, entry)
+					for key, entry in vars(value).items()
+					if not key.startswith("_")
+				]
+				_write_map_header(out, len(attrs))
+				for key, entry in attrs:
+					_write_str(out, key)
+					write(entry)
+				leave(value)
+		else:
+			raise TypeError(f"Unsupported value in serialization: {type(value)!r}")
+
+	def write_columnar(value: ColumnBuffer | ColumnFrame | list[Any]) -> None:
+		if isinstance(value, list):
+			_write_array_header(out, len(value))
+			for entry in value:
+				write(entry)
+		elif isinstance(value, ColumnBuffer):
+			size = 2 + 4 * len(value.shape) + len(value.data)
+			_write_ext_header(out, EXT_ARRAY, size)
+			out.append(ARRAY_DTYPES.index(value.dtype))
+			out.append(len(value.shape))
+			for dim in value.shape:
+				out.extend(dim.to_bytes(4, "big"))
+			out.extend(value.data)
+		else:
+			start = len(out)
+			_write_array_header(out, 2)
+			write(value.columns)
+			if not shared(value.data):
+				_write_array_header(out, len(value.data))
+				for column in value.data:
+					if not shared(column):
+						write_columnar(column)
+			body = bytes(out[start:])
+			del out[start:]
+			_write_ext_header(out, EXT_FRAME, len(body))
+			out.extend(body)
+
+	write(data)
+	return bytes(out)
+
+
+def decode_msgpack(data: bytes) -> Any:
+	"""Decode `encode_msgpack` output, restoring dates, sets and shared refs."""
+	view = memoryview(data)
+	pos = 0
+	objects: list[Any] = []
+
+	def take(n: int) -> memoryview:
+		nonlocal pos
+		if pos + n > len(view):
+			raise ValueError("Truncated MessagePack payload")
+		chunk = view[pos : pos + n]
+		pos += n
+		return chunk
+
+	def uint(n: int) -> int:
+		return int.from_bytes(take(n), "big")
+
+	def read_array(n: int) -> list[Any]:
+		result: list[Any] = []
+		objects.append(result)
+		for _ in range(n):
+			result.append(read())
+		return result
+
+	def read_map(n: int) -> dict[str, Any]:
+		result: dict[str, Any] = {}
+		objects.append(result)
+		for _ in range(n):
+			key = read()
+			if not isinstance(key, str):
+				raise TypeError(f"Map keys must be strings, got {type(key).__name__}")
+			result[key] = read()
+		return result
+
+	def read_ext(code: int, size: int) -> Any:
+		if code == EXT_REF:
+			idx = uint(size)
+			if idx >= len(objects):
+				raise ValueError(f"Dangling reference to index {idx}")
+			return objects[idx]
+		if code == EXT_SET:
+			result: set[Any] = set()
+			objects.append(result)
+			header = read_header()
+			if not isinstance(header, tuple) or header[0] != "array":
+				raise TypeError("Set payload must be an array")
+			for _ in range(header[1]):
+				result.add(read())
+			return result
+		if code == EXT_DATE:
+			(days,) = struct.unpack(">i", take(size))
+			value = dt.date.fromordinal(days + _EPOCH_ORDINAL)
+			objects.append(value)
+			return value
+		if code == EXT_ARRAY:
+			dtype = ARRAY_DTYPES[uint(1)]
+			shape = [uint(4) for _ in range(uint(1))]
+			value = decode_array(dtype, shape, bytes(take(size - 2 - 4 * len(shape))))
+			objects.append(value)
+			return value
+		if code == EXT_FRAME:
+			slot = len(objects)
+			objects.append(None)
+			header = read_header()
+			if header != ("array", 2):
+				raise TypeError("DataFrame payload must be a 2-item array")
+			columns = read()
+			value = rows_from_columns(columns, read())
+			objects[slot] = value
+			return value
+		if code == EXT_TIMESTAMP:
+			if size == 8:
+				data64 = uint(8)
+				nanos, seconds = data64 >> 34, data64 & 0x3FFFFFFFF
+			elif size == 12:
+				nanos = uint(4)
+				seconds = int.from_bytes(take(8), "big", signed=True)
+			else:
+				raise ValueError(f"Unsupported timestamp size {size}")
+			value = _EPOCH + dt.timedelta(seconds=seconds, microseconds=nanos // 1000)
+			objects.append(value)
+			return value
+		raise TypeError(f"Unsupported MessagePack extension type {code}")
+
+	def read_header() -> Any:
+		"""Read one value, or ("array"/"map", length) for containers."""
+		byte = uint(1)
+		if byte <= 0x7F:
+			return byte
+		if byte >= 0xE0:
+			return byte - 0x100
+		if 0xA0 <= byte <= 0xBF:
+			return str(take(byte & 0x1F), "utf-8")
+		if 0x90 <= byte <= 0x9F:
+			return ("array", byte & 0x0F)
+		if 0x80 <= byte <= 0x8F:
+			return ("map", byte & 0x0F)
+		if byte == 0xC0:
+			return None
+		if byte == 0xC2:
+			return False
+		if byte == 0xC3:
+			return True
+		if byte in (0xC4, 0xC5, 0xC6):
+			return bytes(take(uint(1 << (byte - 0xC4))))
+		if byte in (0xC7, 0xC8, 0xC9):
+			size = uint(1 << (byte - 0xC7))
+			code = int.from_bytes(take(1), "big", signed=True)
+			return ("ext", code, size)
+		if byte == 0xCA:
+			return struct.unpack(">f", take(4))[0]
+		if byte == 0xCB:
+			return struct.unpack(">d", take(8))[0]
+		if 0xCC <= byte <= 0xCF:
+			return uint(1 << (byte - 0xCC))
+		if 0xD0 <= byte <= 0xD3:
+			return int.from_bytes(take(1 << (byte - 0xD0)), "big", signed=True)
+		if 0xD4 <= byte <= 0xD8:
+			code = int.from_bytes(take(1), "big", signed=True)
+			return ("ext", code, 1 << (byte - 0xD4))
+		if byte in (0xD9, 0xDA, 0xDB):
+			return str(take(uint(1 << (byte - 0xD9))), "utf-8")
+		if byte in (0xDC, 0xDD):
+			return ("array", uint(2 if byte == 0xDC else 4))
+		if byte in (0xDE, 0xDF):
+			return ("map", uint(2 if byte == 0xDE else 4))
+		raise ValueError(f"Invalid MessagePack byte 0x{byte:02x}")
+
+	def read() -> Any:
+		header = read_header()
+		if type(header) is not tuple:
+			return header
+		if header[0] == "array":
+			return read_array(header[1])
+		if header[0] == "map":
+			return read_map(header[1])
+		return read_ext(header[1], header[2])
+
+	result = read()
+	if pos != len(view):
+		raise ValueError("Trailing bytes after MessagePack payload")
+	return result
+
+
+# ----------------------------------------------------------------------
+# Writers
+# ----------------------------------------------------------------------
+
+
+def _write_int(out: bytearray, value: int) -> None:
+	if 0 <= value <= 0x7F:
+		out.append(value)
+	elif -32 <= value < 0:
+		out.append(value & 0xFF)
+	elif 0 < value <= 0xFFFFFFFFFFFFFFFF:
+		size = (
+			1
+			if value <= 0xFF
+			else 2
+			if value <= 0xFFFF
+			else 4
+			if value <= 0xFFFFFFFF
+			else 8
+		)
+		out.append(_UINT_PREFIX[size])
+		out.extend(value.to_bytes(size, "big"))
+	elif -0x8000000000000000 <= value < 0:
+		size = (
+			1
+			if value >= -0x80
+			else 2
+			if value >= -0x8000
+			else 4
+			if value >= -0x80000000
+			else 8
+		)
+		out.append(_INT_PREFIX[size])
+		out.extend(value.to_bytes(size, "big", signed=True))
+	else:
+		# Beyond 64 bits; JSON clients would read it as a double too
+		out.extend(_pack_double(0xCB, float(value)))
+
+
+_UINT_PREFIX = {1: 0xCC, 2: 0xCD, 4: 0xCE, 8: 0xCF}
+_INT_PREFIX = {1: 0xD0, 2: 0xD1, 4: 0xD2, 8: 0xD3}
+
+
+def _write_float(out: bytearray, value: float) -> None:
+	if math.isnan(value):
+		out.append(0xC0)
+		return
+	if math.isinf(value):
+		raise ValueError(
+			f"Cannot serialize {value}: Infinity is not valid JSON. "
+			+ "Replace with None or a sentinel value."
+		)
+	out.extend(_pack_double(0xCB, value))
+
+
+def _write_str(out: bytearray, value: str) -> None:
+	encoded = value.encode("utf-8")
+	size = len(encoded)
+	if size <= 0x1F:
+		out.append(0xA0 | size)
+	elif size <= 0xFF:
+		out.append(0xD9)
+		out.append(size)
+	elif size <= 0xFFFF:
+		out.append(0xDA)
+		out.extend(size.to_bytes(2, "big"))
+	else:
+		out.append(0xDB)
+		out.extend(size.to_bytes(4, "big"))
+	out.extend(encoded)
+
+
+def _write_bin(out: bytearray, value: bytes) -> None:
+	size = len(value)
+	if size <= 0xFF:
+		out.append(0xC4)
+		out.append(size)
+	elif size <= 0xFFFF:
+		out.append(0xC5)
+		out.extend(size.to_bytes(2, "big"))
+	else:
+		out.append(0xC6)
+		out.extend(size.to_bytes(4, "big"))
+	out.extend(value)
+
+
+def _write_array_header(out: bytearray, size: int) -> None:
+	if size <= 0x0F:
+		out.append(0x90 | size)
+	elif size <= 0xFFFF:
+		out.append(0xDC)
+		out.extend(size.to_bytes(2, "big"))
+	else:
+		out.append(0xDD)
+		out.extend(size.to_bytes(4, "big"))
+
+
+def _write_map_header(out: bytearray, size: int) -> None:
+	if size <= 0x0F:
+		out.append(0x80 | size)
+	elif size <= 0xFFFF:
+		out.append(0xDE)
+		out.extend(size.to_bytes(2, "big"))
+	else:
+		out.append(0xDF)
+		out.extend(size.to_bytes(4, "big"))
+
+
+def _write_ext_header(out: bytearray, code: int, size: int) -> None:
+	fixed = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}.get(size)
+	if fixed is not None:
+		out.append(fixed)
+	elif size <= 0xFF:
+		out.append(0xC7)
+		out.append(size)
+	elif size <= 0xFFFF:
+		out.append(0xC8)
+		out.extend(size.to_bytes(2, "big"))
+	else:
+		out.append(0xC9)
+		out.extend(size.to_bytes(4, "big"))
+	out.extend(code.to_bytes(1, "big", signed=True))
+
+
+def _write_timestamp(out: bytearray, value: dt.datetime) -> None:
+	if value.tzinfo is None:
+		value = value.replace(tzinfo=dt.UTC)
+	millis = (value - _EPOCH) // _ONE_MS
+	seconds, ms = divmod(millis, 1000)
+	nanos = ms * 1_000_000
+	if 0 <= seconds < 1 << 34:
+		out.extend(b"\xd7\xff")
+		out.extend(((nanos << 34) | seconds).to_bytes(8, "big"))
+	else:
+		out.extend(b"\xc7\x0c\xff")
+		out.extend(nanos.to_bytes(4, "big"))
+		out.extend(seconds.to_bytes(8, "big", signed=True))
+
+
+__all__ = [
+	"WIRE_FORMATS_AUTH_KEY",
+	"WireFormat",
+	"decode_msgpack",
+	"encode_msgpack",
+	"negotiate_wire_format",
+]
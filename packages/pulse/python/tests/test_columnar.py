@@ -0,0 +1,138 @@
+import datetime as dt
+import json
+from typing import Any
+
+import pytest
+from pulse.columnar import decode_array, rows_from_columns
+from pulse.serializer import deserialize, serialize
+from pulse.wire import decode_msgpack, encode_msgpack
+
+
+def roundtrips(data: Any) -> list[Any]:
+	"""Decoded `data` through both wire formats, with and without refs."""
+	return [
+		deserialize(json.loads(json.dumps(serialize(data)))),
+		deserialize(json.loads(json.dumps(serialize(data, track_refs=False)))),
+		decode_msgpack(encode_msgpack(data)),
+		decode_msgpack(encode_msgpack(data, track_refs=False)),
+	]
+
+
+def test_decode_array_without_numpy():
+	data = b"".join(i.to_bytes(2, "little", signed=True) for i in (0, -1, 2, -3))
+	assert decode_array("int16", [4], data) == [0, -1, 2, -3]
+	assert decode_array("int16", [2, 2], data) == [[0, -1], [2, -3]]
+	assert decode_array("int16", [], data[:2]) == 0
+	assert decode_array("float64", [0, 3], b"") == []
+
+
+def test_rows_from_columns():
+	assert rows_from_columns(["x", "y"], [[1, 2], ["a", "b"]]) == [
+		{"x": 1, "y": "a"},
+		{"x": 2, "y": "b"},
+	]
+
+
+def test_plain_payloads_have_four_metadata_lists():
+	assert len(serialize({"a": [1, 2]})[0]) == 4
+	assert len(serialize({"a": [1, 2]}, track_refs=False)[0]) == 4
+
+
+def test_numeric_arrays_are_sent_as_buffers():
+	np = pytest.importorskip("numpy")
+	matrix = np.arange(6, dtype=np.int16).reshape(2, 3)
+	meta, payload = serialize({"m": matrix})
+	assert len(meta) == 5
+	assert meta[4] == [1]
+	assert payload == {
+		"m": {"dtype": "int16", "shape": [2, 3], "data": "AAABAAIAAwAEAAUA"}
+	}
+	for decoded in roundtrips({"m": matrix, "f": np.linspace(0, 1, 5)}):
+		assert decoded["m"] == [[0, 1, 2], [3, 4, 5]]
+		assert decoded["f"] == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_float_buffers_keep_nan_and_reject_infinity():
+	np = pytest.importorskip("numpy")
+	pd = pytest.importorskip("pandas")
+	for decoded in roundtrips({"f": np.array([1.0, np.nan])}):
+		assert decoded["f"][0] == 1.0
+		assert np.isnan(decoded["f"][1])
+	for value in (np.array([np.inf]), pd.Series([1.0, -np.inf])):
+		with pytest.raises(ValueError, match="Infinity"):
+			serialize({"v": value})
+		with pytest.raises(ValueError, match="Infinity"):
+			encode_msgpack({"v": value}, track_refs=False)
+
+
+def test_wide_and_narrow_dtypes_are_converted():
+	np = pytest.importorskip("numpy")
+	payload: Any = serialize(
+		{
+			"i64": np.array([1, 2], dtype=np.int64),
+			"f16": np.array([0.5], dtype=np.float16),
+			"big": np.array([1, 2], dtype=">i4"),
+		}
+	)[1]
+	assert payload["i64"]["dtype"] == "float64"
+	assert payload["f16"]["dtype"] == "float32"
+	decoded = deserialize(serialize({"big": np.array([1, 2], dtype=">i4")}))
+	assert decoded["big"] == [1, 2]
+
+
+def test_other_dtypes_are_sent_as_lists():
+	np = pytest.importorskip("numpy")
+	data = {
+		"flags": np.array([True, False]),
+		"names": np.array(["a", "b"]),
+		"when": np.array(["2024-01-01T00:00:00.123456789"], dtype="datetime64[ns]"),
+	}
+	meta, _ = serialize(data)
+	assert len(meta) == 4
+	for decoded in roundtrips(data):
+		assert decoded["flags"] == [True, False]
+		assert decoded["names"] == ["a", "b"]
+		assert decoded["when"] == [
+			dt.datetime(2024, 1, 1, 0, 0, 0, 123000, tzinfo=dt.UTC)
+		]
+
+
+def test_shared_arrays_are_references():
+	np = pytest.importorskip("numpy")
+	values = np.arange(3, dtype=np.float64)
+	decoded = deserialize(serialize({"a": values, "b": values}))
+	assert decoded["a"] is decoded["b"]
+	decoded = decode_msgpack(encode_msgpack({"a": values, "b": values}))
+	assert decoded["a"] is decoded["b"]
+
+
+def test_dataframes_are_sent_as_columns():
+	pd = pytest.importorskip("pandas")
+	df = pd.DataFrame(
+		{
+			"x": [0.5, 1.5, 2.5],
+			"name": ["a", "b", None],
+			"when": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+			"n": pd.array([1, 2, 3], dtype="Int64"),
+		}
+	)
+	payload: Any = serialize({"df": df, "s": df["x"]})[1]
+	assert payload["df"]["columns"] == ["x", "name", "when", "n"]
+	assert payload["s"]["dtype"] == "float64"
+	for decoded in roundtrips({"df": df, "s": df["x"]}):
+		assert decoded["s"] == [0.5, 1.5, 2.5]
+		assert decoded["df"] == [
+			{
+				"x": 0.5,
+				"name": "a",
+				"when": dt.datetime(2024, 1, 1, tzinfo=dt.UTC),
+				"n": 1,
+			},
+			{
+				"x": 1.5,
+				"name": "b",
+				"when": dt.datetime(2024, 1, 2, tzinfo=dt.UTC),
+				"n": 2,
+			},
+			{"x": 2.5, "name": None, "when": None, "n": 3},
+		]
@@ -0,0 +1,289 @@
+import copy
+import random
+from typing import Any
+
+import pytest
+from pulse.compaction import (
+	compact_operations,
+	compose_reconciliations,
+	merge_props_deltas,
+)
+from pulse.dom.tags import div, li, span, ul
+from pulse.patches import apply_patch
+from pulse.renderer import RenderTree
+from pulse.transpiler.vdom import ReconciliationOperation, VDOMOperation
+
+
+# Reference client: applies operations to a VDOM the way the JS renderer
+# applies them to React elements.
+def _apply(vdom: Any, ops: list[VDOMOperation]) -> Any:
+	root = copy.deepcopy(vdom)
+	for op in ops:
+		root = _apply_at(root, op["path"].split(".") if op["path"] else [], op)
+	return root
+
+
+def _apply_at(node: Any, parts: list[str], op: Any) -> Any:
+	if parts:
+		head = parts[0]
+		if head.isdigit():
+			node["children"][int(head)] = _apply_at(
+				node["children"][int(head)], parts[1:], op
+			)
+		else:
+			node["props"][head] = _apply_at(node["props"][head], parts[1:], op)
+		return node
+	if op["type"] == "replace":
+		return copy.deepcopy(op["data"])
+	if op["type"] == "update_props":
+		props = node.setdefault("props", {})
+		for key in op["data"].get("remove", []):
+			props.pop(key, None)
+		props.update(copy.deepcopy(op["data"].get("set", {})))
+		for key, ops in op["data"].get("patch", {}).items():
+			props[key] = apply_patch(props[key], ops)
+		if not props:
+			del node["props"]
+		if "eval" in op["data"]:
+			if op["data"]["eval"]:
+				node["eval"] = list(op["data"]["eval"])
+			else:
+				node.pop("eval", None)
+		return node
+	prev = node.get("children", [])
+	new = dict(zip(*op["new"], strict=True))
+	reuse = dict(zip(*op["reuse"], strict=True))
+	removed = op.get("removed")
+	stable: list[int] = []
+	if removed is not None:
+		stable = [
+			i for i in range(len(prev)) if i not in removed and i not in op["reuse"][1]
+		]
+	children: list[Any] = []
+	for i in range(op["N"]):
+		if i in new:
+			children.append(copy.deepcopy(new[i]))
+		elif i in reuse:
+			children.append(prev[reuse[i]])
+		elif removed is not None:
+			children.append(prev[stable.pop(0)])
+		else:
+			children.append(prev[i])
+	if children:
+		node["children"] = children
+	else:
+		node.pop("children", None)
+	return node
+
+
+def _noop() -> None:
+	pass
+
+
+# Random trees described as plain dicts, mutated between renders
+def _random_spec(rng: random.Random, depth: int) -> dict[str, Any]:
+	spec: dict[str, Any] = {
+		"tag": rng.choice(["div", "ul", "span"]),
+		"props": {},
+		"children": [],
+		"keyed": rng.random() < 0.6,
+	}
+	for name in ("className", "title", "onClick"):
+		if rng.random() < 0.5:
+			spec["props"][name] = rng.randint(0, 3)
+	if depth > 0:
+		for idx in range(rng.randint(0, 5)):
+			spec["children"].append(
+				_random_spec(rng, depth - 1) if rng.random() < 0.7 else f"t{idx}"
+			)
+	for idx, child in enumerate(spec["children"]):
+		if isinstance(child, dict):
+			child["key"] = f"k{rng.randint(0, 10**6)}-{idx}"
+	return spec
+
+
+def _mutate(rng: random.Random, spec: Any, depth: int) -> Any:
+	if isinstance(spec, str):
+		return spec + "!" if rng.random() < 0.3 else spec
+	spec = {**spec, "props": dict(spec["props"]), "children": list(spec["children"])}
+	roll = rng.random()
+	if roll < 0.12:
+		spec["tag"] = rng.choice(["div", "ul", "span"])
+	for name in ("className", "title", "onClick"):
+		if rng.random() < 0.25:
+			if name in spec["props"] and rng.random() < 0.5:
+				del spec["props"][name]
+			else:
+				spec["props"][name] = rng.randint(0, 3)
+	children = spec["children"]
+	if children and rng.random() < 0.3:
+		rng.shuffle(children)
+	if children and rng.random() < 0.3:
+		children.pop(rng.randrange(len(children)))
+	if depth > 0 and rng.random() < 0.3:
+		child = _random_spec(rng, depth - 1)
+		child["key"] = f"n{rng.randint(0, 10**6)}"
+		children.insert(rng.randint(0, len(children)), child)
+	spec["children"] = [_mutate(rng, child, depth - 1) for child in children]
+	return spec
+
+
+def _element(spec: Any) -> Any:
+	if isinstance(spec, str):
+		return spec
+	tag = {"div": div, "ul": ul, "span": span}[spec["tag"]]
+	props: dict[str, Any] = {}
+	for name, value in spec["props"].items():
+		props[name] = _noop if name == "onClick" else f"{name}-{value}"
+	if spec["keyed"] and "key" in spec:
+		props["key"] = spec["key"]
+	return tag(**props)[*[_element(child) for child in spec["children"]]]
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_compaction_matches_client_result(seed: int):
+	rng = random.Random(seed)
+	spec = _random_spec(rng, 3)
+	tree = RenderTree(_element(spec))
+	initial = tree.render()
+
+	ops: list[VDOMOperation] = []
+	for _ in range(rng.randint(2, 5)):
+		spec = _mutate(rng, spec, 3)
+		ops.extend(tree.rerender(_element(spec)))
+	expected = RenderTree(_element(spec)).render()
+
+	assert _apply(initial, ops) == expected
+	compacted = compact_operations(copy.deepcopy(ops))
+	assert len(compacted) <= len(ops)
+	assert _apply(initial, compacted) == expected
+
+
+def test_compaction_shrinks_repeated_updates():
+	tree = RenderTree(ul(*[li(key=str(i), className="a")[str(i)] for i in range(5)]))
+	initial = tree.render()
+	ops: list[VDOMOperation] = []
+	for cls in ("b", "c", "d"):
+		ops.extend(
+			tree.rerender(
+				ul(*[li(key=str(i), className=cls)[str(i)] for i in range(5)])
+			)
+		)
+	compacted = compact_operations(ops)
+	assert len(ops) == 15
+	assert len(compacted) == 5
+	assert _apply(initial, compacted) == _apply(initial, ops)
+
+
+def test_replace_drops_shadowed_operations():
+	ops: list[VDOMOperation] = [
+		{"type": "update_props", "path": "0.1", "data": {"set": {"a": 1}}},
+		{"type": "update_props", "path": "1", "data": {"set": {"b": 1}}},
+		{"type": "replace", "path": "0", "data": {"tag": "p"}},
+	]
+	assert compact_operations(ops) == [ops[1], ops[2]]
+
+
+def test_replace_is_not_shadowed_across_ancestor_reconciliation():
+	ops: list[VDOMOperation] = [
+		{"type": "update_props", "path": "0.1", "data": {"set": {"a": 1}}},
+		{
+			"type": "reconciliation",
+			"path": "",
+			"N": 2,
+			"new": ([], []),
+			"reuse": ([0, 1], [1, 0]),
+		},
+		{"type": "replace", "path": "0", "data": {"tag": "p"}},
+	]
+	assert compact_operations(ops) == ops
+
+
+def test_operations_fold_into_earlier_replace():
+	ops: list[VDOMOperation] = [
+		{
+			"type": "replace",
+			"path": "2",
+			"data": {"tag": "div", "children": [{"tag": "span"}, "x"]},
+		},
+		{"type": "update_props", "path": "0", "data": {"set": {"a": 1}}},
+		{"type": "update_props", "path": "2.0", "data": {"set": {"id": "s"}}},
+		{"type": "replace", "path": "2.1", "data": "y"},
+	]
+	assert compact_operations(ops) == [
+		{
+			"type": "replace",
+			"path": "2",
+			"data": {
+				"tag": "div",
+				"children": [{"tag": "span", "props": {"id": "s"}}, "y"],
+			},
+		},
+		ops[1],
+	]
+	# The original replacement payload is left untouched
+	first = ops[0]
+	assert first["type"] == "replace"
+	assert first["data"] == {"tag": "div", "children": [{"tag": "span"}, "x"]}
+
+
+def test_merge_props_deltas():
+	assert merge_props_deltas(
+		{"set": {"a": 1, "b": 2}, "remove": ["c"]},
+		{"set": {"c": 3}, "remove": ["a"]},
+	) == {"set": {"b": 2, "c": 3}, "remove": ["a"]}
+	assert merge_props_deltas(
+		{"set": {"onClick": "$cb"}, "eval": ["onClick"]},
+		{"set": {"title": "x"}},
+	) == {"set": {"onClick": "$cb", "title": "x"}, "eval": ["onClick"]}
+	# `onClick` was set under an eval list that the merged delta would change
+	assert (
+		merge_props_deltas(
+			{"set": {"onClick": "$cb"}},
+			{"set": {"title": "x"}, "eval": ["title"]},
+		)
+		is None
+	)
+
+
+def test_merge_props_deltas_with_patches():
+	append: Any = {"t": "splice", "path": [], "start": 2, "delete": 0, "items": [3]}
+	drop: Any = {"t": "splice", "path": [], "start": 0, "delete": 1, "items": []}
+	# A patch of a value set earlier is folded into it
+	assert merge_props_deltas(
+		{"set": {"data": [1, 2]}}, {"patch": {"data": [append]}}
+	) == {"set": {"data": [1, 2, 3]}}
+	# Patches of the same value are applied in turn
+	assert merge_props_deltas(
+		{"patch": {"data": [append]}}, {"patch": {"data": [drop]}}
+	) == {"patch": {"data": [append, drop]}}
+	# A later set or remove overrides a patch
+	assert merge_props_deltas(
+		{"patch": {"data": [append], "rows": [drop]}},
+		{"set": {"data": []}, "remove": ["rows"]},
+	) == {"set": {"data": []}, "remove": ["rows"]}
+	assert merge_props_deltas({"remove": ["data"]}, {"patch": {"data": [drop]}}) is None
+
+
+def test_compose_reconciliations():
+	first: ReconciliationOperation = {
+		"type": "reconciliation",
+		"path": "",
+		"N": 3,
+		"new": ([0], ["a"]),
+		"reuse": ([], []),
+		"removed": [],
+	}
+	second: ReconciliationOperation = {
+		"type": "reconciliation",
+		"path": "",
+		"N": 3,
+		"new": ([], []),
+		"reuse": ([0], [2]),
+		"removed": [],
+	}
+	composed = compose_reconciliations(first, second)
+	node = {"tag": "ul", "children": ["x", "y"]}
+	assert _apply(node, [composed]) == _apply(node, [first, second])
+	assert composed["N"] == 3
+	assert composed["new"] == ([1], ["a"])
@@ -0,0 +1,101 @@
+import gzip
+import json
+
+import pytest
+from pulse.compression import Compression, negotiate_encoding
+from pulse.serializer import deserialize, serialize
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+
+def make_request(accept_encoding: str | None) -> Request:
+	headers = []
+	if accept_encoding is not None:
+		headers.append((b"accept-encoding", accept_encoding.encode()))
+	return Request({"type": "http", "method": "POST", "headers": headers})
+
+
+def test_negotiate_encoding():
+	assert negotiate_encoding(None) is None
+	assert negotiate_encoding("identity") is None
+	assert negotiate_encoding("gzip, deflate") == "gzip"
+	assert negotiate_encoding("gzip;q=0") is None
+	assert negotiate_encoding("*") == negotiate_encoding("gzip, br")
+	assert negotiate_encoding("*, gzip;q=0") in (None, "br")
+
+
+def test_large_messages_are_gzipped():
+	compression = Compression(threshold=256, level=1)
+	message = {
+		"type": "vdom_init",
+		"path": "/",
+		"rows": [f"row {i}" for i in range(100)],
+	}
+	payload = list(serialize(message, track_refs=False))
+
+	compressed = compression.compress_message(payload)
+	assert isinstance(compressed, bytes)
+	assert compressed[:2] == b"\x1f\x8b"
+	assert deserialize(json.loads(gzip.decompress(compressed))) == message
+
+	# Small messages are sent as the bytes they were encoded to
+	small = {"type": "vdom_update", "path": "/", "ops": []}
+	encoded = compression.compress_message(list(serialize(small)))
+	assert deserialize(json.loads(encoded)) == small
+
+	msgpack = b"\x81" + b"\xa1a" * 200
+	assert gzip.decompress(compression.compress_message(msgpack)) == msgpack
+
+	stats = compression.stats["socket", "gzip"]
+	assert stats.calls == 2
+	assert stats.bytes_out < stats.bytes_in
+	assert 0 < stats.ratio < 1
+	assert compression.snapshot()[0]["ratio"] == stats.ratio
+
+
+def test_incompressible_payloads_are_sent_as_is():
+	compression = Compression(threshold=16)
+	payload = bytes(range(256))
+	assert compression.compress_message(payload) is payload
+	assert compression.compress_message(b"\x81\xa1a\x01") == b"\x81\xa1a\x01"
+	stats = compression.stats["socket", "gzip"]
+	assert stats.bytes_out == stats.bytes_in == 256
+
+
+def test_responses_are_compressed_when_accepted():
+	compression = Compression(threshold=1024)
+	content = {"rows": list(range(2000))}
+
+	response = compression.compress_response(
+		make_request("gzip"), JSONResponse(content)
+	)
+	assert response.headers["content-encoding"] == "gzip"
+	assert response.headers["vary"] == "Accept-Encoding"
+	assert int(response.headers["content-length"]) == len(response.body)
+	assert json.loads(gzip.decompress(response.body)) == content
+
+	for request, original in (
+		(make_request(None), JSONResponse(content)),
+		(make_request("gzip"), JSONResponse({"small": True})),
+		(make_request("gzip"), Response(status_code=204)),
+	):
+		response = compression.compress_response(request, original)
+		assert "content-encoding" not in response.headers
+
+	disabled = Compression(threshold=1024, http=False)
+	response = disabled.compress_response(make_request("gzip"), JSONResponse(content))
+	assert "content-encoding" not in response.headers
+
+
+def test_socket_compression_needs_client_support():
+	assert Compression().accepts_socket("gzip")
+	assert not Compression().accepts_socket(None)
+	assert not Compression().accepts_socket("br")
+	assert not Compression(socket=False).accepts_socket("gzip")
+
+
+def test_levels_are_validated():
+	with pytest.raises(ValueError):
+		Compression(level=0)
+	with pytest.raises(ValueError):
+		Compression(brotli_quality=12)
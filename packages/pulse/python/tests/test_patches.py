@@ -0,0 +1,181 @@
+import copy
+import random
+from typing import Any, cast
+
+import pytest
+from pulse.compaction import compact_operations
+from pulse.patches import apply_patch, diff_value
+from pulse.renderer import RenderTree
+from pulse.transpiler.nodes import Element
+from pulse.transpiler.vdom import VDOMElement
+
+
+def test_appending_to_a_series_sends_the_new_item():
+	series = [{"t": i, "v": i * 0.5} for i in range(1000)]
+	ops = diff_value(series, [*series, {"t": 1000, "v": 500.0}])
+	assert ops == [
+		{
+			"t": "splice",
+			"path": [],
+			"start": 1000,
+			"delete": 0,
+			"items": [{"t": 1000, "v": 500.0}],
+		}
+	]
+
+
+def test_sliding_window_drops_and_appends():
+	window = list(range(100))
+	assert diff_value(window, [*window[2:], 100, 101]) == [
+		{"t": "splice", "path": [], "start": 0, "delete": 2, "items": []},
+		{"t": "splice", "path": [], "start": 98, "delete": 0, "items": [100, 101]},
+	]
+	assert diff_value(window, [-1, *window]) == [
+		{"t": "splice", "path": [], "start": 0, "delete": 0, "items": [-1]}
+	]
+
+
+def test_nested_values_are_patched_in_place():
+	rows = [{"id": i, "name": f"row {i}", "tags": ["a", "b"]} for i in range(20)]
+	config: dict[str, Any] = {"title": "Rows", "rows": rows, "legend": True}
+	updated = copy.deepcopy(config)
+	updated["rows"][5]["name"] = "renamed"
+	updated["title"] = "All rows"
+	del updated["legend"]
+	assert diff_value(config, updated) == [
+		{"t": "del", "path": ["legend"]},
+		{"t": "set", "path": ["title"], "value": "All rows"},
+		{"t": "set", "path": ["rows", 5, "name"], "value": "renamed"},
+	]
+
+
+def test_small_or_rewritten_values_are_sent_in_full():
+	assert diff_value([1, 2, 3], [1, 2, 3, 4]) is None
+	assert diff_value(list(range(100)), list(range(100, 200))) is None
+	assert diff_value(list(range(100)), {"a": 1}) is None
+	assert diff_value("a" * 100, "b" * 100) is None
+
+
+def test_apply_patch_copies_instead_of_mutating():
+	value = {"series": [[0, 1], [1, 2]], "name": "a"}
+	snapshot = copy.deepcopy(value)
+	result = apply_patch(
+		value,
+		[
+			{
+				"t": "splice",
+				"path": ["series"],
+				"start": 2,
+				"delete": 0,
+				"items": [[2, 3]],
+			},
+			{"t": "set", "path": ["series", 0, 1], "value": 9},
+			{"t": "del", "path": ["name"]},
+		],
+	)
+	assert result == {"series": [[0, 9], [1, 2], [2, 3]]}
+	assert value == snapshot
+	assert result["series"][1] is value["series"][1]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_patches_roundtrip_random_values(seed: int):
+	rng = random.Random(seed)
+	leaves: list[Any] = [0, 1, 1.0, True, "a", None]
+
+	def value(depth: int) -> Any:
+		roll = rng.random()
+		if depth == 0 or roll < 0.3:
+			return rng.choice(leaves)
+		if roll < 0.65:
+			return [value(depth - 1) for _ in range(rng.randint(0, 20))]
+		keys = rng.sample("abcdefgh", rng.randint(0, 8))
+		return {key: value(depth - 1) for key in keys}
+
+	def mutate(v: Any) -> Any:
+		if isinstance(v, list):
+			v = list(v)
+			for _ in range(rng.randint(0, 3)):
+				roll = rng.random()
+				if roll < 0.3 and v:
+					del v[rng.randrange(len(v))]
+				elif roll < 0.5:
+					v.insert(rng.randint(0, len(v)), value(1))
+				elif roll < 0.8 and v:
+					i = rng.randrange(len(v))
+					v[i] = mutate(v[i])
+				elif v:
+					v = [*v[rng.randint(1, 3) :], value(1)]
+			return v
+		if isinstance(v, dict):
+			v = {k: mutate(x) if rng.random() < 0.3 else x for k, x in v.items()}
+			if v and rng.random() < 0.3:
+				del v[rng.choice(list(v))]
+			if rng.random() < 0.3:
+				v[rng.choice("xyz")] = value(1)
+			return v
+		return rng.choice(leaves)
+
+	for _ in range(50):
+		old = value(4)
+		new = mutate(old)
+		snapshot = copy.deepcopy(old)
+		ops = diff_value(old, new)
+		if ops is not None:
+			assert apply_patch(old, ops) == new
+			assert old == snapshot
+
+
+def _chart(data: Any, title: str | None = None) -> Element:
+	props: dict[str, Any] = {"data": data}
+	if title is not None:
+		props["title"] = title
+	return Element("div", props=props)
+
+
+def test_renderer_sends_patches_when_enabled():
+	points = [[i, i * 2] for i in range(200)]
+	tree = RenderTree(_chart(points, "chart"))
+	tree.prop_patches = True
+	initial = cast(VDOMElement, tree.render())
+
+	ops = tree.rerender(_chart([*points, [200, 400]], "chart"))
+	assert ops == [
+		{
+			"type": "update_props",
+			"path": "",
+			"data": {
+				"patch": {
+					"data": [
+						{
+							"t": "splice",
+							"path": [],
+							"start": 200,
+							"delete": 0,
+							"items": [[200, 400]],
+						}
+					]
+				}
+			},
+		}
+	]
+	more = tree.rerender(_chart([*points[1:], [200, 400], [201, 402]], "x"))
+	expected = RenderTree(_chart([*points[1:], [200, 400], [201, 402]], "x"))
+	compacted = compact_operations([*ops, *more])
+	assert len(compacted) == 1
+	op = compacted[0]
+	assert op["type"] == "update_props"
+	props = dict(initial.get("props", {}))
+	props["title"] = op["data"].get("set", {})["title"]
+	props["data"] = apply_patch(props["data"], op["data"].get("patch", {})["data"])
+	assert props == cast(VDOMElement, expected.render()).get("props")
+
+
+def test_renderer_sends_full_values_by_default():
+	points = list(range(200))
+	tree = RenderTree(_chart(points))
+	tree.render()
+	ops = tree.rerender(_chart([*points, 200]))
+	op = ops[0]
+	assert op["type"] == "update_props"
+	assert op["data"] == {"set": {"data": [*points, 200]}}
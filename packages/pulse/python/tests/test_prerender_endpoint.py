@@ -39,3 +39,93 @@ async def test_prerender_normalizes_paths(monkeypatch: pytest.MonkeyPatch):
 	payload = deserialize(resp.json())
 	assert "/a" in payload["views"]
 	assert "a" not in payload["views"]
+
+
+@ps.component
+def prerender_table():
+	return ps.ul()[*[ps.li(key=str(i))[f"Row {i}"] for i in range(500)]]
+
+
+@pytest.mark.asyncio
+async def test_prerender_response_is_compressed(monkeypatch: pytest.MonkeyPatch):
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://localhost:3000")
+	compression = ps.Compression(threshold=1024)
+	app = ps.App(routes=[Route("table", prerender_table)], compression=compression)
+	app.setup("http://example.com")
+	body = {
+		"paths": ["/table"],
+		"routeInfo": {
+			"pathname": "/table",
+			"hash": "",
+			"query": "",
+			"queryParams": {},
+			"pathParams": {},
+			"catchall": [],
+		},
+	}
+
+	transport = httpx.ASGITransport(app=app.fastapi)
+	async with httpx.AsyncClient(
+		transport=transport, base_url="http://testserver"
+	) as client:
+		plain = await client.post(
+			"/_pulse/prerender", json=body, headers={"accept-encoding": "identity"}
+		)
+		gzipped = await client.post(
+			"/_pulse/prerender", json=body, headers={"accept-encoding": "gzip"}
+		)
+
+	assert "content-encoding" not in plain.headers
+	assert gzipped.headers["content-encoding"] == "gzip"
+	assert "accept-encoding" in gzipped.headers["vary"].lower()
+	assert int(gzipped.headers["content-length"]) < len(plain.content) / 4
+	# httpx decodes the body transparently
+	views = deserialize(gzipped.json())["views"]
+	assert views["/table"] == deserialize(plain.json())["views"]["/table"]
+	(stats,) = compression.stats.values()
+	assert (stats.transport, stats.encoding, stats.calls) == ("http", "gzip", 1)
+	assert stats.bytes_in == len(plain.content)
+	assert stats.time > 0
+
+
+@ps.component
+def prerender_redirects():
+	ps.redirect("/login")
+
+
+async def post_prerender(app: ps.App, paths: list[str]) -> httpx.Response:
+	transport = httpx.ASGITransport(app=app.fastapi)
+	async with httpx.AsyncClient(
+		transport=transport, base_url="http://testserver"
+	) as client:
+		return await client.post(
+			"/_pulse/prerender",
+			json={
+				"paths": paths,
+				"routeInfo": {
+					"pathname": paths[-1],
+					"hash": "",
+					"query": "",
+					"queryParams": {},
+					"pathParams": {},
+					"catchall": [],
+				},
+			},
+		)
+
+
+@pytest.mark.asyncio
+async def test_prerender_stops_rendering_at_redirect(monkeypatch: pytest.MonkeyPatch):
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://localhost:3000")
+	routes = [
+		Route("a", prerender_home),
+		Route("b", prerender_redirects),
+		Route("c", prerender_home),
+	]
+	app = ps.App(routes=routes)
+	app.setup("http://example.com")
+
+	resp = await post_prerender(app, ["/a", "/b", "/c"])
+	assert resp.json() == {"redirect": "/login"}
+	render = next(iter(app.render_sessions.values()))
+	assert "/c" not in render.route_mounts
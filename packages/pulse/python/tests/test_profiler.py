@@ -0,0 +1,204 @@
+from typing import Any
+
+import httpx
+import pulse as ps
+import pytest
+from pulse.component import component
+from pulse.dom.tags import div, li, span, ul
+from pulse.reactive import Batch, Signal
+from pulse.render_session import RenderSession
+from pulse.renderer import RenderTree
+from pulse.routing import Route, RouteTree
+from pulse.transpiler.nodes import Element
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+
+def _profiled(element: Any, profiler: ps.RenderProfiler) -> RenderTree:
+	tree = RenderTree(element)
+	tree.profiler = profiler.route("/page")
+	return tree
+
+
+def test_profiler_records_calls_and_self_time():
+	profiler = ps.RenderProfiler()
+
+	@component
+	def Leaf(i: int) -> Element:
+		return span(str(i))
+
+	@component
+	def Page() -> Element:
+		return div(*[Leaf(i) for i in range(3)])
+
+	tree = _profiled(Page(), profiler)
+	tree.render()
+
+	page = profiler.components[("/page", "Page")]
+	leaf = profiler.components[("/page", "Leaf")]
+	assert page.calls == 1
+	assert leaf.calls == 3
+	assert page.total_time >= page.self_time + leaf.total_time * 0.999
+	assert leaf.self_time == pytest.approx(leaf.total_time)
+	# Initial renders produce no operations
+	assert page.operations == leaf.operations == 0
+
+
+def test_profiler_attributes_operations_to_innermost_component():
+	profiler = ps.RenderProfiler()
+	items = Signal(["a", "b"], name="items")
+	title = Signal("x", name="title")
+
+	@component
+	def Items() -> Element:
+		return ul(*[li(key=item)[item] for item in items()])
+
+	@component
+	def Page() -> Element:
+		return div(span(title()), Items())
+
+	tree = _profiled(Page(), profiler)
+	tree.render()
+
+	with Batch():
+		title.write("y")
+		items.write(["a", "b", "c"])
+	ops = tree.rerender()
+
+	page = profiler.components[("/page", "Page")]
+	list_profile = profiler.components[("/page", "Items")]
+	assert page.calls == list_profile.calls == 2
+	assert page.operations + list_profile.operations == len(ops)
+	assert list_profile.operations == 1
+	assert list_profile.bytes > 0
+	assert profiler.top(1, by="operations")[0].operations == 1
+
+
+def test_profiler_without_byte_measurement():
+	profiler = ps.RenderProfiler(measure_bytes=False)
+	label = Signal("a", name="label")
+
+	@component
+	def Page() -> Element:
+		return div(label())
+
+	tree = _profiled(Page(), profiler)
+	tree.render()
+	with Batch():
+		label.write("b")
+	tree.rerender()
+
+	page = profiler.components[("/page", "Page")]
+	assert page.operations == 1
+	assert page.bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_profiler_records_route_messages():
+	profiler = ps.RenderProfiler()
+	app = ps.App(profiler=profiler)
+
+	@component
+	def Page() -> Element:
+		return div("hello")
+
+	session = RenderSession("test-id", RouteTree([Route("a", Page)]), profiler=profiler)
+	with ps.PulseContext(app=app), ps.PulseContext.update(render=session):
+		session.prerender(["/a"], None)
+
+	route = profiler.routes["/a"]
+	assert route.inits == 1
+	assert route.updates == 0
+	assert route.bytes > 0
+	assert profiler.components[("/a", "Page")].calls == 1
+
+	snapshot = profiler.snapshot()
+	assert [r["route"] for r in snapshot["routes"]] == ["/a"]
+	assert snapshot["components"][0]["name"] == "Page"
+
+	profiler.reset()
+	assert profiler.snapshot() == {"routes": [], "components": []}
+	session.close()
+
+
+class _Proxy:
+	def __init__(self, **_: Any) -> None:
+		pass
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		await PlainTextResponse("app")(scope, receive, send)
+
+	async def proxy_websocket(self, _: Any) -> None:
+		raise AssertionError("unexpected websocket request")
+
+	async def close(self) -> None:
+		pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("pulse_env", "served"), [("dev", True), ("prod", False)])
+async def test_profile_endpoint_is_dev_only(
+	monkeypatch: pytest.MonkeyPatch, pulse_env: str, served: bool
+):
+	monkeypatch.setenv("PULSE_ENV", pulse_env)
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://react.test")
+	monkeypatch.setattr("pulse.app.ReactProxy", _Proxy)
+	profiler = ps.RenderProfiler()
+	profiler.record_message("/a", 0.5, None)
+	app = ps.App(
+		routes=[],
+		session_store=ps.CookieSessionStore(secret="test-secret"),
+		server_address="https://testserver",
+		profiler=profiler,
+	)
+	app.setup("https://testserver")
+	transport = httpx.ASGITransport(app=app.fastapi)
+	try:
+		async with httpx.AsyncClient(
+			transport=transport, base_url="http://testserver"
+		) as client:
+			response = await client.get("/_pulse/profile")
+			if served:
+				assert response.json()["routes"][0]["route"] == "/a"
+				reset = await client.delete("/_pulse/profile")
+				assert reset.status_code == 200
+				assert profiler.routes == {}
+			else:
+				# Falls through to the React app
+				assert response.text == "app"
+	finally:
+		await app.close()
+
+
+@pytest.mark.asyncio
+async def test_profile_endpoint_serves_compression_stats(
+	monkeypatch: pytest.MonkeyPatch,
+):
+	monkeypatch.setenv("PULSE_ENV", "dev")
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://react.test")
+	monkeypatch.setattr("pulse.app.ReactProxy", _Proxy)
+	compression = ps.Compression(threshold=16)
+	compression.compress_message(["vdom_update", "x" * 1000])
+	app = ps.App(
+		routes=[],
+		session_store=ps.CookieSessionStore(secret="test-secret"),
+		server_address="https://testserver",
+		compression=compression,
+	)
+	app.setup("https://testserver")
+	transport = httpx.ASGITransport(app=app.fastapi)
+	try:
+		async with httpx.AsyncClient(
+			transport=transport, base_url="http://testserver"
+		) as client:
+			response = await client.get("/_pulse/profile")
+			[stats] = response.json()["compression"]
+			assert stats["transport"] == "socket"
+			assert stats["encoding"] == "gzip"
+			assert stats["calls"] == 1
+			assert stats["ratio"] < 0.1
+			reset = await client.delete("/_pulse/profile")
+			assert reset.status_code == 200
+			assert compression.stats == {}
+	finally:
+		await app.close()
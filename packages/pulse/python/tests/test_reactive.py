@@ -9,6 +9,7 @@ from pulse import (
 	AsyncEffect,
 	Computed,
 	Effect,
+	Selector,
 	Signal,
 	Untrack,
 	computed,
@@ -18,7 +19,7 @@ from pulse import (
 	repeat,
 )
 from pulse.helpers import MISSING
-from pulse.reactive import Batch, Scope, flush_effects
+from pulse.reactive import RENDER_EFFECT_RANK, Batch, Scope, flush_effects
 from pulse.reactive_extensions import (
 	ReactiveDict,
 	ReactiveList,
@@ -779,9 +780,9 @@ def test_effect_unregister_from_batch_on_disposal():
 		@effect
 		def e(): ...
 
-		assert batch.effects == [e]
+		assert list(batch.effects) == [e]
 		e.dispose()
-		assert batch.effects == []
+		assert list(batch.effects) == []
 
 
 def test_effect_unset_batch_after_run():
@@ -807,6 +808,56 @@ def test_effect_rescheduling_itself():
 	assert e.runs == 11  # 10 increment runs + 1 run without a write
 
 
+def test_batch_schedules_each_effect_once():
+	s = Signal(0)
+
+	def read() -> None:
+		s()
+
+	effects = [Effect(read, lazy=True) for _ in range(3)]
+
+	with Batch() as batch:
+		for e in effects * 2:
+			e.schedule()
+		assert list(batch.effects) == effects
+		effects[1].cancel()
+		assert list(batch.effects) == [effects[0], effects[2]]
+
+	assert [e.runs for e in effects] == [1, 0, 1]
+
+
+def test_batch_runs_render_effects_after_state_effects():
+	s = Signal(0)
+	t = Signal(0)
+	order: list[str] = []
+
+	class RenderEffect(Effect):
+		rank = RENDER_EFFECT_RANK
+
+	def render():
+		order.append(f"render:{t()}")
+
+	def sync():
+		order.append(f"sync:{s()}")
+		t.write(s() + 1)
+
+	render_effect = RenderEffect(render, lazy=True)
+	sync_effect = Effect(sync, lazy=True)
+	with Batch():
+		render_effect.schedule()
+		sync_effect.schedule()
+
+	# The render effect runs once, with the value written by the state effect
+	assert order == ["sync:0", "render:1"]
+	assert render_effect.runs == 1
+
+	order.clear()
+	with Batch():
+		s.write(1)
+	assert order == ["sync:1", "render:2"]
+	assert render_effect.runs == 2
+
+
 def test_effect_doesnt_rerun_if_read_after_write():
 	s = Signal(0)
 	t = Signal(False)
@@ -888,8 +939,8 @@ def test_effect_immediate_false_explicit_deps_registers_on_init():
 
 	# Explicit deps should be registered immediately upon initialization (before first run)
 	assert e.runs == 0
-	assert a.obs == [e]
-	assert b.obs == [e]
+	assert list(a.obs) == [e]
+	assert list(b.obs) == [e]
 	# Explicit deps should be stored in regular deps attribute (not _explicit_deps)
 	assert e.update_deps is False
 	assert e.deps == {a: a.last_change, b: b.last_change}
@@ -898,8 +949,8 @@ def test_effect_immediate_false_explicit_deps_registers_on_init():
 	flush_effects()
 	assert e.runs == 1
 	assert e.deps == {a: a.last_change, b: b.last_change}
-	assert a.obs == [e]
-	assert b.obs == [e]
+	assert list(a.obs) == [e]
+	assert list(b.obs) == [e]
 
 
 def test_effect_explicit_deps_doesnt_track_dynamic_deps():
@@ -1036,6 +1087,160 @@ def test_effect_capture_deps_updates_observers():
 	assert e.deps == {b: b.last_change}
 
 
+def test_reactive_primitives_have_no_instance_dict():
+	s = Signal(0)
+	c = Computed(lambda: s() + 1)
+	e = Effect(lambda: None, lazy=True)
+	sel = Selector(s)
+	for obj in (s, c, e, sel):
+		assert not hasattr(obj, "__dict__")
+	e.dispose()
+	sel.dispose()
+
+
+def test_signal_observer_change_listeners():
+	s = Signal(0, name="s")
+	seen: list[int] = []
+	off = s.on_observer_change(seen.append)
+
+	first = Effect(lambda: None, lazy=True)
+	second = Effect(lambda: None, lazy=True)
+	s.add_obs(first)
+	s.add_obs(first)
+	s.add_obs(second)
+	assert list(s.obs) == [first, second]
+	assert seen == [1]
+
+	s.remove_obs(first)
+	s.remove_obs(first)
+	assert seen == [1]
+	s.remove_obs(second)
+	assert seen == [1, 0]
+
+	off()
+	s.add_obs(first)
+	assert seen == [1, 0]
+
+
+def test_selector_notifies_only_previous_and_new_key():
+	selected = Signal(1, name="selected")
+	is_selected = Selector(selected)
+	runs = [0] * 5
+	seen: dict[int, bool] = {}
+
+	def row(key: int):
+		def fn():
+			runs[key] += 1
+			seen[key] = is_selected(key)
+
+		return Effect(fn, name=f"row-{key}")
+
+	effects = [row(key) for key in range(5)]
+	flush_effects()
+	assert runs == [1, 1, 1, 1, 1]
+	assert seen == {0: False, 1: True, 2: False, 3: False, 4: False}
+
+	selected.write(3)
+	flush_effects()
+	assert runs == [1, 2, 1, 2, 1]
+	assert seen[1] is False and seen[3] is True
+
+	# Selecting a key nobody reads only notifies the previous key
+	selected.write(42)
+	flush_effects()
+	assert runs == [1, 2, 1, 3, 1]
+	assert not any(seen.values())
+
+	for e in effects:
+		e.dispose()
+	is_selected.dispose()
+
+
+def test_selector_tracks_computed_source():
+	items = Signal(["a", "b", "c"], name="items")
+	index = Signal(0, name="index")
+	is_selected = Selector(lambda: items()[index()])
+	runs = {"a": 0, "b": 0, "c": 0}
+
+	def row(key: str):
+		def fn():
+			runs[key] += 1
+			is_selected(key)
+
+		return Effect(fn)
+
+	effects = [row(key) for key in runs]
+	flush_effects()
+	assert is_selected.value == "a"
+
+	index.write(2)
+	flush_effects()
+	assert is_selected.value == "c"
+	assert runs == {"a": 2, "b": 1, "c": 2}
+
+	# A source change that keeps the selected key notifies nobody
+	items.write(["x", "y", "c"])
+	flush_effects()
+	assert is_selected.value == "c"
+	assert runs == {"a": 2, "b": 1, "c": 2}
+
+	for e in effects:
+		e.dispose()
+	source = is_selected.source
+	is_selected.dispose()
+	# The Computed wrapping the function stops tracking its signals
+	assert source not in items.obs
+	assert source not in index.obs
+
+
+def test_selector_keys_that_compare_equal_share_a_signal():
+	selected = Signal(1)
+	is_selected = Selector(selected)
+	seen: list[tuple[bool, bool]] = []
+
+	def fn():
+		seen.append((is_selected(1), is_selected(True)))
+
+	e = Effect(fn, immediate=True)
+	assert list(is_selected.signals) == [1]
+	assert seen == [(True, True)]
+
+	selected.write(2)
+	flush_effects()
+	assert seen[-1] == (False, False)
+
+	e.dispose()
+	is_selected.dispose()
+
+
+def test_selector_drops_key_signals_without_observers():
+	selected = Signal(1)
+	is_selected = Selector(selected)
+
+	# Untracked reads compare directly
+	assert is_selected(1) is True
+	with Untrack():
+		assert is_selected(2) is False
+	assert is_selected.signals == {}
+
+	def reader(key: int):
+		def fn():
+			is_selected(key)
+
+		return Effect(fn, immediate=True)
+
+	first, second = reader(1), reader(2)
+	assert set(is_selected.signals) == {1, 2}
+
+	first.dispose()
+	assert set(is_selected.signals) == {2}
+
+	is_selected.dispose()
+	assert is_selected.signals == {}
+	assert is_selected not in selected.obs
+	second.dispose()
+
+
 @pytest.mark.asyncio
 async def test_async_effect_tracks_dependencies_across_await():
 	s1 = Signal(1, name="s1")
@@ -1476,6 +1681,7 @@ def test_reactive_dict_delete_sets_none_preserving_subscribers():
 
 def test_reactive_dict_get_after_delete_uses_default_when_absent():
 	ctx = ReactiveDict({"a": 1})
+	assert ctx["a"] == 1
 
 	# Remove key: value signal remains but marks logical absence
 	del ctx["a"]
@@ -1765,6 +1971,58 @@ def test_reactive_list_iter_subscribes_to_items_and_structure():
 	assert iter_counts[-1] == 3
 
 
+def test_reactive_list_creates_item_signals_on_first_read():
+	lst = ReactiveList(range(5))
+	assert lst._signals == [None] * 5  # pyright: ignore[reportPrivateUsage]
+
+	assert list(lst) == [0, 1, 2, 3, 4]
+	assert lst.unwrap() == [0, 1, 2, 3, 4]
+	assert lst[1:3] == [1, 2]
+	assert lst._signals == [None] * 5  # pyright: ignore[reportPrivateUsage]
+
+	assert lst[3] == 3
+	assert [s is not None for s in lst._signals] == [  # pyright: ignore[reportPrivateUsage]
+		False,
+		False,
+		False,
+		True,
+		False,
+	]
+
+
+def test_reactive_list_bulk_operations_bump_version_once():
+	lst = ReactiveList([3, 1, 2])
+	versions: list[int] = []
+	firsts: list[int] = []
+
+	@effect
+	def e():  # pyright: ignore[reportUnusedFunction]
+		versions.append(lst.version)
+		firsts.append(lst[0])
+
+	flush_effects()
+	assert versions == [0]
+
+	lst.extend([5, 4])
+	assert lst.version == 1
+	lst += [0]
+	assert lst.version == 2
+	lst.sort()
+	assert lst.version == 3
+	# Sorting reorders the items as well as their signals
+	assert lst.unwrap() == [0, 1, 2, 3, 4, 5]
+	del lst[1:3]
+	assert lst.version == 4
+	lst[0:2] = [7]
+	assert lst.version == 5
+	assert lst.unwrap() == [7, 4, 5]
+	assert len(lst._signals) == 3  # pyright: ignore[reportPrivateUsage]
+
+	flush_effects()
+	assert versions == [0, 5]
+	assert firsts == [3, 7]
+
+
 def test_reactive_wraps_dataclass_class_and_caches():
 	@dataclass
 	class Model:
@@ -2303,7 +2561,7 @@ def test_computed_copy_has_fresh_dependency_graph():
 	copied = copy.copy(comp)
 	assert copied is not comp
 	assert copied.deps == {}
-	assert copied.obs == []
+	assert len(copied.obs) == 0
 
 	assert copied() == 2
 	assert source in copied.deps
@@ -2322,7 +2580,7 @@ def test_computed_deepcopy_is_independent():
 	deep_copied = copy.deepcopy(comp)
 	assert deep_copied is not comp
 	assert deep_copied.deps == {}
-	assert deep_copied.obs == []
+	assert len(deep_copied.obs) == 0
 	assert deep_copied() == 20
 
 	source.write(15)
@@ -2404,9 +2662,11 @@ def test_effect_copy_preserves_lazy_flag():
 def test_reactive_dict_copy_uses_new_signals():
 	ctx = ReactiveDict({"a": 1})
 	copied = copy.copy(ctx)
+	# Signals are created on the first read of a key
+	assert ctx["a"] == copied["a"] == 1
 
 	assert copied is not ctx
-	assert copied._signals != ctx._signals  # pyright: ignore[reportPrivateUsage]
+	assert copied._signals is not ctx._signals  # pyright: ignore[reportPrivateUsage]
 	assert copied._signals["a"] is not ctx._signals["a"]  # pyright: ignore[reportPrivateUsage]
 	assert copied._structure is not ctx._structure  # pyright: ignore[reportPrivateUsage]
 
@@ -2419,6 +2679,7 @@ def test_reactive_dict_copy_uses_new_signals():
 def test_reactive_dict_deepcopy_clones_nested_values():
 	ctx = ReactiveDict({"a": {"x": 1}})
 	deep_copied = copy.deepcopy(ctx)
+	_ = ctx["a"], deep_copied["a"]
 
 	assert deep_copied is not ctx
 	assert deep_copied._signals["a"] is not ctx._signals["a"]  # pyright: ignore[reportPrivateUsage]
@@ -2438,6 +2699,8 @@ def test_reactive_list_copy_and_deepcopy_use_new_signals():
 	items = ReactiveList([1, {"nested": 2}])
 	copied = copy.copy(items)
 	deep_copied = copy.deepcopy(items)
+	# Signals are created on the first read of an index
+	assert items[0] == copied[0] == deep_copied[0] == 1
 
 	assert copied is not items
 	assert deep_copied is not items
@@ -3052,6 +3315,162 @@ def test_reactive_dict_values_subscribes_to_values():
 	assert results == [[1, 2], [99, 2]]
 
 
+def test_reactive_dict_creates_key_signals_on_first_read():
+	rd = ReactiveDict({"a": 1, "b": 2})
+	assert rd._signals == {}  # pyright: ignore[reportPrivateUsage]
+
+	assert list(rd.items()) == [("a", 1), ("b", 2)]
+	assert rd.unwrap() == {"a": 1, "b": 2}
+	assert rd._signals == {}  # pyright: ignore[reportPrivateUsage]
+
+	assert rd["a"] == 1
+	assert list(rd._signals) == ["a"]  # pyright: ignore[reportPrivateUsage]
+
+
+def test_reactive_dict_update_notifies_once():
+	rd = ReactiveDict({"a": 1, "b": 2})
+	keys: list[list[str]] = []
+	values: list[list[int]] = []
+
+	@effect
+	def track_keys():  # pyright: ignore[reportUnusedFunction]
+		keys.append(list(rd))
+
+	@effect
+	def track_values():  # pyright: ignore[reportUnusedFunction]
+		values.append(list(rd.values()))
+
+	flush_effects()
+	structure = rd._structure.value  # pyright: ignore[reportPrivateUsage]
+
+	rd.update({"a": 10, "b": 20, "c": 30, "d": 40})
+	assert rd._structure.value == structure + 1  # pyright: ignore[reportPrivateUsage]
+	flush_effects()
+	assert keys == [["a", "b"], ["a", "b", "c", "d"]]
+	assert values == [[1, 2], [10, 20, 30, 40]]
+
+	# Replacing values only reruns readers of the values
+	rd.update(a=11, b=21)
+	flush_effects()
+	assert len(keys) == 2
+	assert values[-1] == [11, 21, 30, 40]
+
+
+def test_shallow_reactive_does_not_wrap_values():
+	data = ps.shallow({"rows": [{"id": 1}], "meta": {"total": 1}})
+	assert isinstance(data, ReactiveDict)
+	assert type(data["rows"]) is list
+	assert type(data["meta"]) is dict
+
+	seen: list[Any] = []
+
+	@effect
+	def e():  # pyright: ignore[reportUnusedFunction]
+		seen.append(data["meta"])
+
+	flush_effects()
+	data["meta"] = {"total": 2}
+	flush_effects()
+	assert seen == [{"total": 1}, {"total": 2}]
+	assert type(data["meta"]) is dict
+
+	rows = reactive([[1], [2]], shallow=True)
+	rows.append([3])
+	rows[0] = [0]
+	assert all(type(row) is list for row in rows)
+	assert rows.unwrap() == [[0], [2], [3]]
+	assert type(copy.copy(rows)[2]) is list
+
+
+def test_shallow_reactive_dataclass_instance_keeps_field_contents_raw():
+	@dataclass
+	class Table:
+		rows: list[list[int]]
+		meta: dict[str, Any]
+
+	table = reactive(Table(rows=[[1], [2]], meta={"sort": {"key": "id"}}), shallow=True)
+	assert isinstance(table.rows, ReactiveList)
+	assert isinstance(table.meta, ReactiveDict)
+	assert all(type(row) is list for row in table.rows)
+	assert type(table.meta["sort"]) is dict
+
+	table.rows.append([3])
+	assert type(table.rows[2]) is list
+
+
+def test_lazy_reactive_wraps_nested_values_on_first_read():
+	raw: dict[str, Any] = {
+		"user": {"name": "Ada", "tags": ["a"]},
+		"rows": [{"id": 1}, {"id": 2}],
+	}
+	data: ReactiveDict[str, Any] = reactive(raw, lazy=True)
+	assert isinstance(data, ReactiveDict)
+	# Nothing below the top level is wrapped yet
+	assert dict.__getitem__(data, "user") is raw["user"]
+
+	user = data["user"]
+	assert isinstance(user, ReactiveDict)
+	assert data["user"] is user
+	assert dict.__getitem__(user, "tags") is raw["user"]["tags"]
+	assert isinstance(user["tags"], ReactiveList)
+
+	rows: ReactiveList[Any] = data["rows"]
+	assert isinstance(rows, ReactiveList)
+	first = next(iter(rows))
+	assert isinstance(first, ReactiveDict)
+	assert list.__getitem__(rows, 1) is raw["rows"][1]
+	assert [type(row) for row in rows[1:]] == [ReactiveDict]
+
+	names: list[str] = []
+
+	@effect
+	def e():  # pyright: ignore[reportUnusedFunction]
+		names.append(data["user"]["name"])
+
+	flush_effects()
+	# Values written to a read key are wrapped right away
+	data["user"] = {"name": "Grace"}
+	flush_effects()
+	assert names == ["Ada", "Grace"]
+	assert isinstance(dict.__getitem__(data, "user"), ReactiveDict)
+	assert data.unwrap() == {"user": {"name": "Grace"}, "rows": [{"id": 1}, {"id": 2}]}
+
+
+def test_lazy_reactive_iteration_sees_changes_made_while_iterating():
+	rows: ReactiveList[Any] = reactive([[1], [2], [3]], lazy=True)
+	seen: list[Any] = []
+	for row in rows:
+		seen.append(row.unwrap())
+		rows.pop()
+	assert seen == [[1], [2]]
+	assert rows.unwrap() == [[1]]
+
+	rows.append([2])
+	seen.clear()
+	for row in rows:
+		seen.append(row.unwrap())
+		if len(rows) < 3:
+			rows.append([3])
+	assert seen == [[1], [2], [3]]
+
+	data: ReactiveDict[str, Any] = reactive({"a": [1], "b": [2]}, lazy=True)
+	values: list[Any] = []
+	for key, value in data.items():
+		values.append(value.unwrap())
+		data["b"] = [key]
+	assert values == [[1], ["a"]]
+	values.clear()
+	for value in data.values():
+		values.append(value.unwrap())
+		data["b"] = [3]
+	assert values == [[1], [3]]
+
+
+def test_reactive_rejects_shallow_and_lazy_together():
+	with pytest.raises(ValueError, match="mutually exclusive"):
+		reactive([1], shallow=True, lazy=True)
+
+
 # ---------------------- Effect Interval Tests ----------------------
 
 
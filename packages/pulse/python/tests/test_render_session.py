@@ -20,6 +20,7 @@ from pulse.messages import ServerMessage
 from pulse.reactive import Effect
 from pulse.render_session import RenderSession
 from pulse.routing import Route, RouteInfo, RouteTree
+from pulse.templates import expand_templates, is_element
 from pulse.test_helpers import wait_for
 from pulse.transpiler.nodes import Element, PulseNode
 
@@ -1672,6 +1673,53 @@ async def test_prerender_seeds_effect_deps_for_updates():
 	session.close()
 
 
+@pytest.mark.asyncio
+async def test_update_rerenders_only_the_dirty_component():
+	"""A state change re-renders the component that read it, at its own path."""
+
+	class CounterState(ps.State):
+		count: int = 0
+
+	renders: list[str] = []
+
+	def counter():
+		renders.append("counter")
+		state = ps.setup(CounterState)
+
+		def inc():
+			state.count = state.count + 1
+
+		return ps.button(onClick=inc)[str(state.count)]
+
+	def page():
+		renders.append("page")
+		return ps.div()[ps.h1()["Title"], ps.component(counter)()]
+
+	routes = RouteTree([Route("a", ps.component(page))])
+	session = RenderSession("test-id", routes)
+
+	messages: list[ServerMessage] = []
+	session.connect(lambda msg: messages.append(msg))
+
+	with ps.PulseContext.update(render=session):
+		session.prerender(["/a"], None)
+		session.attach("/a", make_route_info("/a"))
+
+	assert renders == ["page", "counter"]
+	renders.clear()
+
+	session.execute_callback("/a", "1.onClick", [])
+	session.flush()
+
+	assert renders == ["counter"]
+	updates = [m for m in messages if m["type"] == "vdom_update"]
+	assert len(updates) == 1
+	assert [op["path"] for op in updates[0]["ops"]] == ["1"]
+	assert "1.onClick" in session.route_mounts["/a"].tree.callbacks
+
+	session.close()
+
+
 @pytest.mark.asyncio
 async def test_prerender_keeps_mounts_for_unrendered_paths():
 	"""Test that prerender preserves mounts that are not part of the new paths."""
@@ -2178,3 +2226,118 @@ async def test_async_callback_error_reports_real_traceback():
 	assert "NoneType: None" not in err["stack"]
 
 	session.close()
+
+
+@pytest.mark.asyncio
+async def test_chunked_prerender_streams_remaining_children():
+	def page():
+		return ps.ul()[*[ps.li(key=str(i))[str(i)] for i in range(7)]]
+
+	routes = RouteTree([Route("a", ps.component(page))])
+	session = RenderSession("test-id", routes, render_chunk_size=3)
+
+	messages: list[ServerMessage] = []
+	session.connect(lambda msg: messages.append(msg))
+
+	with ps.PulseContext.update(render=session):
+		result = session.prerender(["/a"], None)
+		session.attach("/a", make_route_info("/a"))
+
+	init = result["/a"]
+	assert init["type"] == "vdom_init"
+	vdom = cast(dict[str, Any], cast(object, init["vdom"]))
+	assert len(vdom["children"]) == 3
+
+	await wait_for(lambda: not session.route_mounts["/a"].tree.deferred)
+	await asyncio.sleep(0)
+	updates = [m for m in messages if m["type"] == "vdom_update"]
+	assert [[cast(Any, op)["new"][0] for op in m["ops"]] for m in updates] == [
+		[[3, 4, 5]],
+		[[6]],
+	]
+	assert session.route_mounts["/a"].stream_task is None
+
+	session.close()
+
+
+def test_render_chunk_size_must_be_positive():
+	with pytest.raises(ValueError):
+		RenderSession("test-id", RouteTree([]), render_chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_pending_mount_coalesces_queued_updates():
+	class LabelState(ps.State):
+		label: str = "a"
+
+	def page():
+		state = ps.setup(LabelState)
+
+		def next_label():
+			state.label = state.label + "!"
+
+		return ps.div()[ps.button(onClick=next_label, title=state.label)["next"]]
+
+	routes = RouteTree([Route("a", ps.component(page))])
+	session = RenderSession("test-id", routes)
+
+	with ps.PulseContext.update(render=session):
+		session.prerender(["/a"], None)
+
+	mount = session.route_mounts["/a"]
+	for _ in range(3):
+		session.execute_callback("/a", "0.onClick", [])
+		session.flush()
+	assert mount.queue is not None
+	assert len(mount.queue) == 1
+	update = mount.queue[0]
+	assert update["type"] == "vdom_update"
+	assert update["ops"] == [
+		{"type": "update_props", "path": "0", "data": {"set": {"title": "a!!!"}}}
+	]
+
+	messages: list[ServerMessage] = []
+	session.connect(lambda msg: messages.append(msg))
+	with ps.PulseContext.update(render=session):
+		session.attach("/a", make_route_info("/a"))
+	assert messages == [update]
+
+	session.close()
+
+
+@pytest.mark.asyncio
+async def test_vdom_templates_compact_initial_render():
+	def page():
+		return ps.ul(className="list")[
+			*[
+				ps.li(key=str(i), className="row")[
+					ps.span(className="label")[f"Item {i}"],
+					ps.button(className="btn primary", disabled=i % 2 == 0)["Open"],
+				]
+				for i in range(20)
+			]
+		]
+
+	routes = RouteTree([Route("a", ps.component(page))])
+	plain = RenderSession("plain", routes)
+	compact = RenderSession("compact", routes, vdom_templates=True)
+	with ps.PulseContext.update(render=plain):
+		expected = plain.prerender(["/a"], None)["/a"]
+	with ps.PulseContext.update(render=compact):
+		init = compact.prerender(["/a"], None)["/a"]
+
+	assert expected["type"] == "vdom_init" and init["type"] == "vdom_init"
+	assert "templates" not in expected
+	templates = init.get("templates", [])
+	assert len(templates) == 1
+	vdom = init["vdom"]
+	assert is_element(vdom)
+	assert vdom.get("children", [])[0] == {
+		"t": "tpl",
+		"id": 0,
+		"slots": ["0", "Item 0", True],
+	}
+	assert expand_templates(vdom, templates) == expected["vdom"]
+
+	plain.close()
+	compact.close()
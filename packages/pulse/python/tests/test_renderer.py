@@ -1,4 +1,7 @@
 import asyncio
+import functools
+import inspect
+import random
 from collections.abc import Sequence
 from pathlib import Path
 from types import SimpleNamespace
@@ -6,11 +9,19 @@ from typing import Any, cast, override
 
 import pulse as ps
 import pytest
+from pulse import renderer as renderer_module
 from pulse.component import component
 from pulse.dom.tags import button, div, li, span, ul
-from pulse.hooks.core import HookContext
+from pulse.reactive import Batch, Computed, Signal
 from pulse.refs import RefHandle
-from pulse.renderer import RenderTree
+from pulse.renderer import (
+	ComponentHooks,
+	NormalizedChildren,
+	RenderTree,
+	callback_signature,
+	longest_increasing_subsequence,
+	normalize_children,
+)
 from pulse.transpiler.nodes import Element, PulseNode, Value
 from pulse.transpiler.vdom import VDOMElement, VDOMExpr
 
@@ -25,6 +36,13 @@ def _apply_reconciliation(prev: list[str], op: dict[str, Any]) -> list[str]:
 	reuse_map = {
 		dest: src for dest, src in zip(reuse_indices, reuse_sources, strict=True)
 	}
+	# Relative mode: children neither removed nor moved keep their order and
+	# fill the remaining slots.
+	removed = op.get("removed")
+	stable: list[int] | None = None
+	if removed is not None:
+		skipped = set(removed) | set(reuse_sources)
+		stable = [idx for idx in range(len(prev)) if idx not in skipped]
 	for i in range(N):
 		if i in new_map:
 			v = new_map[i]
@@ -69,6 +87,8 @@ def _apply_reconciliation(prev: list[str], op: dict[str, Any]) -> list[str]:
 				next_list[i] = str(v)  # pyright: ignore[reportUnknownArgumentType]
 		elif i in reuse_map:
 			next_list[i] = prev[reuse_map[i]]
+		elif stable is not None:
+			next_list[i] = prev[stable.pop(0)]
 		else:
 			next_list[i] = prev[i] if i < len(prev) else None
 	return [x for x in next_list if x is not None]
@@ -82,7 +102,7 @@ def _get_reconciliation_ops(ops: Sequence[Any], path: str = "") -> list[dict[str
 	]
 
 
-class TrackingHookContext(HookContext):
+class TrackingHookContext(ComponentHooks):
 	did_unmount: bool
 
 	def __init__(self) -> None:
@@ -524,6 +544,498 @@ def test_render_tree_unmount_clears_state_and_unmounts_children():
 	assert tree.rendered is False
 
 
+def test_rerender_only_invokes_dirty_components():
+	left = Signal(0, name="left")
+	right = Signal(0, name="right")
+	calls: list[str] = []
+
+	@component
+	def Left() -> Element:
+		calls.append("left")
+		return span(f"L{left()}")
+
+	@component
+	def Right() -> Element:
+		calls.append("right")
+		return span(f"R{right()}")
+
+	@component
+	def Root() -> Element:
+		calls.append("root")
+		return div(Left(), Right())
+
+	tree = RenderTree(Root())
+	tree.render()
+	assert calls == ["root", "left", "right"]
+	calls.clear()
+
+	assert tree.rerender() == []
+	assert calls == []
+
+	with Batch():
+		right.write(1)
+
+	ops = tree.rerender()
+	assert calls == ["right"]
+	assert [op["path"] for op in ops] == ["1"]
+	assert not tree.dirty
+
+
+def test_rerender_skips_component_whose_computed_is_unchanged():
+	count = Signal(1, name="count")
+	parity = Computed(lambda: count() % 2, name="parity")
+	calls: list[str] = []
+
+	@component
+	def Parity() -> Element:
+		calls.append("parity")
+		return span(str(parity()))
+
+	tree = RenderTree(div(Parity()))
+	tree.render()
+	calls.clear()
+
+	with Batch():
+		count.write(3)
+
+	assert tree.rerender() == []
+	assert calls == []
+	assert not tree.dirty
+
+	with Batch():
+		count.write(4)
+
+	ops = tree.rerender()
+	assert calls == ["parity"]
+	assert [op["path"] for op in ops] == ["0"]
+
+
+def test_rerender_dirty_ancestor_covers_dirty_descendant():
+	outer = Signal(0, name="outer")
+	inner = Signal(0, name="inner")
+	calls: list[str] = []
+
+	@component
+	def Inner() -> Element:
+		calls.append("inner")
+		return span(str(inner()))
+
+	@component
+	def Outer() -> Element:
+		calls.append("outer")
+		return div(str(outer()), Inner())
+
+	tree = RenderTree(div(Outer()))
+	tree.render()
+	calls.clear()
+
+	with Batch():
+		inner.write(1)
+		outer.write(1)
+
+	ops = tree.rerender()
+	assert calls == ["outer", "inner"]
+	assert {op["path"] for op in ops} == {"0", "0.1"}
+	assert not tree.dirty
+
+
+def test_rerender_dirty_component_keeps_sibling_callbacks():
+	label = Signal("a", name="label")
+
+	def on_left() -> None:
+		pass
+
+	def on_right() -> None:
+		pass
+
+	@component
+	def Labelled() -> Element:
+		value = label()
+		if value == "a":
+			return button(onClick=on_right)[value]
+		return span(value)
+
+	tree = RenderTree(div(button(onClick=on_left)["left"], Labelled()))
+	tree.render()
+	assert set(tree.callbacks) == {"0.onClick", "1.onClick"}
+
+	with Batch():
+		label.write("b")
+
+	tree.rerender()
+	assert set(tree.callbacks) == {"0.onClick"}
+	assert tree.callbacks["0.onClick"].fn is on_left
+
+
+def test_unmounted_dirty_component_is_not_rerendered():
+	show = Signal(True, name="show")
+	value = Signal(0, name="value")
+	calls: list[str] = []
+
+	@component
+	def Child() -> Element:
+		calls.append("child")
+		return span(str(value()))
+
+	@component
+	def Parent() -> Element:
+		return div(Child() if show() else None)
+
+	tree = RenderTree(Parent())
+	tree.render()
+	calls.clear()
+
+	with Batch():
+		value.write(1)
+		show.write(False)
+
+	tree.rerender()
+	assert calls == []
+	assert not tree.dirty
+
+	with Batch():
+		value.write(2)
+	assert not tree.dirty
+
+
+def test_memo_component_skips_rerender_with_equal_args():
+	calls: list[str] = []
+
+	def on_select() -> None:
+		pass
+
+	@ps.memo
+	def Sidebar(title: str) -> Element:
+		calls.append(title)
+		return div(button(onClick=on_select)[title])
+
+	tree = RenderTree(div(span("query"), Sidebar(title="Nav")))
+	tree.render()
+	assert calls == ["Nav"]
+
+	ops = tree.rerender(div(span("query!"), Sidebar(title="Nav")))
+	assert calls == ["Nav"]
+	assert all(not op["path"].startswith("1") for op in ops)
+	assert "1.0.onClick" in tree.callbacks
+
+	ops = tree.rerender(div(span("query!"), Sidebar(title="Menu")))
+	assert calls == ["Nav", "Menu"]
+	assert [op["path"] for op in ops] == ["1.0"]
+
+
+def test_memo_component_custom_compare():
+	calls: list[int] = []
+
+	@ps.memo(compare=lambda prev, next: prev.kwargs["id"] == next.kwargs["id"])
+	def Row(id: int, label: str) -> Element:
+		calls.append(id)
+		return span(label)
+
+	tree = RenderTree(div(Row(id=1, label="a")))
+	tree.render()
+	tree.rerender(div(Row(id=1, label="b")))
+	assert calls == [1]
+	tree.rerender(div(Row(id=2, label="b")))
+	assert calls == [1, 2]
+
+
+def test_memo_component_still_tracks_reactive_deps():
+	count = Signal(0, name="count")
+	calls: list[int] = []
+
+	@component(memo=True)
+	def Counter() -> Element:
+		value = count()
+		calls.append(value)
+		return span(str(value))
+
+	tree = RenderTree(div(Counter()))
+	tree.render()
+
+	with Batch():
+		count.write(1)
+
+	# Dirty memo components re-render even when the parent passes equal args.
+	tree.rerender(div(Counter()))
+	assert calls == [0, 1]
+
+	with Batch():
+		count.write(2)
+	tree.rerender()
+	assert calls == [0, 1, 2]
+
+
+def test_memo_component_rerenders_when_moved():
+	calls: list[str] = []
+
+	@ps.memo
+	def Item(label: str, key: str | None = None) -> Element:
+		calls.append(label)
+		return li(label)
+
+	tree = RenderTree(ul(Item("a", key="a"), Item("b", key="b")))
+	tree.render()
+	calls.clear()
+
+	tree.rerender(ul(Item("b", key="b"), Item("a", key="a")))
+	# Moved components re-render so their subtree paths stay accurate.
+	assert sorted(calls) == ["a", "b"]
+
+
+def test_rendered_children_are_not_normalized_again(monkeypatch: pytest.MonkeyPatch):
+	tree = RenderTree(ul()[*[li(key=str(i))[str(i)] for i in range(3)], [span("x")]])
+	tree.render()
+	root = cast(Element, tree.element)
+	assert isinstance(root.children, NormalizedChildren)
+	assert normalize_children(root.children) is root.children
+	assert len(root.children) == 4
+
+	# Re-rendering and unmounting only walk the new children lists
+	walked: list[int] = []
+	original = renderer_module.normalize_children
+
+	def counting(children: Any) -> list[Any]:
+		if type(children) is not NormalizedChildren and children:
+			walked.append(len(children))
+		return original(children)
+
+	monkeypatch.setattr(renderer_module, "normalize_children", counting)
+	tree.rerender(ul()[*[li(key=str(i))[str(i)] for i in range(3)], [span("y")]])
+	assert sorted(walked) == [1, 1, 1, 1, 4]
+	walked.clear()
+	tree.unmount()
+	assert walked == []
+
+
+def test_deep_tree_does_not_hit_recursion_limit():
+	depth = 5000
+	label = Signal("a", name="label")
+
+	@component
+	def Leaf() -> Element:
+		return span(label())
+
+	def chain(leaf: Any) -> Element:
+		node = leaf
+		for _ in range(depth):
+			node = div(node)
+		return node
+
+	leaf = Leaf()
+	leaf.hooks = TrackingHookContext()
+	tree = RenderTree(chain(leaf))
+	vdom = tree.render()
+	assert _vdom_at(vdom, ".".join(["0"] * depth)) == {"tag": "span", "children": ["a"]}
+
+	with Batch():
+		label.write("b")
+	ops = tree.rerender()
+	assert [op["path"] for op in ops] == [".".join(["0"] * depth)]
+
+	ops = tree.rerender(chain(span("c")))
+	assert [op["path"] for op in ops] == [".".join(["0"] * (depth - 1))]
+	assert leaf.hooks.did_unmount is True
+	tree.unmount()
+
+
+def test_component_error_closes_open_components():
+	@component
+	def Broken() -> Element:
+		raise RuntimeError("boom")
+
+	@component
+	def Outer() -> Element:
+		return div(span("ok"), Broken())
+
+	tree = RenderTree(div(Outer()))
+	tree.profiler = ps.RenderProfiler().route("/")
+	with pytest.raises(RuntimeError, match="boom"):
+		tree.render()
+	assert tree.profiler._stack == []  # pyright: ignore[reportPrivateUsage]
+	assert tree.profiler.profiler.components[("/", "Outer")].calls == 1
+
+
+def _vdom_at(vdom: Any, path: str) -> Any:
+	node = vdom
+	for part in path.split(".") if path else []:
+		node = node["children"][int(part)]
+	return node
+
+
+def _apply_appends(vdom: Any, ops: Sequence[Any]) -> None:
+	for op in ops:
+		assert op["type"] == "reconciliation"
+		assert op["reuse"] == ([], [])
+		node = _vdom_at(vdom, op["path"])
+		children = node.setdefault("children", [])
+		assert op["new"][0] == list(range(len(children), op["N"]))
+		children.extend(op["new"][1])
+
+
+def _report(rows: int, cols: int) -> Element:
+	return div(className="report")[
+		*[
+			div(key=f"r{i}", onClick=lambda: None)[
+				*[span()[f"{i}:{j}"] for j in range(cols)]
+			]
+			for i in range(rows)
+		]
+	]
+
+
+def test_chunked_render_streams_deferred_children():
+	full = RenderTree(_report(10, 6)).render()
+
+	tree = RenderTree(_report(10, 6))
+	vdom = tree.render(chunk_size=4)
+	shell = cast(VDOMElement, vdom)
+	assert len(shell.get("children", [])) == 4
+	assert len(_vdom_at(vdom, "0")["children"]) == 4
+	assert set(tree.callbacks) == {f"{i}.onClick" for i in range(4)}
+
+	chunks = 0
+	while tree.deferred:
+		ops = tree.render_deferred(4)
+		_apply_appends(vdom, ops)
+		chunks += 1
+	assert vdom == full
+	# 6 rows left at the root, plus 2 cells for each of the 10 rows
+	assert chunks == 7
+	assert set(tree.callbacks) == {f"{i}.onClick" for i in range(10)}
+	assert tree.render_deferred(4) == []
+
+
+def test_chunked_render_deferred_components_mount_once():
+	calls: list[int] = []
+
+	@component
+	def Row(i: int, key: str | None = None) -> Element:
+		calls.append(i)
+		return li(str(i))
+
+	tree = RenderTree(ul(*[Row(i, key=str(i)) for i in range(5)]))
+	vdom = tree.render(chunk_size=2)
+	assert calls == [0, 1]
+	_apply_appends(vdom, tree.render_deferred())
+	assert calls == [0, 1, 2, 3, 4]
+	assert vdom == RenderTree(ul(*[Row(i, key=str(i)) for i in range(5)])).render()
+
+
+def test_rerender_supersedes_deferred_children():
+	rows = Signal(6, name="rows")
+
+	@component
+	def Report() -> Element:
+		return ul(*[li(key=str(i))[str(i)] for i in range(rows())])
+
+	tree = RenderTree(Report())
+	vdom = tree.render(chunk_size=2)
+	assert len(_vdom_at(vdom, "")["children"]) == 2
+
+	with Batch():
+		rows.write(3)
+	ops = tree.rerender()
+	# The reconciliation diffs against what the client has (two rows)
+	recon = _get_reconciliation_ops(ops)
+	assert len(recon) == 1
+	assert recon[0]["N"] == 3
+	assert recon[0]["new"][0] == [2]
+	assert not tree.deferred
+	assert tree.render_deferred(2) == []
+
+
+def test_unmount_drops_deferred_children():
+	show = Signal(True, name="show")
+
+	@component
+	def Page() -> Element:
+		return div(ul(*[li(str(i)) for i in range(5)]) if show() else "empty")
+
+	tree = RenderTree(Page())
+	tree.render(chunk_size=2)
+	assert tree.deferred
+
+	with Batch():
+		show.write(False)
+	tree.rerender()
+	assert tree.render_deferred(2) == []
+	assert not tree.deferred
+
+
+def test_render_on_rendered_tree_completes_deferred_children():
+	tree = RenderTree(_report(3, 3))
+	tree.render(chunk_size=1)
+	assert tree.deferred
+	assert tree.render() == RenderTree(_report(3, 3)).render()
+	assert not tree.deferred
+
+
+class _Handler:
+	def on_click(self, event: Any) -> None:
+		pass
+
+	def on_any(self, *args: Any) -> None:
+		pass
+
+
+@pytest.mark.parametrize(
+	"fn",
+	[
+		lambda: None,
+		lambda event, extra=1: None,
+		lambda *args: None,
+		_Handler().on_click,
+		_Handler().on_any,
+		functools.partial(lambda a, b, c: None, 1),
+		functools.partial(lambda a, b, c: None, b=2),
+		functools.partial(_Handler().on_click, 1),
+		functools.wraps(lambda a, b: None)(lambda *args: None),
+		print,
+	],
+)
+def test_callback_signature_matches_inspect(fn: Any):
+	params = inspect.signature(fn).parameters.values()
+	expected = (
+		sum(
+			1
+			for p in params
+			if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+			and p.default is p.empty
+		),
+		any(p.kind is p.VAR_POSITIONAL for p in params),
+	)
+	assert callback_signature(fn) == expected
+	# Second lookup goes through the cache
+	assert callback_signature(fn) == expected
+
+
+def test_callback_signature_cache_per_code_object(monkeypatch: pytest.MonkeyPatch):
+	"""2,000 rows x 3 handlers: signatures are inspected once per code object."""
+	# Each inspection of a cacheable callback adds one entry
+	signatures: dict[Any, tuple[int, bool]] = {}
+	monkeypatch.setattr(renderer_module, "_CALLBACK_SIGNATURES", signatures)
+
+	def table(query: str) -> Element:
+		rows: list[Element] = []
+		for i in range(2000):
+			rows.append(
+				div(
+					onClick=lambda i=i: None,
+					onFocus=lambda event, i=i: None,
+					onBlur=functools.partial(lambda i, event: None, i),
+				)[f"{query}{i}"]
+			)
+		return div(*rows)
+
+	tree = RenderTree(table(""))
+	tree.render()
+	tree.rerender(table("a"))
+	tree.rerender(table("ab"))
+
+	assert len(tree.callbacks) == 6000
+	assert sorted(signatures.values()) == [(0, False), (1, False), (1, False)]
+
+
 def test_diff_updates_props():
 	tree = RenderTree(Element("div", props={"class": "one"}))
 	tree.render()
@@ -958,6 +1470,96 @@ def test_keyed_complex_reorder():
 	assert final_dom == ["d", "b", "e", "a"]
 
 
+def test_keyed_move_last_to_front_emits_single_move():
+	keys = [str(i) for i in range(5000)]
+	tree = RenderTree(ul(*[li(k, key=k) for k in keys]))
+	tree.render()
+
+	moved = [keys[-1], *keys[:-1]]
+	ops = tree.rerender(ul(*[li(k, key=k) for k in moved]))
+
+	recon_ops = _get_reconciliation_ops(ops)
+	assert len(recon_ops) == 1
+	op = recon_ops[0]
+	assert op["reuse"] == ([0], [4999])
+	assert op["removed"] == []
+	assert op["new"] == ([], [])
+	assert _apply_reconciliation(keys, op) == moved
+
+
+def test_keyed_single_removal_uses_relative_form():
+	keys = [str(i) for i in range(100)]
+	tree = RenderTree(ul(*[li(k, key=k) for k in keys]))
+	tree.render()
+
+	remaining = [k for k in keys if k != "2"]
+	ops = tree.rerender(ul(*[li(k, key=k) for k in remaining]))
+
+	(op,) = _get_reconciliation_ops(ops)
+	assert op["reuse"] == ([], [])
+	assert op["removed"] == [2]
+	assert _apply_reconciliation(keys, op) == remaining
+
+
+def test_keyed_swap_moves_one_child():
+	tree = RenderTree(ul(li("a", key="a"), li("b", key="b")))
+	tree.render()
+
+	ops = tree.rerender(ul(li("b", key="b"), li("a", key="a")))
+
+	(op,) = _get_reconciliation_ops(ops)
+	assert op["reuse"] == ([0], [1])
+	assert op["removed"] == []
+	assert _apply_reconciliation(["a", "b"], op) == ["b", "a"]
+
+
+def test_keyed_reconciliation_keeps_absolute_form_when_smaller():
+	tree = RenderTree(ul(li("a", key="a"), li("b", key="b")))
+	tree.render()
+
+	ops = tree.rerender(ul(li("b", key="b")))
+
+	(op,) = _get_reconciliation_ops(ops)
+	assert "removed" not in op
+	assert op["reuse"] == ([0], [1])
+
+
+def test_keyed_reconciliation_random_permutations():
+	rng = random.Random(1234)
+	for _ in range(200):
+		prev = [str(k) for k in rng.sample(range(30), rng.randint(0, 12))]
+		pool = prev + [str(k) for k in range(30, 40)]
+		nxt = rng.sample(pool, rng.randint(0, len(pool)))
+
+		tree = RenderTree(ul(*[li(k, key=k) for k in prev]))
+		tree.render()
+		ops = tree.rerender(ul(*[li(k, key=k) for k in nxt]))
+
+		dom = list(prev)
+		for op in _get_reconciliation_ops(ops):
+			dom = _apply_reconciliation(dom, op)
+		assert dom == nxt
+		# Moved children never exceed the shifted ones the absolute form lists.
+		for op in _get_reconciliation_ops(ops):
+			if "removed" in op:
+				shifted = sum(
+					1 for i, k in enumerate(nxt) if k in prev and prev.index(k) != i
+				)
+				assert len(op["reuse"][0]) + len(op["removed"]) < shifted
+
+
+def test_longest_increasing_subsequence():
+	assert longest_increasing_subsequence([]) == set()
+	assert longest_increasing_subsequence([3, 2, 1]) in ({0}, {1}, {2})
+	seq = [4, 0, 1, 2, 3]
+	assert longest_increasing_subsequence(seq) == {1, 2, 3, 4}
+	seq = [2, 5, 3, 7, 11, 8, 10, 13, 6]
+	positions = sorted(longest_increasing_subsequence(seq))
+	values = [seq[p] for p in positions]
+	assert len(values) == 6
+	assert values == sorted(values)
+
+
 def test_render_props():
 	"""Test render props functionality."""
 
@@ -1,6 +1,10 @@
 import datetime as dt
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
 
 import pytest
+from pulse import serializer
 from pulse.serializer import deserialize, serialize
 
 
@@ -149,6 +153,24 @@ def test_date_roundtrip_v4():
 	assert parsed["day"] == day
 
 
+def test_plain_payloads_are_returned_as_is():
+	payload = serialize({"type": "callback", "args": [{"x": 1, "y": 2.5}]})
+	assert deserialize(payload) is payload[1]
+
+
+def test_deeply_nested_payloads_v4():
+	depth = 5_000
+	data: list[object] = ["2024-01-02", [1]]
+	for _ in range(depth):
+		data = [data]
+	# Built by hand: the date and the set are the innermost nodes
+	payload = (([], [depth + 1], [depth + 2], []), data)
+	parsed = deserialize(payload)  # pyright: ignore[reportArgumentType]
+	for _ in range(depth):
+		parsed = parsed[0]
+	assert parsed == [dt.date(2024, 1, 2), {1}]
+
+
 def test_unsupported_values_raise_v3():
 	with pytest.raises(TypeError):
 		serialize({"x": lambda: None})
@@ -187,3 +209,91 @@ class TestNaNAndInfinity:
 		payload = serialize(data)
 		parsed = deserialize(payload)
 		assert parsed == data
+
+
+class TestTreeMode:
+	"""`track_refs=False` skips shared-reference tracking for tree data."""
+
+	def test_matches_default_output_on_trees(self):
+		@dataclass
+		class Point:
+			x: int
+			y: float
+
+		class Color(str, Enum):
+			RED = "red"
+
+		data = {
+			"type": "vdom_update",
+			"ops": [
+				{"type": "update_props", "path": "0.1", "data": {"set": {"a": 1}}},
+				{
+					"type": "replace",
+					"path": "2",
+					"data": {
+						"tag": "div",
+						"props": {
+							"when": dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.UTC),
+							"day": dt.date(2024, 1, 2),
+							"tags": {"x"},
+							"point": Point(1, float("nan")),
+							"color": Color.RED,
+							"pair": (True, None),
+						},
+						"children": ["text", 3, 2.5],
+					},
+				},
+			],
+		}
+		assert serialize(data, track_refs=False) == serialize(data)
+
+	def test_shared_values_are_duplicated(self):
+		shared = {"day": dt.date(2024, 1, 2)}
+		payload = serialize([shared, shared], track_refs=False)
+		assert payload[0][0] == []
+		parsed = deserialize(payload)
+		assert parsed == [shared, shared]
+		assert parsed[0] is not parsed[1]
+
+	def test_cycles_are_written_as_references(self):
+		props: dict[str, Any] = {"label": "x"}
+		props["self"] = props
+		data = {"tag": "div", "props": {"value": props}}
+		payload = serialize(data, track_refs=False)
+		assert payload == serialize(data)
+		parsed = deserialize(payload)
+		assert parsed["props"]["value"]["self"] is parsed["props"]["value"]
+
+	def test_cycles_in_shared_values_point_to_each_copy(self):
+		node: dict[str, Any] = {"day": dt.date(2024, 1, 2)}
+		node["parent"] = [node]
+		parsed = deserialize(serialize([node, node], track_refs=False))
+		assert parsed[0] is not parsed[1]
+		for copy in parsed:
+			assert copy["parent"][0] is copy
+			assert copy["day"] == dt.date(2024, 1, 2)
+
+	def test_cyclic_values_are_walked_once(self, monkeypatch: pytest.MonkeyPatch):
+		class Node:
+			def __init__(self) -> None:
+				self.label = "x"
+				self.self = self
+
+		visits: list[object] = []
+
+		def encode_columnar(value: object) -> None:
+			visits.append(value)
+
+		monkeypatch.setattr(serializer, "encode_columnar", encode_columnar)
+		node = Node()
+		parsed = deserialize(serialize({"value": node}, track_refs=False))
+		assert parsed["value"]["self"] is parsed["value"]
+		assert visits == [node]
+
+	def test_errors_match_default(self):
+		with pytest.raises(TypeError, match="Dict keys must be strings"):
+			serialize({"a": {1: "x"}}, track_refs=False)
+		with pytest.raises(TypeError, match="Unsupported value"):
+			serialize([lambda: None], track_refs=False)
+		with pytest.raises(ValueError, match="Infinity"):
+			serialize([float("inf")], track_refs=False)
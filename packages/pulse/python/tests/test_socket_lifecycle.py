@@ -7,12 +7,15 @@ tear down the new connection or strand the render session's cleanup timer.
 """
 
 import asyncio
+import gzip
+import json
 from collections.abc import Callable, Coroutine
 from typing import Any, cast, override
 
 import pulse as ps
 import pytest
-from pulse.messages import ServerMessage
+from pulse.app import MESSAGE_BATCH_EVENT
+from pulse.messages import ServerMessage, ServerUpdateMessage
 from pulse.queries.query import KeyedQueryResult
 from pulse.reactive import Computed
 from pulse.serializer import Serialized, deserialize, serialize
@@ -118,8 +121,9 @@ async def test_reconnect_before_disconnect_resyncs_mount_and_stale_queries(
 	messages: dict[str, list[ServerMessage]] = {}
 
 	async def fake_emit(event: str, data: Any, *, to: str) -> None:
-		if event == "message":
-			message = deserialize(cast(Serialized, data))
+		payloads = [data] if event == "message" else data
+		for payload in payloads:
+			message = deserialize(cast(Serialized, payload))
 			messages.setdefault(to, []).append(cast(ServerMessage, message))
 
 	monkeypatch.setattr(app.sio, "emit", fake_emit)
@@ -627,3 +631,72 @@ async def test_close_render_unmaps_socket(monkeypatch: pytest.MonkeyPatch):
 	assert app._render_to_page_instance == {}  # pyright: ignore[reportPrivateUsage]
 
 	await app.close()
+
+
+@pytest.mark.asyncio
+async def test_messages_sent_in_one_tick_are_emitted_as_one_batch(
+	monkeypatch: pytest.MonkeyPatch,
+):
+	app = make_app(monkeypatch)
+	environ = make_environ(app, "user-1")
+	sent: list[tuple[str, Any]] = []
+
+	async def fake_emit(event: str, data: Any, *, to: str) -> None:
+		sent.append((event, data))
+
+	monkeypatch.setattr(app.sio, "emit", fake_emit)
+	await connect_handler(app)("socket-a", environ, {"render_id": "render-1"})
+	render = app.render_sessions["render-1"]
+
+	for path in ("/a", "/b", "/c"):
+		render.send({"type": "vdom_update", "path": path, "ops": []})
+	await wait_for(lambda: bool(sent))
+	assert len(sent) == 1
+	event, batch = sent[0]
+	assert event == MESSAGE_BATCH_EVENT
+	assert [deserialize(payload)["path"] for payload in batch] == ["/a", "/b", "/c"]
+
+	# A lone message keeps the plain event
+	render.send({"type": "vdom_update", "path": "/d", "ops": []})
+	await wait_for(lambda: len(sent) == 2)
+	event, payload = sent[1]
+	assert event == "message"
+	assert deserialize(payload)["path"] == "/d"
+
+	await app.close()
+
+
+@pytest.mark.asyncio
+async def test_large_messages_are_compressed_for_clients_that_support_it(
+	monkeypatch: pytest.MonkeyPatch,
+):
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://localhost:3000")
+	app = ps.App(routes=[], compression=ps.Compression(threshold=512))
+	app.setup("http://example.com")
+	environ = make_environ(app, "user-1")
+	sent: list[tuple[str, Any]] = []
+
+	async def fake_emit(event: str, data: Any, *, to: str) -> None:
+		sent.append((event, data))
+
+	monkeypatch.setattr(app.sio, "emit", fake_emit)
+	connect = connect_handler(app)
+	await connect("socket-a", environ, {"render_id": "r1"})
+	await connect(
+		"socket-b", environ, {"render_id": "r2", "__pulse_compression": "gzip"}
+	)
+
+	message: ServerUpdateMessage = {
+		"type": "vdom_update",
+		"path": "/",
+		"ops": [{"type": "replace", "path": "", "data": "x" * 1000}],
+	}
+	for rid in ("r1", "r2"):
+		app.render_sessions[rid].send(message)
+	await wait_for(lambda: len(sent) == 2)
+	plain, compressed = sent[0][1], sent[1][1]
+	assert deserialize(plain)["ops"] == message["ops"]
+	assert isinstance(compressed, bytes)
+	assert deserialize(json.loads(gzip.decompress(compressed)))["ops"] == message["ops"]
+
+	await app.close()
@@ -284,6 +284,43 @@ class TestState:
 		state.dispose()
 		assert effect.__disposed__
 
+	def test_selector_property(self):
+		class TableState(ps.State):
+			selected_id: int | None = None
+
+			@ps.selector
+			def is_selected(self):
+				return self.selected_id
+
+		state = TableState()
+		runs = {1: 0, 2: 0, 3: 0}
+
+		def row(key: int):
+			def fn():
+				runs[key] += 1
+				_ = state.is_selected(key)
+
+			return ps.Effect(fn)
+
+		effects = [row(key) for key in runs]
+		flush_effects()
+		assert state.is_selected is state.is_selected
+		assert state.is_selected(1) is False
+
+		state.selected_id = 2
+		flush_effects()
+		assert state.is_selected(2) is True
+		assert runs == {1: 1, 2: 2, 3: 1}
+
+		with pytest.raises(AttributeError):
+			state.is_selected = None  # pyright: ignore[reportAttributeAccessIssue]
+
+		selector = state.is_selected
+		for e in effects:
+			e.dispose()
+		state.dispose()
+		assert selector.__disposed__
+
 	def test_unannotated_property_becomes_signal(self):
 		class MyState(ps.State):
 			count: int
@@ -616,6 +653,29 @@ class TestState:
 		flush_effects()
 		assert set_checks[-1] is False
 
+	def test_shallow_and_lazy_values_keep_their_mode(self):
+		class S(ps.State):
+			rows: list[dict[str, Any]] = []
+
+		s = S()
+		seen: list[int] = []
+
+		@ps.effect
+		def track():  # pyright: ignore[reportUnusedFunction]
+			seen.append(len(s.rows))
+
+		flush_effects()
+		s.rows = ps.shallow([{"id": 1}, {"id": 2}])
+		flush_effects()
+		assert seen == [0, 2]
+		assert isinstance(s.rows, ReactiveList)
+		assert type(s.rows[0]) is dict
+
+		s.rows = ps.reactive([{"id": 3}], lazy=True)
+		assert list.__getitem__(s.rows, 0) == {"id": 3}
+		assert type(list.__getitem__(s.rows, 0)) is dict
+		assert isinstance(s.rows[0], ReactiveDict)
+
 	def test_non_reactive_property_detection(self):
 		"""Test that assignment to non-reactive properties after initialization is caught"""
 
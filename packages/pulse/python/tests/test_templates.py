@@ -0,0 +1,135 @@
+import json
+import random
+from typing import Any
+
+from pulse.templates import (
+	expand_templates,
+	extract_templates,
+	is_element,
+	is_template_ref,
+)
+from pulse.transpiler.vdom import VDOMElement
+
+
+def _size(value: Any) -> int:
+	return len(json.dumps(value, separators=(",", ":")))
+
+
+def _row(i: int) -> VDOMElement:
+	return {
+		"tag": "tr",
+		"key": f"row-{i}",
+		"props": {"className": "row", "data-index": i},
+		"children": [
+			{"tag": "td", "props": {"className": "cell name"}, "children": [f"n{i}"]},
+			{
+				"tag": "td",
+				"props": {"className": "cell"},
+				"children": [
+					{"tag": "button", "props": {"onClick": "$cb"}, "eval": ["onClick"]},
+					"Edit",
+				],
+			},
+		],
+	}
+
+
+def test_repeated_rows_become_one_template():
+	vdom: VDOMElement = {"tag": "table", "children": [_row(i) for i in range(50)]}
+	compact, templates = extract_templates(vdom)
+	assert is_element(compact)
+
+	assert templates == [
+		{
+			"tag": "tr",
+			"keyed": True,
+			"props": {"className": "row"},
+			"children": [
+				{
+					"tag": "td",
+					"props": {"className": "cell name"},
+					"children": [None],
+					"slots": [0],
+				},
+				{
+					"tag": "td",
+					"props": {"className": "cell"},
+					"children": [
+						{
+							"tag": "button",
+							"props": {"onClick": "$cb"},
+							"eval": ["onClick"],
+						},
+						"Edit",
+					],
+				},
+			],
+			"slots": ["data-index"],
+		}
+	]
+	assert compact.get("children", [])[3] == {
+		"t": "tpl",
+		"id": 0,
+		"slots": ["row-3", 3, "n3"],
+	}
+	assert expand_templates(compact, templates) == vdom
+	assert _size([compact, templates]) < _size(vdom) / 3
+
+
+def test_small_or_unique_shapes_are_left_alone():
+	vdom: VDOMElement = {
+		"tag": "ul",
+		"children": [
+			{"tag": "li", "children": ["a"]},
+			{"tag": "li", "children": ["b"]},
+			{"tag": "p", "props": {"id": "x"}},
+		],
+	}
+	assert extract_templates(vdom) == (vdom, [])
+	assert extract_templates("text") == ("text", [])
+
+
+def test_slot_values_are_compared_strictly():
+	vdom: VDOMElement = {
+		"tag": "div",
+		"children": [
+			{"tag": "input", "props": {"value": value, "className": "field"}}
+			for value in (1, 1.0, True, 1)
+		],
+	}
+	compact, templates = extract_templates(vdom)
+	assert templates[0].get("slots") == ["value"]
+	assert expand_templates(compact, templates) == vdom
+	assert is_element(compact)
+	children = compact.get("children", [])
+	values = [json.dumps(ref["slots"]) for ref in children if is_template_ref(ref)]
+	assert values == ["[1]", "[1.0]", "[true]", "[1]"]
+
+
+def test_templates_roundtrip_random_trees():
+	rng = random.Random(0)
+	tags = ["div", "span", "li"]
+	leaves: list[Any] = ["a", "b", 1, None, True, {"t": "ref", "key": "k"}]
+
+	def node(depth: int) -> Any:
+		if depth == 0 or rng.random() < 0.3:
+			return rng.choice(leaves)
+		element: dict[str, Any] = {"tag": rng.choice(tags)}
+		if rng.random() < 0.5:
+			element["key"] = rng.choice(["x", "y", "z"])
+		if rng.random() < 0.7:
+			element["props"] = {
+				name: rng.choice(leaves)
+				for name in rng.sample(["id", "className", "style"], rng.randint(1, 3))
+			}
+		if rng.random() < 0.8:
+			element["children"] = [node(depth - 1) for _ in range(rng.randint(1, 4))]
+		return element
+
+	for _ in range(200):
+		vdom: VDOMElement = {
+			"tag": "",
+			"children": [node(3) for _ in range(rng.randint(1, 20))],
+		}
+		compact, templates = extract_templates(vdom)
+		assert expand_templates(compact, templates) == vdom
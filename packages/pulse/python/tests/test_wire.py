@@ -0,0 +1,226 @@
+import datetime as dt
+from dataclasses import dataclass
+from typing import Any, cast
+
+import pulse as ps
+import pytest
+from pulse import wire
+from pulse.serializer import deserialize, serialize
+from pulse.test_helpers import wait_for
+from pulse.user_session import CookieSessionStore
+from pulse.wire import (
+	WIRE_FORMATS_AUTH_KEY,
+	decode_msgpack,
+	encode_msgpack,
+	negotiate_wire_format,
+)
+
+
+def roundtrip(value: Any, *, track_refs: bool = True) -> Any:
+	return decode_msgpack(encode_msgpack(value, track_refs=track_refs))
+
+
+def test_primitives_roundtrip():
+	data = [
+		0,
+		127,
+		128,
+		-1,
+		-33,
+		2**31,
+		-(2**31) - 1,
+		2**64 - 1,
+		-(2**63),
+		3.5,
+		"",
+		"é" * 40,
+		"x" * 70_000,
+		True,
+		False,
+		None,
+	]
+	assert roundtrip(data) == data
+
+
+def test_integers_beyond_64_bits_become_floats():
+	assert roundtrip(2**70) == float(2**70)
+	assert roundtrip(-(2**70)) == float(-(2**70))
+
+
+def test_nan_and_infinity_match_json_form():
+	assert roundtrip([float("nan")]) == [None]
+	with pytest.raises(ValueError, match="Infinity"):
+		encode_msgpack(float("inf"))
+
+
+def test_special_values_roundtrip():
+	when = dt.datetime(2024, 2, 2, 12, 30, 15, 123456, tzinfo=dt.UTC)
+	data = {
+		"when": when,
+		"day": dt.date(1969, 7, 20),
+		"tags": {"a", "b"},
+		"raw": b"\x00\xff",
+		"far": dt.datetime(2600, 1, 1, tzinfo=dt.UTC),
+		"early": dt.datetime(1900, 1, 1, tzinfo=dt.UTC),
+	}
+	parsed = roundtrip(data)
+	assert parsed["when"] == when.replace(microsecond=123000)
+	assert parsed["day"] == dt.date(1969, 7, 20)
+	assert parsed["tags"] == {"a", "b"}
+	assert parsed["raw"] == b"\x00\xff"
+	assert parsed["far"] == data["far"]
+	assert parsed["early"] == data["early"]
+
+
+def test_naive_datetime_is_utc():
+	assert roundtrip(dt.datetime(2024, 1, 1)) == dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+
+
+def test_extension_bytes():
+	assert encode_msgpack(dt.date(1970, 1, 2)) == b"\xd6\x01\x00\x00\x00\x01"
+	assert encode_msgpack({1}) == b"\xd5\x02\x91\x01"
+	assert encode_msgpack(dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.UTC)) == (
+		b"\xd7\xff" + (1).to_bytes(8, "big")
+	)
+	shared: list[int] = []
+	assert encode_msgpack([shared, shared]) == b"\x92\x90\xd6\x03\x00\x00\x00\x01"
+
+
+def test_shared_refs_and_cycles():
+	shared_set = {dt.date(2024, 1, 1)}
+	root: dict[str, Any] = {"s": shared_set, "also": shared_set}
+	root["self"] = root
+	parsed = roundtrip(root)
+	assert parsed["self"] is parsed
+	assert parsed["also"] is parsed["s"]
+	assert parsed["s"] == shared_set
+
+
+def test_tree_mode_duplicates_shared_values():
+	shared = {"a": 1}
+	parsed = roundtrip([shared, shared], track_refs=False)
+	assert parsed == [{"a": 1}, {"a": 1}]
+	assert parsed[0] is not parsed[1]
+
+
+def test_tree_mode_encodes_cycles_as_references():
+	root: dict[str, Any] = {"a": 1}
+	root["self"] = root
+	assert encode_msgpack(root, track_refs=False) == encode_msgpack(root)
+	parsed = roundtrip(root, track_refs=False)
+	assert parsed["self"] is parsed
+
+
+def test_tree_mode_cycles_in_shared_values_point_to_each_copy():
+	node: dict[str, Any] = {"day": dt.date(2024, 1, 2)}
+	node["parent"] = [node]
+	parsed = roundtrip([node, node], track_refs=False)
+	assert parsed[0] is not parsed[1]
+	for copy in parsed:
+		assert copy["parent"][0] is copy
+		assert copy["day"] == dt.date(2024, 1, 2)
+
+
+def test_tree_mode_walks_cyclic_values_once(monkeypatch: pytest.MonkeyPatch):
+	class Node:
+		def __init__(self) -> None:
+			self.label = "x"
+			self.self = self
+
+	visits: list[object] = []
+
+	def encode_columnar(value: object) -> None:
+		visits.append(value)
+
+	monkeypatch.setattr(wire, "encode_columnar", encode_columnar)
+	node = Node()
+	parsed = roundtrip({"value": node}, track_refs=False)
+	assert parsed["value"]["self"] is parsed["value"]
+	# The node and its reference to itself, rather than a walk down to the
+	# recursion limit followed by a second encoding
+	assert visits == [node, node]
+
+
+def test_matches_json_form():
+	@dataclass
+	class Point:
+		x: int
+		y: int
+
+	class Obj:
+		def __init__(self) -> None:
+			self.name = "obj"
+			self._hidden = True
+
+	data = {
+		"point": Point(1, 2),
+		"obj": Obj(),
+		"nested": [{"when": dt.datetime(2024, 3, 3, tzinfo=dt.UTC)}, ("t", 1)],
+		"tags": {1, 2},
+	}
+	for track_refs in (True, False):
+		expected = deserialize(serialize(data, track_refs=track_refs))
+		assert roundtrip(data, track_refs=track_refs) == expected
+
+
+def test_unsupported_values_raise():
+	with pytest.raises(TypeError):
+		encode_msgpack({"fn": lambda: None})
+	with pytest.raises(TypeError):
+		encode_msgpack({1: "a"})
+
+
+def test_truncated_payload_raises():
+	with pytest.raises(ValueError):
+		decode_msgpack(encode_msgpack({"a": [1, 2, 3]})[:-1])
+
+
+def test_negotiate_wire_format():
+	assert negotiate_wire_format("msgpack", "msgpack") == "msgpack"
+	assert negotiate_wire_format("json,msgpack", "msgpack") == "msgpack"
+	assert negotiate_wire_format(None, "msgpack") == "json"
+	assert negotiate_wire_format("msgpack", "json") == "json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("enabled", "offered", "binary"),
+	[
+		("msgpack", "msgpack", True),
+		("msgpack", None, False),
+		("json", "msgpack", False),
+	],
+)
+async def test_socket_messages_use_negotiated_format(
+	monkeypatch: pytest.MonkeyPatch,
+	enabled: Any,
+	offered: str | None,
+	binary: bool,
+):
+	monkeypatch.setenv("PULSE_REACT_SERVER_ADDRESS", "http://localhost:3000")
+	app = ps.App(routes=[], wire_format=enabled)
+	app.setup("http://example.com")
+	store = app.session_store
+	assert isinstance(store, CookieSessionStore)
+	environ = {"HTTP_COOKIE": f"{app.cookie.name}={store.encode('user-1', {})}"}
+	auth = {"render_id": "render-1"}
+	if offered is not None:
+		auth[WIRE_FORMATS_AUTH_KEY] = offered
+
+	emitted: list[Any] = []
+
+	async def fake_emit(event: str, data: Any, *, to: str) -> None:
+		emitted.append(data)
+
+	monkeypatch.setattr(app.sio, "emit", fake_emit)
+	connect = app.sio.handlers["/"]["connect"]
+	await connect("socket-a", environ, auth)
+	render = app.render_sessions["render-1"]
+	render.send({"type": "vdom_init", "path": "/", "vdom": {"tag": "div"}})  # pyright: ignore[reportArgumentType]
+	await wait_for(lambda: bool(emitted))
+
+	data = emitted[0]
+	assert isinstance(data, bytes) is binary
+	decoded = decode_msgpack(data) if binary else deserialize(cast(Any, data))
+	assert decoded["vdom"] == {"tag": "div"}
+	await app.close()
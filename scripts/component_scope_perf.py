@@ -0,0 +1,214 @@
+"""Measure what per-component dependency tracking costs the renderer.
+
+Each mounted component's hook context (`ComponentHooks`) records the signals
+its render reads, so a change re-renders only that component. This script
+compares it against `UntrackedHooks`, the same hook context with tracking
+turned off: components then run inside their hook context only, like before
+components had their own dependency scope, and every signal they read
+belongs to the enclosing route. Renders run inside an effect, as the route's
+render effect runs them, so both variants pay for subscribing to what they
+read; unmount includes disposing that effect.
+
+The tree is a page component listing `--rows` row components, each reading
+its own signal.
+For both variants it times a fresh render, a full rerender where every row's
+props change, and unmount. For tracked components it also times writing a
+single row's signal, which re-renders only that row. Garbage
+collection is paused while timing; instead, it reports how many objects each
+row keeps alive, which is what makes collections more frequent.
+
+Usage:
+	python scripts/component_scope_perf.py [--rows N] [--repeat N] [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from collections.abc import Callable
+from typing import Any, Literal, override
+
+from pulse.component import component
+from pulse.dom.tags import div, li, span, ul
+from pulse.hooks.core import HookContext
+from pulse.reactive import Batch, Effect, Signal
+from pulse.renderer import ComponentHooks, RenderTree
+from pulse.transpiler.nodes import Element, PulseNode
+
+# ============================================================
+# Hook contexts without dependency tracking
+# ============================================================
+
+
+class UntrackedHooks(ComponentHooks):
+	@override
+	def __enter__(self):
+		HookContext.__enter__(self)
+		return self
+
+	@override
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: Any,
+	) -> Literal[False]:
+		return HookContext.__exit__(self, exc_type, exc_val, exc_tb)
+
+
+# ============================================================
+# Workload
+# ============================================================
+
+
+@component
+def Row(index: int, label: str, count: Signal[int]) -> Element:
+	return li(span(label), div(f"{index}: {count()}", className="count"))
+
+
+@component
+def Page(rows: list[PulseNode]) -> Element:
+	return ul(*rows)
+
+
+def build(
+	labels: str, counts: list[Signal[int]], hooks: type[ComponentHooks] | None = None
+) -> PulseNode:
+	rows: list[PulseNode] = []
+	for i, count in enumerate(counts):
+		row = Row(i, f"{labels}{i}", count)
+		row.key = str(i)
+		if hooks is not None:
+			# Mounted rows keep their hook context; new ones take this one
+			row.hooks = hooks()
+		rows.append(row)
+	page = Page(rows)
+	if hooks is not None:
+		page.hooks = hooks()
+	return page
+
+
+class Route:
+	"""Runs renders in an effect, as a route's render effect does.
+
+	The effect stays subscribed to what the last render read, like the
+	route's, until `dispose()`.
+	"""
+
+	def __init__(self) -> None:
+		self.render: Callable[[], object] = lambda: None
+		self.effect = Effect(self.run, lazy=True)
+
+	def run(self) -> None:
+		self.render()
+
+	def time(self, render: Callable[[], object]) -> float:
+		self.render = render
+		start = time.perf_counter()
+		self.effect.run()
+		return time.perf_counter() - start
+
+	def dispose(self) -> None:
+		self.effect.dispose()
+
+
+def measure(hooks: type[ComponentHooks], rows: int) -> dict[str, float]:
+	counts = [Signal(0) for _ in range(rows)]
+	tree = RenderTree(build("row ", counts, hooks))
+	route = Route()
+	gc.collect()
+	objects = len(gc.get_objects())
+	# Collections run when allocations cross a threshold, so they land in
+	# whichever variant crosses it: time without them, count what's kept.
+	gc.disable()
+	try:
+		render = route.time(tree.render)
+		gc.collect()
+		retained = (len(gc.get_objects()) - objects) / rows
+		rerender = route.time(lambda: tree.rerender(build("item ", counts)))
+
+		update = float("nan")
+		if hooks is ComponentHooks:
+			# The route effect re-runs on the tree's version and re-renders
+			# only the dirty row
+			ops: list[Any] = []
+			route.render = lambda: ops.extend(tree.rerender())
+			start = time.perf_counter()
+			with Batch():
+				counts[rows // 2].write(1)
+			update = time.perf_counter() - start
+			assert len(ops) == 1, ops
+
+		start = time.perf_counter()
+		tree.unmount()
+		route.dispose()
+		unmount = time.perf_counter() - start
+	finally:
+		gc.enable()
+	return {
+		"render": render,
+		"rerender": rerender,
+		"update": update,
+		"unmount": unmount,
+		"retained": retained,
+	}
+
+
+def check(rows: int) -> None:
+	counts = [Signal(0) for _ in range(rows)]
+	tracked = RenderTree(build("row ", counts, ComponentHooks))
+	untracked = RenderTree(build("row ", counts, UntrackedHooks))
+	assert tracked.render() == untracked.render()
+	assert tracked.rerender(build("item ", counts)) == untracked.rerender(
+		build("item ", counts)
+	)
+	# Only tracked rows subscribe to their signal
+	assert all(len(count.obs) == 1 for count in counts)
+	tracked.unmount()
+	assert all(not count.obs for count in counts)
+	untracked.unmount()
+
+
+def main(rows: int = 5000, repeat: int = 10, skip_perf: bool = False) -> None:
+	check(100)
+	print("Tracked and untracked renders match")
+	if skip_perf:
+		return
+
+	# Interleave the variants, alternating which goes first, so drift and
+	# the state one run leaves for the next affect both alike
+	tracked: list[dict[str, float]] = []
+	untracked: list[dict[str, float]] = []
+	for i in range(repeat):
+		if i % 2:
+			tracked.append(measure(ComponentHooks, rows))
+		untracked.append(measure(UntrackedHooks, rows))
+		if not i % 2:
+			tracked.append(measure(ComponentHooks, rows))
+
+	print(f"\n{rows} row components, best of {repeat} (ms)")
+	print(f"{'':<10} {'untracked':>10} {'tracked':>10} {'ratio':>7}")
+	for key in ("render", "rerender", "unmount"):
+		before = min(r[key] for r in untracked) * 1000
+		after = min(r[key] for r in tracked) * 1000
+		print(f"{key:<10} {before:>10.1f} {after:>10.1f} {after / before:>6.2f}x")
+	update = min(r["update"] for r in tracked) * 1000
+	print(f"{'update':<10} {'-':>10} {update:>10.2f}   (one row)")
+	print(
+		"\nObjects kept per row after render: "
+		+ f"{untracked[0]['retained']:.1f} untracked, "
+		+ f"{tracked[0]['retained']:.1f} tracked"
+	)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument("--rows", type=int, default=5000, help="Row components")
+	parser.add_argument("--repeat", type=int, default=10, help="Runs per variant")
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(rows=args.rows, repeat=args.repeat, skip_perf=args.skip_perf)
@@ -0,0 +1,103 @@
+"""Measure gzip compression of large socket messages at each level.
+
+With `App(compression=ps.Compression(...))`, socket messages above the size
+threshold are gzipped before they are sent. This script renders a 5,000-row
+table, encodes its `vdom_init` message as JSON and MessagePack, and compares
+the compressed size and CPU cost for a few gzip levels, next to the render
+and encoding themselves.
+
+Usage:
+	python scripts/compression_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pulse.compression import Compression
+from pulse.dom.tags import span, table, tbody, td, tr
+from pulse.renderer import RenderTree
+from pulse.serializer import serialize
+from pulse.transpiler.nodes import Element
+from pulse.wire import encode_msgpack
+
+
+def build_table(rows: int) -> Element:
+	return table(className="grid")[
+		tbody()[
+			*[
+				tr(key=f"row-{i}", className="grid-row")[
+					td(className="cell cell-id")[str(i)],
+					td(className="cell cell-name")[f"Customer {i}"],
+					td(className="cell cell-amount")[f"{i * 3.5:.2f}"],
+					td(className="cell cell-status")[
+						span(className="badge badge-ok")["active"]
+					],
+				]
+				for i in range(rows)
+			]
+		]
+	]
+
+
+def bench(label: str, fn: Callable[[], Any], iterations: int) -> float:
+	fn()
+	best = float("inf")
+	for _ in range(iterations):
+		start = time.perf_counter()
+		fn()
+		best = min(best, time.perf_counter() - start)
+	print(f"  {label:28s} {best * 1000:8.2f}ms")
+	return best
+
+
+def report_level(level: int, payload: Any, size: int, skip_perf: bool) -> None:
+	compression = Compression(threshold=0, level=level)
+	compressed = compression.compress_message(payload)
+	label = f"gzip level {level}"
+	print(
+		f"  {label:28s} {len(compressed):>12,} bytes"
+		f" ({size / len(compressed):.1f}x smaller)"
+	)
+	if not skip_perf:
+		# JSON payloads include the json.dumps whose output is compressed
+		bench(label, lambda: compression.compress_message(payload), 5)
+
+
+def report(name: str, payload: Any, size: int, skip_perf: bool) -> None:
+	print(f"{name}: {size:,} bytes")
+	for level in (1, 6, 9):
+		report_level(level, payload, size, skip_perf)
+
+
+def main(skip_perf: bool = False) -> None:
+	def build() -> Any:
+		return RenderTree(build_table(5_000)).render()
+
+	message = {"type": "vdom_init", "path": "/", "vdom": build()}
+	as_json = list(serialize(message, track_refs=False))
+	as_msgpack = encode_msgpack(message, track_refs=False)
+
+	if not skip_perf:
+		print("for scale")
+		bench("render", build, 3)
+		bench("serialize + json.dumps", lambda: json.dumps(serialize(message)), 5)
+		bench("encode_msgpack", lambda: encode_msgpack(message), 5)
+	report("vdom_init, 5,000 rows (JSON)", as_json, len(json.dumps(as_json)), skip_perf)
+	report(
+		"vdom_init, 5,000 rows (MessagePack)", as_msgpack, len(as_msgpack), skip_perf
+	)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,100 @@
+"""Measure `deserialize()` on typical inbound client messages.
+
+Most client messages (callbacks for mouse moves and keystrokes, route
+updates) carry no dates, sets or shared references, and `deserialize()`
+returns their JSON as-is. Larger payloads with metadata, such as form data
+and channel messages, are rebuilt by an iterative walk. This script times
+both kinds next to the `json.loads` socket.io does first.
+
+Usage:
+	python scripts/deserialize_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pulse.serializer import deserialize, serialize
+
+
+def bench(label: str, fn: Callable[[], Any], iterations: int) -> float:
+	fn()
+	best = float("inf")
+	for _ in range(iterations):
+		start = time.perf_counter()
+		fn()
+		best = min(best, time.perf_counter() - start)
+	print(f"  {label:28s} {best * 1e6:10.2f}us")
+	return best
+
+
+def callback_message() -> Any:
+	return {
+		"type": "callback",
+		"path": "/dashboard",
+		"callback": "1.0.3.onMouseMove",
+		"args": [{"clientX": 412, "clientY": 96, "buttons": 0, "type": "mousemove"}],
+	}
+
+
+def form_message(fields: int) -> Any:
+	return {
+		"type": "callback",
+		"path": "/orders/new",
+		"callback": "2.onSubmit",
+		"args": [
+			{
+				"lines": [
+					{"sku": f"SKU-{i}", "qty": i % 7, "note": "", "gift": False}
+					for i in range(fields)
+				],
+				"due": dt.date(2024, 5, 1),
+			}
+		],
+	}
+
+
+def channel_message(rows: int) -> Any:
+	now = dt.datetime(2024, 5, 1, 12, tzinfo=dt.UTC)
+	return {
+		"type": "channel_message",
+		"channel": "grid",
+		"event": "rows",
+		"payload": [
+			{"id": i, "updated": now, "tags": {"a", "b"}, "values": [i, i + 1, i + 2]}
+			for i in range(rows)
+		],
+	}
+
+
+def report(name: str, message: Any, iterations: int, skip_perf: bool) -> None:
+	# What arrives from socket.io: freshly parsed JSON
+	wire = json.dumps(serialize(message))
+	payload = json.loads(wire)
+	assert deserialize(payload) == deserialize(serialize(message))
+	print(f"{name} ({len(wire):,} bytes)")
+	if skip_perf:
+		return
+	bench("json.loads (for scale)", lambda: json.loads(wire), iterations)
+	bench("deserialize", lambda: deserialize(payload), iterations)
+
+
+def main(skip_perf: bool = False) -> None:
+	report("callback, no metadata", callback_message(), 10_000, skip_perf)
+	report("form data, 2,000 lines", form_message(2_000), 50, skip_perf)
+	report("channel message, 2,000 rows", channel_message(2_000), 50, skip_perf)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
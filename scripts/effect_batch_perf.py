@@ -0,0 +1,202 @@
+"""Compare batch flushes against the list-backed batch they replaced.
+
+`Batch` keeps scheduled effects in an insertion-ordered set and runs them by
+rank: state effects first, then render effects. This script keeps the
+previous implementation as `ListBatch`, which checked membership on a list
+and ran effects in the order they were scheduled, and runs both on:
+
+- schedule: one effect per row signal, all scheduled by writing every row
+  inside one batch, then flushed.
+- fan-in: the same row effects, each syncing its row into a shared total,
+  and a render effect reading the total and a title. The title is written
+  first, so the render effect is scheduled before the row effects: the list
+  batch renders, then renders again after the row effects wrote the total.
+
+For each size it prints the best time of a few runs and how many times the
+render effect ran.
+
+Usage:
+	python scripts/effect_batch_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from collections.abc import Callable
+from typing import Any, override
+
+from pulse.reactive import (
+	REACTIVE_CONTEXT,
+	RENDER_EFFECT_RANK,
+	Batch,
+	Effect,
+	ReactiveContext,
+	Signal,
+)
+
+# ============================================================
+# List-backed batch (previous implementation)
+# ============================================================
+
+
+class ListBatch(Batch):
+	effects_list: list[Effect]
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.effects_list = []
+
+	@override
+	def register_effect(self, effect: Effect):
+		if effect not in self.effects_list:
+			self.effects_list.append(effect)
+
+	@override
+	def unregister_effect(self, effect: Effect):
+		self.effects_list.remove(effect)
+
+	@override
+	def flush(self):
+		token = None
+		rc = REACTIVE_CONTEXT.get()
+		if rc.batch is not self:
+			token = REACTIVE_CONTEXT.set(ReactiveContext(rc.epoch, self, rc.scope))
+		self.flush_id += 1
+		while len(self.effects_list) > 0:
+			current_effects = self.effects_list
+			self.effects_list = []
+			for effect in current_effects:
+				effect.batch = None
+				if not effect.should_run():
+					continue
+				try:
+					effect.run()
+				except Exception as exc:
+					effect.handle_error(exc)
+		if token:
+			REACTIVE_CONTEXT.reset(token)
+
+
+class RenderEffect(Effect):
+	rank = RENDER_EFFECT_RANK
+
+
+# ============================================================
+# Scenarios
+# ============================================================
+
+
+def reader(*signals: Signal[Any]) -> Callable[[], None]:
+	def read() -> None:
+		for s in signals:
+			s()
+
+	return read
+
+
+def schedule(batch_cls: type[Batch], rows: int) -> tuple[float, int]:
+	signals = [Signal(0, name=f"row:{i}") for i in range(rows)]
+	effects = [Effect(reader(s), lazy=True) for s in signals]
+	with batch_cls():
+		for e in effects:
+			e.schedule()
+	start = time.perf_counter()
+	with batch_cls():
+		for s in signals:
+			s.write(s.value + 1)
+	elapsed = time.perf_counter() - start
+	for e in effects:
+		e.dispose()
+	return elapsed, 0
+
+
+def fan_in(batch_cls: type[Batch], rows: int) -> tuple[float, int]:
+	signals = [Signal(0, name=f"row:{i}") for i in range(rows)]
+	title = Signal("", name="title")
+	total = Signal(0, name="total")
+	synced = [0] * rows
+
+	def make_sync(i: int) -> Callable[[], None]:
+		def sync() -> None:
+			value = signals[i]()
+			total.write(total.value + value - synced[i])
+			synced[i] = value
+
+		return sync
+
+	render = RenderEffect(reader(title, total), lazy=True)
+	effects = [Effect(make_sync(i), lazy=True) for i in range(rows)]
+	with batch_cls():
+		render.schedule()
+		for e in effects:
+			e.schedule()
+	runs = render.runs
+	start = time.perf_counter()
+	with batch_cls():
+		# The render effect is scheduled before the row effects
+		title.write(f"{rows} rows")
+		for s in signals:
+			s.write(s.value + 1)
+	elapsed = time.perf_counter() - start
+	renders = render.runs - runs
+	for e in [render, *effects]:
+		e.dispose()
+	return elapsed, renders
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def bench(
+	name: str,
+	scenario: Callable[[type[Batch], int], tuple[float, int]],
+	sizes: list[int],
+	iterations: int,
+) -> None:
+	print(f"\n{name}")
+	for rows in sizes:
+		results: dict[str, Any] = {}
+		for label, cls in (("list", ListBatch), ("ordered set", Batch)):
+			best = float("inf")
+			renders = 0
+			for _ in range(iterations):
+				gc.collect()
+				elapsed, renders = scenario(cls, rows)
+				best = min(best, elapsed)
+			results[label] = (best, renders)
+		base, base_renders = results["list"]
+		new, new_renders = results["ordered set"]
+		line = (
+			f"  {rows:6d} rows   list {base * 1000:9.2f}ms   "
+			+ f"ordered set {new * 1000:8.2f}ms   ({base / new:6.1f}x faster)"
+		)
+		if scenario is fan_in:
+			line += f"   renders {base_renders} -> {new_renders}"
+		print(line)
+
+
+def main(skip_perf: bool = False) -> None:
+	# Ranks save the render effect its second run
+	_, list_renders = fan_in(ListBatch, 10)
+	_, set_renders = fan_in(Batch, 10)
+	assert (list_renders, set_renders) == (2, 1), (list_renders, set_renders)
+	print("fan-in: the render effect runs twice with the list batch, once by rank")
+	if skip_perf:
+		return
+	sizes = [1_000, 5_000, 20_000]
+	bench("schedule: one effect per row", schedule, sizes, 3)
+	bench("fan-in: row effects feeding a render effect", fan_in, sizes, 3)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,70 @@
+"""Measure prop patches on a live time series.
+
+A chart that receives a 10k-point series and gains one point per tick used to
+resend the whole series in `update_props`. With `App(prop_patches=True)` the
+change is sent as a patch. This script re-renders such a chart, appending a
+point and dropping the oldest one (a sliding window), and compares the update
+payload size and the time to diff and serialize it.
+
+Usage:
+	python scripts/prop_patches_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from pulse.renderer import RenderTree
+from pulse.serializer import serialize
+from pulse.transpiler.nodes import Element
+
+POINTS = 10_000
+TICKS = 50
+
+
+def series(start: int) -> list[dict[str, Any]]:
+	return [{"t": t, "v": (t * 7919) % 1000 / 10} for t in range(start, start + POINTS)]
+
+
+def chart(data: list[dict[str, Any]]) -> Element:
+	# `data` is not a typed `div` prop, like the props of a charting component
+	return Element("div", props={"className": "chart", "data": data})
+
+
+def run(prop_patches: bool) -> tuple[int, float]:
+	"""Total update bytes and seconds over `TICKS` re-renders."""
+	tree = RenderTree(chart(series(0)))
+	tree.prop_patches = prop_patches
+	tree.render()
+	windows = [series(tick) for tick in range(1, TICKS + 1)]
+	size = 0
+	start = time.perf_counter()
+	for window in windows:
+		ops = tree.rerender(chart(window))
+		size += len(json.dumps(serialize(ops, track_refs=False)))
+	return size, time.perf_counter() - start
+
+
+def main(skip_perf: bool = False) -> None:
+	full_size, full_time = run(prop_patches=False)
+	patch_size, patch_time = run(prop_patches=True)
+	print(f"Sliding window of {POINTS:,} points, {TICKS} ticks")
+	print(f"  {'full values':20s} {full_size // TICKS:>12,} bytes/update")
+	print(f"  {'patches':20s} {patch_size // TICKS:>12,} bytes/update")
+	if skip_perf:
+		return
+	print(f"  {'full values':20s} {full_time / TICKS * 1000:8.2f}ms/update")
+	print(f"  {'patches':20s} {patch_time / TICKS * 1000:8.2f}ms/update")
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
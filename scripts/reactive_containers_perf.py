@@ -0,0 +1,273 @@
+"""Compare lazy item signals in reactive containers against eager ones.
+
+`ReactiveList` and `ReactiveDict` create the Signal of an index or key on its
+first read. Iteration, `values()`, `items()` and `unwrap()` subscribe to the
+container's structure and to one Signal for replaced values, and bulk
+operations notify once. This script keeps the previous behaviour as
+`EagerList` and `EagerDict`, which allocate a Signal per item up front, read
+every item Signal while iterating and rebuild all Signals after slice
+operations, and runs both on lists of rows and dicts of values. Rows are
+tuples, so wrapping nested containers doesn't hide the cost of the container:
+
+- construct: wrap the rows.
+- iterate: read every row through iteration, like a component rendering a
+  table.
+- extend: append the rows to an empty container in one call.
+- sort: sort the rows by a key.
+- slice: delete the first half of the rows, then replace the first tenth
+  with a shorter slice.
+- update: update every key of a dict with new values.
+
+For each size it prints the best time of a few runs, and for construction,
+the memory allocated per item.
+
+Usage:
+	python scripts/reactive_containers_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
+
+from pulse.reactive import Signal
+from pulse.reactive_extensions import ReactiveDict, ReactiveList, reactive
+
+# ============================================================
+# Eager containers (previous implementation)
+# ============================================================
+
+
+class EagerList(list[Any]):
+	def __init__(self, initial: Iterable[Any] = ()) -> None:
+		super().__init__()
+		self._signals: list[Signal[Any]] = []
+		self._structure = Signal(0)
+		for item in initial:
+			v = reactive(item)
+			self._signals.append(Signal(v))
+			super().append(v)
+
+	def _bump_structure(self) -> None:
+		self._structure.write(self._structure.read() + 1)
+
+	def __getitem__(self, idx: Any) -> Any:
+		if isinstance(idx, slice):
+			start, stop, step = idx.indices(len(self))
+			return [self._signals[i].read() for i in range(start, stop, step)]
+		return self._signals[idx].read()
+
+	def __setitem__(self, key: Any, value: Any) -> None:
+		assert isinstance(key, slice)
+		super().__setitem__(key, list(value))
+		self._signals = [Signal(reactive(v)) for v in super().__iter__()]
+		self._bump_structure()
+
+	def __delitem__(self, idx: Any) -> None:
+		super().__delitem__(idx)
+		self._signals = [Signal(v) for v in super().__iter__()]
+		self._bump_structure()
+
+	def extend(self, values: Iterable[Any]) -> None:
+		for v in values:
+			vv = reactive(v)
+			super().append(vv)
+			self._signals.append(Signal(vv))
+		self._bump_structure()
+
+	def sort(self, key: Callable[[Any], Any] | None = None, reverse: bool = False):
+		current = list(super().__iter__())
+		idxs = list(range(len(current)))
+		idxs.sort(key=lambda i: key(current[i]) if key else current[i], reverse=reverse)
+		self._signals = [self._signals[i] for i in idxs]
+		self._bump_structure()
+
+	def __len__(self) -> int:
+		self._structure.read()
+		return super().__len__()
+
+	def __iter__(self) -> Iterator[Any]:
+		self._structure.read()
+		for sig in self._signals:
+			yield sig.read()
+
+
+class EagerDict(dict[Any, Any]):
+	def __init__(self, initial: Mapping[Any, Any] | None = None) -> None:
+		super().__init__()
+		self._signals: dict[Any, Signal[Any]] = {}
+		self._structure = Signal(0)
+		if initial:
+			for k, v in initial.items():
+				v = reactive(v)
+				super().__setitem__(k, v)
+				self._signals[k] = Signal(v)
+
+	def _bump_structure(self) -> None:
+		self._structure.write(self._structure.read() + 1)
+
+	def __getitem__(self, key: Any) -> Any:
+		return self._signals[key].read()
+
+	def __iter__(self) -> Iterator[Any]:
+		self._structure.read()
+		return super().__iter__()
+
+	def set(self, key: Any, value: Any) -> None:
+		value = reactive(value)
+		was_present = super().__contains__(key)
+		sig = self._signals.get(key)
+		if sig is None:
+			self._signals[key] = Signal(value)
+		else:
+			sig.write(value)
+		super().__setitem__(key, value)
+		if not was_present:
+			self._bump_structure()
+
+	def update(self, other: Any = None, **kwargs: Any) -> None:
+		for k in other:
+			self.set(k, other[k])
+
+	def values(self) -> Any:
+		return [self[k] for k in self]
+
+
+# ============================================================
+# Scenarios
+# ============================================================
+
+ListFactory = Callable[[Iterable[Any]], list[Any]]
+DictFactory = Callable[[Mapping[Any, Any]], dict[Any, Any]]
+
+
+def rows(count: int) -> list[tuple[int, str, int]]:
+	return [(i, f"Row {i}", (i * 7919) % 1000) for i in range(count)]
+
+
+def construct(make: ListFactory, data: list[Any]) -> float:
+	start = time.perf_counter()
+	make(data)
+	return time.perf_counter() - start
+
+
+def iterate(make: ListFactory, data: list[Any]) -> float:
+	lst = make(data)
+	start = time.perf_counter()
+	for row in lst:
+		_ = row[1]
+	return time.perf_counter() - start
+
+
+def extend(make: ListFactory, data: list[Any]) -> float:
+	lst = make([])
+	start = time.perf_counter()
+	lst.extend(data)
+	return time.perf_counter() - start
+
+
+def sort(make: ListFactory, data: list[Any]) -> float:
+	lst = make(data)
+	start = time.perf_counter()
+	lst.sort(key=lambda row: row[2])
+	return time.perf_counter() - start
+
+
+def slice_ops(make: ListFactory, data: list[Any]) -> float:
+	lst = make(data)
+	start = time.perf_counter()
+	del lst[: len(data) // 2]
+	lst[: len(data) // 10] = data[:5]
+	return time.perf_counter() - start
+
+
+def update(make: DictFactory, data: list[Any]) -> float:
+	d = make({row[0]: row[2] for row in data})
+	new = {row[0]: row[2] + 1 for row in data}
+	start = time.perf_counter()
+	d.update(new)
+	return time.perf_counter() - start
+
+
+def bytes_per_item(make: ListFactory, data: list[Any]) -> float:
+	gc.collect()
+	tracemalloc.start()
+	start, _ = tracemalloc.get_traced_memory()
+	lst = make(data)
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del lst
+	return (current - start) / len(data)
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def bench(
+	name: str,
+	scenario: Callable[[Any, list[Any]], float],
+	eager: Any,
+	lazy: Any,
+	sizes: list[int],
+	iterations: int,
+) -> None:
+	print(f"\n{name}")
+	for size in sizes:
+		data = rows(size)
+		results: dict[str, float] = {}
+		for label, make in (("eager", eager), ("lazy", lazy)):
+			best = float("inf")
+			for _ in range(iterations):
+				gc.collect()
+				best = min(best, scenario(make, data))
+			results[label] = best
+		base, new = results["eager"], results["lazy"]
+		print(
+			f"  {size:6d} rows   eager {base * 1000:9.2f}ms   "
+			+ f"lazy {new * 1000:8.2f}ms   ({base / new:6.1f}x faster)"
+		)
+
+
+def main(skip_perf: bool = False) -> None:
+	# Iteration and bulk operations don't create item signals
+	lst = ReactiveList(rows(10))
+	_ = list(lst)
+	lst.extend(rows(5))
+	lst.sort(key=lambda row: row[2])
+	del lst[:3]
+	assert all(sig is None for sig in lst._signals)  # pyright: ignore[reportPrivateUsage]
+	assert lst.unwrap() == sorted(rows(10) + rows(5), key=lambda row: row[2])[3:]
+	print("iteration and bulk operations create no item signals")
+	if skip_perf:
+		return
+	sizes = [1_000, 10_000, 50_000]
+	print("\nconstruct: bytes per row")
+	for size in sizes:
+		data = rows(size)
+		eager = bytes_per_item(EagerList, data)
+		lazy = bytes_per_item(ReactiveList, data)
+		print(f"  {size:6d} rows   eager {eager:7.1f}B   lazy {lazy:6.1f}B")
+	bench("construct: wrap the rows", construct, EagerList, ReactiveList, sizes, 3)
+	bench("iterate: read every row", iterate, EagerList, ReactiveList, sizes, 3)
+	bench("extend: append every row", extend, EagerList, ReactiveList, sizes, 3)
+	bench("sort: sort rows by score", sort, EagerList, ReactiveList, sizes, 3)
+	bench(
+		"slice: delete and replace slices", slice_ops, EagerList, ReactiveList, sizes, 3
+	)
+	bench("update: update every key", update, EagerDict, ReactiveDict, sizes, 3)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,226 @@
+"""Memory used by reactive primitives and by a State-heavy render session.
+
+`Signal`, `Computed` and `Effect` use `__slots__`, keep their observers in an
+insertion-ordered set and only allocate a list of observer-change listeners
+when one is registered. This script keeps the previous layout as
+`LegacySignal` (an instance `__dict__`, an observer list and an empty listener
+list per signal) and reports:
+
+- primitives: bytes per `Signal`, `Computed` and `Effect`, measured with
+  `tracemalloc` over many instances, and bytes per `LegacySignal`.
+- observers: the time to unsubscribe every effect observing one signal, with
+  the observer list and with the observer set.
+- sessions: bytes and signals per render session for a dashboard app whose
+  state holds scalar fields and a list of records, prerendered in many
+  sessions.
+
+Usage:
+	python scripts/reactive_memory_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pulse as ps
+from pulse.reactive import Computed, Effect, Signal
+from pulse.render_session import RenderSession
+from pulse.routing import Route, RouteInfo, RouteTree
+
+# ============================================================
+# Previous signal layout
+# ============================================================
+
+
+class LegacySignal:
+	def __init__(self, value: Any, name: str | None = None):
+		self.value = value
+		self.name = name
+		self.obs: list[Any] = []
+		self._obs_change_listeners: list[Callable[[int], None]] = []
+		self.last_change = -1
+
+	def add_obs(self, obs: Any):
+		self.obs.append(obs)
+
+	def remove_obs(self, obs: Any):
+		if obs in self.obs:
+			self.obs.remove(obs)
+
+
+# ============================================================
+# Primitives
+# ============================================================
+
+
+def measure(make: Callable[[int], Any], count: int) -> float:
+	"""Bytes allocated per object created by `make`."""
+	gc.collect()
+	tracemalloc.start()
+	start, _ = tracemalloc.get_traced_memory()
+	objects = [make(i) for i in range(count)]
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	# The list holding the objects is not part of their cost
+	held = current - start - objects.__sizeof__()
+	del objects
+	return held / count
+
+
+def primitives(count: int) -> None:
+	source = Signal(0, name="source")
+	print(f"\nprimitives: bytes per object ({count} objects)")
+	rows: list[tuple[str, Callable[[int], Any]]] = [
+		("LegacySignal", lambda i: LegacySignal(i)),
+		("Signal", lambda i: Signal(i)),
+		("Computed", lambda i: Computed(lambda: source() + 1)),
+		("Effect", lambda i: Effect(lambda: None, lazy=True)),
+	]
+	for label, make in rows:
+		print(f"  {label:14s} {measure(make, count):8.1f} bytes")
+
+
+def unsubscribe(signal_cls: type[Any], observers: int) -> float:
+	signal = signal_cls(0)
+	subscribers = [object() for _ in range(observers)]
+	for obs in subscribers:
+		signal.add_obs(obs)
+	start = time.perf_counter()
+	for obs in subscribers:
+		signal.remove_obs(obs)
+	return time.perf_counter() - start
+
+
+def observers(sizes: list[int]) -> None:
+	print("\nobservers: unsubscribe every observer of one signal")
+	for size in sizes:
+		legacy = min(unsubscribe(LegacySignal, size) for _ in range(3))
+		current = min(unsubscribe(Signal, size) for _ in range(3))
+		print(
+			f"  {size:6d} observers   list {legacy * 1000:9.2f}ms   "
+			+ f"set {current * 1000:7.2f}ms   ({legacy / current:6.1f}x faster)"
+		)
+
+
+# ============================================================
+# Sessions
+# ============================================================
+
+RECORDS = 200
+SHOWN = 20
+
+
+class DashboardState(ps.State):
+	title: str = "Orders"
+	query: str = ""
+	page: int = 0
+	page_size: int = SHOWN
+	sort_by: str = "id"
+	descending: bool = False
+	loading: bool = False
+	error: str | None = None
+	selected: int | None = None
+	records: list[dict[str, Any]]
+
+	def __init__(self):
+		self.records = [
+			{
+				"id": i,
+				"customer": f"Customer {i}",
+				"status": "open" if i % 3 else "closed",
+				"total": i * 10,
+				"tags": ["priority"] if i % 7 == 0 else [],
+			}
+			for i in range(RECORDS)
+		]
+
+
+@ps.component
+def Dashboard():
+	state = DashboardState()
+	start = state.page * state.page_size
+	return ps.div(
+		ps.h1(state.title),
+		ps.input(value=state.query),
+		ps.ul(
+			*[
+				ps.li(
+					f"{r['customer']}: {r['total']} ({r['status']})", key=str(r["id"])
+				)
+				for r in state.records[start : start + state.page_size]
+			]
+		),
+	)
+
+
+def route_info(pathname: str) -> RouteInfo:
+	return {
+		"pathname": pathname,
+		"hash": "",
+		"query": "",
+		"queryParams": {},
+		"pathParams": {},
+		"catchall": [],
+	}
+
+
+def count_signals() -> int:
+	return sum(1 for obj in gc.get_objects() if isinstance(obj, Signal))
+
+
+async def sessions(count: int) -> None:
+	routes = RouteTree([Route("/", Dashboard)])
+	created: list[RenderSession] = []
+	app = ps.App()
+	gc.collect()
+	signals = count_signals()
+	tracemalloc.start()
+	start, _ = tracemalloc.get_traced_memory()
+	for i in range(count):
+		render = RenderSession(f"render-{i}", routes)
+		with ps.PulseContext(app=app, render=render):
+			render.prerender(["/"], route_info("/"))
+		created.append(render)
+	gc.collect()
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	per_session = (current - start) / count
+	signals = (count_signals() - signals) / count
+	print(f"\nsessions: {count} render sessions, {RECORDS} records each")
+	print(f"  {per_session / 1024:8.1f} KiB per session")
+	print(f"  {signals:8.0f} signals per session")
+	for render in created:
+		render.close()
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def main(skip_perf: bool = False) -> None:
+	assert not hasattr(Signal(0), "__dict__")
+	assert not hasattr(Computed(lambda: 0), "__dict__")
+	assert not hasattr(Effect(lambda: None, lazy=True), "__dict__")
+	print("Signal, Computed and Effect have no instance __dict__")
+	if skip_perf:
+		return
+	primitives(100_000)
+	observers([1_000, 10_000, 50_000])
+	asyncio.run(sessions(20))
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
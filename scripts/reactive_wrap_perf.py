@@ -0,0 +1,169 @@
+"""Compare deep, shallow and lazy wrapping of large nested data.
+
+Assigning a value to a `State` field wraps it with `reactive()`, which by
+default converts every nested dict and list into reactive containers.
+`ps.shallow(value)` only wraps the top level, and
+`ps.reactive(value, lazy=True)` wraps nested containers on their first read.
+This script builds an API-like response (records with nested fields and
+lists, about 1 KB of JSON each) and, for each mode, measures:
+
+- assign: assigning the response to a `State` field.
+- memory: the memory allocated by that assignment.
+- page: reading the fields of the first 50 records, like a component
+  rendering the first page of a table.
+- unwrap: converting the whole value back to plain data.
+
+For each size it prints the best time of a few runs.
+
+Usage:
+	python scripts/reactive_wrap_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pulse as ps
+from pulse.reactive_extensions import ReactiveDict, ReactiveList, unwrap
+
+PAGE_SIZE = 50
+
+# ============================================================
+# Data
+# ============================================================
+
+
+def response(count: int) -> dict[str, Any]:
+	return {
+		"total": count,
+		"items": [
+			{
+				"id": i,
+				"name": f"Order {i}",
+				"status": "open" if i % 3 else "closed",
+				"customer": {
+					"id": i % 500,
+					"name": f"Customer {i % 500}",
+					"address": {"city": "Paris", "zip": f"{75000 + i % 20}"},
+				},
+				"lines": [
+					{"sku": f"SKU-{i}-{j}", "qty": j + 1, "price": 9.99 * (j + 1)}
+					for j in range(5)
+				],
+				"tags": ["priority"] if i % 7 == 0 else [],
+			}
+			for i in range(count)
+		],
+	}
+
+
+class ResultsState(ps.State):
+	data: Any = None
+
+
+Wrap = Callable[[Any], Any]
+
+MODES: list[tuple[str, Wrap]] = [
+	("deep", lambda value: value),
+	("shallow", ps.shallow),
+	("lazy", lambda value: ps.reactive(value, lazy=True)),
+]
+
+# ============================================================
+# Scenarios
+# ============================================================
+
+
+def assign(wrap: Wrap, data: dict[str, Any]) -> tuple[float, ResultsState]:
+	state = ResultsState()
+	start = time.perf_counter()
+	state.data = wrap(data)
+	return time.perf_counter() - start, state
+
+
+def read_page(state: ResultsState) -> float:
+	start = time.perf_counter()
+	for item in state.data["items"][:PAGE_SIZE]:
+		_ = item["name"], item["status"], item["customer"]["name"]
+		for line in item["lines"]:
+			_ = line["qty"]
+	return time.perf_counter() - start
+
+
+def allocated(wrap: Wrap, data: dict[str, Any]) -> int:
+	gc.collect()
+	tracemalloc.start()
+	start, _ = tracemalloc.get_traced_memory()
+	_, state = assign(wrap, data)
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del state
+	return current - start
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def bench(sizes: list[int], iterations: int) -> None:
+	for size in sizes:
+		# Each run parses its own copy, like a fresh API response
+		payload = json.dumps(response(size))
+		print(f"\n{size} records ({len(payload) / 1e6:.1f} MB of JSON)")
+		for label, wrap in MODES:
+			times = {
+				"assign": float("inf"),
+				"page": float("inf"),
+				"unwrap": float("inf"),
+			}
+			for _ in range(iterations):
+				data = json.loads(payload)
+				gc.collect()
+				elapsed, state = assign(wrap, data)
+				times["assign"] = min(times["assign"], elapsed)
+				times["page"] = min(times["page"], read_page(state))
+				start = time.perf_counter()
+				unwrap(state.data)
+				times["unwrap"] = min(times["unwrap"], time.perf_counter() - start)
+			memory = allocated(wrap, json.loads(payload))
+			print(
+				f"  {label:8s} assign {times['assign'] * 1000:8.2f}ms   "
+				+ f"memory {memory / 1e6:7.1f} MB   "
+				+ f"page {times['page'] * 1000:6.2f}ms   "
+				+ f"unwrap {times['unwrap'] * 1000:8.2f}ms"
+			)
+
+
+def main(skip_perf: bool = False) -> None:
+	# Every mode reads the same data
+	expected = response(PAGE_SIZE)
+	for label, wrap in MODES:
+		state = ResultsState()
+		state.data = wrap(response(PAGE_SIZE))
+		assert unwrap(state.data) == expected, label
+	state = ResultsState()
+	state.data = ps.reactive(response(10), lazy=True)
+	assert isinstance(state.data["items"], ReactiveList)
+	assert type(list.__getitem__(state.data["items"], 0)) is dict
+	assert isinstance(state.data["items"][0], ReactiveDict)
+	print("deep, shallow and lazy values unwrap to the same data")
+	if skip_perf:
+		return
+	bench([1_000, 10_000], 3)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,206 @@
+"""Compare render path encodings on deep and wide Pulse trees.
+
+The renderer addresses nodes with dotted strings ("0.3.1.onClick") that are
+shared by update operations, the callback registry, `execute_callback` and the
+client renderer. This script measures what that encoding costs against the
+alternatives (tuple-of-int paths, interned linked path objects, integer node
+ids assigned at mount time):
+
+- CPU: a tree walk that only builds paths, next to a full render/rerender for
+  scale.
+- Wire: JSON bytes of the paths in an update touching every leaf, then of
+  the whole update message, raw and gzipped, with dotted paths and with
+  integer ids.
+
+Usage:
+	python scripts/render_path_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import zlib
+from collections.abc import Callable
+from itertools import count
+from typing import Any
+
+from pulse.dom.tags import div, span
+from pulse.renderer import RenderTree, join_path
+from pulse.transpiler.nodes import Element
+
+# ============================================================
+# Tree shapes
+# ============================================================
+
+
+def build_deep(depth: int, width: int, label: str = "") -> Element:
+	if depth == 0:
+		return span(className="leaf")[label]
+	return div(className="node")[
+		*[build_deep(depth - 1, width, label) for _ in range(width)]
+	]
+
+
+def build_wide(rows: int, label: str = "") -> Element:
+	return div(className="table")[
+		*[div(className="row")[span()[f"{label}{i}"]] for i in range(rows)]
+	]
+
+
+def children(node: Any) -> list[Any]:
+	if isinstance(node, Element):
+		return list(node.children or [])
+	return []
+
+
+# ============================================================
+# Path encodings
+# ============================================================
+
+
+def walk_dotted(node: Any, path: str, out: list[Any]) -> None:
+	out.append(path)
+	for idx, child in enumerate(children(node)):
+		walk_dotted(child, join_path(path, idx), out)
+
+
+def walk_tuple(node: Any, path: tuple[int, ...], out: list[Any]) -> None:
+	out.append(path)
+	for idx, child in enumerate(children(node)):
+		walk_tuple(child, (*path, idx), out)
+
+
+class LinkedPath:
+	"""Parent pointer + segment; the dotted form is materialized on demand."""
+
+	__slots__ = ("parent", "segment", "_str")
+
+	def __init__(self, parent: LinkedPath | None, segment: int) -> None:
+		self.parent = parent
+		self.segment = segment
+		self._str: str | None = None
+
+	def __str__(self) -> str:
+		if self._str is None:
+			if self.parent is None:
+				self._str = str(self.segment)
+			else:
+				self._str = f"{self.parent}.{self.segment}"
+		return self._str
+
+
+def walk_linked(node: Any, path: LinkedPath | None, out: list[Any]) -> None:
+	out.append(path)
+	for idx, child in enumerate(children(node)):
+		walk_linked(child, LinkedPath(path, idx), out)
+
+
+def walk_ids(node: Any, ids: count[int], out: list[Any]) -> None:
+	out.append(next(ids))
+	for child in children(node):
+		walk_ids(child, ids, out)
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def bench(label: str, fn: Callable[[], Any], iterations: int) -> float:
+	for _ in range(2):
+		fn()
+	start = time.perf_counter()
+	for _ in range(iterations):
+		fn()
+	elapsed = (time.perf_counter() - start) / iterations
+	print(f"  {label:28s} {elapsed * 1000:8.2f}ms")
+	return elapsed
+
+
+def leaf_paths(node: Any, path: str, out: list[str]) -> None:
+	kids = children(node)
+	if not kids or not isinstance(kids[0], Element):
+		out.append(path)
+		return
+	for idx, child in enumerate(kids):
+		leaf_paths(child, join_path(path, idx), out)
+
+
+def run_shape(
+	name: str, build: Callable[[str], Element], iterations: int, skip_perf: bool
+) -> None:
+	tree = RenderTree(build(""))
+	tree.render()
+	root = tree.element
+	dotted: list[Any] = []
+	walk_dotted(root, "", dotted)
+	print(f"\n{name}: {len(dotted)} nodes")
+
+	if not skip_perf:
+		render = bench(
+			"render (context)", lambda: RenderTree(build("")).render(), iterations
+		)
+		rerender = bench(
+			"rerender (context)",
+			lambda: tree.rerender(build(str(time.perf_counter_ns()))),
+			iterations,
+		)
+		walks: list[tuple[str, Callable[[], Any]]] = [
+			("dotted strings (current)", lambda: walk_dotted(root, "", [])),
+			("tuple[int, ...]", lambda: walk_tuple(root, (), [])),
+			("linked path objects", lambda: walk_linked(root, None, [])),
+			("integer node ids", lambda: walk_ids(root, count(), [])),
+		]
+		for label, fn in walks:
+			elapsed = bench(label, fn, iterations)
+			print(
+				f"  {'':28s} {elapsed / render * 100:7.1f}% of render, "
+				+ f"{elapsed / rerender * 100:.1f}% of rerender"
+			)
+
+	# Wire cost: every leaf text changes, one op per leaf.
+	leaves: list[str] = []
+	leaf_paths(root, "", leaves)
+	tuples = [tuple(int(p) for p in path.split(".")) if path else () for path in leaves]
+	print("  wire bytes for paths of one op per leaf:")
+	for label, encoded in [
+		("dotted strings (current)", leaves),
+		("int arrays", [list(t) for t in tuples]),
+		("integer node ids", list(range(len(leaves)))),
+	]:
+		size = len(json.dumps(encoded, separators=(",", ":")))
+		print(f"  {label:28s} {size:8d} B")
+
+	# Paths are only part of an update: compare whole messages, raw and gzipped
+	tree = RenderTree(build(""))
+	tree.render()
+	ops: list[Any] = tree.rerender(build("x"))
+	ids: dict[str, int] = {}
+	with_ids = [{**op, "path": ids.setdefault(op["path"], len(ids))} for op in ops]
+	print(f"  update message ({len(ops)} ops):")
+	for label, message in [
+		("dotted strings (current)", ops),
+		("integer node ids", with_ids),
+	]:
+		raw = json.dumps(message, separators=(",", ":")).encode()
+		gzipped = len(zlib.compress(raw, 6))
+		print(f"  {label:28s} {len(raw):8d} B raw   {gzipped:7d} B gzipped")
+
+
+def main(skip_perf: bool = False) -> None:
+	run_shape(
+		"deep (depth 8, width 3)", lambda label: build_deep(8, 3, label), 5, skip_perf
+	)
+	run_shape("wide (5,000 rows)", lambda label: build_wide(5000, label), 5, skip_perf)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,585 @@
+"""Compare the explicit-stack renderer against the recursive one it replaced.
+
+`Renderer` walks trees with an explicit work stack, so render, reconcile and
+unmount don't use a Python frame per tree level. This script keeps the
+previous recursive implementation as `RecursiveRenderer` and runs both on
+the tree shapes of `tree_perf.py`, turned into Pulse elements:
+
+- wide: `build_tuple_tree(8)`, a bushy tree of lists, objects and binary
+  nodes (about 10k elements).
+- deep: a chain of binary nodes, each with a small `build_tuple_tree(2)` side
+  branch.
+
+Both renderers must produce the same VDOM and operations. For each shape it
+times a fresh render, a full rerender where every leaf changes, and unmount.
+It also reports the deepest chain each implementation handles at the default
+recursion limit.
+
+Usage:
+	python scripts/render_stack_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, cast
+
+import pulse.renderer as renderer_module
+from pulse.component import component
+from pulse.dom.tags import div, li, span, ul
+from pulse.renderer import (
+	ComponentHooks,
+	DeferredChildren,
+	Renderer,
+	RenderTree,
+	eval_keys_for_props,
+	join_path,
+	key_value,
+	longest_increasing_subsequence,
+	same_node,
+)
+from pulse.transpiler.nodes import (
+	Child,
+	Children,
+	Element,
+	Expr,
+	Node,
+	PulseNode,
+	Value,
+)
+from pulse.transpiler.vdom import (
+	VDOM,
+	ReconciliationOperation,
+	ReplaceOperation,
+	UpdatePropsDelta,
+	UpdatePropsOperation,
+	VDOMElement,
+	VDOMNode,
+)
+from tree_perf import K_ADD, K_LIST, K_LIT, K_MUL, K_OBJ, build_tuple_tree
+
+# ============================================================
+# Recursive renderer (previous implementation)
+# ============================================================
+
+
+class RecursiveRenderer(Renderer):
+	def render_tree(self, node: Node, path: str = "") -> tuple[Any, Node]:
+		if isinstance(node, PulseNode):
+			return self.render_component(node, path)
+		if isinstance(node, Element):
+			return self.render_node(node, path)
+		if isinstance(node, Value):
+			return node.value, node.value
+		if isinstance(node, Expr):
+			return node.render(), node
+		# Pass through any other value - serializer will validate
+		return node, node
+
+	def render_component(
+		self, component: PulseNode, path: str
+	) -> tuple[VDOM, PulseNode]:
+		if self.reuse_contents and component.contents is not None:
+			hooks = self.component_hooks(component, path)
+			with self.collect_callbacks(hooks):
+				vdom, component.contents = self.render_tree(component.contents, path)
+			return vdom, component
+		hooks = self.component_hooks(component, path)
+		profiler = self.tree.profiler
+		frame = profiler.enter(component, self.operations) if profiler else None
+		try:
+			with self.collect_callbacks(hooks):
+				with hooks:
+					rendered = component.fn(*component.args, **component.kwargs)
+				vdom, normalized_child = self.render_tree(rendered, path)
+		finally:
+			if profiler is not None and frame is not None:
+				profiler.exit(frame, self.operations)
+		component.contents = normalized_child
+		return vdom, component
+
+	def render_node(self, element: Element, path: str) -> tuple[VDOMNode, Element]:
+		tag = self.render_tag(element.tag)
+		vdom_node: VDOMElement = {"tag": tag}
+		if (key_val := key_value(element)) is not None:
+			vdom_node["key"] = key_val
+
+		props = element.props_dict()
+		props_result = self.diff_props({}, props, path, prev_eval=set())
+		if props_result.delta_set:
+			vdom_node["props"] = props_result.delta_set
+		if props_result.eval_keys:
+			vdom_node["eval"] = sorted(props_result.eval_keys)
+
+		for task in props_result.render_prop_reconciles:
+			normalized_value = self.reconcile_tree(
+				task.previous, task.current, task.path
+			)
+			props_result.normalized[task.key] = normalized_value
+
+		element.props = props_result.normalized or None
+
+		children = recursive_normalize_children(element.children)
+		pending: list[Node] = []
+		if (
+			self.chunk_size is not None
+			and not self.reuse_contents
+			and len(children) > self.chunk_size
+		):
+			pending = children[self.chunk_size :]
+			children = children[: self.chunk_size]
+
+		children_vdom: list[VDOM] = []
+		normalized_children: list[Node] = []
+		for idx, child in enumerate(children):
+			child_path = join_path(path, idx)
+			child_vdom, normalized_child = self.render_tree(child, child_path)
+			children_vdom.append(child_vdom)
+			normalized_children.append(normalized_child)
+
+		if children_vdom:
+			vdom_node["children"] = children_vdom
+		element.children = normalized_children
+		if pending:
+			self.tree.defer(
+				DeferredChildren(
+					element=element,
+					path=path,
+					children=normalized_children,
+					pending=pending,
+					callback_keys=self.owned_callback_keys(),
+				)
+			)
+
+		return vdom_node, element
+
+	def reconcile_tree(
+		self,
+		previous: Node,
+		current: Node,
+		path: str = "",
+	) -> Node:
+		if isinstance(current, Value):
+			current = current.value
+		if isinstance(previous, Value):
+			previous = previous.value
+		if not same_node(previous, current):
+			recursive_unmount(previous)
+			new_vdom, normalized = self.render_tree(current, path)
+			self.operations.append(
+				ReplaceOperation(type="replace", path=path, data=new_vdom)
+			)
+			return normalized
+
+		if isinstance(previous, PulseNode) and isinstance(current, PulseNode):
+			return self.reconcile_component(previous, current, path)
+
+		if isinstance(previous, Element) and isinstance(current, Element):
+			return self.reconcile_element(previous, current, path)
+
+		return current
+
+	def reconcile_component(
+		self,
+		previous: PulseNode,
+		current: PulseNode,
+		path: str,
+	) -> PulseNode:
+		current.hooks = previous.hooks
+		current.contents = previous.contents
+
+		if self.can_skip_component(previous, current, path):
+			current.hooks.node = current
+			return current
+
+		hooks = self.component_hooks(current, path)
+		profiler = self.tree.profiler
+		frame = profiler.enter(current, self.operations) if profiler else None
+		try:
+			with self.collect_callbacks(hooks):
+				with hooks:
+					rendered = current.fn(*current.args, **current.kwargs)
+
+				if current.contents is None:
+					new_vdom, normalized = self.render_tree(rendered, path)
+					current.contents = normalized
+					self.operations.append(
+						ReplaceOperation(type="replace", path=path, data=new_vdom)
+					)
+				else:
+					current.contents = self.reconcile_tree(
+						current.contents, rendered, path
+					)
+		finally:
+			if profiler is not None and frame is not None:
+				profiler.exit(frame, self.operations)
+
+		return current
+
+	def rerender_component(self, hooks: ComponentHooks) -> None:
+		"""Re-enter the tree at a dirty component and reconcile its subtree."""
+		node = hooks.node
+		assert node is not None
+		self.reconcile_component(node, node, hooks.path)
+
+	def reconcile_element(
+		self,
+		previous: Element,
+		current: Element,
+		path: str,
+	) -> Element:
+		prev_props = previous.props_dict()
+		new_props = current.props_dict()
+		prev_eval = eval_keys_for_props(prev_props)
+		props_result = self.diff_props(prev_props, new_props, path, prev_eval)
+
+		if (
+			props_result.delta_set
+			or props_result.delta_remove
+			or props_result.eval_changed
+		):
+			delta: UpdatePropsDelta = {}
+			if props_result.delta_set:
+				delta["set"] = props_result.delta_set
+			if props_result.delta_remove:
+				delta["remove"] = sorted(props_result.delta_remove)
+			if props_result.eval_changed:
+				delta["eval"] = sorted(props_result.eval_keys)
+			self.operations.append(
+				UpdatePropsOperation(type="update_props", path=path, data=delta)
+			)
+
+		for task in props_result.render_prop_reconciles:
+			normalized_value = self.reconcile_tree(
+				task.previous, task.current, task.path
+			)
+			props_result.normalized[task.key] = normalized_value
+
+		# The new children list is reconciled in full, so anything still
+		# deferred under the previous element is covered by these operations.
+		self.tree.deferred.pop(id(previous), None)
+		prev_children = recursive_normalize_children(previous.children)
+		next_children = recursive_normalize_children(current.children)
+		normalized_children = self.reconcile_children(
+			prev_children, next_children, path
+		)
+
+		current.props = props_result.normalized or None
+		current.children = normalized_children
+		return current
+
+	def reconcile_children(
+		self,
+		c1: list[Node],
+		c2: list[Node],
+		path: str,
+	) -> list[Node]:
+		if not c1 and not c2:
+			return []
+
+		N1 = len(c1)
+		N2 = len(c2)
+		norm: list[Node | None] = [None] * N2
+		N = min(N1, N2)
+		i = 0
+		while i < N:
+			x1 = c1[i]
+			x2 = c2[i]
+			if not same_node(x1, x2):
+				break
+			norm[i] = self.reconcile_tree(x1, x2, join_path(path, i))
+			i += 1
+
+		if i == N1 == N2:
+			return norm
+
+		op = ReconciliationOperation(
+			type="reconciliation", path=path, N=len(c2), new=([], []), reuse=([], [])
+		)
+		self.operations.append(op)
+
+		keys_to_old_idx: dict[str, int] = {}
+		for j1 in range(i, N1):
+			key = key_value(c1[j1])
+			if key is not None:
+				keys_to_old_idx[key] = j1
+
+		reused = [False] * (N1 - i)
+		# Destination and source index of every reused child, in new order
+		reuse_dests: list[int] = []
+		reuse_sources: list[int] = []
+		for j2 in range(i, N2):
+			x2 = c2[j2]
+			k = key_value(x2)
+			if k is not None:
+				j1 = keys_to_old_idx.get(k)
+				if j1 is not None:
+					x1 = c1[j1]
+					if same_node(x1, x2):
+						norm[j2] = self.reconcile_tree(x1, x2, join_path(path, j2))
+						reused[j1 - i] = True
+						reuse_dests.append(j2)
+						reuse_sources.append(j1)
+						continue
+			if k is None and j2 < N1:
+				x1 = c1[j2]
+				if same_node(x1, x2):
+					reused[j2 - i] = True
+					norm[j2] = self.reconcile_tree(x1, x2, join_path(path, j2))
+					reuse_dests.append(j2)
+					reuse_sources.append(j2)
+					continue
+
+			vdom, el = self.render_tree(x2, join_path(path, j2))
+			op["new"][0].append(j2)
+			op["new"][1].append(vdom)
+			norm[j2] = el
+
+		removed: list[int] = []
+		for j1 in range(i, N1):
+			if not reused[j1 - i]:
+				removed.append(j1)
+				self.unmount_subtree(c1[j1])
+
+		shifted = [
+			idx
+			for idx, (j2, j1) in enumerate(zip(reuse_dests, reuse_sources, strict=True))
+			if j1 != j2
+		]
+		if not shifted:
+			return norm
+		# Children on a longest increasing run of sources keep their relative
+		# order; only the others need to move.
+		stable = longest_increasing_subsequence(reuse_sources)
+		moved = [idx for idx in range(len(reuse_sources)) if idx not in stable]
+		relative = len(removed) + len(moved) < len(shifted)
+		for idx in moved if relative else shifted:
+			op["reuse"][0].append(reuse_dests[idx])
+			op["reuse"][1].append(reuse_sources[idx])
+		if relative:
+			op["removed"] = removed
+
+		return norm
+
+	def unmount_subtree(self, node: Node) -> None:
+		recursive_unmount(node)
+
+
+def recursive_normalize_children(children: Children | None) -> list[Node]:
+	if not children:
+		return []
+
+	out: list[Node] = []
+	seen_keys: set[str] = set()
+
+	def register_key(item: Node) -> None:
+		key: str | None = None
+		if isinstance(item, PulseNode):
+			key = item.key
+		elif isinstance(item, Element):
+			key = key_value(item)
+		if key is None:
+			return
+		if key in seen_keys:
+			raise ValueError(f"Duplicate key '{key}'")
+		seen_keys.add(key)
+
+	def visit(item: Child) -> None:
+		if isinstance(item, dict):
+			raise TypeError("Dict is not a valid child; wrap in Value for props")
+		if isinstance(item, Iterable) and not isinstance(item, (str, bytes)):
+			for sub in item:
+				visit(sub)
+		else:
+			node = cast(Node, item)
+			register_key(node)
+			out.append(node)
+
+	for child in children:
+		visit(child)
+
+	return out
+
+
+def recursive_unmount(element: Node) -> None:
+	if isinstance(element, PulseNode):
+		if element.contents is not None:
+			recursive_unmount(element.contents)
+			element.contents = None
+		if element.hooks is not None:
+			element.hooks.unmount()
+		return
+
+	if isinstance(element, Element):
+		props = element.props_dict()
+		for value in props.values():
+			if isinstance(value, (Element, PulseNode)):
+				recursive_unmount(value)
+		for child in recursive_normalize_children(element.children):
+			recursive_unmount(child)
+		element.children = []
+		return
+
+
+# ============================================================
+# Tree shapes
+# ============================================================
+
+
+@component
+def Field(name: str, value: Any, key: str | None = None) -> Element:
+	return div(className="field")[span(name), value]
+
+
+def to_element(node: tuple[Any, ...]) -> Node:
+	"""Pulse elements for a `tree_perf` tuple tree; objects become components."""
+	kind = node[0]
+	if kind == K_LIT:
+		return span(className="lit")[str(node[1])]
+	if kind == K_ADD or kind == K_MUL:
+		return div(className="add" if kind == K_ADD else "mul")[
+			to_element(node[1]), to_element(node[2])
+		]
+	if kind == K_LIST:
+		return ul(
+			*[li(key=str(idx))[to_element(child)] for idx, child in enumerate(node[1:])]
+		)
+	assert kind == K_OBJ
+	return div(className="obj")[
+		*[Field(name, to_element(child), key=name) for name, child in node[1:]]
+	]
+
+
+def build_chain(depth: int, leaf_value: int) -> tuple[Any, ...]:
+	node: tuple[Any, ...] = (K_LIT, leaf_value)
+	for level in range(depth):
+		node = (K_ADD, build_tuple_tree(2, leaf_value + level), node)
+	return node
+
+
+def to_element_iterative(root: tuple[Any, ...]) -> Node:
+	"""`to_element` for chains too deep to convert recursively."""
+	chain: list[tuple[Any, ...]] = []
+	node = root
+	while node[0] == K_ADD and node[2][0] == K_ADD:
+		chain.append(node)
+		node = node[2]
+	out = to_element(node)
+	for link in reversed(chain):
+		out = div(className="add")[to_element(link[1]), out]
+	return out
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+@contextmanager
+def use_renderer(cls: type[Renderer]) -> Iterator[None]:
+	previous = renderer_module.Renderer
+	renderer_module.Renderer = cls
+	try:
+		yield
+	finally:
+		renderer_module.Renderer = previous
+
+
+def run_cycle(
+	cls: type[Renderer], build: Callable[[int], Node]
+) -> tuple[VDOM, list[Any], dict[str, float]]:
+	"""Render, fully rerender and unmount one tree; returns outputs and timings."""
+	with use_renderer(cls):
+		first, second = build(1), build(2)
+		tree = RenderTree(first)
+		start = time.perf_counter()
+		vdom = tree.render()
+		rendered = time.perf_counter()
+		ops = tree.rerender(second)
+		rerendered = time.perf_counter()
+		tree.unmount()
+		unmounted = time.perf_counter()
+	timings = {
+		"render": rendered - start,
+		"rerender": rerendered - rendered,
+		"unmount": unmounted - rerendered,
+	}
+	return vdom, ops, timings
+
+
+def bench(
+	name: str, build: Callable[[int], Node], iterations: int, skip_perf: bool
+) -> None:
+	print(f"\n{name}")
+	vdom_a, ops_a, _ = run_cycle(RecursiveRenderer, build)
+	vdom_b, ops_b, _ = run_cycle(Renderer, build)
+	assert vdom_a == vdom_b, "VDOM differs between renderers"
+	assert ops_a == ops_b, "operations differ between renderers"
+	print(f"  identical output ({len(ops_b)} operations)")
+	if skip_perf:
+		return
+
+	best: dict[str, dict[str, float]] = {}
+	for label, cls in (("recursive", RecursiveRenderer), ("explicit stack", Renderer)):
+		totals: dict[str, float] = {}
+		for _ in range(iterations):
+			gc.collect()
+			_, _, timings = run_cycle(cls, build)
+			for phase, elapsed in timings.items():
+				totals[phase] = min(totals.get(phase, elapsed), elapsed)
+		best[label] = totals
+	for phase in ("render", "rerender", "unmount"):
+		base = best["recursive"][phase]
+		new = best["explicit stack"][phase]
+		print(
+			f"  {phase:9s} recursive {base * 1000:8.2f}ms   "
+			+ f"explicit stack {new * 1000:8.2f}ms   ({new / base:5.2f}x)"
+		)
+
+
+def max_depth(cls: type[Renderer], limit: int = 100_000) -> int:
+	"""Deepest chain (doubling up to `limit`) that renders, rerenders and unmounts."""
+	ok = 0
+	depth = 64
+	while depth <= limit:
+		try:
+			run_cycle(cls, lambda v, d=depth: to_element_iterative(build_chain(d, v)))
+		except RecursionError:
+			break
+		ok = depth
+		depth *= 2
+	return ok
+
+
+def main(skip_perf: bool = False) -> None:
+	print(f"recursion limit: {sys.getrecursionlimit()}")
+	bench(
+		"wide: build_tuple_tree(8)",
+		lambda v: to_element(build_tuple_tree(8, v)),
+		5,
+		skip_perf,
+	)
+	bench(
+		"deep: 200-link chain",
+		lambda v: to_element_iterative(build_chain(200, v)),
+		5,
+		skip_perf,
+	)
+	print("\ndeepest chain handled (powers of two):")
+	print(f"  recursive        {max_depth(RecursiveRenderer, 4096)}")
+	print(f"  explicit stack   {max_depth(Renderer, 4096)}+")
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
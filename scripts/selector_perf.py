@@ -0,0 +1,132 @@
+"""Compare keyed selectors against comparing the selected key in every row.
+
+When every row of a table reads `selected() == row_id`, each row depends on
+`selected`, so changing the selection re-runs all of them. With
+`is_selected = Selector(selected)`, each row reads `is_selected(row_id)` and
+only depends on its own key, so a selection change re-runs the previous and
+the new row. This script mounts one Effect per row, standing in for row
+components, and for each approach measures:
+
+- mount: creating and running the row effects.
+- select: changing the selection and flushing the effects, averaged over
+  a series of clicks.
+- reruns: the number of row effects re-run by one selection change.
+
+For each size it prints the best time of a few runs.
+
+Usage:
+	python scripts/selector_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+
+from pulse.reactive import Effect, Selector, Signal, flush_effects
+
+CLICKS = 20
+
+# ============================================================
+# Rows
+# ============================================================
+
+
+class Table:
+	def __init__(self, size: int, mode: str) -> None:
+		self.selected = Signal(0)
+		self.selector = Selector(self.selected) if mode == "selector" else None
+		self.runs = [0]
+		self.rows = [self.row(i) for i in range(size)]
+
+	def row(self, key: int) -> Effect:
+		runs = self.runs
+		selected = self.selected
+		selector = self.selector
+
+		if selector is None:
+			# Previous pattern: every row compares the selected key itself
+			def render():
+				runs[0] += 1
+				_ = "active" if selected() == key else ""
+		else:
+
+			def render():
+				runs[0] += 1
+				_ = "active" if selector(key) else ""
+
+		return Effect(render, immediate=True)
+
+	def select(self, key: int) -> None:
+		self.selected.write(key)
+		flush_effects()
+
+	def dispose(self) -> None:
+		for row in self.rows:
+			row.dispose()
+		if self.selector is not None:
+			self.selector.dispose()
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def measure(size: int, mode: str) -> tuple[float, float, int]:
+	gc.collect()
+	start = time.perf_counter()
+	table = Table(size, mode)
+	mount = time.perf_counter() - start
+	table.runs[0] = 0
+	start = time.perf_counter()
+	for click in range(1, CLICKS + 1):
+		table.select(click * 7 % size)
+	select = (time.perf_counter() - start) / CLICKS
+	reruns = table.runs[0] // CLICKS
+	table.dispose()
+	return mount, select, reruns
+
+
+def bench(sizes: list[int], iterations: int) -> None:
+	for size in sizes:
+		print(f"\n{size} rows")
+		results: dict[str, tuple[float, float, int]] = {}
+		for mode in ("compare", "selector"):
+			best = (float("inf"), float("inf"), 0)
+			for _ in range(iterations):
+				mount, select, reruns = measure(size, mode)
+				best = (min(best[0], mount), min(best[1], select), reruns)
+			results[mode] = best
+			mount, select, reruns = best
+			print(
+				f"  {mode:8s} mount {mount * 1000:8.2f}ms   "
+				+ f"select {select * 1000:8.3f}ms   reruns {reruns:6d}"
+			)
+		base, new = results["compare"][1], results["selector"][1]
+		print(f"  selection change {base / new:.1f}x faster")
+
+
+def main(skip_perf: bool = False) -> None:
+	# Both approaches render the same selection, the selector re-runs 2 rows
+	for mode, expected in (("compare", 100), ("selector", 2)):
+		table = Table(100, mode)
+		table.runs[0] = 0
+		table.select(42)
+		assert table.runs[0] == expected, (mode, table.runs[0])
+		table.dispose()
+	print("a selection change re-runs 2 rows instead of 100")
+	if skip_perf:
+		return
+	bench([1_000, 10_000, 50_000], 3)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,133 @@
+"""Compare serializer modes on realistic socket payloads.
+
+`serialize(data)` records every container for shared-reference tracking;
+`serialize(data, track_refs=False)` is the tree mode used for `vdom_init`,
+`vdom_update` and prerender responses. This script builds those messages from
+rendered Pulse trees and measures both modes, with `json.dumps` of the result
+for scale, and the MessagePack wire format (`App(wire_format="msgpack")`).
+
+Usage:
+	python scripts/serializer_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pulse.dom.tags import button, div, span, table, tbody, td, tr
+from pulse.renderer import RenderTree
+from pulse.serializer import serialize
+from pulse.transpiler.nodes import Element
+from pulse.wire import encode_msgpack
+
+# ============================================================
+# Payloads
+# ============================================================
+
+
+def noop() -> None:
+	pass
+
+
+def build_table(rows: int, label: str) -> Element:
+	return table(className="grid")[
+		tbody()[
+			*[
+				tr(key=f"r{i}", className="row")[
+					td()[f"{label}{i}"],
+					td(style={"textAlign": "right"})[str(i * 3)],
+					td(title=dt.date(2024, 1, 1 + i % 28).isoformat())[
+						button(onClick=noop, disabled=i % 2 == 0)["Edit"]
+					],
+				]
+				for i in range(rows)
+			]
+		]
+	]
+
+
+def build_dashboard(cards: int, label: str) -> Element:
+	return div(className="dashboard")[
+		*[
+			div(className="card", id=f"card-{i}")[
+				span(className="title")[f"{label} card {i}"],
+				div(className="body")[
+					*[span(className="metric")[f"{j}: {i * j}"] for j in range(8)]
+				],
+			]
+			for i in range(cards)
+		]
+	]
+
+
+def payloads(build: Callable[[str], Element]) -> tuple[Any, Any]:
+	tree = RenderTree(build("a"))
+	init = {"type": "vdom_init", "path": "/", "vdom": tree.render()}
+	update = {"type": "vdom_update", "path": "/", "ops": tree.rerender(build("b"))}
+	return init, update
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+def bench(label: str, fn: Callable[[], Any], iterations: int) -> float:
+	for _ in range(2):
+		fn()
+	best = float("inf")
+	for _ in range(iterations):
+		start = time.perf_counter()
+		fn()
+		best = min(best, time.perf_counter() - start)
+	print(f"  {label:28s} {best * 1000:8.2f}ms")
+	return best
+
+
+def run_payload(name: str, message: Any, iterations: int, skip_perf: bool) -> None:
+	tracked = serialize(message)
+	tree = serialize(message, track_refs=False)
+	assert tree[1] == tracked[1] and tree[0][1:] == tracked[0][1:], name
+	size = len(json.dumps(tree, separators=(",", ":")))
+	binary = len(encode_msgpack(message, track_refs=False))
+	print(f"\n{name}: {size:,} bytes JSON, {binary:,} bytes MessagePack")
+	if skip_perf:
+		return
+	default = bench("serialize (track refs)", lambda: serialize(message), iterations)
+	fast = bench(
+		"serialize (tree mode)",
+		lambda: serialize(message, track_refs=False),
+		iterations,
+	)
+	bench("json.dumps (context)", lambda: json.dumps(tree), iterations)
+	bench(
+		"encode_msgpack (tree mode)",
+		lambda: encode_msgpack(message, track_refs=False),
+		iterations,
+	)
+	print(f"  {'':28s} tree mode: {default / fast:.2f}x faster")
+
+
+def main(skip_perf: bool = False) -> None:
+	for name, build in (
+		("table (2,000 rows)", lambda label: build_table(2000, label)),
+		("dashboard (300 cards)", lambda label: build_dashboard(300, label)),
+	):
+		init, update = payloads(build)
+		run_payload(f"{name} vdom_init", init, 10, skip_perf)
+		run_payload(f"{name} vdom_update", update, 10, skip_perf)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)
@@ -0,0 +1,626 @@
+"""Throughput and latency benchmarks for the socket message pipeline.
+
+Drives the server's hot path in-process, without a browser: a client
+`callback` message goes through the Socket.IO `message` handler,
+`App._process_socket_message`, the middleware, `RenderSession.execute_callback`,
+the batch flush and rerender, `serialize()` (or MessagePack) and the emit. The
+Socket.IO server's `emit` is replaced by `FakeSocket`, which encodes each frame
+as Socket.IO would and wakes up whoever waits for a reply on that socket.
+
+Sockets connect through the real `connect` handler, routes are prerendered and
+attached like a browser would, and every callback is a message the client
+could have sent. Each scenario is a canonical app:
+
+- large-list: one route rendering 1000 keyed `ps.memo` rows. Most clicks bump
+  one row's count (the list reconciles, one row rerenders); one in ten moves
+  the last row to the front.
+- deep-tree: a 300-level chain of nested components. Clicks alternate between
+  a counter in the leaf (only the leaf rerenders) and a label read at the root
+  (the whole chain reconciles).
+- many-mounts: 50 routes attached to one render session, all reading one
+  counter. Each click updates every mount in one batch flush.
+- many-sessions: 200 sockets, each with its own render session. Clicks are
+  sent in waves of one message per socket, all at once.
+
+For each scenario it reports the p50 and p99 latency (from receiving the
+message to emitting the reply), messages per second, frames and bytes sent per
+message, and allocations per message measured with `tracemalloc` in a separate
+pass: the peak memory allocated while handling a message, and the memory still
+held after all messages (divided by their count).
+
+Results can be saved with `--json` and compared against a previous run with
+`--baseline`: the script exits with status 1 when a metric is worse than the
+baseline by more than `--tolerance`.
+
+Usage:
+	python scripts/socket_bench.py [--scenario NAME ...] [--messages N]
+		[--wire json|msgpack] [--compress] [--json PATH] [--baseline PATH]
+		[--tolerance 0.25] [--seed 0]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any, cast
+
+import pulse as ps
+from pulse.compression import COMPRESSION_AUTH_KEY, Compression
+from pulse.render_session import RenderSession
+from pulse.serializer import Serialized, serialize
+from pulse.user_session import CookieSessionStore
+from pulse.wire import WIRE_FORMATS_AUTH_KEY, WireFormat
+
+# Seconds to wait for the reply to a message before giving up
+REPLY_TIMEOUT = 10.0
+WARMUP_MESSAGES = 20
+ALLOC_MESSAGES = 200
+
+# ============================================================
+# Apps
+# ============================================================
+
+LIST_SIZE = 1000
+TREE_DEPTH = 300
+MOUNT_COUNT = 50
+SESSION_COUNT = 200
+
+
+@ps.global_state
+class ListState(ps.State):
+	order: list[int]
+	counts: dict[int, int]
+
+	def __init__(self):
+		self.order = list(range(LIST_SIZE))
+		self.counts = dict.fromkeys(range(LIST_SIZE), 0)
+
+	def bump(self, row: int):
+		self.counts[row] += 1
+
+	def rotate(self):
+		self.order = [self.order[-1], *self.order[:-1]]
+
+
+@ps.memo
+def Row(row: int, count: int, key: str | None = None):
+	state = ListState()
+	return ps.li(
+		ps.span(f"Row {row}"),
+		ps.span(str(count), className="count"),
+		ps.button("+", onClick=lambda: state.bump(row)),
+	)
+
+
+@ps.component
+def LargeList():
+	state = ListState()
+	return ps.div(
+		ps.button("Rotate", onClick=state.rotate),
+		ps.ul(*[Row(row, state.counts[row], key=str(row)) for row in state.order]),
+	)
+
+
+@ps.global_state
+class TreeState(ps.State):
+	leaf: int = 0
+	renames: int = 0
+	label: str = "root"
+
+	def bump_leaf(self):
+		self.leaf += 1
+
+	def rename(self):
+		self.renames += 1
+		self.label = f"root {self.renames}"
+
+
+@ps.component
+def Leaf():
+	state = TreeState()
+	return ps.button(f"Leaf {state.leaf}", onClick=state.bump_leaf)
+
+
+@ps.component
+def Level(depth: int, label: str):
+	if depth == 0:
+		return Leaf()
+	return ps.div(className="level")[
+		ps.span(f"{label} / {depth}"), Level(depth - 1, label)
+	]
+
+
+@ps.component
+def DeepTree():
+	state = TreeState()
+	return ps.div(
+		ps.button(state.label, onClick=state.rename),
+		Level(TREE_DEPTH, state.label),
+	)
+
+
+@ps.global_state
+class Ticker(ps.State):
+	value: int = 0
+
+	def tick(self):
+		self.value += 1
+
+
+@ps.component
+def Panel():
+	ticker = Ticker()
+	pathname = ps.route()["pathname"]
+	return ps.section(
+		ps.h2(pathname),
+		ps.p(f"{ticker.value} ticks"),
+		ps.button("Tick", onClick=ticker.tick),
+	)
+
+
+@ps.component
+def Counter():
+	ticker = Ticker()
+	return ps.button(f"Clicked {ticker.value} times", onClick=ticker.tick)
+
+
+# ============================================================
+# Scenarios
+# ============================================================
+
+
+def depth(key: str) -> int:
+	return key.count(".")
+
+
+def pick_any(
+	rng: random.Random, step: int, callbacks: dict[str, list[str]]
+) -> tuple[str, str]:
+	path = rng.choice(list(callbacks))
+	return path, rng.choice(callbacks[path])
+
+
+def pick_list(
+	rng: random.Random, step: int, callbacks: dict[str, list[str]]
+) -> tuple[str, str]:
+	# "Rotate" is the shallowest button, the others bump a row
+	keys = sorted(callbacks["/"], key=depth)
+	if rng.random() < 0.1:
+		return "/", keys[0]
+	return "/", rng.choice(keys[1:])
+
+
+def pick_tree(
+	rng: random.Random, step: int, callbacks: dict[str, list[str]]
+) -> tuple[str, str]:
+	# The root and leaf buttons, in turn
+	keys = callbacks["/"]
+	if step % 2:
+		return "/", min(keys, key=depth)
+	return "/", max(keys, key=depth)
+
+
+@dataclass
+class Scenario:
+	name: str
+	routes: Callable[[], list[ps.Route]]
+	paths: list[str]
+	sessions: int = 1
+	# Picks the (path, callback key) to click from the click handlers by path
+	pick: Callable[[random.Random, int, dict[str, list[str]]], tuple[str, str]] = (
+		pick_any
+	)
+
+
+SCENARIOS = {
+	"large-list": Scenario(
+		name="large-list",
+		routes=lambda: [ps.Route("/", LargeList)],
+		paths=["/"],
+		pick=pick_list,
+	),
+	"deep-tree": Scenario(
+		name="deep-tree",
+		routes=lambda: [ps.Route("/", DeepTree)],
+		paths=["/"],
+		pick=pick_tree,
+	),
+	"many-mounts": Scenario(
+		name="many-mounts",
+		routes=lambda: [ps.Route(f"m{i}", Panel) for i in range(MOUNT_COUNT)],
+		paths=[f"/m{i}" for i in range(MOUNT_COUNT)],
+	),
+	"many-sessions": Scenario(
+		name="many-sessions",
+		routes=lambda: [ps.Route("/", Counter)],
+		paths=["/"],
+		sessions=SESSION_COUNT,
+	),
+}
+
+# ============================================================
+# Fake socket and client
+# ============================================================
+
+
+class FakeSocket:
+	"""Stands in for `AsyncServer.emit`, counting frames and their size."""
+
+	frames: int
+	bytes: int
+	_waiters: dict[str, asyncio.Future[None]]
+
+	def __init__(self) -> None:
+		self.frames = 0
+		self.bytes = 0
+		self._waiters = {}
+
+	async def emit(self, event: str, data: Any, *, to: str) -> None:
+		self.frames += 1
+		self.bytes += wire_size(data)
+		waiter = self._waiters.pop(to, None)
+		if waiter is not None and not waiter.done():
+			waiter.set_result(None)
+
+	def expect(self, sid: str) -> asyncio.Future[None]:
+		"""Future resolved by the next frame emitted to `sid`."""
+		waiter = asyncio.get_running_loop().create_future()
+		self._waiters[sid] = waiter
+		return waiter
+
+
+def wire_size(data: Any) -> int:
+	"""Size of a frame as Socket.IO sends it: JSON, with binary attachments."""
+	if isinstance(data, bytes):
+		return len(data)
+	if isinstance(data, list) and any(isinstance(item, bytes) for item in data):
+		return sum(wire_size(item) for item in cast(list[Any], data))
+	return len(json.dumps(data, separators=(",", ":")))
+
+
+def route_info(pathname: str) -> ps.RouteInfo:
+	return {
+		"pathname": pathname,
+		"hash": "",
+		"query": "",
+		"queryParams": {},
+		"pathParams": {},
+		"catchall": [],
+	}
+
+
+@dataclass
+class Client:
+	sid: str
+	render: RenderSession
+
+
+class Harness:
+	"""One app, its fake socket and its connected clients."""
+
+	app: ps.App
+	socket: FakeSocket
+	clients: list[Client]
+	step: int
+
+	def __init__(self, scenario: Scenario, wire: WireFormat, compress: bool) -> None:
+		self.scenario = scenario
+		self.wire = wire
+		self.compress = compress
+		self.app = ps.App(
+			routes=scenario.routes(),
+			wire_format=wire,
+			compression=Compression(threshold=1024) if compress else None,
+		)
+		self.app.setup("http://example.com")
+		self.socket = FakeSocket()
+		self.app.sio.emit = self.socket.emit  # pyright: ignore[reportAttributeAccessIssue]
+		self.clients = []
+		self.step = 0
+		handlers = self.app.sio.handlers["/"]
+		self._connect = handlers["connect"]
+		self._message = handlers["message"]
+
+	async def connect(self, index: int) -> Client:
+		store = self.app.session_store
+		assert isinstance(store, CookieSessionStore)
+		cookie = store.encode(f"user-{index}", {})
+		environ = {"HTTP_COOKIE": f"{self.app.cookie.name}={cookie}"}
+		auth = {"render_id": f"render-{index}"}
+		if self.wire == "msgpack":
+			auth[WIRE_FORMATS_AUTH_KEY] = "msgpack"
+		if self.compress:
+			auth[COMPRESSION_AUTH_KEY] = "gzip"
+		sid = f"socket-{index}"
+		await self._connect(sid, environ, auth)
+		render = self.app.render_sessions[auth["render_id"]]
+		session = self.app.user_sessions[f"user-{index}"]
+		with ps.PulseContext.update(session=session, render=render):
+			for path in self.scenario.paths:
+				render.prerender([path], route_info(path))
+		client = Client(sid=sid, render=render)
+		for path in self.scenario.paths:
+			await self.send(
+				client,
+				serialize(
+					{
+						"type": "attach",
+						"path": path,
+						"routeInfo": route_info(path),
+						"attachId": f"attach-{path}",
+					}
+				),
+			)
+		self.clients.append(client)
+		return client
+
+	async def send(self, client: Client, data: Serialized) -> float:
+		"""Send one message and wait for the reply; returns the latency."""
+		reply = self.socket.expect(client.sid)
+		start = time.perf_counter()
+		await self._message(client.sid, data)
+		await asyncio.wait_for(reply, REPLY_TIMEOUT)
+		return time.perf_counter() - start
+
+	def callbacks(self, client: Client) -> dict[str, list[str]]:
+		"""Click handlers of each mounted path, in render order."""
+		return {
+			path: [
+				key
+				for key in client.render.route_mounts[path].tree.callbacks
+				if key.rsplit(".", 1)[-1] == "onClick"
+			]
+			for path in self.scenario.paths
+		}
+
+	def click(self, client: Client, rng: random.Random) -> Serialized:
+		path, key = self.scenario.pick(rng, self.step, self.callbacks(client))
+		return serialize(
+			{"type": "callback", "path": path, "callback": key, "args": []}
+		)
+
+	async def wave(self, rng: random.Random) -> list[float]:
+		"""One click per client, sent together."""
+		self.step += 1
+		messages = [(client, self.click(client, rng)) for client in self.clients]
+		return list(
+			await asyncio.gather(
+				*(self.send(client, data) for client, data in messages)
+			)
+		)
+
+	async def close(self) -> None:
+		await self.app.close()
+
+
+# ============================================================
+# Benchmark harness
+# ============================================================
+
+
+@dataclass
+class Result:
+	scenario: str
+	messages: int
+	p50_ms: float
+	p99_ms: float
+	msgs_per_sec: float
+	frames_per_msg: float
+	bytes_per_msg: float
+	alloc_peak_kib: float
+	retained_bytes_per_msg: float
+
+
+# Metric name -> True when higher is better
+COMPARED = {
+	"p50_ms": False,
+	"p99_ms": False,
+	"msgs_per_sec": True,
+	"bytes_per_msg": False,
+	"alloc_peak_kib": False,
+}
+
+
+def percentile(values: list[float], q: float) -> float:
+	ordered = sorted(values)
+	idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+	return ordered[idx]
+
+
+async def run_scenario(
+	scenario: Scenario,
+	messages: int,
+	wire: WireFormat,
+	compress: bool,
+	seed: int,
+) -> Result:
+	rng = random.Random(seed)
+	harness = Harness(scenario, wire, compress)
+	try:
+		for index in range(scenario.sessions):
+			await harness.connect(index)
+		waves = max(1, messages // scenario.sessions)
+		warmup = max(1, WARMUP_MESSAGES // scenario.sessions)
+		for _ in range(warmup):
+			await harness.wave(rng)
+
+		gc.collect()
+		frames, sent = harness.socket.frames, harness.socket.bytes
+		latencies: list[float] = []
+		start = time.perf_counter()
+		for _ in range(waves):
+			latencies.extend(await harness.wave(rng))
+		elapsed = time.perf_counter() - start
+		count = len(latencies)
+		frames = harness.socket.frames - frames
+		sent = harness.socket.bytes - sent
+
+		# Allocations, in a separate pass: tracemalloc slows everything down
+		alloc_waves = max(1, min(waves, ALLOC_MESSAGES // scenario.sessions))
+		peaks: list[int] = []
+		gc.collect()
+		tracemalloc.start()
+		try:
+			baseline = tracemalloc.get_traced_memory()[0]
+			for _ in range(alloc_waves):
+				tracemalloc.reset_peak()
+				before = tracemalloc.get_traced_memory()[0]
+				await harness.wave(rng)
+				peaks.append(tracemalloc.get_traced_memory()[1] - before)
+			gc.collect()
+			retained = tracemalloc.get_traced_memory()[0] - baseline
+		finally:
+			tracemalloc.stop()
+		alloc_messages = alloc_waves * scenario.sessions
+	finally:
+		await harness.close()
+
+	return Result(
+		scenario=scenario.name,
+		messages=count,
+		p50_ms=statistics.median(latencies) * 1000,
+		p99_ms=percentile(latencies, 0.99) * 1000,
+		msgs_per_sec=count / elapsed,
+		frames_per_msg=frames / count,
+		bytes_per_msg=sent / count,
+		# Per wave: the messages of a wave are handled concurrently
+		alloc_peak_kib=statistics.mean(peaks) / scenario.sessions / 1024,
+		retained_bytes_per_msg=retained / alloc_messages,
+	)
+
+
+def print_results(results: list[Result]) -> None:
+	print(
+		f"\n{'scenario':15s} {'msgs':>6s} {'p50 ms':>8s} {'p99 ms':>8s} "
+		+ f"{'msgs/s':>9s} {'frames':>7s} {'B/msg':>9s} "
+		+ f"{'alloc KiB':>10s} {'kept B':>8s}"
+	)
+	for r in results:
+		print(
+			f"{r.scenario:15s} {r.messages:6d} {r.p50_ms:8.3f} {r.p99_ms:8.3f} "
+			+ f"{r.msgs_per_sec:9.0f} {r.frames_per_msg:7.2f} {r.bytes_per_msg:9.0f} "
+			+ f"{r.alloc_peak_kib:10.1f} {r.retained_bytes_per_msg:8.0f}"
+		)
+
+
+def compare(
+	results: list[Result], baseline: dict[str, dict[str, Any]], tolerance: float
+) -> list[str]:
+	"""Metrics worse than the baseline by more than `tolerance`."""
+	regressions: list[str] = []
+	for r in results:
+		base = baseline.get(r.scenario)
+		if base is None:
+			continue
+		current = asdict(r)
+		for metric, higher_is_better in COMPARED.items():
+			old, new = base.get(metric), current[metric]
+			if not old:
+				continue
+			change = (old - new) / old if higher_is_better else (new - old) / old
+			if change > tolerance:
+				regressions.append(
+					f"{r.scenario} {metric}: {old:.3f} -> {new:.3f} "
+					+ f"({change:+.0%} worse)"
+				)
+	return regressions
+
+
+def main(
+	scenarios: list[str],
+	messages: int,
+	wire: WireFormat,
+	compress: bool,
+	seed: int,
+	json_path: str | None,
+	baseline_path: str | None,
+	tolerance: float,
+) -> int:
+	os.environ.setdefault("PULSE_REACT_SERVER_ADDRESS", "http://localhost:3000")
+	print(f"wire: {wire}, compression: {'on' if compress else 'off'}, seed: {seed}")
+	results: list[Result] = []
+	for name in scenarios:
+		result = asyncio.run(
+			run_scenario(SCENARIOS[name], messages, wire, compress, seed)
+		)
+		results.append(result)
+		print(f"  {name}: done")
+	print_results(results)
+
+	if json_path:
+		with open(json_path, "w") as f:
+			json.dump(
+				{
+					"wire": wire,
+					"compress": compress,
+					"python": sys.version.split()[0],
+					"results": {r.scenario: asdict(r) for r in results},
+				},
+				f,
+				indent=2,
+			)
+		print(f"\nwrote {json_path}")
+
+	if baseline_path:
+		with open(baseline_path) as f:
+			baseline = json.load(f)["results"]
+		regressions = compare(results, baseline, tolerance)
+		if regressions:
+			print(f"\nregressions (tolerance {tolerance:.0%}):")
+			for line in regressions:
+				print(f"  {line}")
+			return 1
+		print(f"\nno regressions against {baseline_path}")
+	return 0
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--scenario",
+		action="append",
+		choices=list(SCENARIOS),
+		help="Scenario to run (repeatable, defaults to all)",
+	)
+	parser.add_argument(
+		"--messages", type=int, default=1000, help="Timed messages per scenario"
+	)
+	parser.add_argument("--wire", choices=["json", "msgpack"], default="json")
+	parser.add_argument(
+		"--compress", action="store_true", help="Compress large socket messages"
+	)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--json", dest="json_path", help="Write results to a file")
+	parser.add_argument(
+		"--baseline", help="Results file to compare against (exit 1 on regression)"
+	)
+	parser.add_argument(
+		"--tolerance",
+		type=float,
+		default=0.25,
+		help="Allowed relative slowdown before a metric is a regression",
+	)
+	args = parser.parse_args()
+	sys.exit(
+		main(
+			scenarios=args.scenario or list(SCENARIOS),
+			messages=args.messages,
+			wire=args.wire,
+			compress=args.compress,
+			seed=args.seed,
+			json_path=args.json_path,
+			baseline_path=args.baseline,
+			tolerance=args.tolerance,
+		)
+	)
@@ -0,0 +1,109 @@
+"""Measure template extraction on list-heavy `vdom_init` payloads.
+
+With `App(vdom_templates=True)`, elements repeated with the same shape are
+sent once as a template plus the values that differ per occurrence. This
+script renders a table page and a card grid, and compares payload size,
+`json.dumps` / `json.loads` time and the cost of extracting templates,
+next to the render itself.
+
+Usage:
+	python scripts/vdom_templates_perf.py [--skip-perf]
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pulse.dom.tags import button, div, h3, img, p, span, table, tbody, td, tr
+from pulse.renderer import RenderTree
+from pulse.templates import expand_templates, extract_templates
+from pulse.transpiler.nodes import Element
+
+
+def build_table(rows: int) -> Element:
+	return table(className="grid")[
+		tbody()[
+			*[
+				tr(key=f"row-{i}", className="grid-row")[
+					td(className="cell cell-id")[str(i)],
+					td(className="cell cell-name")[f"Customer {i}"],
+					td(className="cell cell-amount", style={"textAlign": "right"})[
+						f"{i * 3.5:.2f}"
+					],
+					td(className="cell cell-status")[
+						span(className="badge badge-ok")["active"]
+					],
+				]
+				for i in range(rows)
+			]
+		]
+	]
+
+
+def build_cards(count: int) -> Element:
+	return div(className="cards")[
+		*[
+			div(key=str(i), className="card shadow rounded")[
+				img(src=f"/img/{i}.png", alt="", className="card-image"),
+				div(className="card-body")[
+					h3(className="card-title")[f"Product {i}"],
+					p(className="card-text muted")["In stock"],
+					button(className="btn btn-primary", type="button")["Add to cart"],
+				],
+			]
+			for i in range(count)
+		]
+	]
+
+
+def bench(label: str, fn: Callable[[], Any], iterations: int) -> float:
+	fn()
+	best = float("inf")
+	for _ in range(iterations):
+		start = time.perf_counter()
+		fn()
+		best = min(best, time.perf_counter() - start)
+	print(f"  {label:28s} {best * 1000:8.2f}ms")
+	return best
+
+
+def report(name: str, build: Callable[[], Element], skip_perf: bool) -> None:
+	vdom = RenderTree(build()).render()
+	compact, templates = extract_templates(vdom)
+	assert expand_templates(compact, templates) == vdom
+
+	plain_json = json.dumps(vdom)
+	compact_json = json.dumps([compact, templates])
+	print(f"{name} ({len(templates)} template(s))")
+	print(f"  {'plain':28s} {len(plain_json):>12,} bytes")
+	print(
+		f"  {'templates':28s} {len(compact_json):>12,} bytes"
+		f" ({len(plain_json) / len(compact_json):.1f}x smaller)"
+	)
+	if skip_perf:
+		return
+	bench("render (for scale)", lambda: RenderTree(build()).render(), 3)
+	bench("extract_templates", lambda: extract_templates(vdom), 5)
+	bench("json.dumps plain", lambda: json.dumps(vdom), 5)
+	bench("json.dumps templates", lambda: json.dumps([compact, templates]), 5)
+	bench("json.loads plain", lambda: json.loads(plain_json), 5)
+	bench("json.loads templates", lambda: json.loads(compact_json), 5)
+
+
+def main(skip_perf: bool = False) -> None:
+	report("table, 5,000 rows", lambda: build_table(5_000), skip_perf)
+	report("card grid, 2,000 cards", lambda: build_cards(2_000), skip_perf)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--skip-perf", action="store_true", help="Skip performance benchmark"
+	)
+	args = parser.parse_args()
+	main(skip_perf=args.skip_perf)